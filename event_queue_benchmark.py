@@ -0,0 +1,112 @@
+import gc
+import logging
+import random
+import sys
+import time
+from typing import List, Tuple, Type
+
+from src.main.event.event_queue import EventQueue
+from src.main.event.timing_wheel import TimingWheel
+from src.main.logging.setup_logging import setup_logging
+
+NUM_PENDING_EVENTS: Tuple[int, ...] = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+DEFAULT_NUM_OPERATIONS: int = 200_000
+NUM_REPEATS: int = 3
+MILLISECOND: int = 1_000_000
+TIMER_PATTERNS: Tuple[Tuple[str, int, int, int], ...] = (
+    ('1-5 ms, whole ms', 1, 5, MILLISECOND),
+    ('1-5 ms, any ns', MILLISECOND, 5 * MILLISECOND, 1),
+    ('1 ms-60 s, whole ms', 1, 60_000, MILLISECOND))
+
+
+def draw_delays(random_generator: random.Random,
+                num_delays: int,
+                timer_pattern: Tuple[str, int, int, int]) -> List[int]:
+    """
+    Draws the delays of the events scheduled by a timer pattern.
+
+    :param random_generator: Generator of the random delays.
+    :type random_generator: random.Random
+    :param num_delays: The number of delays to draw.
+    :type num_delays: int
+    :param timer_pattern: The name of the pattern, the range of its delays
+        and their resolution in nanoseconds.
+    :type timer_pattern: Tuple[str, int, int, int]
+    :return: The delays in nanoseconds.
+    :rtype: List[int]
+    """
+    _, delay_floor, delay_ceiling, resolution = timer_pattern
+    return [random_generator.randint(delay_floor, delay_ceiling) * resolution
+            for _ in range(num_delays)]
+
+
+def measure_hold(queue_class: Type[EventQueue],
+                 num_pending_events: int,
+                 timer_pattern: Tuple[str, int, int, int],
+                 num_operations: int) -> float:
+    """
+    Measures the hold model: the queue is filled with pending events, then
+    every operation pops the earliest event and schedules the next one of
+    its processor, so the number of pending events stays the same, like a
+    simulation where every processor always has a pending wake-up.
+
+    :param queue_class: The event queue to measure.
+    :type queue_class: Type[EventQueue]
+    :param num_pending_events: The number of pending events.
+    :type num_pending_events: int
+    :param timer_pattern: The name of the pattern, the range of its delays
+        and their resolution in nanoseconds.
+    :type timer_pattern: Tuple[str, int, int, int]
+    :param num_operations: The number of pops and pushes measured.
+    :type num_operations: int
+    :return: The best time of a pop and a push over the repeats, in
+        nanoseconds.
+    :rtype: float
+    """
+    random_generator: random.Random = random.Random(1)
+    event_queue: EventQueue = queue_class()
+    for processor, delay in enumerate(draw_delays(random_generator,
+                                                  num_pending_events,
+                                                  timer_pattern)):
+        event_queue.push(delay, processor)
+    best_time: float = float('inf')
+    for _ in range(NUM_REPEATS):
+        delays: List[int] = draw_delays(random_generator, num_operations, timer_pattern)
+        start_time: float = time.perf_counter()
+        for delay in delays:
+            processor = event_queue.pop()
+            event_queue.push(event_queue.current_time + delay, processor)
+        best_time = min(best_time, time.perf_counter() - start_time)
+    return best_time / num_operations * 10 ** 9
+
+
+def main() -> None:
+    """
+    Benchmarks the timing wheel against the binary heap event queue for
+    every timer pattern and number of pending events, with the garbage
+    collector disabled, and logs a table of the time per event.
+
+    The number of measured operations can be given as the only argument.
+    """
+    setup_logging(False)
+    num_operations: int = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_NUM_OPERATIONS
+    logging.info(f"Pop and push of {num_operations:,} events, best of {NUM_REPEATS}")
+    logging.info(f"{'Delays':<20} {'Pending':>9} {'Heap (ns)':>10} {'Wheel (ns)':>11} "
+                 f"{'Speedup':>8}")
+    gc.disable()
+    try:
+        for timer_pattern in TIMER_PATTERNS:
+            for num_pending_events in NUM_PENDING_EVENTS:
+                heap_time: float = measure_hold(EventQueue, num_pending_events,
+                                                timer_pattern, num_operations)
+                wheel_time: float = measure_hold(TimingWheel, num_pending_events,
+                                                 timer_pattern, num_operations)
+                logging.info(f"{timer_pattern[0]:<20} {num_pending_events:>9,} "
+                             f"{heap_time:>10,.0f} {wheel_time:>11,.0f} "
+                             f"{heap_time / wheel_time:>7.2f}x")
+    finally:
+        gc.enable()
+
+
+if __name__ == "__main__":
+    main()
@@ -13,7 +13,8 @@ def main() -> None:
     The main function initializes the application configuration
     by parsing the provided command-line arguments, sets up
     logging based on the verbosity configuration, and starts
-    the simulation process.
+    the simulation process, or the simulation of the whole grid
+    of configurations if one is given.
 
     :raises SystemExit: Raised if there are issues with parsing the
         command-line arguments or unexpected errors during setup or
@@ -21,6 +22,11 @@ def main() -> None:
     """
     config: Config = get_config_from_arguments(sys.argv[1:])
     setup_logging(config.verbose)
+    if config.grid:
+        # Imported here, so that NumPy is only needed to simulate a grid.
+        from src.main.simulator.grid_simulator import GridSimulator
+        GridSimulator(config).simulate()
+        return
     simulator: Simulator = Simulator(config)
     simulator.simulate()
 
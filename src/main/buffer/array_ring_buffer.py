@@ -0,0 +1,115 @@
+import logging
+from array import array
+
+from src.main.buffer.buffer import Buffer
+from src.main.buffer.empty_buffer_exception import EmptyBufferException
+from src.main.buffer.full_buffer_exception import FullBufferException
+from src.main.statistics.statistic_tracker import StatisticTracker
+from src.main.statistics.tracking_mode import TrackingMode
+from src.main.thread.critical_section import tracked_critical_section
+from src.main.thread.processor.lock.lock import Lock
+
+
+class ArrayRingBuffer(Buffer):
+    """
+    A thread-safe, fixed-capacity ring buffer for integer items.
+
+    Items are stored unboxed in a preallocated `array('q')` of signed 64-bit
+    integers and addressed with modular indices, so enqueueing and dequeueing
+    allocate nothing per item. The class declares `__slots__`, so instances
+    carry no per-instance attribute dictionary and memory use is
+    `8 * buffer_size` bytes plus a small constant.
+
+    :ivar ring: The preallocated storage for the buffered integers.
+    :type ring: array
+    :ivar mutex_lock: A lock used to manage concurrent access to the buffer.
+    :type mutex_lock: Lock
+    :ivar head: The index of the oldest item in the ring.
+    :type head: int
+    :ivar count: The number of items currently held in the ring.
+    :type count: int
+    """
+    __slots__ = ('ring', 'mutex_lock', 'head', 'count')
+    TYPE_CODE: str = 'q'
+    def __init__(self,
+                 buffer_size: int,
+                 mutex_lock: Lock,
+                 statistic_tracker: StatisticTracker):
+        """
+        Initializes the ring buffer with zeroed storage for the given buffer
+        size, a mutex lock for thread-safety, and a statistic tracker.
+
+        :param buffer_size: The maximum number of integers the ring can hold.
+        :type buffer_size: int
+        :param mutex_lock: A lock used to synchronize access to the buffer.
+        :type mutex_lock: Lock
+        :param statistic_tracker: An object responsible for tracking relevant
+            statistics.
+        :type statistic_tracker: StatisticTracker
+        """
+        super().__init__(buffer_size, statistic_tracker)
+        self.ring: array = array(ArrayRingBuffer.TYPE_CODE, [0]) * buffer_size
+        self.mutex_lock: Lock = mutex_lock
+        self.head: int = 0
+        self.count: int = 0
+
+    def is_empty(self) -> bool:
+        """
+        Determines if the ring buffer is empty.
+
+        :return: Boolean indicating whether the buffer is empty or not.
+        :rtype: bool
+        """
+        return self.count == 0
+
+    def is_full(self) -> bool:
+        """
+        Checks if the ring buffer has reached its capacity.
+
+        :return: True if the buffer is full, False otherwise.
+        :rtype: bool
+        """
+        return self.count >= self.buffer_size
+
+    @tracked_critical_section
+    def enqueue(self, number_to_enqueue: int) -> None:
+        """
+        Stores an integer in the slot after the newest item if the buffer is
+        not full. If the buffer is full, raises a `FullBufferException`.
+
+        :param number_to_enqueue: The integer value to add to the ring. It
+            must fit in a signed 64-bit integer.
+        :type number_to_enqueue: int
+        :return: None
+        :raises FullBufferException: If the buffer is full.
+        :raises OverflowError: If the number does not fit in 64 bits.
+        """
+        if not self.is_full():
+            tail: int = (self.head + self.count) % self.buffer_size
+            self.ring[tail] = number_to_enqueue
+            self.count += 1
+        else:
+            if TrackingMode.is_verbose:
+                logging.debug("Buffer is full")
+            raise FullBufferException()
+
+    @tracked_critical_section
+    def dequeue(self) -> int:
+        """
+        Removes and returns the oldest integer in the ring if the buffer is
+        not empty. If the buffer is empty, an exception is raised instead.
+
+        :raises EmptyBufferException: Raised when attempting to dequeue from
+            an empty buffer.
+        :return: The oldest item in the ring.
+        :rtype: int
+        """
+        if not self.is_empty():
+            number: int = self.ring[self.head]
+            self.head = (self.head + 1) % self.buffer_size
+            self.count -= 1
+            return number
+        else:
+            if TrackingMode.is_verbose:
+                logging.debug("Buffer is empty")
+            raise EmptyBufferException()
@@ -0,0 +1,119 @@
+import asyncio
+import logging
+
+from src.main.buffer.buffer import Buffer
+from src.main.buffer.empty_buffer_exception import EmptyBufferException
+from src.main.buffer.full_buffer_exception import FullBufferException
+from src.main.statistics.statistic_tracker import StatisticTracker
+from src.main.statistics.tracking_mode import TrackingMode
+
+
+class AsyncBuffer(Buffer):
+    """
+    A bounded FIFO buffer for producers and consumers running as coroutines
+    on a single event loop, backed by an `asyncio.Queue`.
+
+    The awaitable `put` and `get` suspend the calling coroutine while the
+    buffer is full or empty, parking it as a future on the event loop rather
+    than on an operating system thread, so tens of thousands of producers
+    and consumers can wait at once. Only one coroutine runs at a time, so no
+    lock is needed. The buffer must only be used from the event loop running
+    the coroutines.
+
+    :ivar queue: The queue holding the buffered items.
+    :type queue: asyncio.Queue
+    """
+    def __init__(self,
+                 buffer_size: int,
+                 statistic_tracker: StatisticTracker):
+        """
+        Initializes an empty buffer.
+
+        :param buffer_size: The maximum number of elements the buffer can
+            hold.
+        :type buffer_size: int
+        :param statistic_tracker: An object responsible for tracking relevant
+            statistics.
+        :type statistic_tracker: StatisticTracker
+        """
+        super().__init__(buffer_size, statistic_tracker)
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+
+    def is_empty(self) -> bool:
+        """
+        Determines if the buffer is empty.
+
+        :return: Boolean indicating whether the buffer is empty or not.
+        :rtype: bool
+        """
+        return self.queue.empty()
+
+    def is_full(self) -> bool:
+        """
+        Checks if the buffer has reached its maximum capacity.
+
+        :return: True if the buffer is full, False otherwise.
+        :rtype: bool
+        """
+        return self.queue.full()
+
+    def enqueue(self, number_to_enqueue: int) -> None:
+        """
+        Adds a number to the buffer without waiting. If the buffer is full,
+        raises a `FullBufferException`.
+
+        :param number_to_enqueue: The integer value to add to the buffer.
+        :type number_to_enqueue: int
+        :return: None
+        :raises FullBufferException: If the buffer is full.
+        """
+        try:
+            self.queue.put_nowait(number_to_enqueue)
+        except asyncio.QueueFull:
+            self.statistic_tracker.increment_full_buffer()
+            if TrackingMode.is_verbose:
+                logging.debug("Buffer is full")
+            raise FullBufferException()
+
+    def dequeue(self) -> int:
+        """
+        Removes and returns the oldest item in the buffer without waiting.
+
+        :raises EmptyBufferException: If the buffer is empty.
+        :return: The oldest item in the buffer.
+        :rtype: int
+        """
+        try:
+            return self.queue.get_nowait()
+        except asyncio.QueueEmpty:
+            self.statistic_tracker.increment_empty_buffer()
+            if TrackingMode.is_verbose:
+                logging.debug("Buffer is empty")
+            raise EmptyBufferException()
+
+    async def put(self, number_to_enqueue: int) -> None:
+        """
+        Adds a number to the buffer, suspending the calling coroutine while
+        the buffer is full. Each call which finds the buffer full is counted
+        once by the statistic tracker.
+
+        :param number_to_enqueue: The integer value to add to the buffer.
+        :type number_to_enqueue: int
+        :return: None
+        """
+        if self.queue.full():
+            self.statistic_tracker.increment_full_buffer()
+        await self.queue.put(number_to_enqueue)
+
+    async def get(self) -> int:
+        """
+        Removes and returns the oldest item in the buffer, suspending the
+        calling coroutine while the buffer is empty. Each call which finds
+        the buffer empty is counted once by the statistic tracker.
+
+        :return: The oldest item in the buffer.
+        :rtype: int
+        """
+        if self.queue.empty():
+            self.statistic_tracker.increment_empty_buffer()
+        return await self.queue.get()
@@ -0,0 +1,93 @@
+from abc import ABC, abstractmethod
+
+from src.main.buffer.buffer import Buffer
+from src.main.buffer.buffer_status import BufferStatus
+from src.main.buffer.empty_buffer_exception import EmptyBufferException
+from src.main.buffer.full_buffer_exception import FullBufferException
+
+
+class BlockingBuffer(Buffer, ABC):
+    """
+    Abstract base class for buffers that can park the calling thread until
+    the requested operation is able to make progress.
+
+    In addition to the non-blocking `enqueue` and `dequeue` operations of
+    `Buffer`, blocking buffers provide `put` and `get`, which wait for free
+    space or an available item for up to an optional timeout.
+    """
+    @abstractmethod
+    def put(self,
+            number_to_enqueue: int,
+            timeout: float | None = None) -> None:
+        """
+        Adds a number to the buffer, waiting for free space if the buffer is
+        full.
+
+        :param number_to_enqueue: The number to be added to the buffer.
+        :type number_to_enqueue: int
+        :param timeout: The maximum number of seconds to wait for free space,
+            or None to wait indefinitely.
+        :type timeout: float | None
+        :raises FullBufferException: If the buffer is still full once the
+            timeout has elapsed.
+        :return: This method does not return anything.
+        :rtype: None
+        """
+        pass
+
+    @abstractmethod
+    def get(self, timeout: float | None = None) -> int:
+        """
+        Removes and returns the oldest number in the buffer, waiting for an
+        item if the buffer is empty.
+
+        :param timeout: The maximum number of seconds to wait for an item,
+            or None to wait indefinitely.
+        :type timeout: float | None
+        :raises EmptyBufferException: If the buffer is still empty once the
+            timeout has elapsed.
+        :return: The element removed from the buffer.
+        :rtype: int
+        """
+        pass
+
+    def try_put(self,
+                number_to_enqueue: int,
+                timeout: float | None = None) -> BufferStatus:
+        """
+        Adds a number to the buffer, waiting for free space if the buffer is
+        full, and reports a timeout through the return value.
+
+        :param number_to_enqueue: The number to be added to the buffer.
+        :type number_to_enqueue: int
+        :param timeout: The maximum number of seconds to wait for free space,
+            or None to wait indefinitely.
+        :type timeout: float | None
+        :return: `BufferStatus.OK` if the number was added, or
+            `BufferStatus.FULL` if the buffer was still full once the timeout
+            elapsed.
+        :rtype: BufferStatus
+        """
+        try:
+            self.put(number_to_enqueue, timeout)
+        except FullBufferException:
+            return BufferStatus.FULL
+        return BufferStatus.OK
+
+    def try_get(self, timeout: float | None = None) -> int | BufferStatus:
+        """
+        Removes and returns the oldest number in the buffer, waiting for an
+        item if the buffer is empty, and reports a timeout through the
+        `BufferStatus.EMPTY` sentinel.
+
+        :param timeout: The maximum number of seconds to wait for an item,
+            or None to wait indefinitely.
+        :type timeout: float | None
+        :return: The element removed from the buffer, or `BufferStatus.EMPTY`
+            if the buffer was still empty once the timeout elapsed.
+        :rtype: int | BufferStatus
+        """
+        try:
+            return self.get(timeout)
+        except EmptyBufferException:
+            return BufferStatus.EMPTY
@@ -0,0 +1,145 @@
+import logging
+import threading
+from collections import deque
+from threading import Condition
+
+from src.main.buffer.blocking_buffer import BlockingBuffer
+from src.main.buffer.empty_buffer_exception import EmptyBufferException
+from src.main.buffer.full_buffer_exception import FullBufferException
+from src.main.statistics.statistic_tracker import StatisticTracker
+from src.main.statistics.track_performance import track_performance
+
+
+class BlockingBufferQueue(BlockingBuffer):
+    """
+    A thread-safe bounded buffer queue which blocks instead of polling.
+
+    Producers waiting for free space park on the `not_full` condition and
+    consumers waiting for an item park on the `not_empty` condition. Both
+    conditions share a single lock, and every successful operation notifies
+    exactly one waiter on the opposite condition, which is the only thread
+    that is able to make progress.
+
+    :ivar buffer: A deque used to store the elements in the buffer.
+    :type buffer: collections.deque
+    :ivar lock: The lock shared by both condition variables.
+    :type lock: threading.Lock
+    :ivar not_full: Condition signalled when space becomes available.
+    :type not_full: Condition
+    :ivar not_empty: Condition signalled when an item becomes available.
+    :type not_empty: Condition
+    """
+    def __init__(self,
+                 buffer_size: int,
+                 statistic_tracker: StatisticTracker):
+        """
+        Initializes the blocking buffer queue with a buffer size and a
+        statistic tracker for monitoring.
+
+        :param buffer_size: The maximum number of elements the buffer can
+            hold.
+        :type buffer_size: int
+        :param statistic_tracker: An object responsible for tracking relevant
+            statistics.
+        :type statistic_tracker: StatisticTracker
+        """
+        super().__init__(buffer_size, statistic_tracker)
+        self.buffer: deque = deque()
+        self.lock: threading.Lock = threading.Lock()
+        self.not_full: Condition = threading.Condition(self.lock)
+        self.not_empty: Condition = threading.Condition(self.lock)
+
+    def is_empty(self) -> bool:
+        """
+        Determines if the buffer is empty.
+
+        :return: Boolean indicating whether the buffer is empty or not.
+        :rtype: bool
+        """
+        return len(self.buffer) == 0
+
+    def is_full(self) -> bool:
+        """
+        Checks if the buffer has reached its maximum capacity.
+
+        :return: True if the buffer is full, False otherwise.
+        :rtype: bool
+        """
+        return len(self.buffer) >= self.buffer_size
+
+    def enqueue(self, number_to_enqueue: int) -> None:
+        """
+        Adds a number to the queue without waiting. If the buffer is full,
+        raises a `FullBufferException`.
+
+        :param number_to_enqueue: The integer value to add to the queue.
+        :type number_to_enqueue: int
+        :return: None
+        :raises FullBufferException: If the buffer is full.
+        """
+        self.put(number_to_enqueue, timeout=0)
+
+    def dequeue(self) -> int:
+        """
+        Removes and returns the oldest item in the buffer without waiting.
+
+        :raises EmptyBufferException: If the buffer is empty.
+        :return: The oldest item in the buffer.
+        :rtype: int
+        """
+        return self.get(timeout=0)
+
+    @track_performance
+    def put(self,
+            number_to_enqueue: int,
+            timeout: float | None = None) -> None:
+        """
+        Adds a number to the queue, parking the calling thread on the
+        `not_full` condition while the buffer is full. Each call which finds
+        the buffer full is counted once by the statistic tracker.
+
+        :param number_to_enqueue: The integer value to add to the queue.
+        :type number_to_enqueue: int
+        :param timeout: The maximum number of seconds to wait for free space,
+            or None to wait indefinitely.
+        :type timeout: float | None
+        :raises FullBufferException: If the buffer is still full once the
+            timeout has elapsed.
+        :return: None
+        """
+        with self.not_full:
+            if self.is_full():
+                self.statistic_tracker.increment_full_buffer()
+                if not self.not_full.wait_for(lambda: not self.is_full(),
+                                              timeout):
+                    logging.debug("Buffer is full")
+                    raise FullBufferException()
+            self.buffer.appendleft(number_to_enqueue)
+            self.not_empty.notify()
+
+    @track_performance
+    def get(self, timeout: float | None = None) -> int:
+        """
+        Removes and returns the oldest item in the buffer, parking the
+        calling thread on the `not_empty` condition while the buffer is
+        empty. Each call which finds the buffer empty is counted once by the
+        statistic tracker.
+
+        :param timeout: The maximum number of seconds to wait for an item,
+            or None to wait indefinitely.
+        :type timeout: float | None
+        :raises EmptyBufferException: If the buffer is still empty once the
+            timeout has elapsed.
+        :return: The oldest item in the buffer.
+        :rtype: int
+        """
+        with self.not_empty:
+            if self.is_empty():
+                self.statistic_tracker.increment_empty_buffer()
+                if not self.not_empty.wait_for(lambda: not self.is_empty(),
+                                               timeout):
+                    logging.debug("Buffer is empty")
+                    raise EmptyBufferException()
+            number: int = self.buffer.pop()
+            self.not_full.notify()
+            return number
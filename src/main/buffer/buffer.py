@@ -1,6 +1,10 @@
 import logging
 from abc import ABC, abstractmethod
+from typing import List
 
+from src.main.buffer.buffer_status import BufferStatus
+from src.main.buffer.empty_buffer_exception import EmptyBufferException
+from src.main.buffer.full_buffer_exception import FullBufferException
 from src.main.statistics.statistic_tracker import StatisticTracker
 
 
@@ -19,6 +23,7 @@ class Buffer(ABC):
         with the buffer for monitoring buffer operations.
     :type statistic_tracker: StatisticTracker
     """
+    __slots__ = ('buffer_size', 'statistic_tracker')
     def __init__(self,
                  buffer_size: int,
                  statistic_tracker: StatisticTracker):
@@ -72,6 +77,99 @@ class Buffer(ABC):
         """
         pass
 
+    def try_enqueue(self, number_to_enqueue: int) -> BufferStatus:
+        """
+        Enqueues the provided number without raising when the buffer is full.
+        Implementations should override this to report a full buffer through
+        the return value alone; the default wraps `enqueue`.
+
+        :param number_to_enqueue: The number to be added to the buffer.
+        :type number_to_enqueue: int
+        :return: `BufferStatus.OK` if the number was enqueued, or
+            `BufferStatus.FULL` if the buffer was full.
+        :rtype: BufferStatus
+        """
+        try:
+            self.enqueue(number_to_enqueue)
+        except FullBufferException:
+            return BufferStatus.FULL
+        return BufferStatus.OK
+
+    def try_dequeue(self) -> int | BufferStatus:
+        """
+        Dequeues an element without raising when the buffer is empty.
+        Implementations should override this to report an empty buffer
+        through the return value alone; the default wraps `dequeue`.
+
+        :return: The dequeued element, or `BufferStatus.EMPTY` if the buffer
+            was empty.
+        :rtype: int | BufferStatus
+        """
+        try:
+            return self.dequeue()
+        except EmptyBufferException:
+            return BufferStatus.EMPTY
+
+    def enqueue_many(self, numbers_to_enqueue: List[int]) -> int:
+        """
+        Enqueues as many of the provided numbers as the buffer has room for,
+        in order. Implementations should override this to move the whole
+        batch under a single lock acquisition; the default enqueues the
+        numbers one at a time.
+
+        :param numbers_to_enqueue: The numbers to be added to the buffer.
+        :type numbers_to_enqueue: List[int]
+        :raises FullBufferException: If the buffer is full and none of the
+            numbers could be enqueued.
+        :return: The number of items that were enqueued, taken from the front
+            of the provided list.
+        :rtype: int
+        """
+        num_enqueued: int = 0
+        for number_to_enqueue in numbers_to_enqueue:
+            try:
+                self.enqueue(number_to_enqueue)
+            except FullBufferException:
+                if num_enqueued == 0:
+                    raise
+                break
+            num_enqueued += 1
+        return num_enqueued
+
+    def dequeue_many(self, max_items: int) -> List[int]:
+        """
+        Dequeues up to the given number of items, oldest first.
+        Implementations should override this to move the whole batch under a
+        single lock acquisition; the default dequeues the items one at a
+        time.
+
+        :param max_items: The maximum number of items to dequeue.
+        :type max_items: int
+        :raises EmptyBufferException: If the buffer is empty and no item could
+            be dequeued.
+        :return: The dequeued items, oldest first.
+        :rtype: List[int]
+        """
+        dequeued_numbers: List[int] = []
+        while len(dequeued_numbers) < max_items:
+            try:
+                dequeued_numbers.append(self.dequeue())
+            except EmptyBufferException:
+                if not dequeued_numbers:
+                    raise
+                break
+        return dequeued_numbers
+
+    def close(self) -> None:
+        """
+        Releases any resources held by the buffer outside of the Python heap.
+        The default does nothing; buffers backed by operating system resources
+        override it.
+
+        :return: None
+        """
+        pass
+
     @abstractmethod
     def is_empty(self) -> bool:
         """
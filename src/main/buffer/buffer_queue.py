@@ -1,14 +1,15 @@
 import logging
 from collections import deque
+from typing import List
 
 from src.main.buffer.buffer import Buffer
+from src.main.buffer.buffer_status import BufferStatus
 from src.main.buffer.empty_buffer_exception import EmptyBufferException
 from src.main.buffer.full_buffer_exception import FullBufferException
 from src.main.statistics.statistic_tracker import StatisticTracker
-from src.main.statistics.track_performance import track_performance, \
-    track_exceptions
-from src.main.thread.critical_section import critical_section
-from src.main.thread.processor.lock.mutex_lock import MutexLock
+from src.main.statistics.tracking_mode import TrackingMode
+from src.main.thread.critical_section import tracked_critical_section
+from src.main.thread.processor.lock.lock import Lock
 
 
 class BufferQueue(Buffer):
@@ -24,14 +25,14 @@ class BufferQueue(Buffer):
     fixed maximum length.
     :type buffer: collections.deque
     :ivar mutex_lock: A lock used to manage concurrent access to the buffer.
-    :type mutex_lock: MutexLock
+    :type mutex_lock: Lock
     :ivar statistic_tracker: An object used for tracking statistics related to
      the buffer's operation.
     :type statistic_tracker: StatisticTracker
     """
     def __init__(self,
                  buffer_size: int,
-                 mutex_lock: MutexLock,
+                 mutex_lock: Lock,
                  statistic_tracker: StatisticTracker):
         """
         Initializes the class with a buffer size, a mutex lock for
@@ -41,14 +42,14 @@ class BufferQueue(Buffer):
             can hold.
         :type buffer_size: int
         :param mutex_lock: A lock used to synchronize access to the buffer.
-        :type mutex_lock: MutexLock
+        :type mutex_lock: Lock
         :param statistic_tracker: An object responsible for tracking relevant
         statistics.
         :type statistic_tracker: StatisticTracker
         """
         super().__init__(buffer_size, statistic_tracker)
         self.buffer: deque = deque(maxlen=buffer_size)
-        self.mutex_lock: MutexLock = mutex_lock
+        self.mutex_lock: Lock = mutex_lock
 
     def is_empty(self) -> bool:
         """
@@ -74,49 +75,121 @@ class BufferQueue(Buffer):
         """
         return len(self.buffer) == self.buffer.maxlen
 
-    @track_performance
-    @critical_section
-    @track_exceptions
-    def enqueue(self, number_to_enqueue: int) -> None:
+    @tracked_critical_section
+    def try_enqueue(self, number_to_enqueue: int) -> BufferStatus:
         """
-        Adds a number to the queue if the buffer is not full. If the buffer is
-        full, raises a `FullBufferException`.
+        Adds a number to the queue if the buffer is not full. A full buffer
+        is reported through the return value instead of an exception.
 
         This method ensures thread safety using a critical section decorator
-        and tracks function performance and exceptions through the applied
+        and tracks function performance and full buffers through the applied
         decorators.
 
         :param number_to_enqueue: The integer value to add to the queue.
         :type number_to_enqueue: int
-        :return: None
-        :raises FullBufferException: If the buffer is full and no space is
-            available to add the number.
+        :return: `BufferStatus.OK` if the number was added, or
+            `BufferStatus.FULL` if the buffer was full.
+        :rtype: BufferStatus
         """
         if not self.is_full():
             self.buffer.appendleft(number_to_enqueue)
-        else:
+            return BufferStatus.OK
+        if TrackingMode.is_verbose:
             logging.debug("Buffer is full")
+        return BufferStatus.FULL
+
+    @tracked_critical_section
+    def try_dequeue(self) -> int | BufferStatus:
+        """
+        Removes and returns the last item in the buffer if it is not empty.
+        An empty buffer is reported through the `BufferStatus.EMPTY` sentinel
+        instead of an exception.
+
+        :return: The last item in the buffer, or `BufferStatus.EMPTY` if the
+            buffer was empty.
+        :rtype: int | BufferStatus
+        """
+        if not self.is_empty():
+            return self.buffer.pop()
+        if TrackingMode.is_verbose:
+            logging.debug("Buffer is empty")
+        return BufferStatus.EMPTY
+
+    def enqueue(self, number_to_enqueue: int) -> None:
+        """
+        Adds a number to the queue if the buffer is not full. If the buffer is
+        full, raises a `FullBufferException`. Kept for compatibility; it
+        wraps `try_enqueue`.
+
+        :param number_to_enqueue: The integer value to add to the queue.
+        :type number_to_enqueue: int
+        :return: None
+        :raises FullBufferException: If the buffer is full and no space is
+            available to add the number.
+        """
+        if self.try_enqueue(number_to_enqueue) is BufferStatus.FULL:
             raise FullBufferException()
 
-    @track_performance
-    @critical_section
-    @track_exceptions
     def dequeue(self) -> int:
         """
-        Dequeues an item from the buffer.
-
-        This method removes and returns the last item in the buffer if it is
-        not empty. If the buffer is empty, an exception is raised instead.
-        The method is decorated with performance tracking, critical section
-        locking, and exception tracking functionality.
+        Removes and returns the last item in the buffer if it is not empty.
+        If the buffer is empty, an exception is raised instead. Kept for
+        compatibility; it wraps `try_dequeue`.
 
         :raises EmptyBufferException: Raised when attempting to dequeue from
         an empty buffer.
         :return: The last item in the buffer.
         :rtype: int
         """
-        if not self.is_empty():
-            return self.buffer.pop()
+        number: int | BufferStatus = self.try_dequeue()
+        if number is BufferStatus.EMPTY:
+            raise EmptyBufferException()
+        return number
+
+    @tracked_critical_section
+    def enqueue_many(self, numbers_to_enqueue: List[int]) -> int:
+        """
+        Adds as many of the provided numbers as fit in the buffer under a
+        single acquisition of the mutex lock. If the buffer is full, raises a
+        `FullBufferException`.
+
+        :param numbers_to_enqueue: The integer values to add to the queue, in
+            order.
+        :type numbers_to_enqueue: List[int]
+        :return: The number of items that were enqueued, taken from the front
+            of the provided list.
+        :rtype: int
+        :raises FullBufferException: If the buffer is full and no number could
+            be enqueued.
+        """
+        num_free_slots: int = self.buffer.maxlen - len(self.buffer)
+        if num_free_slots > 0:
+            accepted_numbers: List[int] = numbers_to_enqueue[:num_free_slots]
+            self.buffer.extendleft(accepted_numbers)
+            return len(accepted_numbers)
         else:
-            logging.debug("Buffer is empty")
-            raise EmptyBufferException()
\ No newline at end of file
+            if TrackingMode.is_verbose:
+                logging.debug("Buffer is full")
+            raise FullBufferException()
+
+    @tracked_critical_section
+    def dequeue_many(self, max_items: int) -> List[int]:
+        """
+        Removes and returns up to the given number of items, oldest first,
+        under a single acquisition of the mutex lock. If the buffer is empty,
+        an exception is raised instead.
+
+        :param max_items: The maximum number of items to dequeue.
+        :type max_items: int
+        :raises EmptyBufferException: Raised when attempting to dequeue from
+            an empty buffer.
+        :return: The dequeued items, oldest first.
+        :rtype: List[int]
+        """
+        num_items: int = min(max_items, len(self.buffer))
+        if num_items > 0:
+            return [self.buffer.pop() for _ in range(num_items)]
+        else:
+            if TrackingMode.is_verbose:
+                logging.debug("Buffer is empty")
+            raise EmptyBufferException()
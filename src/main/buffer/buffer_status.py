@@ -0,0 +1,19 @@
+from enum import Enum
+
+
+class BufferStatus(Enum):
+    """
+    This Enum class defines the outcomes of the non-raising buffer
+    operations. `EMPTY` also serves as the sentinel returned instead of an
+    item when nothing could be dequeued.
+
+    :ivar OK: The operation succeeded.
+    :type OK: str
+    :ivar FULL: The buffer was full, so nothing was enqueued.
+    :type FULL: str
+    :ivar EMPTY: The buffer was empty, so nothing was dequeued.
+    :type EMPTY: str
+    """
+    OK: str = 'ok'
+    FULL: str = 'full'
+    EMPTY: str = 'empty'
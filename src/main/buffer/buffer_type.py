@@ -0,0 +1,45 @@
+from enum import Enum
+
+
+class BufferType(Enum):
+    """
+    This Enum class defines the buffer implementations the simulator can be
+    configured to use, keyed by the name accepted on the command line.
+
+    :ivar QUEUE: A deque protected by a mutex lock which raises when the
+        buffer is full or empty.
+    :type QUEUE: str
+    :ivar BLOCKING: A deque guarded by not-full and not-empty condition
+        variables which parks waiting threads instead of raising.
+    :type BLOCKING: str
+    :ivar SPSC: A lock-free ring for one producer and one consumer.
+    :type SPSC: str
+    :ivar ARRAY: A preallocated ring of unboxed 64-bit integers.
+    :type ARRAY: str
+    :ivar SHARDED: Independently locked sub-queues, one per consumer, with
+        work stealing.
+    :type SHARDED: str
+    :ivar PRIORITY: A heap which dequeues urgent items before bulk items.
+    :type PRIORITY: str
+    :ivar SHARED_MEMORY: A ring of 64-bit integers in a shared memory block
+        which can be used from several processes.
+    :type SHARED_MEMORY: str
+    :ivar MMAP: A circular log of 64-bit integers in a memory-mapped file.
+    :type MMAP: str
+    :ivar ELASTIC: A mutex-protected deque whose capacity grows and shrinks
+        with the rate of full and empty buffer events.
+    :type ELASTIC: str
+    :ivar SEMAPHORE: A ring guarded by counting semaphores for free and
+        full slots and a mutex around the ring indices.
+    :type SEMAPHORE: str
+    """
+    QUEUE: str = 'queue'
+    BLOCKING: str = 'blocking'
+    SPSC: str = 'spsc'
+    ARRAY: str = 'array'
+    SHARDED: str = 'sharded'
+    PRIORITY: str = 'priority'
+    SHARED_MEMORY: str = 'shared-memory'
+    MMAP: str = 'mmap'
+    ELASTIC: str = 'elastic'
+    SEMAPHORE: str = 'semaphore'
@@ -0,0 +1,169 @@
+import logging
+from collections import deque
+from typing import List
+
+from src.main.buffer.buffer_queue import BufferQueue
+from src.main.buffer.buffer_status import BufferStatus
+from src.main.buffer.empty_buffer_exception import EmptyBufferException
+from src.main.buffer.full_buffer_exception import FullBufferException
+from src.main.statistics.buffer_event import BufferEvent
+from src.main.statistics.statistic_tracker import StatisticTracker
+from src.main.thread.critical_section import critical_section
+from src.main.thread.processor.lock.lock import Lock
+
+
+class ElasticBufferQueue(BufferQueue):
+    """
+    A buffer queue whose capacity changes while the simulation runs.
+
+    Every time a producer finds the buffer full or a consumer finds it empty,
+    the queue looks at the rolling window of recent buffer events kept by the
+    statistic tracker. Once the window is filled, the capacity grows when most
+    events are full buffers, and shrinks when there was no full buffer at all,
+    staying within the configured bounds. The window is cleared after every
+    resize, so each decision is based on events seen at the current capacity.
+    The queue never shrinks below the number of items it holds.
+
+    :ivar min_buffer_size: The smallest capacity the queue shrinks to.
+    :type min_buffer_size: int
+    :ivar max_buffer_size: The largest capacity the queue grows to.
+    :type max_buffer_size: int
+    """
+    GROW_FACTOR: float = 2.0
+    SHRINK_FACTOR: float = 0.75
+    GROW_THRESHOLD: float = 0.5
+    def __init__(self,
+                 buffer_size: int,
+                 mutex_lock: Lock,
+                 statistic_tracker: StatisticTracker,
+                 min_buffer_size: int,
+                 max_buffer_size: int):
+        """
+        Initializes the queue with a starting capacity clamped to the given
+        bounds.
+
+        :param buffer_size: The starting capacity of the queue.
+        :type buffer_size: int
+        :param mutex_lock: A lock used to synchronize access to the buffer.
+        :type mutex_lock: Lock
+        :param statistic_tracker: An object responsible for tracking relevant
+            statistics, including the rolling window of buffer events.
+        :type statistic_tracker: StatisticTracker
+        :param min_buffer_size: The smallest capacity the queue shrinks to.
+        :type min_buffer_size: int
+        :param max_buffer_size: The largest capacity the queue grows to.
+        :type max_buffer_size: int
+        """
+        super().__init__(min(max(buffer_size, min_buffer_size), max_buffer_size),
+                         mutex_lock,
+                         statistic_tracker)
+        self.min_buffer_size: int = min_buffer_size
+        self.max_buffer_size: int = max_buffer_size
+
+    def try_enqueue(self, number_to_enqueue: int) -> BufferStatus:
+        """
+        Adds a number to the queue, adjusting the capacity if the buffer was
+        full.
+
+        :param number_to_enqueue: The integer value to add to the queue.
+        :type number_to_enqueue: int
+        :return: `BufferStatus.OK` if the number was added, or
+            `BufferStatus.FULL` if the buffer was full.
+        :rtype: BufferStatus
+        """
+        buffer_status: BufferStatus = super().try_enqueue(number_to_enqueue)
+        if buffer_status is BufferStatus.FULL:
+            self.adjust_buffer_size()
+        return buffer_status
+
+    def try_dequeue(self) -> int | BufferStatus:
+        """
+        Removes and returns the oldest item, adjusting the capacity if the
+        buffer was empty.
+
+        :return: The oldest item in the buffer, or `BufferStatus.EMPTY` if
+            the buffer was empty.
+        :rtype: int | BufferStatus
+        """
+        number: int | BufferStatus = super().try_dequeue()
+        if number is BufferStatus.EMPTY:
+            self.adjust_buffer_size()
+        return number
+
+    def enqueue_many(self, numbers_to_enqueue: List[int]) -> int:
+        """
+        Adds as many of the provided numbers as fit in the buffer, adjusting
+        the capacity if the buffer was full.
+
+        :param numbers_to_enqueue: The integer values to add to the queue, in
+            order.
+        :type numbers_to_enqueue: List[int]
+        :return: The number of items that were enqueued.
+        :rtype: int
+        :raises FullBufferException: If the buffer is full and no number could
+            be enqueued.
+        """
+        try:
+            return super().enqueue_many(numbers_to_enqueue)
+        except FullBufferException:
+            self.adjust_buffer_size()
+            raise
+
+    def dequeue_many(self, max_items: int) -> List[int]:
+        """
+        Removes and returns up to the given number of items, adjusting the
+        capacity if the buffer was empty.
+
+        :param max_items: The maximum number of items to dequeue.
+        :type max_items: int
+        :raises EmptyBufferException: If the buffer is empty.
+        :return: The dequeued items, oldest first.
+        :rtype: List[int]
+        """
+        try:
+            return super().dequeue_many(max_items)
+        except EmptyBufferException:
+            self.adjust_buffer_size()
+            raise
+
+    @critical_section
+    def adjust_buffer_size(self) -> None:
+        """
+        Resizes the queue once the rolling window of buffer events is filled:
+        it grows if most events were full buffers and shrinks if none were.
+
+        :return: None
+        """
+        statistic_tracker: StatisticTracker = self.statistic_tracker
+        num_events: int = len(statistic_tracker.recent_buffer_events)
+        if num_events < StatisticTracker.BUFFER_EVENT_WINDOW:
+            return
+        num_full: int = statistic_tracker.count_recent_buffer_events(BufferEvent.FULL)
+        new_buffer_size: int = self.buffer_size
+        if num_full > num_events * ElasticBufferQueue.GROW_THRESHOLD:
+            new_buffer_size = min(self.max_buffer_size,
+                                  int(self.buffer_size * ElasticBufferQueue.GROW_FACTOR) + 1)
+        elif num_full == 0:
+            new_buffer_size = max(self.min_buffer_size,
+                                  len(self.buffer),
+                                  int(self.buffer_size * ElasticBufferQueue.SHRINK_FACTOR))
+        statistic_tracker.clear_recent_buffer_events()
+        if new_buffer_size != self.buffer_size:
+            self.resize(new_buffer_size)
+
+    def resize(self, new_buffer_size: int) -> None:
+        """
+        Replaces the underlying deque with one of the given capacity, keeping
+        all buffered items. The caller must hold the mutex lock, and the new
+        size must not be smaller than the number of buffered items.
+
+        :param new_buffer_size: The new capacity of the queue.
+        :type new_buffer_size: int
+        :return: None
+        """
+        old_buffer_size: int = self.buffer_size
+        self.buffer = deque(self.buffer, maxlen=new_buffer_size)
+        self.buffer_size = new_buffer_size
+        elapsed_time: float = self.statistic_tracker.add_buffer_resize(new_buffer_size)
+        logging.info(f"Resized buffer from {old_buffer_size} to "
+                     f"{new_buffer_size} at {elapsed_time:.3f} seconds")
@@ -0,0 +1,136 @@
+import logging
+import mmap
+import struct
+import tempfile
+from typing import BinaryIO
+
+from src.main.buffer.buffer import Buffer
+from src.main.buffer.empty_buffer_exception import EmptyBufferException
+from src.main.buffer.full_buffer_exception import FullBufferException
+from src.main.statistics.statistic_tracker import StatisticTracker
+from src.main.statistics.tracking_mode import TrackingMode
+from src.main.thread.critical_section import tracked_critical_section
+from src.main.thread.processor.lock.lock import Lock
+
+
+class MmapRingBuffer(Buffer):
+    """
+    A thread-safe, fixed-capacity ring buffer whose integer records are stored
+    in a memory-mapped temporary file used as a circular log.
+
+    The file is created sparse, so disk blocks are only allocated for records
+    which have been written, and the operating system page cache decides which
+    pages stay resident. Producers and consumers only touch the pages around
+    the tail and head of the log, so resident memory stays flat regardless of
+    the buffer size. The file is deleted when the buffer is closed.
+
+    :ivar log_file: The temporary file backing the log.
+    :type log_file: BinaryIO
+    :ivar log: The memory map over the log file.
+    :type log: mmap.mmap
+    :ivar mutex_lock: A lock used to manage concurrent access to the buffer.
+    :type mutex_lock: Lock
+    :ivar head: The index of the oldest record in the log.
+    :type head: int
+    :ivar count: The number of records currently held in the log.
+    :type count: int
+    """
+    RECORD_FORMAT: struct.Struct = struct.Struct('<q')
+    def __init__(self,
+                 buffer_size: int,
+                 mutex_lock: Lock,
+                 statistic_tracker: StatisticTracker):
+        """
+        Initializes the buffer by creating a sparse temporary file with room
+        for the given number of records and mapping it into memory.
+
+        :param buffer_size: The maximum number of integers the log can hold.
+        :type buffer_size: int
+        :param mutex_lock: A lock used to synchronize access to the buffer.
+        :type mutex_lock: Lock
+        :param statistic_tracker: An object responsible for tracking relevant
+            statistics.
+        :type statistic_tracker: StatisticTracker
+        """
+        super().__init__(buffer_size, statistic_tracker)
+        log_size: int = max(buffer_size, 1) * MmapRingBuffer.RECORD_FORMAT.size
+        self.log_file: BinaryIO = tempfile.TemporaryFile()
+        self.log_file.truncate(log_size)
+        self.log: mmap.mmap = mmap.mmap(self.log_file.fileno(), log_size)
+        self.mutex_lock: Lock = mutex_lock
+        self.head: int = 0
+        self.count: int = 0
+        logging.debug(f"Memory-mapped log of {log_size:,} bytes created.")
+
+    def is_empty(self) -> bool:
+        """
+        Determines if the log is empty.
+
+        :return: Boolean indicating whether the buffer is empty or not.
+        :rtype: bool
+        """
+        return self.count == 0
+
+    def is_full(self) -> bool:
+        """
+        Checks if the log has reached its capacity.
+
+        :return: True if the buffer is full, False otherwise.
+        :rtype: bool
+        """
+        return self.count >= self.buffer_size
+
+    @tracked_critical_section
+    def enqueue(self, number_to_enqueue: int) -> None:
+        """
+        Writes an integer record after the newest record if the buffer is not
+        full. If the buffer is full, raises a `FullBufferException`.
+
+        :param number_to_enqueue: The integer value to add to the log. It must
+            fit in a signed 64-bit integer.
+        :type number_to_enqueue: int
+        :return: None
+        :raises FullBufferException: If the buffer is full.
+        :raises struct.error: If the number does not fit in 64 bits.
+        """
+        if not self.is_full():
+            tail: int = (self.head + self.count) % self.buffer_size
+            MmapRingBuffer.RECORD_FORMAT.pack_into(
+                self.log, tail * MmapRingBuffer.RECORD_FORMAT.size,
+                number_to_enqueue)
+            self.count += 1
+        else:
+            if TrackingMode.is_verbose:
+                logging.debug("Buffer is full")
+            raise FullBufferException()
+
+    @tracked_critical_section
+    def dequeue(self) -> int:
+        """
+        Reads and removes the oldest integer record if the buffer is not
+        empty. If the buffer is empty, an exception is raised instead.
+
+        :raises EmptyBufferException: Raised when attempting to dequeue from
+            an empty buffer.
+        :return: The oldest item in the log.
+        :rtype: int
+        """
+        if not self.is_empty():
+            number: int = MmapRingBuffer.RECORD_FORMAT.unpack_from(
+                self.log, self.head * MmapRingBuffer.RECORD_FORMAT.size)[0]
+            self.head = (self.head + 1) % self.buffer_size
+            self.count -= 1
+            return number
+        else:
+            if TrackingMode.is_verbose:
+                logging.debug("Buffer is empty")
+            raise EmptyBufferException()
+
+    def close(self) -> None:
+        """
+        Unmaps the log and deletes its backing file.
+
+        :return: None
+        """
+        self.log.close()
+        self.log_file.close()
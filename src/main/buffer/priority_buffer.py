@@ -0,0 +1,231 @@
+import heapq
+import itertools
+import logging
+import time
+from typing import List, Tuple
+
+from src.main.buffer.buffer import Buffer
+from src.main.buffer.buffer_status import BufferStatus
+from src.main.buffer.empty_buffer_exception import EmptyBufferException
+from src.main.buffer.full_buffer_exception import FullBufferException
+from src.main.buffer.priority_class import PriorityClass
+from src.main.statistics.statistic_tracker import StatisticTracker
+from src.main.statistics.tracking_mode import TrackingMode
+from src.main.thread.critical_section import tracked_critical_section
+from src.main.thread.processor.lock.lock import Lock
+
+
+class PriorityBuffer(Buffer):
+    """
+    A thread-safe bounded buffer which dequeues items by priority class.
+
+    Items are kept in a binary heap ordered by priority class and then by an
+    enqueue sequence number, so urgent items overtake bulk items while items
+    of the same class stay in FIFO order. Both operations cost O(log n). The
+    time each item waited in the buffer is reported to the statistic tracker
+    per priority class.
+
+    :ivar heap: The heap of buffered entries, each holding the class value,
+        the sequence number, the enqueue time in nanoseconds, the priority
+        class and the item.
+    :type heap: List[Tuple[int, int, int, PriorityClass, int]]
+    :ivar mutex_lock: A lock used to manage concurrent access to the buffer.
+    :type mutex_lock: Lock
+    """
+    def __init__(self,
+                 buffer_size: int,
+                 mutex_lock: Lock,
+                 statistic_tracker: StatisticTracker):
+        """
+        Initializes the priority buffer with a buffer size, a mutex lock for
+        thread-safety, and a statistic tracker for monitoring.
+
+        :param buffer_size: The maximum number of elements the heap can hold.
+        :type buffer_size: int
+        :param mutex_lock: A lock used to synchronize access to the buffer.
+        :type mutex_lock: Lock
+        :param statistic_tracker: An object responsible for tracking relevant
+            statistics.
+        :type statistic_tracker: StatisticTracker
+        """
+        super().__init__(buffer_size, statistic_tracker)
+        self.heap: List[Tuple[int, int, int, PriorityClass, int]] = []
+        self.mutex_lock: Lock = mutex_lock
+        self.sequence: itertools.count = itertools.count()
+
+    def is_empty(self) -> bool:
+        """
+        Determines if the buffer is empty.
+
+        :return: Boolean indicating whether the buffer is empty or not.
+        :rtype: bool
+        """
+        return len(self.heap) == 0
+
+    def is_full(self) -> bool:
+        """
+        Checks if the buffer has reached its capacity.
+
+        :return: True if the buffer is full, False otherwise.
+        :rtype: bool
+        """
+        return len(self.heap) >= self.buffer_size
+
+    def enqueue(self, number_to_enqueue: int) -> None:
+        """
+        Adds a number to the buffer with the bulk priority class.
+
+        :param number_to_enqueue: The integer value to add to the buffer.
+        :type number_to_enqueue: int
+        :return: None
+        :raises FullBufferException: If the buffer is full.
+        """
+        self.enqueue_with_priority(number_to_enqueue, PriorityClass.BULK)
+
+    def try_enqueue(self, number_to_enqueue: int) -> BufferStatus:
+        """
+        Adds a number to the buffer with the bulk priority class without
+        raising when the buffer is full.
+
+        :param number_to_enqueue: The integer value to add to the buffer.
+        :type number_to_enqueue: int
+        :return: `BufferStatus.OK` if the number was added, or
+            `BufferStatus.FULL` if the buffer was full.
+        :rtype: BufferStatus
+        """
+        return self.try_enqueue_with_priority(number_to_enqueue,
+                                              PriorityClass.BULK)
+
+    def enqueue_many(self, numbers_to_enqueue: List[int]) -> int:
+        """
+        Adds as many of the provided numbers as fit in the buffer with the
+        bulk priority class, under a single acquisition of the mutex lock.
+
+        :param numbers_to_enqueue: The integer values to add to the buffer,
+            in order.
+        :type numbers_to_enqueue: List[int]
+        :return: The number of items that were enqueued, taken from the front
+            of the provided list.
+        :rtype: int
+        :raises FullBufferException: If the buffer is full and no number could
+            be enqueued.
+        """
+        return self.enqueue_many_with_priority(numbers_to_enqueue,
+                                               [PriorityClass.BULK] * len(numbers_to_enqueue))
+
+    @tracked_critical_section
+    def enqueue_many_with_priority(self,
+                                   numbers_to_enqueue: List[int],
+                                   priority_classes: List[PriorityClass]) -> int:
+        """
+        Adds as many of the provided numbers as fit in the buffer, each
+        tagged with its own priority class, under a single acquisition of the
+        mutex lock. If the buffer is full, raises a `FullBufferException`.
+
+        :param numbers_to_enqueue: The integer values to add to the buffer,
+            in order.
+        :type numbers_to_enqueue: List[int]
+        :param priority_classes: The priority class of every number.
+        :type priority_classes: List[PriorityClass]
+        :return: The number of items that were enqueued, taken from the front
+            of the provided list.
+        :rtype: int
+        :raises FullBufferException: If the buffer is full and no number could
+            be enqueued.
+        """
+        num_free_slots: int = self.buffer_size - len(self.heap)
+        if num_free_slots > 0:
+            enqueue_time: int = time.perf_counter_ns()
+            accepted_numbers: List[int] = numbers_to_enqueue[:num_free_slots]
+            for number_to_enqueue, priority_class in zip(accepted_numbers, priority_classes):
+                heapq.heappush(self.heap, (priority_class.value,
+                                           next(self.sequence),
+                                           enqueue_time,
+                                           priority_class,
+                                           number_to_enqueue))
+            return len(accepted_numbers)
+        if TrackingMode.is_verbose:
+            logging.debug("Buffer is full")
+        raise FullBufferException()
+
+    def enqueue_with_priority(self,
+                              number_to_enqueue: int,
+                              priority_class: PriorityClass) -> None:
+        """
+        Adds a number tagged with a priority class to the buffer if it is not
+        full. If the buffer is full, raises a `FullBufferException`. Kept for
+        compatibility; it wraps `try_enqueue_with_priority`.
+
+        :param number_to_enqueue: The integer value to add to the buffer.
+        :type number_to_enqueue: int
+        :param priority_class: The priority class of the number.
+        :type priority_class: PriorityClass
+        :return: None
+        :raises FullBufferException: If the buffer is full.
+        """
+        if self.try_enqueue_with_priority(number_to_enqueue,
+                                          priority_class) is BufferStatus.FULL:
+            raise FullBufferException()
+
+    @tracked_critical_section
+    def try_enqueue_with_priority(self,
+                                  number_to_enqueue: int,
+                                  priority_class: PriorityClass) -> BufferStatus:
+        """
+        Adds a number tagged with a priority class to the buffer if it is not
+        full. A full buffer is reported through the return value.
+
+        :param number_to_enqueue: The integer value to add to the buffer.
+        :type number_to_enqueue: int
+        :param priority_class: The priority class of the number.
+        :type priority_class: PriorityClass
+        :return: `BufferStatus.OK` if the number was added, or
+            `BufferStatus.FULL` if the buffer was full.
+        :rtype: BufferStatus
+        """
+        if not self.is_full():
+            heapq.heappush(self.heap, (priority_class.value,
+                                       next(self.sequence),
+                                       time.perf_counter_ns(),
+                                       priority_class,
+                                       number_to_enqueue))
+            return BufferStatus.OK
+        if TrackingMode.is_verbose:
+            logging.debug("Buffer is full")
+        return BufferStatus.FULL
+
+    def dequeue(self) -> int:
+        """
+        Removes and returns the oldest item of the most urgent priority class
+        in the buffer. If the buffer is empty, an exception is raised
+        instead. Kept for compatibility; it wraps `try_dequeue`.
+
+        :raises EmptyBufferException: Raised when attempting to dequeue from
+            an empty buffer.
+        :return: The dequeued item.
+        :rtype: int
+        """
+        number: int | BufferStatus = self.try_dequeue()
+        if number is BufferStatus.EMPTY:
+            raise EmptyBufferException()
+        return number
+
+    @tracked_critical_section
+    def try_dequeue(self) -> int | BufferStatus:
+        """
+        Removes and returns the oldest item of the most urgent priority class
+        in the buffer and records how long it waited. An empty buffer is
+        reported through the `BufferStatus.EMPTY` sentinel.
+
+        :return: The dequeued item, or `BufferStatus.EMPTY` if the buffer was
+            empty.
+        :rtype: int | BufferStatus
+        """
+        if not self.is_empty():
+            _, _, enqueue_time, priority_class, number = heapq.heappop(self.heap)
+            self.statistic_tracker.add_priority_wait_time(
+                priority_class, time.perf_counter_ns() - enqueue_time)
+            return number
+        if TrackingMode.is_verbose:
+            logging.debug("Buffer is empty")
+        return BufferStatus.EMPTY
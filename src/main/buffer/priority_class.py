@@ -0,0 +1,16 @@
+from enum import Enum
+
+
+class PriorityClass(Enum):
+    """
+    This Enum class defines the priority classes items can be tagged with
+    when they are enqueued into a priority buffer. Lower values are dequeued
+    first.
+
+    :ivar URGENT: Items which are dequeued before any bulk item.
+    :type URGENT: int
+    :ivar BULK: Items without any urgency.
+    :type BULK: int
+    """
+    URGENT: int = 0
+    BULK: int = 1
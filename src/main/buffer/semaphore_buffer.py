@@ -0,0 +1,160 @@
+import logging
+import threading
+from typing import List
+
+from src.main.buffer.blocking_buffer import BlockingBuffer
+from src.main.buffer.empty_buffer_exception import EmptyBufferException
+from src.main.buffer.full_buffer_exception import FullBufferException
+from src.main.statistics.statistic_tracker import StatisticTracker
+from src.main.statistics.track_performance import track_performance
+from src.main.thread.processor.lock.lock import Lock
+
+
+class SemaphoreBuffer(BlockingBuffer):
+    """
+    The textbook bounded buffer built from two counting semaphores and a
+    mutex.
+
+    The `empty_slots` semaphore counts free slots and the `full_slots`
+    semaphore counts buffered items. A producer takes a free slot before
+    writing and releases a full slot afterwards, and a consumer does the
+    opposite, so threads park on the semaphores instead of polling. The mutex
+    lock is only held while the ring indices are updated.
+
+    :ivar slots: The ring of buffered items.
+    :type slots: List[int]
+    :ivar empty_slots: Semaphore counting the free slots.
+    :type empty_slots: threading.Semaphore
+    :ivar full_slots: Semaphore counting the buffered items.
+    :type full_slots: threading.Semaphore
+    :ivar mutex_lock: A lock guarding the ring indices.
+    :type mutex_lock: Lock
+    :ivar head: The index of the oldest item in the ring.
+    :type head: int
+    :ivar tail: The index of the next free slot in the ring.
+    :type tail: int
+    :ivar count: The number of buffered items.
+    :type count: int
+    """
+    def __init__(self,
+                 buffer_size: int,
+                 mutex_lock: Lock,
+                 statistic_tracker: StatisticTracker):
+        """
+        Initializes the buffer with all slots free.
+
+        :param buffer_size: The maximum number of elements the buffer can
+            hold.
+        :type buffer_size: int
+        :param mutex_lock: A lock used to guard the ring indices.
+        :type mutex_lock: Lock
+        :param statistic_tracker: An object responsible for tracking relevant
+            statistics.
+        :type statistic_tracker: StatisticTracker
+        """
+        super().__init__(buffer_size, statistic_tracker)
+        self.slots: List[int] = [0] * buffer_size
+        self.empty_slots: threading.Semaphore = threading.Semaphore(buffer_size)
+        self.full_slots: threading.Semaphore = threading.Semaphore(0)
+        self.mutex_lock: Lock = mutex_lock
+        self.head: int = 0
+        self.tail: int = 0
+        self.count: int = 0
+
+    def is_empty(self) -> bool:
+        """
+        Determines if the buffer is empty.
+
+        :return: Boolean indicating whether the buffer is empty or not.
+        :rtype: bool
+        """
+        return self.count == 0
+
+    def is_full(self) -> bool:
+        """
+        Checks if the buffer has reached its maximum capacity.
+
+        :return: True if the buffer is full, False otherwise.
+        :rtype: bool
+        """
+        return self.count >= self.buffer_size
+
+    def enqueue(self, number_to_enqueue: int) -> None:
+        """
+        Adds a number to the buffer without waiting. If the buffer is full,
+        raises a `FullBufferException`.
+
+        :param number_to_enqueue: The integer value to add to the buffer.
+        :type number_to_enqueue: int
+        :return: None
+        :raises FullBufferException: If the buffer is full.
+        """
+        self.put(number_to_enqueue, timeout=0)
+
+    def dequeue(self) -> int:
+        """
+        Removes and returns the oldest item in the buffer without waiting.
+
+        :raises EmptyBufferException: If the buffer is empty.
+        :return: The oldest item in the buffer.
+        :rtype: int
+        """
+        return self.get(timeout=0)
+
+    @track_performance
+    def put(self,
+            number_to_enqueue: int,
+            timeout: float | None = None) -> None:
+        """
+        Takes a free slot, parking the calling thread on the `empty_slots`
+        semaphore while the buffer is full, writes the number into it and
+        signals a full slot. Each call which finds the buffer full is counted
+        once by the statistic tracker.
+
+        :param number_to_enqueue: The integer value to add to the buffer.
+        :type number_to_enqueue: int
+        :param timeout: The maximum number of seconds to wait for a free
+            slot, or None to wait indefinitely.
+        :type timeout: float | None
+        :raises FullBufferException: If no slot was freed before the timeout
+            elapsed.
+        :return: None
+        """
+        if not self.empty_slots.acquire(blocking=False):
+            self.statistic_tracker.increment_full_buffer()
+            if not self.empty_slots.acquire(timeout=timeout):
+                logging.debug("Buffer is full")
+                raise FullBufferException()
+        with self.mutex_lock:
+            self.slots[self.tail] = number_to_enqueue
+            self.tail = (self.tail + 1) % self.buffer_size
+            self.count += 1
+        self.full_slots.release()
+
+    @track_performance
+    def get(self, timeout: float | None = None) -> int:
+        """
+        Takes a full slot, parking the calling thread on the `full_slots`
+        semaphore while the buffer is empty, reads the oldest number from it
+        and signals a free slot. Each call which finds the buffer empty is
+        counted once by the statistic tracker.
+
+        :param timeout: The maximum number of seconds to wait for an item,
+            or None to wait indefinitely.
+        :type timeout: float | None
+        :raises EmptyBufferException: If no item arrived before the timeout
+            elapsed.
+        :return: The oldest item in the buffer.
+        :rtype: int
+        """
+        if not self.full_slots.acquire(blocking=False):
+            self.statistic_tracker.increment_empty_buffer()
+            if not self.full_slots.acquire(timeout=timeout):
+                logging.debug("Buffer is empty")
+                raise EmptyBufferException()
+        with self.mutex_lock:
+            number: int = self.slots[self.head]
+            self.head = (self.head + 1) % self.buffer_size
+            self.count -= 1
+        self.empty_slots.release()
+        return number
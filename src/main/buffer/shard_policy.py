@@ -0,0 +1,15 @@
+from enum import Enum
+
+
+class ShardPolicy(Enum):
+    """
+    This Enum class defines how a sharded buffer chooses the shard that
+    receives a newly enqueued item.
+
+    :ivar ROUND_ROBIN: Items are spread across the shards in turn.
+    :type ROUND_ROBIN: str
+    :ivar LEAST_LOADED: Items go to the shard holding the fewest items.
+    :type LEAST_LOADED: str
+    """
+    ROUND_ROBIN: str = 'round-robin'
+    LEAST_LOADED: str = 'least-loaded'
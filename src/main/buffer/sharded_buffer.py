@@ -0,0 +1,179 @@
+import itertools
+import logging
+import threading
+from collections import deque
+from typing import Callable, List
+
+from src.main.buffer.buffer import Buffer
+from src.main.buffer.empty_buffer_exception import EmptyBufferException
+from src.main.buffer.full_buffer_exception import FullBufferException
+from src.main.buffer.shard_policy import ShardPolicy
+from src.main.statistics.statistic_tracker import StatisticTracker
+from src.main.statistics.track_performance import track_performance, \
+    track_exceptions
+from src.main.statistics.tracking_mode import TrackingMode
+from src.main.thread.processor.lock.lock import Lock
+from src.main.thread.processor.lock.mutex_lock import MutexLock
+
+
+class ShardedBuffer(Buffer):
+    """
+    A thread-safe buffer split into independently locked sub-queues.
+
+    Each consuming thread is assigned a home shard on its first dequeue, so
+    with one shard per consumer every consumer mostly works under its own
+    lock. Producers spread items across the shards according to the shard
+    policy, moving on to the next shard when the chosen one is full. A
+    consumer whose home shard is empty steals the newest item from the tail
+    of another shard before reporting the buffer as empty.
+
+    :ivar num_shards: The number of sub-queues.
+    :type num_shards: int
+    :ivar shard_policy: How producers choose the shard for a new item.
+    :type shard_policy: ShardPolicy
+    :ivar shards: The sub-queues holding the buffered items.
+    :type shards: List[collections.deque]
+    :ivar shard_capacities: The maximum number of items of each sub-queue,
+        which add up to the buffer size.
+    :type shard_capacities: List[int]
+    :ivar shard_locks: The locks guarding each sub-queue.
+    :type shard_locks: List[Lock]
+    """
+    def __init__(self,
+                 buffer_size: int,
+                 num_shards: int,
+                 statistic_tracker: StatisticTracker,
+                 shard_policy: ShardPolicy = ShardPolicy.ROUND_ROBIN,
+                 lock_factory: Callable[[], Lock] = MutexLock):
+        """
+        Initializes the sharded buffer by dividing the buffer size as evenly
+        as possible between the given number of shards.
+
+        :param buffer_size: The maximum number of elements across all shards.
+        :type buffer_size: int
+        :param num_shards: The number of sub-queues, usually the number of
+            consumers.
+        :type num_shards: int
+        :param statistic_tracker: An object responsible for tracking relevant
+            statistics.
+        :type statistic_tracker: StatisticTracker
+        :param shard_policy: How producers choose the shard for a new item.
+        :type shard_policy: ShardPolicy
+        :param lock_factory: Creates the lock guarding each shard.
+        :type lock_factory: Callable[[], Lock]
+        """
+        super().__init__(buffer_size, statistic_tracker)
+        self.num_shards: int = max(num_shards, 1)
+        self.shard_policy: ShardPolicy = shard_policy
+        self.shards: List[deque] = [deque() for _ in range(self.num_shards)]
+        shard_size, leftover_slots = divmod(buffer_size, self.num_shards)
+        self.shard_capacities: List[int] = [shard_size + (1 if i < leftover_slots else 0)
+                                            for i in range(self.num_shards)]
+        self.shard_locks: List[Lock] = [lock_factory() for _ in range(self.num_shards)]
+        self.shard_counter: itertools.count = itertools.count()
+        self.home_shard_counter: itertools.count = itertools.count()
+        self.thread_state: threading.local = threading.local()
+
+    def is_empty(self) -> bool:
+        """
+        Determines if every shard of the buffer is empty.
+
+        :return: Boolean indicating whether the buffer is empty or not.
+        :rtype: bool
+        """
+        return all(len(shard) == 0 for shard in self.shards)
+
+    def is_full(self) -> bool:
+        """
+        Checks if every shard of the buffer has reached its capacity.
+
+        :return: True if the buffer is full, False otherwise.
+        :rtype: bool
+        """
+        return all(len(shard) >= capacity
+                   for shard, capacity in zip(self.shards, self.shard_capacities))
+
+    def get_home_shard(self) -> int:
+        """
+        Returns the index of the shard owned by the calling thread, assigning
+        the next unowned shard on the thread's first call.
+
+        :return: The index of the calling thread's home shard.
+        :rtype: int
+        """
+        try:
+            return self.thread_state.home_shard
+        except AttributeError:
+            home_shard: int = next(self.home_shard_counter) % self.num_shards
+            self.thread_state.home_shard = home_shard
+            logging.debug(f"Thread {threading.current_thread().name} owns "
+                          f"shard {home_shard}.")
+            return home_shard
+
+    def select_shard(self) -> int:
+        """
+        Chooses the first shard to offer a new item to, according to the
+        shard policy.
+
+        :return: The index of the chosen shard.
+        :rtype: int
+        """
+        if self.shard_policy == ShardPolicy.LEAST_LOADED:
+            return min(range(self.num_shards),
+                       key=lambda index: len(self.shards[index]))
+        return next(self.shard_counter) % self.num_shards
+
+    @track_performance
+    @track_exceptions
+    def enqueue(self, number_to_enqueue: int) -> None:
+        """
+        Adds a number to the shard chosen by the shard policy, or to the next
+        shard with free space if it is full. Only the lock of the shard being
+        written is held.
+
+        :param number_to_enqueue: The integer value to add to the buffer.
+        :type number_to_enqueue: int
+        :return: None
+        :raises FullBufferException: If every shard is full.
+        """
+        first_shard: int = self.select_shard()
+        for offset in range(self.num_shards):
+            index: int = (first_shard + offset) % self.num_shards
+            shard: deque = self.shards[index]
+            with self.shard_locks[index]:
+                if len(shard) < self.shard_capacities[index]:
+                    shard.appendleft(number_to_enqueue)
+                    return
+        if TrackingMode.is_verbose:
+            logging.debug("Buffer is full")
+        raise FullBufferException()
+
+    @track_performance
+    @track_exceptions
+    def dequeue(self) -> int:
+        """
+        Removes and returns the oldest item of the calling thread's home
+        shard. If the home shard is empty, steals the newest item from the
+        tail of the first other shard holding one.
+
+        :raises EmptyBufferException: Raised when every shard is empty.
+        :return: The dequeued item.
+        :rtype: int
+        """
+        home_shard: int = self.get_home_shard()
+        with self.shard_locks[home_shard]:
+            if self.shards[home_shard]:
+                return self.shards[home_shard].pop()
+        for offset in range(1, self.num_shards):
+            index: int = (home_shard + offset) % self.num_shards
+            shard: deque = self.shards[index]
+            if not shard:
+                continue
+            with self.shard_locks[index]:
+                if shard:
+                    if TrackingMode.is_verbose:
+                        logging.debug(f"Stealing from shard {index}.")
+                    return shard.popleft()
+        if TrackingMode.is_verbose:
+            logging.debug("Buffer is empty")
+        raise EmptyBufferException()
@@ -0,0 +1,208 @@
+import logging
+import multiprocessing
+import os
+import sys
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+from src.main.buffer.buffer import Buffer
+from src.main.buffer.empty_buffer_exception import EmptyBufferException
+from src.main.buffer.full_buffer_exception import FullBufferException
+from src.main.statistics.statistic_tracker import StatisticTracker
+from src.main.statistics.tracking_mode import TrackingMode
+from src.main.thread.critical_section import tracked_critical_section
+
+
+class SharedMemoryBuffer(Buffer):
+    """
+    A fixed-capacity ring buffer of integers stored in a
+    `multiprocessing.shared_memory` block, so producers and consumers can run
+    in separate operating system processes.
+
+    The block holds a header of two signed 64-bit counters, the index of the
+    oldest item and the number of buffered items, followed by one signed
+    64-bit slot per item. Items are written into their slots as raw integers,
+    so nothing is pickled when enqueueing or dequeueing. A process-shared
+    lock guards the header and slots.
+
+    The buffer can be passed to a `multiprocessing.Process`; the child attaches
+    to the same shared memory block by name. Only the process which created
+    the block unlinks it when the buffer is closed.
+
+    :ivar shared_memory: The shared memory block holding the header and slots.
+    :type shared_memory: SharedMemory
+    :ivar slots: A 64-bit integer view over the whole shared memory block.
+    :type slots: memoryview
+    :ivar mutex_lock: A process-shared lock guarding the buffer.
+    :type mutex_lock: multiprocessing.synchronize.Lock
+    :ivar owner_pid: The id of the process which created the shared memory
+        block and is responsible for unlinking it.
+    :type owner_pid: int
+    """
+    HEAD_INDEX: int = 0
+    COUNT_INDEX: int = 1
+    HEADER_SLOTS: int = 2
+    SLOT_SIZE: int = 8
+    TYPE_CODE: str = 'q'
+    def __init__(self,
+                 buffer_size: int,
+                 statistic_tracker: StatisticTracker):
+        """
+        Initializes the buffer by creating a zeroed shared memory block large
+        enough for the header and the given buffer size, and a process-shared
+        lock.
+
+        :param buffer_size: The maximum number of integers the buffer can
+            hold.
+        :type buffer_size: int
+        :param statistic_tracker: An object responsible for tracking relevant
+            statistics.
+        :type statistic_tracker: StatisticTracker
+        """
+        super().__init__(buffer_size, statistic_tracker)
+        block_size: int = ((SharedMemoryBuffer.HEADER_SLOTS + buffer_size) *
+                           SharedMemoryBuffer.SLOT_SIZE)
+        self.shared_memory: SharedMemory = SharedMemory(create=True,
+                                                        size=block_size)
+        self.slots: memoryview = self.shared_memory.buf.cast(
+            SharedMemoryBuffer.TYPE_CODE)
+        self.slots[SharedMemoryBuffer.HEAD_INDEX] = 0
+        self.slots[SharedMemoryBuffer.COUNT_INDEX] = 0
+        self.mutex_lock = multiprocessing.Lock()
+        self.owner_pid: int = os.getpid()
+        logging.debug(f"Shared memory block {self.shared_memory.name} created.")
+
+    def __getstate__(self) -> dict:
+        """
+        Returns the state sent to a child process. The shared memory block is
+        sent by name and attached to again in the child.
+
+        :return: The picklable state of the buffer.
+        :rtype: dict
+        """
+        return {
+            'buffer_size': self.buffer_size,
+            'statistic_tracker': self.statistic_tracker,
+            'shared_memory_name': self.shared_memory.name,
+            'mutex_lock': self.mutex_lock,
+            'owner_pid': self.owner_pid
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restores the buffer in a child process by attaching to the shared
+        memory block created by the parent.
+
+        The block stays registered with the resource tracker of the owner
+        only, which unlinks it if the owner exits without closing the buffer.
+        Processes started by `multiprocessing` share the resource tracker of
+        their parent, so a child must not unregister the block, which would
+        drop the registration of the owner.
+
+        :param state: The state returned by `__getstate__`.
+        :type state: dict
+        :return: None
+        """
+        self.buffer_size = state['buffer_size']
+        self.statistic_tracker = state['statistic_tracker']
+        if sys.version_info >= (3, 13):
+            self.shared_memory = SharedMemory(name=state['shared_memory_name'],
+                                              track=False)
+        else:
+            has_shared_tracker: bool = resource_tracker._resource_tracker._fd is not None
+            self.shared_memory = SharedMemory(name=state['shared_memory_name'])
+            # Attaching registers the block with the resource tracker. A
+            # tracker of this process alone would unlink the block when this
+            # process exits; only the owner unlinks it.
+            if not has_shared_tracker:
+                resource_tracker.unregister(self.shared_memory._name, 'shared_memory')
+        self.slots = self.shared_memory.buf.cast(SharedMemoryBuffer.TYPE_CODE)
+        self.mutex_lock = state['mutex_lock']
+        self.owner_pid = state['owner_pid']
+
+    def is_owner(self) -> bool:
+        """
+        Determines if this process created the shared memory block. A process
+        forked from the owner inherits the buffer but is not the owner.
+
+        :return: True if this process created the block, False otherwise.
+        :rtype: bool
+        """
+        return os.getpid() == self.owner_pid
+
+    def is_empty(self) -> bool:
+        """
+        Determines if the buffer is empty.
+
+        :return: Boolean indicating whether the buffer is empty or not.
+        :rtype: bool
+        """
+        return self.slots[SharedMemoryBuffer.COUNT_INDEX] == 0
+
+    def is_full(self) -> bool:
+        """
+        Checks if the buffer has reached its capacity.
+
+        :return: True if the buffer is full, False otherwise.
+        :rtype: bool
+        """
+        return self.slots[SharedMemoryBuffer.COUNT_INDEX] >= self.buffer_size
+
+    @tracked_critical_section
+    def enqueue(self, number_to_enqueue: int) -> None:
+        """
+        Writes an integer into the slot after the newest item if the buffer
+        is not full. If the buffer is full, raises a `FullBufferException`.
+
+        :param number_to_enqueue: The integer value to add to the buffer. It
+            must fit in a signed 64-bit integer.
+        :type number_to_enqueue: int
+        :return: None
+        :raises FullBufferException: If the buffer is full.
+        :raises ValueError: If the number does not fit in 64 bits.
+        """
+        if not self.is_full():
+            head: int = self.slots[SharedMemoryBuffer.HEAD_INDEX]
+            count: int = self.slots[SharedMemoryBuffer.COUNT_INDEX]
+            tail: int = (head + count) % self.buffer_size
+            self.slots[SharedMemoryBuffer.HEADER_SLOTS + tail] = number_to_enqueue
+            self.slots[SharedMemoryBuffer.COUNT_INDEX] = count + 1
+        else:
+            if TrackingMode.is_verbose:
+                logging.debug("Buffer is full")
+            raise FullBufferException()
+
+    @tracked_critical_section
+    def dequeue(self) -> int:
+        """
+        Reads and removes the oldest integer in the buffer if the buffer is
+        not empty. If the buffer is empty, an exception is raised instead.
+
+        :raises EmptyBufferException: Raised when attempting to dequeue from
+            an empty buffer.
+        :return: The oldest item in the buffer.
+        :rtype: int
+        """
+        if not self.is_empty():
+            head: int = self.slots[SharedMemoryBuffer.HEAD_INDEX]
+            number: int = self.slots[SharedMemoryBuffer.HEADER_SLOTS + head]
+            self.slots[SharedMemoryBuffer.HEAD_INDEX] = (head + 1) % self.buffer_size
+            self.slots[SharedMemoryBuffer.COUNT_INDEX] -= 1
+            return number
+        else:
+            if TrackingMode.is_verbose:
+                logging.debug("Buffer is empty")
+            raise EmptyBufferException()
+
+    def close(self) -> None:
+        """
+        Detaches this process from the shared memory block, and unlinks the
+        block if this process created it.
+
+        :return: None
+        """
+        self.slots.release()
+        self.shared_memory.close()
+        if self.is_owner():
+            self.shared_memory.unlink()
+            logging.debug(f"Shared memory block {self.shared_memory.name} unlinked.")
@@ -0,0 +1,102 @@
+import logging
+from typing import List
+
+from src.main.buffer.buffer import Buffer
+from src.main.buffer.empty_buffer_exception import EmptyBufferException
+from src.main.buffer.full_buffer_exception import FullBufferException
+from src.main.statistics.statistic_tracker import StatisticTracker
+
+
+class SpscRingBuffer(Buffer):
+    """
+    A lock-free ring buffer for exactly one producer thread and one consumer
+    thread.
+
+    The ring is preallocated and indexed by two monotonically increasing
+    counters. Only the producer writes `tail` and only the consumer writes
+    `head`, and each side publishes its counter after the slot it guards has
+    been written, so no mutex is required. Single attribute and list item
+    stores are atomic under the global interpreter lock, which makes the
+    published counters safe to read from the other thread.
+
+    :ivar ring: The preallocated slots holding the buffered items.
+    :type ring: List[int | None]
+    :ivar head: The number of items dequeued so far, written by the consumer.
+    :type head: int
+    :ivar tail: The number of items enqueued so far, written by the producer.
+    :type tail: int
+    """
+    def __init__(self,
+                 buffer_size: int,
+                 statistic_tracker: StatisticTracker):
+        """
+        Initializes the ring buffer with preallocated slots for the given
+        buffer size.
+
+        :param buffer_size: The maximum number of elements the ring can hold.
+        :type buffer_size: int
+        :param statistic_tracker: An object responsible for tracking relevant
+            statistics.
+        :type statistic_tracker: StatisticTracker
+        """
+        super().__init__(buffer_size, statistic_tracker)
+        self.ring: List[int | None] = [None] * buffer_size
+        self.head: int = 0
+        self.tail: int = 0
+
+    def is_empty(self) -> bool:
+        """
+        Determines if the ring buffer is empty.
+
+        :return: Boolean indicating whether the buffer is empty or not.
+        :rtype: bool
+        """
+        return self.head == self.tail
+
+    def is_full(self) -> bool:
+        """
+        Checks if the ring buffer has reached its capacity.
+
+        :return: True if the buffer is full, False otherwise.
+        :rtype: bool
+        """
+        return self.tail - self.head >= self.buffer_size
+
+    def enqueue(self, number_to_enqueue: int) -> None:
+        """
+        Writes a number into the next free slot and publishes it by advancing
+        the tail. Must only be called from the single producer thread.
+
+        :param number_to_enqueue: The integer value to add to the ring.
+        :type number_to_enqueue: int
+        :raises FullBufferException: If the ring is full.
+        :return: None
+        """
+        tail: int = self.tail
+        if tail - self.head >= self.buffer_size:
+            self.statistic_tracker.increment_full_buffer()
+            logging.debug("Buffer is full")
+            raise FullBufferException()
+        self.ring[tail % self.buffer_size] = number_to_enqueue
+        self.tail = tail + 1
+
+    def dequeue(self) -> int:
+        """
+        Reads the oldest number from the ring and releases its slot by
+        advancing the head. Must only be called from the single consumer
+        thread.
+
+        :raises EmptyBufferException: If the ring is empty.
+        :return: The oldest item in the ring.
+        :rtype: int
+        """
+        head: int = self.head
+        if head == self.tail:
+            self.statistic_tracker.increment_empty_buffer()
+            logging.debug("Buffer is empty")
+            raise EmptyBufferException()
+        slot: int = head % self.buffer_size
+        number: int = self.ring[slot]
+        self.ring[slot] = None
+        self.head = head + 1
+        return number
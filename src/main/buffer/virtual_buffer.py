@@ -0,0 +1,186 @@
+import logging
+from collections import deque
+from typing import Any, Deque, List
+
+from src.main.buffer.buffer import Buffer
+from src.main.buffer.empty_buffer_exception import EmptyBufferException
+from src.main.buffer.full_buffer_exception import FullBufferException
+from src.main.event.event_queue import EventQueue
+from src.main.statistics.statistic_tracker import StatisticTracker
+from src.main.statistics.tracking_mode import TrackingMode
+
+
+class VirtualBuffer(Buffer):
+    """
+    A bounded FIFO buffer for the discrete-event engine, where producers and
+    consumers take turns on a single thread in virtual time, so no lock is
+    needed.
+
+    Full and empty buffers are counted like in the other buffers. A blocking
+    virtual buffer models `BlockingBufferQueue`: a processor which finds it
+    full or empty waits in line until an operation of the other side makes
+    progress, and is then woken at the current virtual time by scheduling it
+    on the event queue.
+
+    :ivar items: The buffered items, oldest first.
+    :type items: Deque[int]
+    :ivar event_queue: The event queue holding the virtual clock, on which
+        waiting processors are woken.
+    :type event_queue: EventQueue
+    :ivar is_blocking: Whether processors wait for progress instead of
+        polling the buffer.
+    :type is_blocking: bool
+    :ivar waiting_producers: Producers waiting for space, in arrival order.
+    :type waiting_producers: Deque[Any]
+    :ivar waiting_consumers: Consumers waiting for an item, in arrival order.
+    :type waiting_consumers: Deque[Any]
+    """
+    def __init__(self,
+                 buffer_size: int,
+                 statistic_tracker: StatisticTracker,
+                 is_blocking: bool = False,
+                 event_queue: EventQueue | None = None):
+        """
+        Initializes an empty buffer holding an event queue.
+
+        :param buffer_size: The maximum number of elements the buffer can
+            hold.
+        :type buffer_size: int
+        :param statistic_tracker: An object responsible for tracking relevant
+            statistics.
+        :type statistic_tracker: StatisticTracker
+        :param is_blocking: Whether processors wait for progress instead of
+            polling the buffer.
+        :type is_blocking: bool
+        :param event_queue: The event queue holding the virtual clock, or
+            None for a new binary heap.
+        :type event_queue: EventQueue | None
+        """
+        super().__init__(buffer_size, statistic_tracker)
+        self.items: Deque[int] = deque()
+        self.event_queue: EventQueue = event_queue if event_queue is not None else EventQueue()
+        self.is_blocking: bool = is_blocking
+        self.waiting_producers: Deque[Any] = deque()
+        self.waiting_consumers: Deque[Any] = deque()
+
+    def is_empty(self) -> bool:
+        """
+        Determines if the buffer is empty.
+
+        :return: Boolean indicating whether the buffer is empty or not.
+        :rtype: bool
+        """
+        return not self.items
+
+    def is_full(self) -> bool:
+        """
+        Checks if the buffer has reached its maximum capacity.
+
+        :return: True if the buffer is full, False otherwise.
+        :rtype: bool
+        """
+        return len(self.items) >= self.buffer_size
+
+    def enqueue(self, number_to_enqueue: int) -> None:
+        """
+        Adds a number to the buffer. If the buffer is full, raises a
+        `FullBufferException`.
+
+        :param number_to_enqueue: The integer value to add to the buffer.
+        :type number_to_enqueue: int
+        :return: None
+        :raises FullBufferException: If the buffer is full.
+        """
+        self.enqueue_many([number_to_enqueue])
+
+    def dequeue(self) -> int:
+        """
+        Removes and returns the oldest item in the buffer.
+
+        :raises EmptyBufferException: If the buffer is empty.
+        :return: The oldest item in the buffer.
+        :rtype: int
+        """
+        return self.dequeue_many(1)[0]
+
+    def enqueue_many(self, numbers_to_enqueue: List[int]) -> int:
+        """
+        Enqueues as many of the provided numbers as the buffer has room for,
+        in order, and wakes up to as many waiting consumers.
+
+        :param numbers_to_enqueue: The numbers to be added to the buffer.
+        :type numbers_to_enqueue: List[int]
+        :raises FullBufferException: If the buffer is full and none of the
+            numbers could be enqueued.
+        :return: The number of items that were enqueued, taken from the front
+            of the provided list.
+        :rtype: int
+        """
+        num_enqueued: int = min(len(numbers_to_enqueue), self.buffer_size - len(self.items))
+        if num_enqueued <= 0:
+            self.statistic_tracker.increment_full_buffer()
+            if TrackingMode.is_verbose:
+                logging.debug("Buffer is full")
+            raise FullBufferException()
+        self.items.extend(numbers_to_enqueue[:num_enqueued])
+        if self.waiting_consumers:
+            self.wake_processors(self.waiting_consumers, num_enqueued)
+        return num_enqueued
+
+    def dequeue_many(self, max_items: int) -> List[int]:
+        """
+        Dequeues up to the given number of items, oldest first, and wakes up
+        to as many waiting producers.
+
+        :param max_items: The maximum number of items to dequeue.
+        :type max_items: int
+        :raises EmptyBufferException: If the buffer is empty and no item could
+            be dequeued.
+        :return: The dequeued items, oldest first.
+        :rtype: List[int]
+        """
+        if not self.items:
+            self.statistic_tracker.increment_empty_buffer()
+            if TrackingMode.is_verbose:
+                logging.debug("Buffer is empty")
+            raise EmptyBufferException()
+        num_dequeued: int = min(max_items, len(self.items))
+        dequeued_numbers: List[int] = [self.items.popleft() for _ in range(num_dequeued)]
+        if self.waiting_producers:
+            self.wake_processors(self.waiting_producers, num_dequeued)
+        return dequeued_numbers
+
+    def wait_for_space(self, producer: Any) -> None:
+        """
+        Parks a producer until an item is dequeued.
+
+        :param producer: The producer which found the buffer full.
+        :type producer: Any
+        :return: None
+        """
+        self.waiting_producers.append(producer)
+
+    def wait_for_item(self, consumer: Any) -> None:
+        """
+        Parks a consumer until an item is enqueued.
+
+        :param consumer: The consumer which found the buffer empty.
+        :type consumer: Any
+        :return: None
+        """
+        self.waiting_consumers.append(consumer)
+
+    def wake_processors(self, waiting_processors: Deque[Any], num_processors: int) -> None:
+        """
+        Wakes the longest waiting processors by scheduling them at the
+        current virtual time.
+
+        :param waiting_processors: The processors waiting in line.
+        :type waiting_processors: Deque[Any]
+        :param num_processors: The maximum number of processors to wake.
+        :type num_processors: int
+        :return: None
+        """
+        for _ in range(min(num_processors, len(waiting_processors))):
+            self.event_queue.push(self.event_queue.current_time,
+                                  waiting_processors.popleft())
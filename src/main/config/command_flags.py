@@ -29,6 +29,60 @@ class CommandFlags(Enum):
     :type VERBOSE: CommandFlag
     :ivar SUGGESTIONS: Command flag for enabling suggestion mode.
     :type SUGGESTIONS: CommandFlag
+    :ivar BUFFER_TYPE: Command flag for selecting the buffer implementation.
+    :type BUFFER_TYPE: CommandFlag
+    :ivar PRODUCER_BATCH_SIZE: Command flag for the number of items a
+        producer enqueues per buffer operation.
+    :type PRODUCER_BATCH_SIZE: CommandFlag
+    :ivar CONSUMER_BATCH_SIZE: Command flag for the number of items a
+        consumer dequeues per buffer operation.
+    :type CONSUMER_BATCH_SIZE: CommandFlag
+    :ivar SHARD_POLICY: Command flag for selecting how producers spread items
+        across the shards of a sharded buffer.
+    :type SHARD_POLICY: CommandFlag
+    :ivar URGENT_RATIO: Command flag for the fraction of items producers tag
+        as urgent for a priority buffer.
+    :type URGENT_RATIO: CommandFlag
+    :ivar MIN_BUFFER_SIZE: Command flag for the smallest capacity an elastic
+        buffer shrinks to.
+    :type MIN_BUFFER_SIZE: CommandFlag
+    :ivar MAX_BUFFER_SIZE: Command flag for the largest capacity an elastic
+        buffer grows to.
+    :type MAX_BUFFER_SIZE: CommandFlag
+    :ivar LOCK_TYPE: Command flag for selecting the lock guarding the buffer.
+    :type LOCK_TYPE: CommandFlag
+    :ivar LOCK_PROFILE: Command flag for enabling lock profiling.
+    :type LOCK_PROFILE: CommandFlag
+    :ivar MONITOR: Command flag for attaching the sys.monitoring profiler
+        when the simulation starts.
+    :type MONITOR: CommandFlag
+    :ivar SAMPLE_RATE: Command flag for the one in N operations whose timing is
+        recorded.
+    :type SAMPLE_RATE: CommandFlag
+    :ivar SAMPLE_MODE: Command flag for how sampled operations are picked.
+    :type SAMPLE_MODE: CommandFlag
+    :ivar CALIBRATE: Command flag for measuring the timing overhead at startup.
+    :type CALIBRATE: CommandFlag
+    :ivar CORRECT_OVERHEAD: Command flag for subtracting the timing overhead
+        from the throughput figures.
+    :type CORRECT_OVERHEAD: CommandFlag
+    :ivar PROFILE: Command flag for profiling the producer and consumer
+        threads.
+    :type PROFILE: CommandFlag
+    :ivar MEMORY_PROFILE: Command flag for tracing the memory of each subsystem.
+    :type MEMORY_PROFILE: CommandFlag
+    :ivar EXECUTOR: Command flag for the executor of the producers and
+        consumers.
+    :type EXECUTOR: CommandFlag
+    :ivar ENGINE: Command flag for the engine driving the producers and
+        consumers.
+    :type ENGINE: CommandFlag
+    :ivar GRID: Command flag for the grid of configurations simulated at
+        once.
+    :type GRID: CommandFlag
+    :ivar EVENT_QUEUE: Command flag for the queue of pending events of the
+        discrete-event engine.
+    :type EVENT_QUEUE: CommandFlag
     """
     BUFFER_SIZE: CommandFlag = CommandFlag('-b', '--buffer-size', int, 100, 'Buffer size in bytes')
     NUM_ITEMS: CommandFlag = CommandFlag('-n', '--num-items', int, 100,'Number of items to process')
@@ -37,4 +91,24 @@ class CommandFlags(Enum):
     PRODUCER_WORK_SPEED: CommandFlag = CommandFlag('-ps', '--producer-speed-range', str, '1:5','Producer speed range')
     CONSUMER_WORK_SPEED: CommandFlag = CommandFlag('-cs', '--consumer-speed-range',str, '1:5','Consumer speed range')
     VERBOSE: CommandFlag = CommandFlag('-v', '--verbose', bool, False,'Enable verbose mode')
-    SUGGESTIONS: CommandFlag = CommandFlag('-s', '--suggestions', bool, False, 'Show suggestions')
\ No newline at end of file
+    SUGGESTIONS: CommandFlag = CommandFlag('-s', '--suggestions', bool, False, 'Show suggestions')
+    BUFFER_TYPE: CommandFlag = CommandFlag('-bt', '--buffer-type', str, 'queue', 'Buffer implementation (queue, blocking, spsc, array, sharded, priority, shared-memory, mmap, elastic, semaphore)')
+    PRODUCER_BATCH_SIZE: CommandFlag = CommandFlag('-pb', '--producer-batch', int, 1, 'Items enqueued per buffer operation')
+    CONSUMER_BATCH_SIZE: CommandFlag = CommandFlag('-cb', '--consumer-batch', int, 1, 'Items dequeued per buffer operation')
+    SHARD_POLICY: CommandFlag = CommandFlag('-sp', '--shard-policy', str, 'round-robin', 'Sharded buffer policy (round-robin, least-loaded)')
+    URGENT_RATIO: CommandFlag = CommandFlag('-ur', '--urgent-ratio', float, 0.0, 'Fraction of items tagged urgent for a priority buffer')
+    MIN_BUFFER_SIZE: CommandFlag = CommandFlag('-bmin', '--min-buffer-size', int, 1, 'Smallest capacity of an elastic buffer')
+    MAX_BUFFER_SIZE: CommandFlag = CommandFlag('-bmax', '--max-buffer-size', int, 10000, 'Largest capacity of an elastic buffer')
+    LOCK_TYPE: CommandFlag = CommandFlag('-l', '--lock', str, 'mutex', 'Buffer lock implementation (mutex, fair, adaptive, native)')
+    LOCK_PROFILE: CommandFlag = CommandFlag('-lp', '--lock-profile', bool, False, 'Profile lock wait and hold times per thread')
+    MONITOR: CommandFlag = CommandFlag('-mon', '--monitor', bool, False, 'Attach the sys.monitoring profiler at start (Python 3.12+)')
+    SAMPLE_RATE: CommandFlag = CommandFlag('-sr', '--sample-rate', int, 1, 'Time and record only 1 in N producer and consumer operations')
+    SAMPLE_MODE: CommandFlag = CommandFlag('-sm', '--sample-mode', str, 'deterministic', 'Sampled operations (deterministic, random)')
+    CALIBRATE: CommandFlag = CommandFlag('-cal', '--calibrate', bool, False, 'Measure and report the timing overhead at startup')
+    CORRECT_OVERHEAD: CommandFlag = CommandFlag('-co', '--correct-overhead', bool, False, 'Subtract the measured timing overhead from the throughput (implies --calibrate)')
+    PROFILE: CommandFlag = CommandFlag('-prof', '--profile', bool, False, 'Profile the worker threads and report the merged hot spots')
+    MEMORY_PROFILE: CommandFlag = CommandFlag('-mp', '--memory-profile', bool, False, 'Trace the peak and retained memory of each subsystem')
+    EXECUTOR: CommandFlag = CommandFlag('-ex', '--executor', str, 'thread', 'How producers and consumers are executed (thread, process)')
+    ENGINE: CommandFlag = CommandFlag('-e', '--engine', str, 'threaded', 'The engine driving producers and consumers (threaded, asyncio, des)')
+    GRID: CommandFlag = CommandFlag('-g', '--grid', str, '', 'Simulate every combination of BUFFER_SIZES:PRODUCERS:CONSUMERS at once, e.g. 10,100:1,2:1,2 (requires NumPy)')
+    EVENT_QUEUE: CommandFlag = CommandFlag('-eq', '--event-queue', str, 'heap', 'The queue of pending events of the discrete-event engine (heap, wheel)')
\ No newline at end of file
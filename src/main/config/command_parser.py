@@ -1,9 +1,17 @@
 import argparse
+import itertools
 from typing import List, Tuple
 
+from src.main.buffer.buffer_type import BufferType
+from src.main.buffer.shard_policy import ShardPolicy
 from src.main.config.command_flag import CommandFlag
 from src.main.config.command_flags import CommandFlags
 from src.main.config.config import Config
+from src.main.event.event_queue_type import EventQueueType
+from src.main.simulator.engine_type import EngineType
+from src.main.statistics.sample_mode import SampleMode
+from src.main.thread.executor_type import ExecutorType
+from src.main.thread.processor.lock.lock_type import LockType
 
 def set_parser_args(parser: argparse.ArgumentParser,
                     command_flag: CommandFlag):
@@ -67,6 +75,26 @@ def get_config_from_arguments(args: List[str]) -> Config:
         consumer_speed_range: Tuple[int, int] = parse_speed_range(parsed_args.consumer_speed_range)
         verbose: bool = parsed_args.verbose
         suggestions: bool = parsed_args.suggestions
+        buffer_type: BufferType = BufferType(parsed_args.buffer_type)
+        producer_batch_size: int = parse_batch_size(parsed_args.producer_batch)
+        consumer_batch_size: int = parse_batch_size(parsed_args.consumer_batch)
+        shard_policy: ShardPolicy = ShardPolicy(parsed_args.shard_policy)
+        urgent_ratio: float = parse_ratio(parsed_args.urgent_ratio)
+        min_buffer_size, max_buffer_size = parse_buffer_size_bounds(
+            parsed_args.min_buffer_size, parsed_args.max_buffer_size)
+        lock_type: LockType = LockType(parsed_args.lock)
+        lock_profile: bool = parsed_args.lock_profile
+        monitor: bool = parsed_args.monitor
+        sample_rate: int = parse_sample_rate(parsed_args.sample_rate)
+        sample_mode: SampleMode = SampleMode(parsed_args.sample_mode)
+        calibrate: bool = parsed_args.calibrate
+        correct_overhead: bool = parsed_args.correct_overhead
+        profile: bool = parsed_args.profile
+        memory_profile: bool = parsed_args.memory_profile
+        executor: ExecutorType = ExecutorType(parsed_args.executor)
+        engine: EngineType = EngineType(parsed_args.engine)
+        grid: Tuple[Tuple[int, int, int], ...] = parse_grid(parsed_args.grid)
+        event_queue: EventQueueType = EventQueueType(parsed_args.event_queue)
         return Config(
             buffer_size,
             num_items,
@@ -75,7 +103,27 @@ def get_config_from_arguments(args: List[str]) -> Config:
             producer_speed_range,
             consumer_speed_range,
             verbose,
-            suggestions
+            suggestions,
+            buffer_type,
+            producer_batch_size,
+            consumer_batch_size,
+            shard_policy,
+            urgent_ratio,
+            min_buffer_size,
+            max_buffer_size,
+            lock_type,
+            lock_profile,
+            monitor,
+            sample_rate,
+            sample_mode,
+            calibrate,
+            correct_overhead,
+            profile,
+            memory_profile,
+            executor,
+            engine,
+            grid,
+            event_queue
         )
     except Exception as exception:
         print(f"Error parsing arguments: {exception}")
@@ -95,4 +143,94 @@ def parse_speed_range(speed_string: str) -> Tuple[int, int]:
     :rtype: Tuple[int, int]
     """
     floor, ceiling = map(int, speed_string.split(':'))
-    return floor, ceiling
\ No newline at end of file
+    return floor, ceiling
+
+def parse_batch_size(batch_size: int) -> int:
+    """
+    Validates a batch size given on the command line.
+
+    :param batch_size: The number of items moved per buffer operation.
+    :type batch_size: int
+    :raises ValueError: If the batch size is smaller than one.
+    :return: The validated batch size.
+    :rtype: int
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch size must be at least 1, got {batch_size}")
+    return batch_size
+
+def parse_ratio(ratio: float) -> float:
+    """
+    Validates a ratio given on the command line.
+
+    :param ratio: A fraction between zero and one.
+    :type ratio: float
+    :raises ValueError: If the ratio is outside of the range [0, 1].
+    :return: The validated ratio.
+    :rtype: float
+    """
+    if not 0 <= ratio <= 1:
+        raise ValueError(f"ratio must be between 0 and 1, got {ratio}")
+    return ratio
+
+def parse_buffer_size_bounds(min_buffer_size: int,
+                             max_buffer_size: int) -> Tuple[int, int]:
+    """
+    Validates the capacity bounds of an elastic buffer given on the command
+    line.
+
+    :param min_buffer_size: The smallest capacity of the buffer.
+    :type min_buffer_size: int
+    :param max_buffer_size: The largest capacity of the buffer.
+    :type max_buffer_size: int
+    :raises ValueError: If the smallest capacity is below one or above the
+        largest capacity.
+    :return: The validated smallest and largest capacities.
+    :rtype: Tuple[int, int]
+    """
+    if min_buffer_size < 1 or min_buffer_size > max_buffer_size:
+        raise ValueError(f"buffer size bounds must satisfy 1 <= min <= max, "
+                         f"got {min_buffer_size} and {max_buffer_size}")
+    return min_buffer_size, max_buffer_size
+
+
+def parse_grid(grid_string: str) -> Tuple[Tuple[int, int, int], ...]:
+    """
+    Parses a grid of configurations in the format
+    'buffer_sizes:producers:consumers', where each part is a comma-separated
+    list of integers, into every combination of them.
+
+    :param grid_string: The grid given on the command line, or an empty
+        string for no grid.
+    :type grid_string: str
+    :raises ValueError: If the grid does not have three parts or a value is
+        smaller than one.
+    :return: The buffer size, number of producers and number of consumers of
+        every configuration of the grid, or an empty tuple for no grid.
+    :rtype: Tuple[Tuple[int, int, int], ...]
+    """
+    if not grid_string:
+        return ()
+    parts: List[str] = grid_string.split(':')
+    if len(parts) != 3:
+        raise ValueError(f"grid must have the format buffer_sizes:producers:consumers, "
+                         f"got {grid_string}")
+    values: List[List[int]] = [[int(value) for value in part.split(',')] for part in parts]
+    if min(min(part_values) for part_values in values) < 1:
+        raise ValueError(f"grid values must be at least 1, got {grid_string}")
+    return tuple(itertools.product(*values))
+
+
+def parse_sample_rate(sample_rate: int) -> int:
+    """
+    Validates a sample rate given on the command line.
+
+    :param sample_rate: The one in N operations whose timing is recorded.
+    :type sample_rate: int
+    :raises ValueError: If the sample rate is smaller than one.
+    :return: The validated sample rate.
+    :rtype: int
+    """
+    if sample_rate < 1:
+        raise ValueError(f"sample rate must be at least 1, got {sample_rate}")
+    return sample_rate
\ No newline at end of file
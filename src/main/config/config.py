@@ -1,5 +1,13 @@
 from typing import Tuple
 
+from src.main.buffer.buffer_type import BufferType
+from src.main.buffer.shard_policy import ShardPolicy
+from src.main.event.event_queue_type import EventQueueType
+from src.main.simulator.engine_type import EngineType
+from src.main.statistics.sample_mode import SampleMode
+from src.main.thread.executor_type import ExecutorType
+from src.main.thread.processor.lock.lock_type import LockType
+
 
 class Config:
     """
@@ -33,6 +41,65 @@ class Config:
     :ivar suggestions: A flag indicating whether additional recommendations
         or suggestions are shown during program execution.
     :type suggestions: bool
+    :ivar buffer_type: The buffer implementation shared by producers and
+        consumers.
+    :type buffer_type: BufferType
+    :ivar producer_batch_size: The number of items each producer enqueues
+        per buffer operation.
+    :type producer_batch_size: int
+    :ivar consumer_batch_size: The maximum number of items each consumer
+        dequeues per buffer operation.
+    :type consumer_batch_size: int
+    :ivar shard_policy: How producers spread items across the shards of a
+        sharded buffer.
+    :type shard_policy: ShardPolicy
+    :ivar urgent_ratio: The fraction of produced items tagged as urgent for
+        a priority buffer.
+    :type urgent_ratio: float
+    :ivar min_buffer_size: The smallest capacity an elastic buffer shrinks
+        to.
+    :type min_buffer_size: int
+    :ivar max_buffer_size: The largest capacity an elastic buffer grows to.
+    :type max_buffer_size: int
+    :ivar lock_type: The lock implementation guarding the buffer.
+    :type lock_type: LockType
+    :ivar lock_profile: A flag indicating whether lock wait and hold times
+        are profiled.
+    :type lock_profile: bool
+    :ivar monitor: A flag indicating whether the sys.monitoring profiler is
+        attached when the simulation starts.
+    :type monitor: bool
+    :ivar sample_rate: The one in N producer and consumer operations whose
+        timing is recorded.
+    :type sample_rate: int
+    :ivar sample_mode: How the timed operations are picked when sampling.
+    :type sample_mode: SampleMode
+    :ivar calibrate: A flag indicating whether the timing overhead is
+        measured and reported at startup.
+    :type calibrate: bool
+    :ivar correct_overhead: A flag indicating whether the measured timing
+        overhead is subtracted from the throughput figures.
+    :type correct_overhead: bool
+    :ivar profile: A flag indicating whether every producer and consumer
+        thread runs under its own profiler.
+    :type profile: bool
+    :ivar memory_profile: A flag indicating whether the memory held by each
+        subsystem is traced with tracemalloc.
+    :type memory_profile: bool
+    :ivar executor: Whether producers and consumers run as threads or as
+        operating system processes.
+    :type executor: ExecutorType
+    :ivar engine: The engine driving producers and consumers, as threads, as
+        coroutines on a single event loop or as discrete events in virtual
+        time.
+    :type engine: EngineType
+    :ivar grid: The buffer size, number of producers and number of
+        consumers of every configuration simulated at once by the grid
+        simulator, or an empty tuple to run a single simulation.
+    :type grid: Tuple[Tuple[int, int, int], ...]
+    :ivar event_queue: The queue holding the pending events of the
+        discrete-event engine.
+    :type event_queue: EventQueueType
     """
     def __init__(self,
                  buffer_size: int,
@@ -42,7 +109,27 @@ class Config:
                  consumer_speed_range: Tuple[int, int],
                  producer_speed_range: Tuple[int, int],
                  verbose: bool,
-                 suggestions: bool):
+                 suggestions: bool,
+                 buffer_type: BufferType = BufferType.QUEUE,
+                 producer_batch_size: int = 1,
+                 consumer_batch_size: int = 1,
+                 shard_policy: ShardPolicy = ShardPolicy.ROUND_ROBIN,
+                 urgent_ratio: float = 0.0,
+                 min_buffer_size: int = 1,
+                 max_buffer_size: int = 10000,
+                 lock_type: LockType = LockType.MUTEX,
+                 lock_profile: bool = False,
+                 monitor: bool = False,
+                 sample_rate: int = 1,
+                 sample_mode: SampleMode = SampleMode.DETERMINISTIC,
+                 calibrate: bool = False,
+                 correct_overhead: bool = False,
+                 profile: bool = False,
+                 memory_profile: bool = False,
+                 executor: ExecutorType = ExecutorType.THREAD,
+                 engine: EngineType = EngineType.THREADED,
+                 grid: Tuple[Tuple[int, int, int], ...] = (),
+                 event_queue: EventQueueType = EventQueueType.HEAP):
         """
         Constructor for initializing the class with configurable parameters to
         define a producer-consumer system. These parameters include buffer
@@ -72,6 +159,66 @@ class Config:
         :parameter suggestions: A boolean option to enable or disable
         suggestions for potential improvements in the system during runtime.
         :type suggestions: bool
+        :parameter buffer_type: The buffer implementation to simulate.
+        :type buffer_type: BufferType
+        :parameter producer_batch_size: The number of items each producer
+        enqueues per buffer operation.
+        :type producer_batch_size: int
+        :parameter consumer_batch_size: The maximum number of items each
+        consumer dequeues per buffer operation.
+        :type consumer_batch_size: int
+        :parameter shard_policy: How producers spread items across the shards
+        of a sharded buffer.
+        :type shard_policy: ShardPolicy
+        :parameter urgent_ratio: The fraction of produced items tagged as
+        urgent for a priority buffer.
+        :type urgent_ratio: float
+        :parameter min_buffer_size: The smallest capacity an elastic buffer
+        shrinks to.
+        :type min_buffer_size: int
+        :parameter max_buffer_size: The largest capacity an elastic buffer
+        grows to.
+        :type max_buffer_size: int
+        :parameter lock_type: The lock implementation guarding the buffer.
+        :type lock_type: LockType
+        :parameter lock_profile: A boolean flag to profile lock wait and hold
+        times per thread.
+        :type lock_profile: bool
+        :parameter monitor: A boolean flag to attach the sys.monitoring
+        profiler when the simulation starts.
+        :type monitor: bool
+        :parameter sample_rate: The one in N producer and consumer
+        operations whose timing is recorded; 1 records every operation.
+        :type sample_rate: int
+        :parameter sample_mode: How the timed operations are picked when
+        sampling.
+        :type sample_mode: SampleMode
+        :parameter calibrate: A boolean flag to measure and report the timing
+        overhead at startup.
+        :type calibrate: bool
+        :parameter correct_overhead: A boolean flag to subtract the measured
+        timing overhead from the throughput figures.
+        :type correct_overhead: bool
+        :parameter profile: A boolean flag to profile every producer and
+        consumer thread and report the merged hot spots.
+        :type profile: bool
+        :parameter memory_profile: A boolean flag to trace the memory held by
+        each subsystem and report its peak and retained memory.
+        :type memory_profile: bool
+        :parameter executor: The executor running producers and consumers, as
+        threads or as processes sharing a shared memory buffer.
+        :type executor: ExecutorType
+        :parameter engine: The engine driving producers and consumers, as
+        threads, as coroutines on a single event loop or as discrete events in
+        virtual time.
+        :type engine: EngineType
+        :parameter grid: The buffer size, number of producers and number of
+        consumers of every configuration to simulate at once, or an empty tuple
+        to run a single simulation.
+        :type grid: Tuple[Tuple[int, int, int], ...]
+        :parameter event_queue: The queue holding the pending events of the
+        discrete-event engine, a binary heap or a timing wheel.
+        :type event_queue: EventQueueType
         """
         self.buffer_size: int = buffer_size
         self.num_items_to_process: int = num_items_to_process
@@ -81,6 +228,26 @@ class Config:
         self.producer_speed_range: tuple[int, int] = producer_speed_range
         self.verbose: bool = verbose
         self.suggestions: bool = suggestions
+        self.buffer_type: BufferType = buffer_type
+        self.producer_batch_size: int = producer_batch_size
+        self.consumer_batch_size: int = consumer_batch_size
+        self.shard_policy: ShardPolicy = shard_policy
+        self.urgent_ratio: float = urgent_ratio
+        self.min_buffer_size: int = min_buffer_size
+        self.max_buffer_size: int = max_buffer_size
+        self.lock_type: LockType = lock_type
+        self.lock_profile: bool = lock_profile
+        self.monitor: bool = monitor
+        self.sample_rate: int = sample_rate
+        self.sample_mode: SampleMode = sample_mode
+        self.calibrate: bool = calibrate
+        self.correct_overhead: bool = correct_overhead
+        self.profile: bool = profile
+        self.memory_profile: bool = memory_profile
+        self.executor: ExecutorType = executor
+        self.engine: EngineType = engine
+        self.grid: Tuple[Tuple[int, int, int], ...] = grid
+        self.event_queue: EventQueueType = event_queue
 
     def __str__(self):
         """
@@ -95,4 +262,24 @@ class Config:
                 f" num_consumers={self.num_consumers},"
                 f" consumer_speed_range={self.consumer_speed_range},"
                 f" producer_speed_range={self.producer_speed_range},"
-                f" verbose={self.verbose}, suggestions={self.suggestions})")
\ No newline at end of file
+                f" verbose={self.verbose}, suggestions={self.suggestions},"
+                f" buffer_type={self.buffer_type.value},"
+                f" producer_batch_size={self.producer_batch_size},"
+                f" consumer_batch_size={self.consumer_batch_size},"
+                f" shard_policy={self.shard_policy.value},"
+                f" urgent_ratio={self.urgent_ratio},"
+                f" min_buffer_size={self.min_buffer_size},"
+                f" max_buffer_size={self.max_buffer_size},"
+                f" lock_type={self.lock_type.value},"
+                f" lock_profile={self.lock_profile},"
+                f" monitor={self.monitor},"
+                f" sample_rate={self.sample_rate},"
+                f" sample_mode={self.sample_mode.value},"
+                f" calibrate={self.calibrate},"
+                f" correct_overhead={self.correct_overhead},"
+                f" profile={self.profile},"
+                f" memory_profile={self.memory_profile},"
+                f" executor={self.executor.value},"
+                f" engine={self.engine.value},"
+                f" grid={len(self.grid)} configurations,"
+                f" event_queue={self.event_queue.value})")
\ No newline at end of file
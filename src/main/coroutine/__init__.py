@@ -0,0 +1,6 @@
+"""
+src.main.coroutine package
+
+This package contains all the of data structures and scripts related to the
+asyncio engine, which runs producers and consumers as coroutines.
+"""
\ No newline at end of file
@@ -0,0 +1,39 @@
+import logging
+
+from src.main.coroutine.async_processor import AsyncProcessor
+from src.main.statistics.track_performance import track_async_consumer_performance
+
+
+class AsyncConsumer(AsyncProcessor):
+    """
+    Consumes items from a shared asynchronous buffer, suspending while the
+    buffer is empty.
+    """
+    NAME: str = 'Consumer'
+    @track_async_consumer_performance
+    async def process_item(self) -> int:
+        """
+        Gets a batch of items from the buffer, waiting for an item whenever
+        the buffer is empty, then simulates the processing of the batch.
+
+        :return: The number of items dequeued.
+        :rtype: int
+        """
+        batch_size: int = self.get_batch_size()
+        for _ in range(batch_size):
+            dequeued_number: int = await self.buffer.get()
+            self.num_items_to_process -= 1
+            logging.debug(f"Dequeued number: {dequeued_number}")
+        logging.debug(f"Items remaining: {self.num_items_to_process}")
+        await self.simulate_processing(batch_size)
+        return batch_size
+
+    def stop(self) -> None:
+        """
+        Stops the consumer by setting its running status to False.
+
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        logging.debug(f"Consumer {self.id} stopped.")
+        self.running = False
@@ -0,0 +1,152 @@
+import asyncio
+import random
+from abc import ABC, abstractmethod
+
+from src.main.buffer.async_buffer import AsyncBuffer
+from src.main.statistics.statistic_tracker import StatisticTracker
+
+
+class AsyncProcessor(ABC):
+    """
+    Processor abstract base class for the asyncio engine. Unlike `Processor`,
+    it is not a thread: its `run` coroutine is driven by an event loop, and
+    simulated work suspends the coroutine with `asyncio.sleep` instead of
+    putting an operating system thread to sleep.
+
+    :ivar id: Identifier of the processor.
+    :type id: int
+    :ivar name: Name of the processor.
+    :type name: str
+    :ivar speed_floor: Minimum speed of processing in milliseconds.
+    :type speed_floor: int
+    :ivar speed_ceiling: Maximum speed of processing in milliseconds.
+    :type speed_ceiling: int
+    :ivar buffer: Shared buffer object for processing.
+    :type buffer: AsyncBuffer
+    :ivar running: Indicates if the processor should be running.
+    :type running: bool
+    :ivar num_items_to_process: Number of items remaining to process.
+    :type num_items_to_process: int
+    :ivar statistic_tracker: Object for tracking processing statistics.
+    :type statistic_tracker: StatisticTracker
+    :ivar batch_size: The number of items processed together.
+    :type batch_size: int
+    """
+    NAME: str = 'Processor'
+    def __init__(self,
+                 id: int,
+                 speed_floor: int,
+                 speed_ceiling: int,
+                 buffer: AsyncBuffer,
+                 num_items_to_process: int,
+                 statistic_tracker: StatisticTracker,
+                 batch_size: int = 1):
+        """
+        Initializes a processor which processes a specific number of items
+        at a variable speed range.
+
+        :param id: Unique identifier for the processor.
+        :type id: int
+        :param speed_floor: Minimum processing speed.
+        :type speed_floor: int
+        :param speed_ceiling: Maximum processing speed.
+        :type speed_ceiling: int
+        :param buffer: Shared buffer for item consumption or production.
+        :type buffer: AsyncBuffer
+        :param num_items_to_process: Total number of items the processor
+            should process.
+        :type num_items_to_process: int
+        :param statistic_tracker: Object for tracking processing statistics.
+        :type statistic_tracker: StatisticTracker
+        :param batch_size: The number of items to process together.
+        :type batch_size: int
+        """
+        self.id: int = id
+        self.name: str = f"{self.NAME}-{id}"
+        self.speed_floor: int = speed_floor
+        self.speed_ceiling: int = speed_ceiling
+        self.buffer: AsyncBuffer = buffer
+        self.running: bool = False
+        self.num_items_to_process: int = num_items_to_process
+        self.statistic_tracker: StatisticTracker = statistic_tracker
+        self.batch_size: int = batch_size
+
+    async def run(self) -> None:
+        """
+        Processes items for as long as `should_run` evaluates to True, then
+        stops the processor.
+
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        self.running = True
+        while self.should_run():
+            await self.process_item()
+        self.stop()
+
+    @abstractmethod
+    async def process_item(self) -> int:
+        """
+        An abstract coroutine for processing a batch of items.
+
+        :raises NotImplementedError: If called directly and not overridden in
+            a subclass.
+        :return: The number of items processed.
+        :rtype: int
+        """
+        pass
+
+    @abstractmethod
+    def stop(self) -> None:
+        """
+        An abstract method to stop the processor.
+
+        :raises NotImplementedError: If called directly and not overridden in
+            a subclass.
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        pass
+
+    def should_run(self) -> bool:
+        """
+        Determines whether the processor should run based on the state.
+
+        :return: True if the processor should run and False otherwise.
+        :rtype: bool
+        """
+        return self.running and self.num_items_to_process > 0
+
+    def get_batch_size(self) -> int:
+        """
+        Returns the number of items of the next batch, which never exceeds
+        the number of items remaining to process.
+
+        :return: The number of items of the next batch.
+        :rtype: int
+        """
+        return min(self.batch_size, self.num_items_to_process)
+
+    def get_random_speed(self) -> int:
+        """
+        Returns a random speed within the defined floor and ceiling values.
+
+        :return: Random integer value representing the speed within the
+            specified range.
+        :rtype: int
+        """
+        return random.randint(self.speed_floor, self.speed_ceiling)
+
+    async def simulate_processing(self, num_items: int = 1) -> None:
+        """
+        Simulates processing a batch of items by suspending the coroutine for
+        the sum of a random duration per item within the defined speed range.
+        Other coroutines run on the event loop in the meantime.
+
+        :param num_items: The number of items in the batch.
+        :type num_items: int
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        processing_time: int = sum(self.get_random_speed() for _ in range(num_items))
+        await asyncio.sleep(processing_time / 1000)
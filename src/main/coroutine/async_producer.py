@@ -0,0 +1,54 @@
+import logging
+import random
+
+from src.main.coroutine.async_processor import AsyncProcessor
+from src.main.statistics.track_performance import track_async_producer_performance
+
+
+class AsyncProducer(AsyncProcessor):
+    """
+    Produces random numbers into a shared asynchronous buffer, suspending
+    while the buffer is full.
+    """
+    NAME: str = 'Producer'
+    @staticmethod
+    def get_random_number() -> int:
+        """
+        Generates a random integer within the range [1, 100].
+
+        :return: A random integer between 1 and 100 inclusive.
+        :rtype: int
+        """
+        return random.randint(1, 100)
+
+    @track_async_producer_performance
+    async def process_item(self) -> int:
+        """
+        Produces a batch of random numbers, putting each of them into the
+        buffer and waiting for space whenever the buffer is full, then
+        simulates the processing of the batch.
+
+        :return: The number of items enqueued.
+        :rtype: int
+        """
+        batch_size: int = self.get_batch_size()
+        for _ in range(batch_size):
+            random_number: int = self.get_random_number()
+            await self.buffer.put(random_number)
+            self.num_items_to_process -= 1
+            logging.debug(f"Enqueued number: {random_number}")
+        logging.debug(f"Items remaining: {self.num_items_to_process}")
+        await self.simulate_processing(batch_size)
+        return batch_size
+
+    def stop(self) -> None:
+        """
+        Stops the producer by setting its running status to False.
+
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        num_items_remaining: int = (self.statistic_tracker.num_items_to_process -
+                                    self.statistic_tracker.items_produced)
+        logging.debug(f"Producer {self.id} stopped. {num_items_remaining} items remaining.")
+        self.running = False
@@ -0,0 +1,181 @@
+import asyncio
+import logging
+import random
+import threading
+from typing import Coroutine, List, Tuple
+
+from src.main.buffer.async_buffer import AsyncBuffer
+from src.main.coroutine.async_consumer import AsyncConsumer
+from src.main.coroutine.async_processor import AsyncProcessor
+from src.main.coroutine.async_producer import AsyncProducer
+from src.main.statistics.statistic_tracker import StatisticTracker
+from src.main.statistics.thread_profiler import ThreadProfiler
+from src.main.thread.thread_manager import ThreadManager
+
+
+class CoroutineManager(ThreadManager):
+    """
+    Thread manager of the asyncio engine. Producers and consumers are
+    coroutines instead of threads, and are all driven by a single event loop
+    running on one thread, so a simulation can model tens of thousands of
+    them without an operating system thread each.
+
+    Items are distributed among producers and consumers the same way as for
+    threads, and the same statistic tracker is used, so the reporting is
+    unchanged.
+
+    :ivar producers: List of initialized producer coroutines.
+    :type producers: List[AsyncProducer]
+    :ivar consumers: List of initialized consumer coroutines.
+    :type consumers: List[AsyncConsumer]
+    :ivar event_loop_thread: The thread running the event loop, or None if
+        it was not started yet.
+    :type event_loop_thread: threading.Thread | None
+    """
+    EVENT_LOOP_THREAD_NAME: str = 'EventLoop'
+    def __init__(self, num_producers: int,
+                 num_consumers: int,
+                 consumer_speed_range: Tuple[int, int],
+                 producer_speed_range: Tuple[int, int],
+                 buffer: AsyncBuffer,
+                 num_items_to_process: int,
+                 statistic_tracker: StatisticTracker,
+                 producer_batch_size: int = 1,
+                 consumer_batch_size: int = 1,
+                 thread_profiler: ThreadProfiler | None = None):
+        """
+        Initializes the producer and consumer coroutines for a given number
+        of items.
+
+        :param num_producers: Number of producer coroutines to create.
+        :type num_producers: int
+        :param num_consumers: Number of consumer coroutines to create.
+        :type num_consumers: int
+        :param consumer_speed_range: Speed range (min, max) for consumers.
+        :type consumer_speed_range: Tuple[int, int]
+        :param producer_speed_range: Speed range (min, max) for producers.
+        :type producer_speed_range: Tuple[int, int]
+        :param buffer: Shared asynchronous buffer between producers and
+            consumers.
+        :type buffer: AsyncBuffer
+        :param num_items_to_process: Total number of items to be processed by
+            the system.
+        :type num_items_to_process: int
+        :param statistic_tracker: Tracker for collecting processing
+            statistics.
+        :type statistic_tracker: StatisticTracker
+        :param producer_batch_size: Number of items each producer puts into
+            the buffer before simulating their processing.
+        :type producer_batch_size: int
+        :param consumer_batch_size: Number of items each consumer gets from
+            the buffer before simulating their processing.
+        :type consumer_batch_size: int
+        :param thread_profiler: Profiler to run the event loop and the thread
+            management under, or None to run without profiling.
+        :type thread_profiler: ThreadProfiler | None
+        """
+        self.event_loop_thread: threading.Thread | None = None
+        super().__init__(num_producers,
+                         num_consumers,
+                         consumer_speed_range,
+                         producer_speed_range,
+                         buffer,
+                         num_items_to_process,
+                         statistic_tracker,
+                         producer_batch_size,
+                         consumer_batch_size)
+        self.thread_profiler = thread_profiler
+
+    def initialize_producers(self) -> List[AsyncProducer]:
+        """
+        Initializes and returns a list of AsyncProducer objects.
+
+        :return: A list of initialized AsyncProducer objects.
+        :rtype: List[AsyncProducer]
+        """
+        items_per_producer, leftover_items = self.get_num_items_to_produce()
+        producers: List[AsyncProducer] = []
+        for i in range(self.num_producers):
+            items_to_produce: int = items_per_producer + (1 if i < leftover_items else 0)
+            producers.append(AsyncProducer(i + 1,
+                                           self.producer_speed_range[0],
+                                           self.producer_speed_range[1],
+                                           self.buffer,
+                                           items_to_produce,
+                                           self.statistic_tracker,
+                                           self.producer_batch_size))
+        logging.debug(f"{self.num_producers} producers will produce "
+                      f"{self.num_items_to_process} items.")
+        return producers
+
+    def initialize_consumers(self) -> List[AsyncConsumer]:
+        """
+        Initializes and returns a list of AsyncConsumer objects.
+
+        :return: A list of initialized AsyncConsumer objects.
+        :rtype: List[AsyncConsumer]
+        """
+        items_per_consumer, leftover_items = self.get_num_items_to_consume()
+        consumers: List[AsyncConsumer] = []
+        for i in range(self.num_consumers):
+            items_to_consume: int = items_per_consumer + (1 if i < leftover_items else 0)
+            consumers.append(AsyncConsumer(i + 1,
+                                           self.consumer_speed_range[0],
+                                           self.consumer_speed_range[1],
+                                           self.buffer,
+                                           items_to_consume,
+                                           self.statistic_tracker,
+                                           self.consumer_batch_size))
+        logging.debug(f"{self.num_consumers} consumers will consume "
+                      f"{self.num_items_to_process} items.")
+        return consumers
+
+    def start_threads(self) -> None:
+        """
+        Starts the thread running the event loop, which runs every producer
+        and consumer coroutine.
+
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        self.event_loop_thread = threading.Thread(target=self.run_event_loop,
+                                                  name=CoroutineManager.EVENT_LOOP_THREAD_NAME)
+        self.event_loop_thread.start()
+        self.threads_started = True
+
+    def run_event_loop(self) -> None:
+        """
+        Runs a new event loop until every producer and consumer coroutine
+        has finished, under the thread profiler if one is set.
+
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        if self.thread_profiler is not None:
+            self.thread_profiler.run_profiled(asyncio.run, self.run_all())
+        else:
+            asyncio.run(self.run_all())
+
+    async def run_all(self) -> None:
+        """
+        Runs the producer and consumer coroutines concurrently, started in a
+        random order, and waits for all of them to finish.
+
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        processors: List[AsyncProcessor] = self.producers + self.consumers
+        random.shuffle(processors)
+        logging.debug(f"Number of coroutines: {len(processors)}.")
+        coroutines: List[Coroutine] = [processor.run() for processor in processors]
+        await asyncio.gather(*coroutines)
+
+    def join_threads(self) -> None:
+        """
+        Joins the thread running the event loop, if it was started.
+
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        if self.event_loop_thread is not None:
+            self.event_loop_thread.join()
@@ -0,0 +1,7 @@
+"""
+src.main.event package
+
+This package contains all the of data structures and scripts related to the
+discrete-event engine, which simulates producers and consumers in virtual
+time.
+"""
\ No newline at end of file
@@ -0,0 +1,206 @@
+import logging
+import random
+import threading
+import time
+from typing import List, Tuple
+
+from src.main.buffer.virtual_buffer import VirtualBuffer
+from src.main.event.event_queue import EventQueue
+from src.main.event.virtual_consumer import VirtualConsumer
+from src.main.event.virtual_processor import VirtualProcessor
+from src.main.event.virtual_producer import VirtualProducer
+from src.main.statistics.statistic_tracker import StatisticTracker
+from src.main.statistics.thread_profiler import ThreadProfiler
+from src.main.thread.thread_manager import ThreadManager
+
+
+class EventManager(ThreadManager):
+    """
+    Thread manager of the discrete-event engine. Producers and consumers are
+    simulated in virtual time: instead of sleeping through their simulated
+    work, they schedule their next event on the event queue of the virtual
+    buffer, and a single event loop thread handles the events in time order.
+    A run takes as much CPU time as it has events, however long its virtual
+    duration.
+
+    Items are distributed among producers and consumers the same way as for
+    threads, and the same statistic tracker is used, so the reporting and
+    suggestions are unchanged. Throughput is measured in virtual time.
+
+    :ivar producers: List of initialized virtual producers.
+    :type producers: List[VirtualProducer]
+    :ivar consumers: List of initialized virtual consumers.
+    :type consumers: List[VirtualConsumer]
+    :ivar event_queue: The event queue of the virtual buffer.
+    :type event_queue: EventQueue
+    :ivar event_loop_thread: The thread running the event loop, or None if
+        it was not started yet.
+    :type event_loop_thread: threading.Thread | None
+    :ivar num_events: The number of events handled so far.
+    :type num_events: int
+    """
+    EVENT_LOOP_THREAD_NAME: str = 'DiscreteEventLoop'
+    NANOSECONDS_PER_SECOND: int = 1_000_000_000
+    def __init__(self, num_producers: int,
+                 num_consumers: int,
+                 consumer_speed_range: Tuple[int, int],
+                 producer_speed_range: Tuple[int, int],
+                 buffer: VirtualBuffer,
+                 num_items_to_process: int,
+                 statistic_tracker: StatisticTracker,
+                 producer_batch_size: int = 1,
+                 consumer_batch_size: int = 1,
+                 thread_profiler: ThreadProfiler | None = None):
+        """
+        Initializes the virtual producers and consumers for a given number
+        of items.
+
+        :param num_producers: Number of virtual producers to create.
+        :type num_producers: int
+        :param num_consumers: Number of virtual consumers to create.
+        :type num_consumers: int
+        :param consumer_speed_range: Speed range (min, max) for consumers.
+        :type consumer_speed_range: Tuple[int, int]
+        :param producer_speed_range: Speed range (min, max) for producers.
+        :type producer_speed_range: Tuple[int, int]
+        :param buffer: Virtual buffer between producers and consumers, which
+            holds the event queue.
+        :type buffer: VirtualBuffer
+        :param num_items_to_process: Total number of items to be processed by
+            the system.
+        :type num_items_to_process: int
+        :param statistic_tracker: Tracker for collecting processing
+            statistics.
+        :type statistic_tracker: StatisticTracker
+        :param producer_batch_size: Number of items each producer enqueues
+            per buffer operation.
+        :type producer_batch_size: int
+        :param consumer_batch_size: Number of items each consumer dequeues
+            per buffer operation.
+        :type consumer_batch_size: int
+        :param thread_profiler: Profiler to run the event loop and the thread
+            management under, or None to run without profiling.
+        :type thread_profiler: ThreadProfiler | None
+        """
+        self.event_queue: EventQueue = buffer.event_queue
+        self.event_loop_thread: threading.Thread | None = None
+        self.num_events: int = 0
+        super().__init__(num_producers,
+                         num_consumers,
+                         consumer_speed_range,
+                         producer_speed_range,
+                         buffer,
+                         num_items_to_process,
+                         statistic_tracker,
+                         producer_batch_size,
+                         consumer_batch_size)
+        self.thread_profiler = thread_profiler
+
+    def initialize_producers(self) -> List[VirtualProducer]:
+        """
+        Initializes and returns a list of VirtualProducer objects.
+
+        :return: A list of initialized VirtualProducer objects.
+        :rtype: List[VirtualProducer]
+        """
+        items_per_producer, leftover_items = self.get_num_items_to_produce()
+        producers: List[VirtualProducer] = []
+        for i in range(self.num_producers):
+            items_to_produce: int = items_per_producer + (1 if i < leftover_items else 0)
+            producers.append(VirtualProducer(i + 1,
+                                             self.producer_speed_range[0],
+                                             self.producer_speed_range[1],
+                                             self.buffer,
+                                             items_to_produce,
+                                             self.statistic_tracker,
+                                             self.producer_batch_size))
+        logging.debug(f"{self.num_producers} producers will produce "
+                      f"{self.num_items_to_process} items.")
+        return producers
+
+    def initialize_consumers(self) -> List[VirtualConsumer]:
+        """
+        Initializes and returns a list of VirtualConsumer objects.
+
+        :return: A list of initialized VirtualConsumer objects.
+        :rtype: List[VirtualConsumer]
+        """
+        items_per_consumer, leftover_items = self.get_num_items_to_consume()
+        consumers: List[VirtualConsumer] = []
+        for i in range(self.num_consumers):
+            items_to_consume: int = items_per_consumer + (1 if i < leftover_items else 0)
+            consumers.append(VirtualConsumer(i + 1,
+                                             self.consumer_speed_range[0],
+                                             self.consumer_speed_range[1],
+                                             self.buffer,
+                                             items_to_consume,
+                                             self.statistic_tracker,
+                                             self.consumer_batch_size))
+        logging.debug(f"{self.num_consumers} consumers will consume "
+                      f"{self.num_items_to_process} items.")
+        return consumers
+
+    def start_threads(self) -> None:
+        """
+        Starts the thread running the event loop.
+
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        self.event_loop_thread = threading.Thread(target=self.run_event_loop,
+                                                  name=EventManager.EVENT_LOOP_THREAD_NAME)
+        self.event_loop_thread.start()
+        self.threads_started = True
+
+    def run_event_loop(self) -> None:
+        """
+        Runs the simulation until no event is pending, under the thread
+        profiler if one is set, and logs its virtual duration.
+
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        start_time: float = time.process_time()
+        if self.thread_profiler is not None:
+            self.thread_profiler.run_profiled(self.run_events)
+        else:
+            self.run_events()
+        logging.info(f"Simulated "
+                     f"{self.event_queue.current_time / EventManager.NANOSECONDS_PER_SECOND:,.3f}"
+                     f" seconds of virtual time in {self.num_events:,} events and "
+                     f"{time.process_time() - start_time:,.3f} seconds of CPU time")
+
+    def run_events(self) -> None:
+        """
+        Schedules every producer and consumer at the start of the virtual
+        clock in a random order, then handles the events in time order until
+        none is pending.
+
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        processors: List[VirtualProcessor] = self.producers + self.consumers
+        random.shuffle(processors)
+        logging.debug(f"Number of virtual processors: {len(processors)}.")
+        event_queue: EventQueue = self.event_queue
+        for processor in processors:
+            processor.start()
+            event_queue.push(event_queue.current_time, processor)
+        num_events: int = 0
+        while not event_queue.is_empty():
+            processor = event_queue.pop()
+            next_event_time: int | None = processor.handle_event(event_queue.current_time)
+            if next_event_time is not None:
+                event_queue.push(next_event_time, processor)
+            num_events += 1
+        self.num_events += num_events
+
+    def join_threads(self) -> None:
+        """
+        Joins the thread running the event loop, if it was started.
+
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        if self.event_loop_thread is not None:
+            self.event_loop_thread.join()
@@ -0,0 +1,79 @@
+import heapq
+import itertools
+from typing import Any, Iterator, List, Tuple
+
+
+class EventQueue:
+    """
+    Priority queue of the pending events of the discrete-event engine,
+    ordered by their virtual time in nanoseconds. Events scheduled for the
+    same time are popped in the order they were pushed, so runs are
+    reproducible for a given random seed.
+
+    Popping an event advances the virtual clock to its time; the clock never
+    goes backwards.
+
+    :ivar heap: Binary heap of the pending events, as tuples of their time,
+        their sequence number and the processor they belong to.
+    :type heap: List[Tuple[int, int, Any]]
+    :ivar sequence: Counter breaking ties between events of the same time.
+    :type sequence: Iterator[int]
+    :ivar current_time: The virtual time of the last popped event, in
+        nanoseconds.
+    :type current_time: int
+    """
+    def __init__(self):
+        """
+        Initializes an empty queue with the virtual clock at zero.
+        """
+        self.heap: List[Tuple[int, int, Any]] = []
+        self.sequence: Iterator[int] = itertools.count()
+        self.current_time: int = 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of pending events.
+
+        :return: The number of pending events.
+        :rtype: int
+        """
+        return len(self.heap)
+
+    def is_empty(self) -> bool:
+        """
+        Determines if no event is pending.
+
+        :return: True if the queue is empty, False otherwise.
+        :rtype: bool
+        """
+        return not self.heap
+
+    def push(self, event_time: int, processor: Any) -> None:
+        """
+        Schedules an event of a processor.
+
+        :param event_time: The virtual time of the event in nanoseconds. It
+            must not be earlier than the current time.
+        :type event_time: int
+        :param processor: The processor which handles the event.
+        :type processor: Any
+        :return: None
+        :raises ValueError: If the event time is earlier than the current
+            time.
+        """
+        if event_time < self.current_time:
+            raise ValueError(f"Cannot schedule an event at {event_time} ns before"
+                             f" the current time of {self.current_time} ns")
+        heapq.heappush(self.heap, (event_time, next(self.sequence), processor))
+
+    def pop(self) -> Any:
+        """
+        Removes the earliest event and advances the virtual clock to its
+        time.
+
+        :return: The processor which handles the event.
+        :rtype: Any
+        :raises IndexError: If no event is pending.
+        """
+        self.current_time, _, processor = heapq.heappop(self.heap)
+        return processor
@@ -0,0 +1,16 @@
+from enum import Enum
+
+
+class EventQueueType(Enum):
+    """
+    This Enum class defines the queue holding the pending events of the
+    discrete-event engine, keyed by the name accepted on the command line.
+
+    :ivar HEAP: A binary heap, taking logarithmic time per event.
+    :type HEAP: str
+    :ivar WHEEL: A hierarchical timing wheel with millisecond slots, taking
+        amortized constant time per event.
+    :type WHEEL: str
+    """
+    HEAP: str = 'heap'
+    WHEEL: str = 'wheel'
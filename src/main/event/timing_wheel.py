@@ -0,0 +1,209 @@
+import bisect
+import heapq
+from typing import Any, List, Tuple
+
+from src.main.event.event_queue import EventQueue
+
+
+class TimingWheel(EventQueue):
+    """
+    Hierarchical timing wheel holding the pending events of the
+    discrete-event engine in buckets of one millisecond of virtual time,
+    as an alternative to the binary heap of `EventQueue` for runs with many
+    pending events.
+
+    The first level has a slot per millisecond of the current 256
+    milliseconds. Every following overflow level has 64 slots, each spanning
+    a whole rotation of the level below, so the levels cover about 18.6
+    hours ahead. Events further away wait in a binary heap. An event is put
+    in the lowest level whose current rotation contains it. When the clock
+    enters a slot of a higher level, its events are cascaded into the lower
+    levels, at most once per level. Scheduling an event is constant time,
+    and so is popping it, amortized over the events of its millisecond.
+    A bitmap of the occupied slots of every level skips empty slots.
+
+    Events of the same millisecond are sorted by time and sequence number
+    when their slot is reached, which is linear when they were pushed in
+    order, so they are popped in the same order as with `EventQueue`.
+
+    :ivar heap: Binary heap of the events beyond the rotation of the highest
+        level, as tuples of their time, their sequence number and the
+        processor they belong to.
+    :type heap: List[Tuple[int, int, Any]]
+    :ivar slots: The events of every slot of every level, in push order.
+    :type slots: List[List[List[Tuple[int, int, Any]]]]
+    :ivar bitmaps: The occupied slots of every level, one bit per slot.
+    :type bitmaps: List[int]
+    :ivar ready: The events of the current millisecond, in pop order.
+    :type ready: List[Tuple[int, int, Any]]
+    :ivar ready_index: The position of the next event to pop in the ready
+        events.
+    :type ready_index: int
+    :ivar current_tick: The current millisecond of the wheel.
+    :type current_tick: int
+    :ivar num_events: The number of pending events.
+    :type num_events: int
+    """
+    TICK_DURATION: int = 1_000_000
+    LEVEL_BITS: Tuple[int, ...] = (8, 6, 6, 6)
+    LEVEL_SHIFTS: Tuple[int, ...] = (0, 8, 14, 20, 26)
+    LEVEL_MASKS: Tuple[int, ...] = (255, 63, 63, 63)
+    LEVEL_SPANS: Tuple[int, ...] = (1 << 8, 1 << 14, 1 << 20, 1 << 26)
+    NUM_LEVELS: int = 4
+    def __init__(self):
+        """
+        Initializes an empty wheel with the virtual clock at zero.
+        """
+        super().__init__()
+        self.slots: List[List[List[Tuple[int, int, Any]]]] = [
+            [[] for _ in range(1 << level_bits)] for level_bits in TimingWheel.LEVEL_BITS]
+        self.bitmaps: List[int] = [0] * len(TimingWheel.LEVEL_BITS)
+        self.ready: List[Tuple[int, int, Any]] = []
+        self.ready_index: int = 0
+        self.current_tick: int = 0
+        self.num_events: int = 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of pending events.
+
+        :return: The number of pending events.
+        :rtype: int
+        """
+        return self.num_events
+
+    def is_empty(self) -> bool:
+        """
+        Determines if no event is pending.
+
+        :return: True if the wheel is empty, False otherwise.
+        :rtype: bool
+        """
+        return self.num_events == 0
+
+    def push(self, event_time: int, processor: Any) -> None:
+        """
+        Schedules an event of a processor in the slot of its millisecond.
+
+        :param event_time: The virtual time of the event in nanoseconds. It
+            must not be earlier than the current time.
+        :type event_time: int
+        :param processor: The processor which handles the event.
+        :type processor: Any
+        :return: None
+        :raises ValueError: If the event time is earlier than the current
+            time.
+        """
+        if event_time < self.current_time:
+            raise ValueError(f"Cannot schedule an event at {event_time} ns before"
+                             f" the current time of {self.current_time} ns")
+        event: Tuple[int, int, Any] = (event_time, next(self.sequence), processor)
+        self.num_events += 1
+        tick: int = event_time // TimingWheel.TICK_DURATION
+        distance: int = tick ^ self.current_tick
+        if distance > TimingWheel.LEVEL_MASKS[0]:
+            self.insert(tick, event)
+        elif distance:
+            slot: List[Tuple[int, int, Any]] = self.slots[0][tick & TimingWheel.LEVEL_MASKS[0]]
+            if not slot:
+                self.bitmaps[0] |= 1 << (tick & TimingWheel.LEVEL_MASKS[0])
+            slot.append(event)
+        else:
+            ready: List[Tuple[int, int, Any]] = self.ready
+            if len(ready) > self.ready_index and ready[-1][0] > event_time:
+                bisect.insort(ready, event, self.ready_index)
+            else:
+                ready.append(event)
+
+    def insert(self, tick: int, event: Tuple[int, int, Any]) -> None:
+        """
+        Puts an event of a later millisecond in the lowest level whose
+        current rotation contains it, or in the heap beyond them.
+
+        :param tick: The millisecond of the event.
+        :type tick: int
+        :param event: The event, as a tuple of its time, its sequence number
+            and the processor it belongs to.
+        :type event: Tuple[int, int, Any]
+        :return: None
+        """
+        distance: int = tick ^ self.current_tick
+        level: int
+        if distance < TimingWheel.LEVEL_SPANS[0]:
+            level = 0
+        elif distance < TimingWheel.LEVEL_SPANS[1]:
+            level = 1
+        elif distance < TimingWheel.LEVEL_SPANS[2]:
+            level = 2
+        elif distance < TimingWheel.LEVEL_SPANS[3]:
+            level = 3
+        else:
+            heapq.heappush(self.heap, event)
+            return
+        slot_index: int = (tick >> TimingWheel.LEVEL_SHIFTS[level]) & TimingWheel.LEVEL_MASKS[level]
+        slot: List[Tuple[int, int, Any]] = self.slots[level][slot_index]
+        if not slot:
+            self.bitmaps[level] |= 1 << slot_index
+        slot.append(event)
+
+    def pop(self) -> Any:
+        """
+        Removes the earliest event and advances the virtual clock to its
+        time.
+
+        :return: The processor which handles the event.
+        :rtype: Any
+        :raises IndexError: If no event is pending.
+        """
+        if self.ready_index == len(self.ready):
+            self.advance()
+        event: Tuple[int, int, Any] = self.ready[self.ready_index]
+        self.ready_index += 1
+        self.num_events -= 1
+        self.current_time = event[0]
+        return event[2]
+
+    def advance(self) -> None:
+        """
+        Advances the wheel to the next millisecond with pending events and
+        makes them ready, cascading the slots of higher levels on the way. A
+        slot holding a single event is made ready without cascading it.
+
+        :return: None
+        :raises IndexError: If no event is pending.
+        """
+        if self.num_events == 0:
+            raise IndexError("pop from an empty timing wheel")
+        bitmaps: List[int] = self.bitmaps
+        level: int = 0
+        while level < TimingWheel.NUM_LEVELS:
+            shift: int = TimingWheel.LEVEL_SHIFTS[level]
+            slot_index: int = (self.current_tick >> shift) & TimingWheel.LEVEL_MASKS[level]
+            later_slots: int = bitmaps[level] >> slot_index
+            if not later_slots:
+                level += 1
+                continue
+            slot_index += (later_slots & -later_slots).bit_length() - 1
+            level_slots: List[List[Tuple[int, int, Any]]] = self.slots[level]
+            events: List[Tuple[int, int, Any]] = level_slots[slot_index]
+            level_slots[slot_index] = []
+            bitmaps[level] ^= 1 << slot_index
+            if level == 0 or len(events) == 1:
+                events.sort()
+                self.current_tick = events[0][0] // TimingWheel.TICK_DURATION
+                self.ready = events
+                self.ready_index = 0
+                return
+            next_shift: int = TimingWheel.LEVEL_SHIFTS[level + 1]
+            self.current_tick = ((self.current_tick >> next_shift << next_shift) |
+                                 (slot_index << shift))
+            for event in events:
+                self.insert(event[0] // TimingWheel.TICK_DURATION, event)
+            level = 0
+        tick: int = self.heap[0][0] // TimingWheel.TICK_DURATION
+        top_shift: int = TimingWheel.LEVEL_SHIFTS[-1]
+        self.current_tick = tick >> top_shift << top_shift
+        while self.heap and self.heap[0][0] // TimingWheel.TICK_DURATION >> top_shift == tick >> top_shift:
+            event = heapq.heappop(self.heap)
+            self.insert(event[0] // TimingWheel.TICK_DURATION, event)
+        self.advance()
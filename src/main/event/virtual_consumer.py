@@ -0,0 +1,74 @@
+from typing import List
+
+from src.main.buffer.empty_buffer_exception import EmptyBufferException
+from src.main.event.virtual_processor import VirtualProcessor
+
+
+class VirtualConsumer(VirtualProcessor):
+    """
+    Consumes items from the virtual buffer. Like `Consumer`, it stops when
+    it finds the buffer empty after every item has been produced.
+    """
+    NAME: str = 'Consumer'
+    def process_item(self, current_time: int) -> int | None:
+        """
+        Dequeues up to a batch of items from the buffer.
+
+        :param current_time: The virtual time in nanoseconds.
+        :type current_time: int
+        :return: The virtual time the simulated work is complete, the time of
+            the next attempt if the buffer is empty, or None if the consumer
+            stopped or waits to be woken.
+        :rtype: int | None
+        """
+        try:
+            dequeued_numbers: List[int] = self.buffer.dequeue_many(self.get_batch_size())
+        except EmptyBufferException:
+            if (self.statistic_tracker.items_produced ==
+                    self.statistic_tracker.num_items_to_process):
+                self.stop()
+                return None
+            return self.retry_later(current_time)
+        return self.start_processing(current_time, len(dequeued_numbers))
+
+    def wait(self) -> None:
+        """
+        Waits for an item in the blocking buffer.
+
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        self.buffer.wait_for_item(self)
+
+    def should_sample_throughput(self) -> bool:
+        """
+        Decides whether the throughput of the consumed items is recorded.
+
+        :return: True if the throughput should be recorded, False otherwise.
+        :rtype: bool
+        """
+        return self.statistic_tracker.should_sample_consumer()
+
+    def add_throughput(self, throughput: int, num_items: int) -> None:
+        """
+        Records the consumer throughput of consumed items.
+
+        :param throughput: The virtual time per item in nanoseconds.
+        :type throughput: int
+        :param num_items: The number of items consumed.
+        :type num_items: int
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        self.statistic_tracker.add_consumer_throughput(throughput, num_items)
+
+    def increment_processed_items(self, num_items: int) -> None:
+        """
+        Counts consumed items whose throughput is not sampled.
+
+        :param num_items: The number of items consumed.
+        :type num_items: int
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        self.statistic_tracker.increment_consumed_items(num_items)
@@ -0,0 +1,279 @@
+import random
+from abc import ABC, abstractmethod
+
+from src.main.buffer.virtual_buffer import VirtualBuffer
+from src.main.statistics.statistic_tracker import StatisticTracker
+
+
+class VirtualProcessor(ABC):
+    """
+    Processor abstract base class for the discrete-event engine. It is
+    neither a thread nor a coroutine: the engine calls `handle_event` every
+    time an event of the processor is due, and the processor returns the
+    virtual time of its next event instead of sleeping.
+
+    Each event first completes the work started by the previous one, then
+    attempts the next buffer operation, mirroring the loop of `Processor`.
+    The throughput of an operation is recorded when its simulated work is
+    complete, over the virtual time from the start of the attempt, so it
+    includes any time spent waiting on a blocking buffer.
+
+    :ivar id: Identifier of the processor.
+    :type id: int
+    :ivar name: Name of the processor.
+    :type name: str
+    :ivar speed_floor: Minimum speed of processing in milliseconds.
+    :type speed_floor: int
+    :ivar speed_ceiling: Maximum speed of processing in milliseconds.
+    :type speed_ceiling: int
+    :ivar buffer: Shared buffer object for processing.
+    :type buffer: VirtualBuffer
+    :ivar running: Indicates if the processor should be running.
+    :type running: bool
+    :ivar num_items_to_process: Number of items remaining to process.
+    :type num_items_to_process: int
+    :ivar statistic_tracker: Object for tracking processing statistics.
+    :type statistic_tracker: StatisticTracker
+    :ivar batch_size: The number of items processed together.
+    :type batch_size: int
+    :ivar attempt_start_time: The virtual time the current attempt started,
+        in nanoseconds.
+    :type attempt_start_time: int
+    :ivar is_waiting: Whether the processor waits on a blocking buffer.
+    :type is_waiting: bool
+    :ivar num_processing_items: The number of items whose simulated work is
+        in progress.
+    :type num_processing_items: int
+    """
+    NAME: str = 'Processor'
+    POLLING_INTERVAL: int = 10_000_000
+    NANOSECONDS_PER_MILLISECOND: int = 1_000_000
+    def __init__(self,
+                 id: int,
+                 speed_floor: int,
+                 speed_ceiling: int,
+                 buffer: VirtualBuffer,
+                 num_items_to_process: int,
+                 statistic_tracker: StatisticTracker,
+                 batch_size: int = 1):
+        """
+        Initializes a processor which processes a specific number of items
+        at a variable speed range.
+
+        :param id: Unique identifier for the processor.
+        :type id: int
+        :param speed_floor: Minimum processing speed.
+        :type speed_floor: int
+        :param speed_ceiling: Maximum processing speed.
+        :type speed_ceiling: int
+        :param buffer: Shared buffer for item consumption or production.
+        :type buffer: VirtualBuffer
+        :param num_items_to_process: Total number of items the processor
+            should process.
+        :type num_items_to_process: int
+        :param statistic_tracker: Object for tracking processing statistics.
+        :type statistic_tracker: StatisticTracker
+        :param batch_size: The number of items to process together.
+        :type batch_size: int
+        """
+        self.id: int = id
+        self.name: str = f"{self.NAME}-{id}"
+        self.speed_floor: int = speed_floor
+        self.speed_ceiling: int = speed_ceiling
+        self.buffer: VirtualBuffer = buffer
+        self.running: bool = False
+        self.num_items_to_process: int = num_items_to_process
+        self.statistic_tracker: StatisticTracker = statistic_tracker
+        self.batch_size: int = batch_size
+        self.attempt_start_time: int = 0
+        self.is_waiting: bool = False
+        self.num_processing_items: int = 0
+
+    def start(self) -> None:
+        """
+        Marks the processor as running.
+
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        self.running = True
+
+    def handle_event(self, current_time: int) -> int | None:
+        """
+        Completes the work in progress, then attempts the next buffer
+        operation if the processor should still run, or stops it otherwise.
+
+        :param current_time: The virtual time of the event in nanoseconds.
+        :type current_time: int
+        :return: The virtual time of the next event, or None if the processor
+            stopped or waits to be woken by the buffer.
+        :rtype: int | None
+        """
+        if self.num_processing_items > 0:
+            num_items: int = self.num_processing_items
+            self.num_processing_items = 0
+            if self.should_sample_throughput():
+                self.add_throughput((current_time - self.attempt_start_time) // num_items,
+                                    num_items)
+            else:
+                self.increment_processed_items(num_items)
+        if not self.should_run():
+            self.stop()
+            return None
+        if self.is_waiting:
+            self.is_waiting = False
+        else:
+            self.attempt_start_time = current_time
+        return self.process_item(current_time)
+
+    def should_run(self) -> bool:
+        """
+        Determines whether the processor should run based on the state.
+
+        :return: True if the processor should run and False otherwise.
+        :rtype: bool
+        """
+        return self.running and self.num_items_to_process > 0
+
+    def get_batch_size(self) -> int:
+        """
+        Returns the number of items of the next batch, which never exceeds
+        the number of items remaining to process.
+
+        :return: The number of items of the next batch.
+        :rtype: int
+        """
+        return min(self.batch_size, self.num_items_to_process)
+
+    def get_processing_time(self, num_items: int) -> int:
+        """
+        Draws the simulated processing time of a batch of items, the sum of
+        a random duration per item within the defined speed range.
+
+        :param num_items: The number of items in the batch.
+        :type num_items: int
+        :return: The processing time in nanoseconds.
+        :rtype: int
+        """
+        if self.speed_floor == self.speed_ceiling:
+            processing_time: int = self.speed_floor * num_items
+        elif num_items == 1:
+            processing_time = random.randint(self.speed_floor, self.speed_ceiling)
+        else:
+            processing_time = sum(random.randint(self.speed_floor, self.speed_ceiling)
+                                  for _ in range(num_items))
+        return processing_time * VirtualProcessor.NANOSECONDS_PER_MILLISECOND
+
+    def start_processing(self, current_time: int, num_items: int) -> int:
+        """
+        Starts the simulated work on a batch of items taken from or put into
+        the buffer.
+
+        :param current_time: The virtual time in nanoseconds.
+        :type current_time: int
+        :param num_items: The number of items in the batch.
+        :type num_items: int
+        :return: The virtual time the work is complete.
+        :rtype: int
+        """
+        self.num_items_to_process -= num_items
+        self.num_processing_items = num_items
+        return current_time + self.get_processing_time(num_items)
+
+    def retry_later(self, current_time: int) -> int | None:
+        """
+        Handles a full or empty buffer: the processor waits to be woken by a
+        blocking buffer, or polls the buffer again after the polling
+        interval.
+
+        :param current_time: The virtual time in nanoseconds.
+        :type current_time: int
+        :return: The virtual time of the next attempt, or None if the
+            processor waits to be woken.
+        :rtype: int | None
+        """
+        if self.buffer.is_blocking:
+            self.is_waiting = True
+            self.wait()
+            return None
+        return current_time + VirtualProcessor.POLLING_INTERVAL
+
+    @abstractmethod
+    def process_item(self, current_time: int) -> int | None:
+        """
+        An abstract method attempting the next buffer operation.
+
+        :param current_time: The virtual time in nanoseconds.
+        :type current_time: int
+        :raises NotImplementedError: If called directly and not overridden in
+            a subclass.
+        :return: The virtual time of the next event, or None if the processor
+            stopped or waits to be woken.
+        :rtype: int | None
+        """
+        pass
+
+    @abstractmethod
+    def wait(self) -> None:
+        """
+        An abstract method parking the processor on the blocking buffer.
+
+        :raises NotImplementedError: If called directly and not overridden in
+            a subclass.
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        pass
+
+    @abstractmethod
+    def should_sample_throughput(self) -> bool:
+        """
+        An abstract method deciding whether the throughput of the items
+        processed is recorded.
+
+        :raises NotImplementedError: If called directly and not overridden in
+            a subclass.
+        :return: True if the throughput should be recorded, False otherwise.
+        :rtype: bool
+        """
+        pass
+
+    @abstractmethod
+    def add_throughput(self, throughput: int, num_items: int) -> None:
+        """
+        An abstract method recording the throughput of processed items.
+
+        :param throughput: The virtual time per item in nanoseconds.
+        :type throughput: int
+        :param num_items: The number of items processed.
+        :type num_items: int
+        :raises NotImplementedError: If called directly and not overridden in
+            a subclass.
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        pass
+
+    @abstractmethod
+    def increment_processed_items(self, num_items: int) -> None:
+        """
+        An abstract method counting processed items whose throughput is not
+        sampled.
+
+        :param num_items: The number of items processed.
+        :type num_items: int
+        :raises NotImplementedError: If called directly and not overridden in
+            a subclass.
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        pass
+
+    def stop(self) -> None:
+        """
+        Stops the processor by setting its running status to False.
+
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        self.running = False
@@ -0,0 +1,120 @@
+import random
+from typing import List
+
+from src.main.buffer.full_buffer_exception import FullBufferException
+from src.main.buffer.virtual_buffer import VirtualBuffer
+from src.main.event.virtual_processor import VirtualProcessor
+from src.main.statistics.statistic_tracker import StatisticTracker
+
+
+class VirtualProducer(VirtualProcessor):
+    """
+    Produces random numbers into the virtual buffer. Like `Producer`,
+    numbers of a batch which do not fit are kept and offered again on the
+    next attempt.
+
+    :ivar pending_numbers: Produced numbers of the current batch which have
+        not been accepted by the buffer yet.
+    :type pending_numbers: List[int]
+    """
+    NAME: str = 'Producer'
+    def __init__(self,
+                 id: int,
+                 speed_floor: int,
+                 speed_ceiling: int,
+                 buffer: VirtualBuffer,
+                 num_items_to_process: int,
+                 statistic_tracker: StatisticTracker,
+                 batch_size: int = 1):
+        """
+        Initializes a producer without pending numbers.
+
+        :param id: Unique identifier for the producer.
+        :type id: int
+        :param speed_floor: Minimum speed of production.
+        :type speed_floor: int
+        :param speed_ceiling: Maximum speed of production.
+        :type speed_ceiling: int
+        :param buffer: Shared buffer where produced items will be stored.
+        :type buffer: VirtualBuffer
+        :param num_items_to_process: Total number of items the producer
+            should create.
+        :type num_items_to_process: int
+        :param statistic_tracker: Tracks and records production-related
+            statistics.
+        :type statistic_tracker: StatisticTracker
+        :param batch_size: The number of items to produce and enqueue
+            together.
+        :type batch_size: int
+        """
+        super().__init__(id,
+                         speed_floor,
+                         speed_ceiling,
+                         buffer,
+                         num_items_to_process,
+                         statistic_tracker,
+                         batch_size)
+        self.pending_numbers: List[int] = []
+
+    def process_item(self, current_time: int) -> int | None:
+        """
+        Produces a batch of random numbers unless some are still pending, and
+        enqueues as many of them as the buffer accepts.
+
+        :param current_time: The virtual time in nanoseconds.
+        :type current_time: int
+        :return: The virtual time the simulated work is complete, or the
+            time of the next attempt if the buffer is full.
+        :rtype: int | None
+        """
+        if not self.pending_numbers:
+            self.pending_numbers = [random.randint(1, 100)
+                                    for _ in range(self.get_batch_size())]
+        try:
+            num_enqueued: int = self.buffer.enqueue_many(self.pending_numbers)
+        except FullBufferException:
+            return self.retry_later(current_time)
+        del self.pending_numbers[:num_enqueued]
+        return self.start_processing(current_time, num_enqueued)
+
+    def wait(self) -> None:
+        """
+        Waits for space in the blocking buffer.
+
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        self.buffer.wait_for_space(self)
+
+    def should_sample_throughput(self) -> bool:
+        """
+        Decides whether the throughput of the produced items is recorded.
+
+        :return: True if the throughput should be recorded, False otherwise.
+        :rtype: bool
+        """
+        return self.statistic_tracker.should_sample_producer()
+
+    def add_throughput(self, throughput: int, num_items: int) -> None:
+        """
+        Records the producer throughput of produced items.
+
+        :param throughput: The virtual time per item in nanoseconds.
+        :type throughput: int
+        :param num_items: The number of items produced.
+        :type num_items: int
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        self.statistic_tracker.add_producer_throughput(throughput, num_items)
+
+    def increment_processed_items(self, num_items: int) -> None:
+        """
+        Counts produced items whose throughput is not sampled.
+
+        :param num_items: The number of items produced.
+        :type num_items: int
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        self.statistic_tracker.increment_produced_items(num_items)
@@ -1,12 +1,15 @@
 import logging
 import threading
 
+from src.main.statistics.tracking_mode import TrackingMode
+
 
 def setup_logging(use_verbose: bool = False) -> None:
     """
     Sets up the logging configuration for the application. Depending on the
     provided ``use_verbose`` parameter, it will configure either verbose or
-    default logging settings.
+    default logging settings, and switch the per-call instrumentation of the
+    tracking decorators on or off accordingly.
 
     :param use_verbose: A boolean indicating whether verbose logging
         should be enabled. If False, default logging will be used.
@@ -14,6 +17,7 @@ def setup_logging(use_verbose: bool = False) -> None:
     :return: This function does not return a value.
     :rtype: None
     """
+    TrackingMode.set_verbose(use_verbose)
     if use_verbose:
         setup_verbose_logging()
     else:
@@ -0,0 +1,21 @@
+from enum import Enum
+
+
+class EngineType(Enum):
+    """
+    This Enum class defines the engine which drives the producers and
+    consumers, keyed by the name accepted on the command line.
+
+    :ivar THREADED: Every producer and consumer runs as a thread, or as a
+        process with the process executor.
+    :type THREADED: str
+    :ivar ASYNCIO: Every producer and consumer runs as a coroutine on a
+        single event loop, sharing an asynchronous buffer.
+    :type ASYNCIO: str
+    :ivar DES: Producers and consumers are simulated by a discrete-event
+        engine in virtual time, without sleeping through their work.
+    :type DES: str
+    """
+    THREADED: str = 'threaded'
+    ASYNCIO: str = 'asyncio'
+    DES: str = 'des'
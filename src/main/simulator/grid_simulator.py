@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import logging
+import time
+from typing import Dict, Tuple
+
+from src.main.config.config import Config
+from src.main.event.virtual_processor import VirtualProcessor
+from src.main.logging.logging_utilities import log_in_bold, \
+    print_logging_seperator
+from src.main.simulator.grid_workers import GridWorkers
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class GridSimulator:
+    """
+    Simulates a grid of configurations at once, each with its own buffer
+    size, number of producers and number of consumers, and the remaining
+    settings of the configuration.
+
+    The state of every configuration is held in NumPy arrays: the buffer
+    occupancy and counters have one entry per configuration, and the time of
+    the next event, the items left to process and the items being processed
+    have one entry per producer or consumer, held by `GridWorkers`. All
+    configurations advance in lock-step virtual time: every step jumps to the
+    earliest pending event of any configuration and handles every producer
+    and consumer due at that time with array operations, whose cost follows
+    the number of configurations and of workers due rather than of workers.
+
+    The producers and consumers follow the discrete-event engine with a
+    polling buffer. Within a step, producers go before consumers, and
+    producers or consumers of the same configuration are served in order
+    while the buffer has room or items. Times are whole milliseconds, which
+    the integer speed ranges and the polling interval keep exact. The latency
+    is the average time an item spends in the buffer, by Little's law the
+    integral of the buffer occupancy over the number of items consumed.
+
+    NumPy is an optional dependency, only needed by this simulator.
+
+    :ivar config: The configuration whose grid is simulated.
+    :type config: Config
+    :ivar random_generator: Generator of the random processing times.
+    :type random_generator: np.random.Generator
+    :ivar buffer_sizes: The buffer size of every configuration.
+    :type buffer_sizes: np.ndarray
+    :ivar num_producers: The number of producers of every configuration.
+    :type num_producers: np.ndarray
+    :ivar num_consumers: The number of consumers of every configuration.
+    :type num_consumers: np.ndarray
+    :ivar current_time: The current virtual time in milliseconds.
+    :type current_time: int
+    :ivar num_steps: The number of time steps simulated so far.
+    :type num_steps: int
+    :ivar results: The columns of the results table, once simulated.
+    :type results: Dict[str, np.ndarray]
+    """
+    POLLING_INTERVAL: int = (VirtualProcessor.POLLING_INTERVAL //
+                             VirtualProcessor.NANOSECONDS_PER_MILLISECOND)
+    MILLISECONDS_PER_SECOND: int = 1000
+    COLUMNS: Tuple[Tuple[str, str, str], ...] = (
+        ('buffer_size', 'Buffer', '{:>6}'),
+        ('num_producers', 'Producers', '{:>9}'),
+        ('num_consumers', 'Consumers', '{:>9}'),
+        ('duration', 'Duration (s)', '{:>12.3f}'),
+        ('producer_throughput', 'Producer (ms/item)', '{:>18.3f}'),
+        ('consumer_throughput', 'Consumer (ms/item)', '{:>18.3f}'),
+        ('num_full_buffer', 'Full', '{:>8}'),
+        ('num_empty_buffer', 'Empty', '{:>8}'),
+        ('latency', 'Latency (ms)', '{:>12.3f}'))
+    def __init__(self, config: Config, seed: int | None = None):
+        """
+        Initializes the simulator of the grid of a configuration.
+
+        :param config: The configuration whose grid is simulated.
+        :type config: Config
+        :param seed: The seed of the random processing times, or None for
+            fresh entropy.
+        :type seed: int | None
+        :raises RuntimeError: If NumPy is not installed.
+        """
+        if not GridSimulator.is_supported():
+            raise RuntimeError("The grid simulator requires NumPy")
+        self.config: Config = config
+        self.random_generator: np.random.Generator = np.random.default_rng(seed)
+        grid: np.ndarray = np.array(config.grid, dtype=np.int64).reshape(-1, 3)
+        self.buffer_sizes: np.ndarray = grid[:, 0]
+        self.num_producers: np.ndarray = grid[:, 1]
+        self.num_consumers: np.ndarray = grid[:, 2]
+        self.current_time: int = 0
+        self.num_steps: int = 0
+        self.results: Dict[str, np.ndarray] = {}
+
+    @staticmethod
+    def is_supported() -> bool:
+        """
+        Determines if NumPy is installed.
+
+        :return: True if the grid can be simulated, False otherwise.
+        :rtype: bool
+        """
+        return np is not None
+
+    def simulate(self) -> None:
+        """
+        Simulates every configuration of the grid and shows the results.
+
+        :return: None
+        """
+        logging.info(f"Simulating {len(self.buffer_sizes)} configurations at once")
+        start_time: float = time.process_time()
+        self.run()
+        logging.info(f"Simulated the grid in {self.num_steps:,} time steps and "
+                     f"{time.process_time() - start_time:,.3f} seconds of CPU time")
+        print_logging_seperator()
+        log_in_bold(self.get_results_table())
+        print_logging_seperator()
+
+    def run(self) -> Dict[str, np.ndarray]:
+        """
+        Simulates every configuration of the grid until all of their items
+        are consumed.
+
+        :return: The columns of the results table: the buffer size, number
+            of producers and number of consumers, the virtual duration in
+            seconds, the average producer and consumer throughput in
+            milliseconds per item, the number of full and empty buffers, and
+            the average latency of an item in the buffer in milliseconds.
+        :rtype: Dict[str, np.ndarray]
+        """
+        num_items: int = self.config.num_items_to_process
+        producers: GridWorkers = GridWorkers(self.num_producers,
+                                             num_items,
+                                             self.config.producer_speed_range,
+                                             self.config.producer_batch_size,
+                                             self.random_generator)
+        consumers: GridWorkers = GridWorkers(self.num_consumers,
+                                             num_items,
+                                             self.config.consumer_speed_range,
+                                             self.config.consumer_batch_size,
+                                             self.random_generator)
+        occupancy: np.ndarray = np.zeros_like(self.buffer_sizes)
+        occupancy_area: np.ndarray = np.zeros_like(self.buffer_sizes)
+        items_produced: np.ndarray = np.zeros_like(self.buffer_sizes)
+        items_consumed: np.ndarray = np.zeros_like(self.buffer_sizes)
+        num_full_buffer: np.ndarray = np.zeros_like(self.buffer_sizes)
+        num_empty_buffer: np.ndarray = np.zeros_like(self.buffer_sizes)
+        end_times: np.ndarray = np.zeros_like(self.buffer_sizes)
+        self.current_time = 0
+        self.num_steps = 0
+        while True:
+            next_time: int = min(producers.get_next_time(), consumers.get_next_time())
+            if next_time >= GridWorkers.NEVER:
+                break
+            occupancy_area += occupancy * (next_time - self.current_time)
+            self.current_time = next_time
+            self.num_steps += 1
+            producer_indices: np.ndarray = producers.get_due(next_time)
+            consumer_indices: np.ndarray = consumers.get_due(next_time)
+            end_times[producers.get_configurations(producer_indices)] = next_time
+            end_times[consumers.get_configurations(consumer_indices)] = next_time
+            items_produced += producers.complete_work(producer_indices)
+            items_consumed += consumers.complete_work(consumer_indices)
+            producer_indices = producers.stop_finished(producer_indices)
+            consumer_indices = consumers.stop_finished(consumer_indices)
+
+            enqueued: np.ndarray = producers.serve(producer_indices,
+                                                   self.buffer_sizes - occupancy)
+            occupancy += producers.count(producer_indices, enqueued)
+            full_indices: np.ndarray = producers.start_work(producer_indices,
+                                                            enqueued,
+                                                            next_time)
+            num_full_buffer += producers.count(full_indices)
+            producers.times[full_indices] = next_time + GridSimulator.POLLING_INTERVAL
+
+            dequeued: np.ndarray = consumers.serve(consumer_indices, occupancy)
+            occupancy -= consumers.count(consumer_indices, dequeued)
+            empty_indices: np.ndarray = consumers.start_work(consumer_indices,
+                                                             dequeued,
+                                                             next_time)
+            num_empty_buffer += consumers.count(empty_indices)
+            is_done: np.ndarray = (items_produced == num_items)[
+                consumers.get_configurations(empty_indices)]
+            consumers.times[empty_indices] = np.where(
+                is_done, GridWorkers.NEVER, next_time + GridSimulator.POLLING_INTERVAL)
+        self.results = {
+            'buffer_size': self.buffer_sizes,
+            'num_producers': self.num_producers,
+            'num_consumers': self.num_consumers,
+            'duration': end_times / GridSimulator.MILLISECONDS_PER_SECOND,
+            'producer_throughput': producers.time_sums / np.maximum(items_produced, 1),
+            'consumer_throughput': consumers.time_sums / np.maximum(items_consumed, 1),
+            'num_full_buffer': num_full_buffer,
+            'num_empty_buffer': num_empty_buffer,
+            'latency': occupancy_area / np.maximum(items_consumed, 1)
+        }
+        return self.results
+
+    def get_results_table(self) -> str:
+        """
+        Formats the results with one row per configuration.
+
+        :return: The results table, or an empty string if the grid was not
+            simulated yet.
+        :rtype: str
+        """
+        if not self.results:
+            return ""
+        header: str = " ".join(f"{title:>{len(column_format.format(0))}}"
+                               for _, title, column_format in GridSimulator.COLUMNS)
+        results_table: str = f"""
+        {header}"""
+        for row in range(len(self.buffer_sizes)):
+            values: str = " ".join(column_format.format(self.results[key][row].item())
+                                   for key, _, column_format in GridSimulator.COLUMNS)
+            results_table += f"""
+        {values}"""
+        return results_table
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+from typing import Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class GridWorkers:
+    """
+    The producers or the consumers of every configuration of a grid
+    simulation, as flat NumPy arrays with one entry per worker. The workers
+    of a configuration are contiguous and padded to the largest number of
+    workers, so the configuration of a worker is its index divided by that
+    width. Padding workers never have an event.
+
+    Every operation takes the indices of the workers concerned, in ascending
+    order, and costs time in proportion to them and the number of
+    configurations rather than to every worker.
+
+    :ivar num_configurations: The number of configurations of the grid.
+    :type num_configurations: int
+    :ivar width: The largest number of workers of a configuration.
+    :type width: int
+    :ivar speed_range: The range of the processing time per item in
+        milliseconds.
+    :type speed_range: Tuple[int, int]
+    :ivar batch_size: The largest number of items per buffer operation.
+    :type batch_size: int
+    :ivar random_generator: Generator of the random processing times.
+    :type random_generator: np.random.Generator
+    :ivar times: The time of the next event of every worker in milliseconds,
+        or never.
+    :type times: np.ndarray
+    :ivar quotas: The number of items left to process by every worker.
+    :type quotas: np.ndarray
+    :ivar processing_items: The number of items every worker is processing.
+    :type processing_items: np.ndarray
+    :ivar time_sums: The total processing time of every configuration in
+        milliseconds.
+    :type time_sums: np.ndarray
+    """
+    NEVER: int = 2 ** 62
+    def __init__(self,
+                 num_workers: np.ndarray,
+                 num_items_to_process: int,
+                 speed_range: Tuple[int, int],
+                 batch_size: int,
+                 random_generator: np.random.Generator):
+        """
+        Initializes the workers of every configuration, all scheduled at the
+        start of the virtual clock, and distributes the items among them the
+        same way as the thread manager.
+
+        :param num_workers: The number of workers of every configuration.
+        :type num_workers: np.ndarray
+        :param num_items_to_process: The number of items every configuration
+            processes.
+        :type num_items_to_process: int
+        :param speed_range: The range of the processing time per item in
+            milliseconds.
+        :type speed_range: Tuple[int, int]
+        :param batch_size: The largest number of items per buffer operation.
+        :type batch_size: int
+        :param random_generator: Generator of the random processing times.
+        :type random_generator: np.random.Generator
+        """
+        self.num_configurations: int = len(num_workers)
+        self.width: int = int(num_workers.max(initial=0))
+        self.speed_range: Tuple[int, int] = speed_range
+        self.batch_size: int = batch_size
+        self.random_generator: np.random.Generator = random_generator
+        worker_indices: np.ndarray = np.arange(self.width)[np.newaxis, :]
+        num_workers = num_workers[:, np.newaxis]
+        is_worker: np.ndarray = worker_indices < num_workers
+        quotas: np.ndarray = (num_items_to_process // num_workers +
+                              (worker_indices < num_items_to_process % num_workers))
+        self.times: np.ndarray = np.where(is_worker, 0, GridWorkers.NEVER).ravel()
+        self.quotas: np.ndarray = np.where(is_worker, quotas, 0).ravel()
+        self.processing_items: np.ndarray = np.zeros_like(self.quotas)
+        self.time_sums: np.ndarray = np.zeros(self.num_configurations, dtype=np.int64)
+
+    def get_next_time(self) -> int:
+        """
+        Determines the time of the earliest event of any worker.
+
+        :return: The time of the next event in milliseconds, or never.
+        :rtype: int
+        """
+        return int(self.times.min(initial=GridWorkers.NEVER))
+
+    def get_due(self, current_time: int) -> np.ndarray:
+        """
+        Determines the workers with an event at the current time.
+
+        :param current_time: The current virtual time in milliseconds.
+        :type current_time: int
+        :return: The indices of the workers due, in ascending order.
+        :rtype: np.ndarray
+        """
+        return np.flatnonzero(self.times == current_time)
+
+    def get_configurations(self, indices: np.ndarray) -> np.ndarray:
+        """
+        Determines the configuration of workers.
+
+        :param indices: The indices of the workers.
+        :type indices: np.ndarray
+        :return: The index of the configuration of every worker.
+        :rtype: np.ndarray
+        """
+        return indices // self.width
+
+    def count(self, indices: np.ndarray, weights: np.ndarray | None = None) -> np.ndarray:
+        """
+        Counts workers, or sums a value of theirs, per configuration.
+
+        :param indices: The indices of the workers.
+        :type indices: np.ndarray
+        :param weights: The value of every worker to sum, or None to count
+            the workers.
+        :type weights: np.ndarray | None
+        :return: The count or the sum of every configuration.
+        :rtype: np.ndarray
+        """
+        return np.bincount(self.get_configurations(indices),
+                           weights,
+                           self.num_configurations).astype(np.int64)
+
+    def complete_work(self, indices: np.ndarray) -> np.ndarray:
+        """
+        Completes the simulated work of workers.
+
+        :param indices: The indices of the workers due.
+        :type indices: np.ndarray
+        :return: The number of items completed in every configuration.
+        :rtype: np.ndarray
+        """
+        completed_items: np.ndarray = self.count(indices, self.processing_items[indices])
+        self.processing_items[indices] = 0
+        return completed_items
+
+    def stop_finished(self, indices: np.ndarray) -> np.ndarray:
+        """
+        Stops the workers which have no items left.
+
+        :param indices: The indices of the workers due.
+        :type indices: np.ndarray
+        :return: The indices of the workers due which are still running.
+        :rtype: np.ndarray
+        """
+        is_finished: np.ndarray = self.quotas[indices] == 0
+        self.times[indices[is_finished]] = GridWorkers.NEVER
+        return indices[~is_finished]
+
+    def serve(self, indices: np.ndarray, available: np.ndarray) -> np.ndarray:
+        """
+        Serves the requests of workers for up to a batch of items, in order
+        within every configuration, as long as its buffer has room or items.
+
+        :param indices: The indices of the workers due, in ascending order.
+        :type indices: np.ndarray
+        :param available: The room or the items in the buffer of every
+            configuration.
+        :type available: np.ndarray
+        :return: The number of items every worker is served.
+        :rtype: np.ndarray
+        """
+        configurations: np.ndarray = self.get_configurations(indices)
+        requested: np.ndarray = np.minimum(self.quotas[indices], self.batch_size)
+        requested_before: np.ndarray = np.cumsum(requested) - requested
+        is_first: np.ndarray = np.diff(configurations, prepend=-1) != 0
+        first_positions: np.ndarray = np.maximum.accumulate(
+            np.where(is_first, np.arange(len(indices)), 0))
+        requested_before -= requested_before[first_positions]
+        return np.clip(available[configurations] - requested_before, 0, requested)
+
+    def start_work(self,
+                   indices: np.ndarray,
+                   served: np.ndarray,
+                   current_time: int) -> np.ndarray:
+        """
+        Starts the simulated work of the workers which were served, drawing
+        a random processing time per item within the speed range.
+
+        :param indices: The indices of the workers due.
+        :type indices: np.ndarray
+        :param served: The number of items every worker was served.
+        :type served: np.ndarray
+        :param current_time: The current virtual time in milliseconds.
+        :type current_time: int
+        :return: The indices of the workers which were not served.
+        :rtype: np.ndarray
+        """
+        is_served: np.ndarray = served > 0
+        served_indices: np.ndarray = indices[is_served]
+        served = served[is_served]
+        processing_times: np.ndarray = self.draw_processing_times(served)
+        self.quotas[served_indices] -= served
+        self.processing_items[served_indices] = served
+        self.times[served_indices] = current_time + processing_times
+        self.time_sums += self.count(served_indices, processing_times)
+        return indices[~is_served]
+
+    def draw_processing_times(self, num_items: np.ndarray) -> np.ndarray:
+        """
+        Draws the processing time of batches of items, the sum of a random
+        processing time per item within the speed range.
+
+        :param num_items: The number of items of every batch.
+        :type num_items: np.ndarray
+        :return: The processing time of every batch in milliseconds.
+        :rtype: np.ndarray
+        """
+        speed_floor, speed_ceiling = self.speed_range
+        max_items: int = int(num_items.max(initial=0))
+        durations: np.ndarray = self.random_generator.integers(
+            speed_floor, speed_ceiling + 1, size=(len(num_items), max_items))
+        return np.where(np.arange(max_items) < num_items[:, np.newaxis],
+                        durations, 0).sum(axis=1)
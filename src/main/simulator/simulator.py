@@ -1,13 +1,50 @@
 import logging
+import signal
+import threading
 import time
+from types import FrameType
+from typing import Callable, List
 
+from src.main.buffer.array_ring_buffer import ArrayRingBuffer
+from src.main.buffer.async_buffer import AsyncBuffer
+from src.main.buffer.blocking_buffer_queue import BlockingBufferQueue
 from src.main.buffer.buffer import Buffer
 from src.main.buffer.buffer_queue import BufferQueue
+from src.main.buffer.buffer_type import BufferType
+from src.main.buffer.elastic_buffer_queue import ElasticBufferQueue
+from src.main.buffer.mmap_ring_buffer import MmapRingBuffer
+from src.main.buffer.priority_buffer import PriorityBuffer
+from src.main.buffer.semaphore_buffer import SemaphoreBuffer
+from src.main.buffer.shared_memory_buffer import SharedMemoryBuffer
+from src.main.buffer.sharded_buffer import ShardedBuffer
+from src.main.buffer.spsc_ring_buffer import SpscRingBuffer
+from src.main.buffer.virtual_buffer import VirtualBuffer
 from src.main.config.config import Config
-from src.main.logging.logging_utilities import log_in_bold
+from src.main.coroutine.coroutine_manager import CoroutineManager
+from src.main.event.event_manager import EventManager
+from src.main.event.event_queue import EventQueue
+from src.main.event.event_queue_type import EventQueueType
+from src.main.event.timing_wheel import TimingWheel
+from src.main.logging.logging_utilities import log_in_bold, \
+    print_logging_seperator
+from src.main.simulator.engine_type import EngineType
+from src.main.statistics.calibration_probe import CalibrationProbe
+from src.main.statistics.lock_profiler import LockProfiler
+from src.main.statistics.memory_profiler import MemoryProfiler
+from src.main.statistics.monitoring_profiler import MonitoringProfiler
 from src.main.statistics.statistic_tracker import StatisticTracker
+from src.main.statistics.thread_profiler import ThreadProfiler
 from src.main.suggestion.suggester import Suggester
+from src.main.thread.executor_type import ExecutorType
+from src.main.thread.processor.consumer.consumer import Consumer
+from src.main.thread.processor.lock.adaptive_lock import AdaptiveLock
+from src.main.thread.processor.lock.fair_mutex_lock import FairMutexLock
+from src.main.thread.processor.lock.lock import Lock
+from src.main.thread.processor.lock.lock_type import LockType
 from src.main.thread.processor.lock.mutex_lock import MutexLock
+from src.main.thread.processor.lock.native_lock import NativeLock
+from src.main.thread.processor.lock.profiled_lock import ProfiledLock
+from src.main.thread.processor.producer.producer import Producer
 from src.main.thread.thread_manager import ThreadManager
 
 
@@ -26,13 +63,37 @@ class Simulator:
     :type statistic_tracker: StatisticTracker
     :ivar buffer: Buffer implementation for producer-consumer data exchange.
     :type buffer: Buffer
-    :ivar thread_manager: Manages producer and consumer threads.
+    :ivar thread_manager: Manages producer and consumer threads, or
+        coroutines with the asyncio engine, or virtual processors with the
+        discrete-event engine.
     :type thread_manager: ThreadManager
     :ivar suggester: Provides suggestions post-simulation if enabled.
     :type suggester: Suggester
     :ivar is_running: Indicates whether the simulation is currently active.
     :type is_running: bool
+    :ivar locks: Every lock created for the buffer.
+    :type locks: List[Lock]
+    :ivar monitoring_profiler: The sys.monitoring profiler, attached on
+        request or when the monitoring signal is received.
+    :type monitoring_profiler: MonitoringProfiler
+    :ivar previous_signal_handler: The handler of the monitoring signal
+        before the simulation installed its own, or None if none was
+        installed.
+    :type previous_signal_handler: Callable | int | None
+    :ivar thread_profiler: The profiler installed in every worker thread, or
+        None if profiling is disabled.
+    :type thread_profiler: ThreadProfiler | None
+    :ivar memory_profiler: The tracemalloc profiler attributing memory to the
+        subsystems, or None if memory profiling is disabled.
+    :type memory_profiler: MemoryProfiler | None
     """
+    MONITORED_FUNCTIONS: List[Callable] = [Producer.process_item,
+                                           Consumer.process_item,
+                                           BufferQueue.enqueue,
+                                           BufferQueue.dequeue,
+                                           BufferQueue.try_enqueue,
+                                           BufferQueue.try_dequeue,
+                                           MutexLock.acquire]
     def __init__(self, config: Config):
         """
         This class initializes and configures the simulator environment,
@@ -58,22 +119,277 @@ class Simulator:
         """
         self.config: Config = config
         logging.info("Starting simulator")
-        lock: MutexLock = MutexLock()
-        self.statistic_tracker: StatisticTracker = StatisticTracker(config.num_items_to_process)
-        self.buffer: Buffer = BufferQueue(config.buffer_size, lock, self.statistic_tracker)
-        self.thread_manager: ThreadManager = ThreadManager(
-            num_producers=config.num_producers,
-            num_consumers=config.num_consumers,
-            consumer_speed_range=config.consumer_speed_range,
-            producer_speed_range=config.producer_speed_range,
-            buffer=self.buffer,
-            num_items_to_process=config.num_items_to_process,
-            statistic_tracker=self.statistic_tracker
-        )
+        self.memory_profiler: MemoryProfiler | None = None
+        if config.memory_profile:
+            self.memory_profiler = MemoryProfiler()
+            self.memory_profiler.start()
+        self.statistic_tracker: StatisticTracker = StatisticTracker(
+            config.num_items_to_process, config.sample_rate, config.sample_mode)
+        if config.calibrate or config.correct_overhead:
+            self.calibrate_timing()
+        self.locks: List[Lock] = []
+        if config.lock_profile:
+            self.statistic_tracker.lock_profiler = LockProfiler()
+        self.buffer: Buffer = self.create_buffer()
+        self.thread_profiler: ThreadProfiler | None = (
+            ThreadProfiler() if config.profile else None)
+        self.thread_manager: ThreadManager = self.create_thread_manager()
         if config.suggestions:
             self.suggester: Suggester = Suggester(config, self.statistic_tracker)
+        self.monitoring_profiler: MonitoringProfiler = MonitoringProfiler(
+            Simulator.MONITORED_FUNCTIONS)
+        self.previous_signal_handler: Callable | int | None = None
         self.is_running: bool = False
 
+    def calibrate_timing(self) -> None:
+        """
+        Measures the overhead of the timing decorators in this interpreter,
+        reports it, and hands it to the statistic tracker, which subtracts it
+        from the throughput if overhead correction is configured. Throughput
+        measured in virtual time by the discrete-event engine carries no
+        timing overhead, so it is never corrected. The probe runs with
+        verbose tracking off, so it neither logs its calls nor counts the
+        cost of logging them.
+
+        :return: None
+        """
+        calibration_probe: CalibrationProbe = CalibrationProbe()
+        (self.statistic_tracker.timing_overhead,
+         self.statistic_tracker.decorator_overhead) = calibration_probe.calibrate()
+        self.statistic_tracker.is_overhead_corrected = (self.config.correct_overhead and
+                                                        self.config.engine != EngineType.DES)
+        logging.info(f"Calibrated timing overhead: "
+                     f"{self.statistic_tracker.timing_overhead} nanoseconds per"
+                     f" timed operation, "
+                     f"{self.statistic_tracker.decorator_overhead} nanoseconds"
+                     f" per decorated call")
+
+    def create_buffer(self) -> Buffer:
+        """
+        Creates the buffer implementation selected by the configured buffer
+        type. Unrecognized buffer types fall back to the mutex-protected
+        `BufferQueue`. The lock-free single-producer single-consumer ring is
+        picked automatically for the default buffer type when exactly one
+        producer and one consumer are configured, with the default lock
+        and no lock profiling. Producers and consumers
+        running as processes always share the shared memory ring buffer,
+        coroutines of the asyncio engine always share the asynchronous
+        buffer, and the discrete-event engine always uses the virtual buffer,
+        which models the blocking buffer if it is selected.
+
+        :return: The buffer shared by producers and consumers.
+        :rtype: Buffer
+        """
+        if self.config.engine == EngineType.ASYNCIO:
+            if self.config.buffer_type != BufferType.QUEUE:
+                logging.warning(f"The {self.config.buffer_type.value} buffer cannot be"
+                                f" used by coroutines; using the asynchronous"
+                                f" buffer.")
+            logging.info("Using asynchronous buffer on a single event loop")
+            return AsyncBuffer(self.config.buffer_size,
+                               self.statistic_tracker)
+        if self.config.engine == EngineType.DES:
+            is_blocking: bool = self.config.buffer_type == BufferType.BLOCKING
+            if self.config.buffer_type not in (BufferType.QUEUE, BufferType.BLOCKING):
+                logging.warning(f"The {self.config.buffer_type.value} buffer cannot be"
+                                f" simulated in virtual time; using the virtual"
+                                f" buffer.")
+            logging.info(f"Using {'blocking ' if is_blocking else ''}virtual buffer"
+                         f" in virtual time with a {self.config.event_queue.value}"
+                         f" event queue")
+            return VirtualBuffer(self.config.buffer_size,
+                                 self.statistic_tracker,
+                                 is_blocking,
+                                 self.create_event_queue())
+        if self.config.executor == ExecutorType.PROCESS:
+            if self.config.buffer_type not in (BufferType.QUEUE, BufferType.SHARED_MEMORY):
+                logging.warning(f"The {self.config.buffer_type.value} buffer cannot be"
+                                f" shared between processes; using the shared"
+                                f" memory buffer.")
+            logging.info("Using shared memory ring buffer across processes")
+            return SharedMemoryBuffer(self.config.buffer_size,
+                                      self.statistic_tracker)
+        if self.should_use_spsc_buffer():
+            logging.info("Using lock-free single-producer single-consumer"
+                         " ring buffer")
+            return SpscRingBuffer(self.config.buffer_size,
+                                  self.statistic_tracker)
+        if self.config.buffer_type == BufferType.BLOCKING:
+            logging.info("Using blocking buffer queue")
+            return BlockingBufferQueue(self.config.buffer_size,
+                                       self.statistic_tracker)
+        if self.config.buffer_type == BufferType.SHARDED:
+            logging.info(f"Using sharded buffer with "
+                         f"{self.config.num_consumers} shards")
+            return ShardedBuffer(self.config.buffer_size,
+                                 self.config.num_consumers,
+                                 self.statistic_tracker,
+                                 self.config.shard_policy,
+                                 self.create_lock)
+        if self.config.buffer_type == BufferType.SHARED_MEMORY:
+            logging.info("Using shared memory ring buffer")
+            return SharedMemoryBuffer(self.config.buffer_size,
+                                      self.statistic_tracker)
+        lock: Lock = self.create_lock()
+        if self.config.buffer_type == BufferType.ARRAY:
+            logging.info("Using array-backed ring buffer")
+            return ArrayRingBuffer(self.config.buffer_size,
+                                   lock,
+                                   self.statistic_tracker)
+        if self.config.buffer_type == BufferType.PRIORITY:
+            logging.info("Using priority buffer")
+            return PriorityBuffer(self.config.buffer_size,
+                                  lock,
+                                  self.statistic_tracker)
+        if self.config.buffer_type == BufferType.MMAP:
+            logging.info("Using memory-mapped file ring buffer")
+            return MmapRingBuffer(self.config.buffer_size,
+                                  lock,
+                                  self.statistic_tracker)
+        if self.config.buffer_type == BufferType.SEMAPHORE:
+            logging.info("Using counting semaphore buffer")
+            return SemaphoreBuffer(self.config.buffer_size,
+                                   lock,
+                                   self.statistic_tracker)
+        if self.config.buffer_type == BufferType.ELASTIC:
+            logging.info(f"Using elastic buffer queue between "
+                         f"{self.config.min_buffer_size} and "
+                         f"{self.config.max_buffer_size} items")
+            return ElasticBufferQueue(self.config.buffer_size,
+                                      lock,
+                                      self.statistic_tracker,
+                                      self.config.min_buffer_size,
+                                      self.config.max_buffer_size)
+        return BufferQueue(self.config.buffer_size,
+                           lock,
+                           self.statistic_tracker)
+
+    def create_thread_manager(self) -> ThreadManager:
+        """
+        Creates the thread manager of the configured engine. The asyncio
+        engine runs producers and consumers as coroutines on a single event
+        loop, and the discrete-event engine simulates them in virtual time on
+        a single thread, both regardless of the executor.
+
+        :return: The manager running producers and consumers.
+        :rtype: ThreadManager
+        """
+        if (self.config.engine in (EngineType.ASYNCIO, EngineType.DES) and
+                self.config.executor == ExecutorType.PROCESS):
+            logging.warning(f"The {self.config.engine.value} engine runs on a single"
+                            f" thread; ignoring the process executor.")
+        if self.config.engine == EngineType.DES:
+            logging.info(f"Simulating {self.config.num_producers} producers and "
+                         f"{self.config.num_consumers} consumers in virtual time")
+            return EventManager(
+                num_producers=self.config.num_producers,
+                num_consumers=self.config.num_consumers,
+                consumer_speed_range=self.config.consumer_speed_range,
+                producer_speed_range=self.config.producer_speed_range,
+                buffer=self.buffer,
+                num_items_to_process=self.config.num_items_to_process,
+                statistic_tracker=self.statistic_tracker,
+                producer_batch_size=self.config.producer_batch_size,
+                consumer_batch_size=self.config.consumer_batch_size,
+                thread_profiler=self.thread_profiler
+            )
+        if self.config.engine == EngineType.ASYNCIO:
+            logging.info(f"Running {self.config.num_producers} producers and "
+                         f"{self.config.num_consumers} consumers as coroutines")
+            return CoroutineManager(
+                num_producers=self.config.num_producers,
+                num_consumers=self.config.num_consumers,
+                consumer_speed_range=self.config.consumer_speed_range,
+                producer_speed_range=self.config.producer_speed_range,
+                buffer=self.buffer,
+                num_items_to_process=self.config.num_items_to_process,
+                statistic_tracker=self.statistic_tracker,
+                producer_batch_size=self.config.producer_batch_size,
+                consumer_batch_size=self.config.consumer_batch_size,
+                thread_profiler=self.thread_profiler
+            )
+        return ThreadManager(
+            num_producers=self.config.num_producers,
+            num_consumers=self.config.num_consumers,
+            consumer_speed_range=self.config.consumer_speed_range,
+            producer_speed_range=self.config.producer_speed_range,
+            buffer=self.buffer,
+            num_items_to_process=self.config.num_items_to_process,
+            statistic_tracker=self.statistic_tracker,
+            producer_batch_size=self.config.producer_batch_size,
+            consumer_batch_size=self.config.consumer_batch_size,
+            urgent_ratio=self.config.urgent_ratio,
+            thread_profiler=self.thread_profiler,
+            executor=self.config.executor
+        )
+
+    def create_lock(self) -> Lock:
+        """
+        Creates the lock implementation selected by the configured lock type
+        for guarding a buffer, and keeps it for reporting lock statistics.
+        The lock is wrapped in a profiled lock if lock profiling is enabled.
+
+        :return: A new, available lock.
+        :rtype: Lock
+        """
+        lock: Lock
+        if self.config.lock_type == LockType.FAIR:
+            lock = FairMutexLock()
+        elif self.config.lock_type == LockType.ADAPTIVE:
+            lock = AdaptiveLock()
+        elif self.config.lock_type == LockType.NATIVE:
+            lock = NativeLock()
+        else:
+            lock = MutexLock()
+        self.locks.append(lock)
+        if self.statistic_tracker.lock_profiler is not None:
+            return ProfiledLock(lock, self.statistic_tracker.lock_profiler)
+        return lock
+
+    def create_event_queue(self) -> EventQueue:
+        """
+        Creates the queue of pending events of the discrete-event engine
+        selected by the configured event queue type.
+
+        :return: A new, empty event queue.
+        :rtype: EventQueue
+        """
+        if self.config.event_queue == EventQueueType.WHEEL:
+            return TimingWheel()
+        return EventQueue()
+
+    def should_use_spsc_buffer(self) -> bool:
+        """
+        Determines whether the lock-free single-producer single-consumer ring
+        buffer should be used. It is used when explicitly requested, or for
+        the default buffer type when the simulation has exactly one producer
+        and one consumer, unless a lock other than the default mutex is
+        selected or lock profiling is enabled: the ring has no lock to
+        replace or profile.
+
+        :return: True if the ring buffer should be used, False otherwise.
+        :rtype: bool
+        """
+        is_single_producer_consumer: bool = (self.config.num_producers == 1 and
+                                             self.config.num_consumers == 1)
+        if self.config.buffer_type == BufferType.SPSC:
+            if not is_single_producer_consumer:
+                logging.warning("The spsc buffer requires exactly one producer"
+                                " and one consumer; using the queue buffer.")
+            else:
+                if self.config.lock_type != LockType.MUTEX:
+                    logging.warning(f"The spsc buffer is lock-free; the"
+                                    f" {self.config.lock_type.value} lock has no"
+                                    f" effect.")
+                if self.config.lock_profile:
+                    logging.warning("The spsc buffer is lock-free; lock profiling is"
+                                    " unavailable.")
+            return is_single_producer_consumer
+        return (self.config.buffer_type == BufferType.QUEUE and
+                is_single_producer_consumer and
+                self.config.lock_type == LockType.MUTEX and
+                not self.config.lock_profile)
+
     def simulate(self) -> None:
         """
         This method orchestrates the entire lifecycle of a simulation. It
@@ -87,9 +403,12 @@ class Simulator:
         :return: No return value. The method modifies the runtime state of the
          system.
         """
+        self.start_monitoring()
         self.start()
         self.statistic_tracker.start()
         time.sleep(1)
+        if self.memory_profiler is not None:
+            self.memory_profiler.take_snapshot(MemoryProfiler.STEADY_STATE_SNAPSHOT)
         try:
             if self.thread_manager.threads_started:
                 self.thread_manager.join_all()
@@ -98,7 +417,14 @@ class Simulator:
         finally:
             if self.is_running:
                 self.stop()
+            if self.memory_profiler is not None:
+                self.memory_profiler.stop()
             self.statistic_tracker.stop()
+            self.buffer.close()
+            self.stop_monitoring()
+            self.show_lock_statistics()
+            self.show_thread_profile()
+            self.show_memory_profile()
             if self.config.suggestions:
                 self.suggester.show_suggestions()
             self.show_ending_message()
@@ -123,6 +449,106 @@ class Simulator:
         self.is_running = False
         self.thread_manager.join_all()
 
+    def start_monitoring(self) -> None:
+        """
+        Attaches the sys.monitoring profiler if requested, and installs a
+        SIGUSR1 handler which attaches or detaches it while the simulation
+        runs. Without `sys.monitoring` nothing is installed.
+
+        :return: None
+        """
+        if not MonitoringProfiler.is_supported():
+            if self.config.monitor:
+                logging.warning("Monitoring requires Python 3.12 or newer;"
+                                " running without it.")
+            return
+        if self.config.monitor:
+            self.monitoring_profiler.attach()
+        if (hasattr(signal, 'SIGUSR1') and
+                threading.current_thread() is threading.main_thread()):
+            self.previous_signal_handler = signal.signal(
+                signal.SIGUSR1, self.handle_monitoring_signal)
+
+    def handle_monitoring_signal(self,
+                                 signal_number: int,
+                                 frame: FrameType | None) -> None:
+        """
+        Signal handler which attaches the sys.monitoring profiler if it is
+        detached, and detaches it otherwise.
+
+        :param signal_number: The number of the received signal.
+        :type signal_number: int
+        :param frame: The frame interrupted by the signal.
+        :type frame: FrameType | None
+        :return: None
+        """
+        if self.monitoring_profiler.toggle():
+            logging.info("Monitoring attached")
+        else:
+            logging.info("Monitoring detached")
+
+    def stop_monitoring(self) -> None:
+        """
+        Restores the previous handler of the monitoring signal, detaches the
+        sys.monitoring profiler and logs the timings recorded while it was
+        attached.
+
+        :return: None
+        """
+        if self.previous_signal_handler is not None:
+            signal.signal(signal.SIGUSR1, self.previous_signal_handler)
+            self.previous_signal_handler = None
+        self.monitoring_profiler.detach()
+        monitoring_statistics: str = self.monitoring_profiler.get_monitoring_statistics()
+        if monitoring_statistics:
+            log_in_bold(monitoring_statistics)
+            print_logging_seperator()
+
+    def show_lock_statistics(self) -> None:
+        """
+        Logs the spin, park and wakeup counters summed over the adaptive
+        locks guarding the buffer. Nothing is logged for other lock types.
+
+        :return: None
+        """
+        adaptive_locks: List[AdaptiveLock] = [lock for lock in self.locks
+                                              if isinstance(lock, AdaptiveLock)]
+        if not adaptive_locks:
+            return
+        lock_statistics: str = f"""
+        Lock spins: {sum(lock.num_spins for lock in adaptive_locks)}
+        Lock parks: {sum(lock.num_parks for lock in adaptive_locks)}
+        Lock wakeups: {sum(lock.num_wakeups for lock in adaptive_locks)}"""
+        log_in_bold(lock_statistics)
+        print_logging_seperator()
+
+    def show_thread_profile(self) -> None:
+        """
+        Writes the merged profile of the worker threads to its `pstats` file
+        and logs the hot spots. Nothing is logged if profiling is disabled.
+
+        :return: None
+        """
+        if self.thread_profiler is None:
+            return
+        profile_statistics: str = self.thread_profiler.save_profile()
+        if profile_statistics:
+            log_in_bold(profile_statistics)
+            print_logging_seperator()
+
+    def show_memory_profile(self) -> None:
+        """
+        Logs the memory held by each subsystem at the start, at steady state
+        and at the end of the simulation. Nothing is logged if memory
+        profiling is disabled.
+
+        :return: None
+        """
+        if self.memory_profiler is None:
+            return
+        log_in_bold(self.memory_profiler.get_memory_statistics())
+        print_logging_seperator()
+
     def show_ending_message(self) -> None:
         """
 
@@ -0,0 +1,15 @@
+from enum import Enum
+
+
+class BufferEvent(Enum):
+    """
+    This Enum class defines the buffer events recorded in the rolling window
+    of the statistic tracker.
+
+    :ivar FULL: A producer found the buffer full.
+    :type FULL: str
+    :ivar EMPTY: A consumer found the buffer empty.
+    :type EMPTY: str
+    """
+    FULL: str = 'full'
+    EMPTY: str = 'empty'
@@ -0,0 +1,104 @@
+import statistics
+import time
+from typing import Tuple
+
+from src.main.statistics.statistic_tracker import StatisticTracker
+from src.main.statistics.track_performance import track_producer_performance
+from src.main.statistics.tracking_mode import TrackingMode
+
+
+class CalibrationProbe:
+    """
+    Measures the cost of the producer and consumer timing decorators in the
+    running interpreter, by timing an operation which does no work.
+
+    The timing overhead is the duration the decorator records for the empty
+    operation: the clock reads and the call of the wrapped function, which
+    fall inside the timed interval and are reported as part of every
+    operation. The decorator overhead is the full extra cost of a decorated
+    call over a plain call, including the bookkeeping outside the timed
+    interval, which slows the simulation down without being reported.
+
+    The probe measures the decorators with verbose tracking off: verbose
+    mode would log every one of the many probe calls and add the cost of
+    logging, which falls outside the timed interval, to the decorator
+    overhead.
+
+    :ivar statistic_tracker: A scratch tracker receiving the timings of the
+        empty operation.
+    :type statistic_tracker: StatisticTracker
+    """
+    NUM_CALLS: int = 20_000
+    def __init__(self):
+        """
+        Initializes the probe with an empty scratch tracker.
+        """
+        self.statistic_tracker: StatisticTracker = StatisticTracker(CalibrationProbe.NUM_CALLS)
+
+    @track_producer_performance
+    def timed_operation(self) -> int:
+        """
+        An empty operation handling one item, timed by the producer
+        decorator.
+
+        :return: The number of items handled.
+        :rtype: int
+        """
+        return 1
+
+    def plain_operation(self) -> int:
+        """
+        The same empty operation without the decorator.
+
+        :return: The number of items handled.
+        :rtype: int
+        """
+        return 1
+
+    def calibrate(self) -> Tuple[int, int]:
+        """
+        Measures the timing overhead and the decorator overhead with verbose
+        tracking temporarily turned off.
+
+        :return: The timing overhead in nanoseconds per timed operation and
+            the decorator overhead in nanoseconds per call.
+        :rtype: Tuple[int, int]
+        """
+        is_verbose: bool = TrackingMode.is_verbose
+        TrackingMode.set_verbose(False)
+        try:
+            return self.measure_timing_overhead(), self.measure_decorator_overhead()
+        finally:
+            TrackingMode.set_verbose(is_verbose)
+
+    def measure_timing_overhead(self) -> int:
+        """
+        Measures the median duration the decorator records for the empty
+        operation.
+
+        :return: The timing overhead in nanoseconds per timed operation.
+        :rtype: int
+        """
+        self.statistic_tracker.producer_throughput_list.clear()
+        for _ in range(CalibrationProbe.NUM_CALLS):
+            self.timed_operation()
+        return int(statistics.median(self.statistic_tracker.producer_throughput_list))
+
+    def measure_decorator_overhead(self) -> int:
+        """
+        Measures how much longer a decorated call of the empty operation
+        takes than a plain call, averaged over many calls.
+
+        :return: The decorator overhead in nanoseconds per call, or zero if
+            the difference is lost in the noise.
+        :rtype: int
+        """
+        start_time: int = time.perf_counter_ns()
+        for _ in range(CalibrationProbe.NUM_CALLS):
+            self.plain_operation()
+        plain_time: int = time.perf_counter_ns() - start_time
+        start_time = time.perf_counter_ns()
+        for _ in range(CalibrationProbe.NUM_CALLS):
+            self.timed_operation()
+        timed_time: int = time.perf_counter_ns() - start_time
+        return max(timed_time - plain_time, 0) // CalibrationProbe.NUM_CALLS
@@ -0,0 +1,88 @@
+import threading
+from typing import Dict
+
+from src.main.statistics.thread_lock_statistics import ThreadLockStatistics
+from src.main.statistics.track_performance import nanoseconds_to_milliseconds, \
+    format_execution_time_number
+
+
+class LockProfiler:
+    """
+    Collects lock wait times, hold times and acquisition counts per thread.
+
+    Every thread records into its own `ThreadLockStatistics`, looked up
+    through a thread-local cache, so recording needs no extra locking.
+
+    :ivar thread_statistics: The statistics of each thread, by thread name.
+    :type thread_statistics: Dict[str, ThreadLockStatistics]
+    :ivar thread_state: Thread-local cache of the current thread's
+        statistics.
+    :type thread_state: threading.local
+    """
+    def __init__(self):
+        """
+        Initializes a profiler with no recorded threads.
+        """
+        self.thread_statistics: Dict[str, ThreadLockStatistics] = {}
+        self.thread_state: threading.local = threading.local()
+
+    def get_thread_statistics(self) -> ThreadLockStatistics:
+        """
+        Returns the statistics of the current thread, creating them on the
+        thread's first acquisition.
+
+        :return: The statistics of the current thread.
+        :rtype: ThreadLockStatistics
+        """
+        try:
+            return self.thread_state.statistics
+        except AttributeError:
+            statistics: ThreadLockStatistics = ThreadLockStatistics()
+            self.thread_statistics[threading.current_thread().name] = statistics
+            self.thread_state.statistics = statistics
+            return statistics
+
+    def record_wait_time(self, wait_time: int) -> None:
+        """
+        Records an acquisition by the current thread and how long it waited.
+
+        :param wait_time: The wait time in nanoseconds.
+        :type wait_time: int
+        :return: None
+        """
+        self.get_thread_statistics().add_wait_time(wait_time)
+
+    def record_hold_time(self, hold_time: int) -> None:
+        """
+        Records how long the current thread held a lock.
+
+        :param hold_time: The hold time in nanoseconds.
+        :type hold_time: int
+        :return: None
+        """
+        self.get_thread_statistics().add_hold_time(hold_time)
+
+    def get_lock_statistics(self) -> str:
+        """
+        Summarizes, per thread, the number of acquisitions, the total and
+        average wait and hold times, and the 99th percentile bounds from the
+        histograms.
+
+        :return: A formatted string with one entry per thread.
+        :rtype: str
+        """
+        lock_statistics: str = ""
+        for thread_name in sorted(self.thread_statistics):
+            statistics: ThreadLockStatistics = self.thread_statistics[thread_name]
+            num_acquisitions: int = max(statistics.num_acquisitions, 1)
+            total_wait: float = nanoseconds_to_milliseconds(statistics.total_wait_time)
+            total_hold: float = nanoseconds_to_milliseconds(statistics.total_hold_time)
+            average_wait: int = statistics.total_wait_time // num_acquisitions
+            average_hold: int = statistics.total_hold_time // num_acquisitions
+            percentile_wait: int = ThreadLockStatistics.get_percentile_bound(statistics.wait_histogram, 0.99)
+            percentile_hold: int = ThreadLockStatistics.get_percentile_bound(statistics.hold_histogram, 0.99)
+            lock_statistics += f"""
+        {thread_name}: {statistics.num_acquisitions} lock acquisitions
+            Waiting: {format_execution_time_number(total_wait)} milliseconds total, {format_execution_time_number(average_wait)} nanoseconds average, 99th percentile below {format_execution_time_number(percentile_wait)} nanoseconds
+            Holding: {format_execution_time_number(total_hold)} milliseconds total, {format_execution_time_number(average_hold)} nanoseconds average, 99th percentile below {format_execution_time_number(percentile_hold)} nanoseconds"""
+        return lock_statistics
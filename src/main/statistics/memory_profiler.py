@@ -0,0 +1,175 @@
+import logging
+import os
+import tracemalloc
+from typing import Dict, List, Tuple
+
+
+class MemoryProfiler:
+    """
+    Memory profiler built on `tracemalloc`, which attributes the memory held
+    by the simulation to its subsystems.
+
+    Snapshots are taken at the start of the simulation, at steady state and
+    at the end. Every traced allocation is charged to the innermost frame of
+    its traceback which belongs to a subsystem: the buffer, statistics,
+    thread, coroutine and event packages of the simulator, or logging, which also covers the log
+    records created by the standard `logging` package. Allocations without
+    such a frame are charged to `other`.
+
+    `tracemalloc` only tracks the peak of the total traced memory, so the
+    peak of a subsystem is the largest of its three snapshots, while the
+    total peak is exact.
+
+    :ivar snapshot_sizes: The memory held by each subsystem, in bytes, for
+        each snapshot taken so far, in the order they were taken.
+    :type snapshot_sizes: Dict[str, Dict[str, int]]
+    :ivar peak_memory: The peak of the total traced memory in bytes, known
+        once the profiler is stopped.
+    :type peak_memory: int
+    :ivar file_subsystems: Cache of the subsystem of every source file seen,
+        or None if the file belongs to no subsystem.
+    :type file_subsystems: Dict[str, str | None]
+    :ivar is_tracing_started: Whether the profiler started `tracemalloc`
+        itself, and so has to stop it.
+    :type is_tracing_started: bool
+    """
+    NUM_FRAMES: int = 16
+    SUBSYSTEMS: Tuple[str, ...] = ('buffer', 'statistics', 'thread', 'coroutine',
+                                   'event', 'logging')
+    OTHER_SUBSYSTEM: str = 'other'
+    START_SNAPSHOT: str = 'start'
+    STEADY_STATE_SNAPSHOT: str = 'steady state'
+    END_SNAPSHOT: str = 'end'
+    MAIN_DIRECTORY: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    LOGGING_DIRECTORY: str = os.path.dirname(os.path.abspath(logging.__file__))
+    def __init__(self):
+        """
+        Initializes a stopped profiler without any snapshots.
+        """
+        self.snapshot_sizes: Dict[str, Dict[str, int]] = {}
+        self.peak_memory: int = 0
+        self.file_subsystems: Dict[str, str | None] = {}
+        self.is_tracing_started: bool = False
+
+    def start(self) -> None:
+        """
+        Starts tracing allocations, unless they are already traced, and takes
+        the start snapshot.
+
+        :return: None
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(MemoryProfiler.NUM_FRAMES)
+            self.is_tracing_started = True
+        tracemalloc.reset_peak()
+        self.take_snapshot(MemoryProfiler.START_SNAPSHOT)
+
+    def stop(self) -> None:
+        """
+        Takes the end snapshot, records the peak of the traced memory and
+        stops tracing allocations if the profiler started it.
+
+        :return: None
+        """
+        if not tracemalloc.is_tracing():
+            return
+        self.take_snapshot(MemoryProfiler.END_SNAPSHOT)
+        self.peak_memory = tracemalloc.get_traced_memory()[1]
+        if self.is_tracing_started:
+            tracemalloc.stop()
+            self.is_tracing_started = False
+
+    def take_snapshot(self, snapshot_name: str) -> None:
+        """
+        Takes a snapshot of the traced allocations and keeps the memory held
+        by each subsystem. The allocations of `tracemalloc` itself are left
+        out.
+
+        :param snapshot_name: The name the snapshot is reported under.
+        :type snapshot_name: str
+        :return: None
+        """
+        snapshot: tracemalloc.Snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)])
+        subsystem_sizes: Dict[str, int] = dict.fromkeys(
+            MemoryProfiler.SUBSYSTEMS + (MemoryProfiler.OTHER_SUBSYSTEM,), 0)
+        for trace in snapshot.traces:
+            subsystem_sizes[self.get_subsystem(trace.traceback)] += trace.size
+        self.snapshot_sizes[snapshot_name] = subsystem_sizes
+        logging.debug(f"Took the {snapshot_name} memory snapshot")
+
+    def get_subsystem(self, traceback: tracemalloc.Traceback) -> str:
+        """
+        Determines the subsystem an allocation is charged to.
+
+        :param traceback: The traceback of the allocation, oldest frame
+            first.
+        :type traceback: tracemalloc.Traceback
+        :return: The subsystem of the innermost frame which belongs to one,
+            or the other subsystem.
+        :rtype: str
+        """
+        for frame in reversed(traceback):
+            subsystem: str | None = self.get_file_subsystem(frame.filename)
+            if subsystem is not None:
+                return subsystem
+        return MemoryProfiler.OTHER_SUBSYSTEM
+
+    def get_file_subsystem(self, filename: str) -> str | None:
+        """
+        Determines the subsystem a source file belongs to.
+
+        :param filename: The path of the source file.
+        :type filename: str
+        :return: The subsystem of the file, or None if it belongs to none.
+        :rtype: str | None
+        """
+        if filename in self.file_subsystems:
+            return self.file_subsystems[filename]
+        path: str = os.path.abspath(filename)
+        subsystem: str | None = None
+        if path.startswith(MemoryProfiler.LOGGING_DIRECTORY + os.sep):
+            subsystem = 'logging'
+        elif path.startswith(MemoryProfiler.MAIN_DIRECTORY + os.sep):
+            package: str = os.path.relpath(path, MemoryProfiler.MAIN_DIRECTORY).split(os.sep)[0]
+            if package in MemoryProfiler.SUBSYSTEMS:
+                subsystem = package
+        self.file_subsystems[filename] = subsystem
+        return subsystem
+
+    @staticmethod
+    def format_memory_size(num_bytes: int) -> str:
+        """
+        Formats a memory size in kibibytes.
+
+        :param num_bytes: The memory size in bytes.
+        :type num_bytes: int
+        :return: The formatted memory size.
+        :rtype: str
+        """
+        return f"{num_bytes / 1024:,.1f} KiB"
+
+    def get_memory_statistics(self) -> str:
+        """
+        Summarizes, per subsystem, the memory held at every snapshot, the
+        peak over the snapshots and the memory retained between the start
+        and the last snapshot, followed by the total peak.
+
+        :return: A formatted string with one entry per subsystem, or an
+            empty string if no snapshot was taken.
+        :rtype: str
+        """
+        if not self.snapshot_sizes:
+            return ""
+        memory_statistics: str = ""
+        snapshot_names: List[str] = list(self.snapshot_sizes)
+        for subsystem in MemoryProfiler.SUBSYSTEMS + (MemoryProfiler.OTHER_SUBSYSTEM,):
+            sizes: List[int] = [self.snapshot_sizes[name][subsystem] for name in snapshot_names]
+            snapshots: str = ", ".join(f"{MemoryProfiler.format_memory_size(size)} at {name}"
+                                       for name, size in zip(snapshot_names, sizes))
+            memory_statistics += f"""
+        {subsystem}: {snapshots}
+            Peak: {MemoryProfiler.format_memory_size(max(sizes))}, retained: {MemoryProfiler.format_memory_size(sizes[-1] - sizes[0])}"""
+        memory_statistics += f"""
+        Peak traced memory: {MemoryProfiler.format_memory_size(self.peak_memory)}"""
+        return memory_statistics
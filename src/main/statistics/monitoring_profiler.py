@@ -0,0 +1,210 @@
+import inspect
+import sys
+import threading
+import time
+from types import CodeType
+from typing import Callable, Dict, List, Tuple
+
+from src.main.statistics.track_performance import nanoseconds_to_milliseconds, \
+    format_execution_time_number
+
+
+class MonitoringProfiler:
+    """
+    Instrumentation backend built on `sys.monitoring` (PEP 669), which times
+    calls of a chosen set of functions without decorating them.
+
+    While detached, no monitoring events are enabled and the functions run
+    exactly as if the profiler did not exist. Attaching enables the start,
+    return and unwind events for the code objects of the monitored functions
+    only, and can be done while threads are already running them; calls that
+    were already in progress when the profiler was attached are not timed.
+    Every thread records into its own timings, looked up through a
+    thread-local cache, so recording needs no extra locking.
+
+    `sys.monitoring` is available from Python 3.12. On older interpreters
+    `is_supported` returns False and the profiler cannot be attached.
+
+    :ivar function_names: The display name of each monitored code object.
+    :type function_names: Dict[CodeType, str]
+    :ivar thread_timings: The timings recorded by each thread, mapping a
+        function name to its number of calls and total time in nanoseconds.
+    :type thread_timings: List[Dict[str, List[int]]]
+    :ivar thread_state: Thread-local call stack and timings of the current
+        thread, replaced on every attach.
+    :type thread_state: threading.local
+    :ivar is_attached: Whether the monitoring events are currently enabled.
+    :type is_attached: bool
+    """
+    TOOL_NAME: str = 'pc-simulator'
+    TOOL_ID: int = 2
+    def __init__(self, functions: List[Callable]):
+        """
+        Initializes a detached profiler for the given functions. Decorated
+        functions are unwrapped, so the timed code is the original function.
+
+        :param functions: The functions whose calls are timed.
+        :type functions: List[Callable]
+        """
+        self.function_names: Dict[CodeType, str] = {}
+        for function in functions:
+            unwrapped_function: Callable = inspect.unwrap(function)
+            self.function_names[unwrapped_function.__code__] = unwrapped_function.__qualname__
+        self.thread_timings: List[Dict[str, List[int]]] = []
+        self.thread_state: threading.local = threading.local()
+        self.is_attached: bool = False
+
+    @staticmethod
+    def is_supported() -> bool:
+        """
+        Determines if the running interpreter provides `sys.monitoring`.
+
+        :return: True if the profiler can be attached, False otherwise.
+        :rtype: bool
+        """
+        return hasattr(sys, 'monitoring')
+
+    def attach(self) -> None:
+        """
+        Claims the profiler tool id and enables the monitoring events for the
+        monitored functions. Attaching an attached profiler does nothing.
+
+        :return: None
+        :raises RuntimeError: If `sys.monitoring` is not available.
+        :raises ValueError: If another tool already uses the profiler tool id.
+        """
+        if self.is_attached:
+            return
+        if not MonitoringProfiler.is_supported():
+            raise RuntimeError("sys.monitoring requires Python 3.12 or newer")
+        monitoring = sys.monitoring
+        events = monitoring.events
+        monitoring.use_tool_id(MonitoringProfiler.TOOL_ID, MonitoringProfiler.TOOL_NAME)
+        self.thread_state = threading.local()
+        monitoring.register_callback(MonitoringProfiler.TOOL_ID, events.PY_START, self.handle_start)
+        monitoring.register_callback(MonitoringProfiler.TOOL_ID, events.PY_RETURN, self.handle_return)
+        monitoring.register_callback(MonitoringProfiler.TOOL_ID, events.PY_UNWIND, self.handle_return)
+        for code in self.function_names:
+            monitoring.set_local_events(MonitoringProfiler.TOOL_ID, code,
+                                        events.PY_START | events.PY_RETURN)
+        # Unwinding can only be monitored globally; it is rare, and the
+        # callback ignores code objects which are not monitored.
+        monitoring.set_events(MonitoringProfiler.TOOL_ID, events.PY_UNWIND)
+        self.is_attached = True
+
+    def detach(self) -> None:
+        """
+        Disables all monitoring events and releases the profiler tool id.
+        The timings recorded so far are kept. Detaching a detached profiler
+        does nothing.
+
+        :return: None
+        """
+        if not self.is_attached:
+            return
+        monitoring = sys.monitoring
+        events = monitoring.events
+        monitoring.set_events(MonitoringProfiler.TOOL_ID, events.NO_EVENTS)
+        for code in self.function_names:
+            monitoring.set_local_events(MonitoringProfiler.TOOL_ID, code, events.NO_EVENTS)
+        for event in (events.PY_START, events.PY_RETURN, events.PY_UNWIND):
+            monitoring.register_callback(MonitoringProfiler.TOOL_ID, event, None)
+        monitoring.free_tool_id(MonitoringProfiler.TOOL_ID)
+        self.is_attached = False
+
+    def toggle(self) -> bool:
+        """
+        Attaches the profiler if it is detached, and detaches it otherwise.
+
+        :return: True if the profiler is attached afterwards.
+        :rtype: bool
+        """
+        if self.is_attached:
+            self.detach()
+        else:
+            self.attach()
+        return self.is_attached
+
+    def get_call_stack(self) -> List[Tuple[CodeType, int]]:
+        """
+        Returns the stack of monitored calls in progress on the current
+        thread, creating it and the thread's timings on first use.
+
+        :return: The code objects and start times of the calls in progress.
+        :rtype: List[Tuple[CodeType, int]]
+        """
+        try:
+            return self.thread_state.call_stack
+        except AttributeError:
+            self.thread_state.call_stack = []
+            self.thread_state.timings = {}
+            self.thread_timings.append(self.thread_state.timings)
+            return self.thread_state.call_stack
+
+    def handle_start(self, code: CodeType, instruction_offset: int) -> None:
+        """
+        Monitoring callback for the start of a monitored function.
+
+        :param code: The code object of the starting function.
+        :type code: CodeType
+        :param instruction_offset: The offset of the starting instruction.
+        :type instruction_offset: int
+        :return: None
+        """
+        self.get_call_stack().append((code, time.perf_counter_ns()))
+
+    def handle_return(self, code: CodeType, instruction_offset: int, value: object) -> None:
+        """
+        Monitoring callback for a monitored function returning or unwinding.
+        Calls which started before the profiler was attached have no start
+        time and are ignored.
+
+        :param code: The code object of the returning function.
+        :type code: CodeType
+        :param instruction_offset: The offset of the returning instruction.
+        :type instruction_offset: int
+        :param value: The return value, or the exception when unwinding.
+        :type value: object
+        :return: None
+        """
+        end_time: int = time.perf_counter_ns()
+        call_stack: List[Tuple[CodeType, int]] = self.get_call_stack()
+        if not call_stack or call_stack[-1][0] is not code:
+            return
+        start_time: int = call_stack.pop()[1]
+        timing: List[int] = self.thread_state.timings.setdefault(self.function_names[code], [0, 0])
+        timing[0] += 1
+        timing[1] += end_time - start_time
+
+    def get_timings(self) -> Dict[str, List[int]]:
+        """
+        Merges the timings recorded by all threads.
+
+        :return: The number of calls and total time in nanoseconds of each
+            monitored function that was called while attached.
+        :rtype: Dict[str, List[int]]
+        """
+        timings: Dict[str, List[int]] = {}
+        for thread_timings in list(self.thread_timings):
+            for function_name, (num_calls, total_time) in list(thread_timings.items()):
+                timing: List[int] = timings.setdefault(function_name, [0, 0])
+                timing[0] += num_calls
+                timing[1] += total_time
+        return timings
+
+    def get_monitoring_statistics(self) -> str:
+        """
+        Summarizes, per monitored function, the number of timed calls and
+        their total and average time.
+
+        :return: A formatted string with one entry per function.
+        :rtype: str
+        """
+        monitoring_statistics: str = ""
+        timings: Dict[str, List[int]] = self.get_timings()
+        for function_name in sorted(timings):
+            num_calls, total_time = timings[function_name]
+            total_milliseconds: float = nanoseconds_to_milliseconds(total_time)
+            monitoring_statistics += f"""
+        {function_name}: {num_calls} calls, {format_execution_time_number(total_milliseconds)} milliseconds total, {format_execution_time_number(total_time // num_calls)} nanoseconds average"""
+        return monitoring_statistics
@@ -0,0 +1,15 @@
+from enum import Enum
+
+
+class SampleMode(Enum):
+    """
+    This Enum class defines how the statistic tracker picks the one in every
+    N producer and consumer operations that are timed when sampling.
+
+    :ivar DETERMINISTIC: Every N-th operation is timed.
+    :type DETERMINISTIC: str
+    :ivar RANDOM: Each operation is timed with a probability of 1 / N.
+    :type RANDOM: str
+    """
+    DETERMINISTIC: str = 'deterministic'
+    RANDOM: str = 'random'
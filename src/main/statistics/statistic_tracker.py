@@ -1,5 +1,15 @@
+import itertools
+import math
+import random
+import statistics
 import time
-from typing import List
+from collections import deque
+from typing import Any, Deque, Dict, Iterator, List, Tuple
+
+from src.main.buffer.priority_class import PriorityClass
+from src.main.statistics.buffer_event import BufferEvent
+from src.main.statistics.lock_profiler import LockProfiler
+from src.main.statistics.sample_mode import SampleMode
 
 from src.main.logging.logging_utilities import log_in_bold, \
     print_logging_seperator
@@ -31,9 +41,46 @@ class StatisticTracker:
     :type start_time: float
     :ivar end_time: Time when tracking stopped.
     :type end_time: float
+    :ivar priority_wait_times: Time in nanoseconds each dequeued item spent
+        in a priority buffer, per priority class.
+    :type priority_wait_times: Dict[PriorityClass, List[int]]
+    :ivar recent_buffer_events: The most recent full and empty buffer events,
+        oldest first.
+    :type recent_buffer_events: Deque[BufferEvent]
+    :ivar buffer_resizes: The seconds since tracking started and the new
+        buffer size of every runtime resize of the buffer.
+    :type buffer_resizes: List[Tuple[float, int]]
+    :ivar lock_profiler: The profiler of the buffer locks, if lock profiling
+        is enabled.
+    :type lock_profiler: LockProfiler | None
+    :ivar sample_rate: The one in N producer and consumer operations whose
+        timing is recorded. Item counters are always exact.
+    :type sample_rate: int
+    :ivar sample_mode: How the timed operations are picked.
+    :type sample_mode: SampleMode
+    :ivar producer_operation_counter: Counts the producer operations
+        considered for sampling.
+    :type producer_operation_counter: Iterator[int]
+    :ivar consumer_operation_counter: Counts the consumer operations
+        considered for sampling.
+    :type consumer_operation_counter: Iterator[int]
+    :ivar timing_overhead: The calibrated duration, in nanoseconds, that the
+        timing decorators record for an operation which does no work, or
+        zero if not calibrated.
+    :type timing_overhead: int
+    :ivar decorator_overhead: The calibrated extra cost, in nanoseconds, of
+        a decorated call over a plain call, or zero if not calibrated.
+    :type decorator_overhead: int
+    :ivar is_overhead_corrected: Whether the timing overhead is subtracted
+        from the recorded throughput.
+    :type is_overhead_corrected: bool
     """
+    BUFFER_EVENT_WINDOW: int = 32
+    CONFIDENCE_Z_SCORE: float = 1.96
     def __init__(self,
-                 num_items_to_process: int):
+                 num_items_to_process: int,
+                 sample_rate: int = 1,
+                 sample_mode: SampleMode = SampleMode.DETERMINISTIC):
         """
         This class tracks the throughput and performance metrics for a
         producer-consumer system. It keeps record of throughput lists for
@@ -43,6 +90,11 @@ class StatisticTracker:
         :param num_items_to_process: The total number of items to be produced
             and consumed in the system.
         :type num_items_to_process: int
+        :param sample_rate: The one in N producer and consumer operations
+            whose timing is recorded.
+        :type sample_rate: int
+        :param sample_mode: How the timed operations are picked.
+        :type sample_mode: SampleMode
         :ivar num_items_to_process: The number of items to process.
         :type num_items_to_process: int
         :ivar producer_throughput_list: List to hold throughput metrics for
@@ -65,6 +117,36 @@ class StatisticTracker:
         :type start_time: Any
         :ivar end_time: The end time of the process.
         :type end_time: Any
+        :ivar priority_wait_times: Nanoseconds each item waited in a priority
+            buffer, per priority class.
+        :type priority_wait_times: Dict[PriorityClass, List[int]]
+        :ivar recent_buffer_events: Rolling window of the latest full and
+            empty buffer events.
+        :type recent_buffer_events: Deque[BufferEvent]
+        :ivar buffer_resizes: Time and new size of every buffer resize.
+        :type buffer_resizes: List[Tuple[float, int]]
+        :ivar lock_profiler: Profiler of the buffer locks, or None when lock
+            profiling is disabled.
+        :type lock_profiler: LockProfiler | None
+        :ivar sample_rate: The one in N operations whose timing is recorded.
+        :type sample_rate: int
+        :ivar sample_mode: How the timed operations are picked.
+        :type sample_mode: SampleMode
+        :ivar producer_operation_counter: Counter of the producer operations
+            considered for sampling.
+        :type producer_operation_counter: Iterator[int]
+        :ivar consumer_operation_counter: Counter of the consumer operations
+            considered for sampling.
+        :type consumer_operation_counter: Iterator[int]
+        :ivar timing_overhead: Calibrated timing overhead per timed
+            operation in nanoseconds.
+        :type timing_overhead: int
+        :ivar decorator_overhead: Calibrated cost of the timing decorator
+            per call in nanoseconds.
+        :type decorator_overhead: int
+        :ivar is_overhead_corrected: Whether the timing overhead is
+            subtracted from the recorded throughput.
+        :type is_overhead_corrected: bool
         """
         self.num_items_to_process: int = num_items_to_process
         self.producer_throughput_list: List[float] = []
@@ -75,6 +157,19 @@ class StatisticTracker:
         self.num_full_buffer: int = 0
         self.start_time: float = 0
         self.end_time: float = 0
+        self.priority_wait_times: Dict[PriorityClass, List[int]] = {}
+        self.recent_buffer_events: Deque[BufferEvent] = deque(
+            maxlen=StatisticTracker.BUFFER_EVENT_WINDOW)
+        self.buffer_resizes: List[Tuple[float, int]] = []
+        self.lock_profiler: LockProfiler | None = None
+        self.sample_rate: int = sample_rate
+        self.sample_mode: SampleMode = sample_mode
+        self.producer_operation_counter: Iterator[int] = itertools.count()
+        self.consumer_operation_counter: Iterator[int] = itertools.count()
+        self.timing_overhead: int = 0
+        self.decorator_overhead: int = 0
+        self.is_overhead_corrected: bool = False
+
     def start(self) -> None:
         """
         This method initializes the tracking mechanism for monitoring
@@ -94,41 +189,84 @@ class StatisticTracker:
         self.stop_tracking()
         self.show_statistics()
 
-    def increment_produced_items(self) -> None:
+    def increment_produced_items(self, num_items: int = 1) -> None:
         """
         Increments the count of produced items.
 
+        :param num_items: The number of items produced.
+        :type num_items: int
         :return: This method does not return any value.
         :rtype: None
         """
-        self.items_produced += 1
+        self.items_produced += num_items
 
-    def increment_consumed_items(self) -> None:
+    def increment_consumed_items(self, num_items: int = 1) -> None:
         """
         Increments the count of consumed items.
 
+        :param num_items: The number of items consumed.
+        :type num_items: int
         :return: This method does not return any value.
         :rtype: None
         """
-        self.items_consumed += 1
+        self.items_consumed += num_items
 
     def increment_empty_buffer(self) -> None:
         """
-        Increments the value of `num_empty_buffer`.
+        Increments the value of `num_empty_buffer` and records the event in
+        the rolling window.
 
         :return: This method does not return any value.
         :rtype: None
         """
         self.num_empty_buffer += 1
+        self.recent_buffer_events.append(BufferEvent.EMPTY)
 
     def increment_full_buffer(self) -> None:
         """
-        Increments the value of `num_full_buffer`.
+        Increments the value of `num_full_buffer` and records the event in
+        the rolling window.
 
         :return: None
         :rtype: None
         """
         self.num_full_buffer += 1
+        self.recent_buffer_events.append(BufferEvent.FULL)
+
+    def count_recent_buffer_events(self, buffer_event: BufferEvent) -> int:
+        """
+        Counts how many of the events in the rolling window are of the given
+        kind.
+
+        :param buffer_event: The kind of event to count.
+        :type buffer_event: BufferEvent
+        :return: The number of matching events in the window.
+        :rtype: int
+        """
+        return self.recent_buffer_events.count(buffer_event)
+
+    def clear_recent_buffer_events(self) -> None:
+        """
+        Empties the rolling window of buffer events, so that later decisions
+        are based only on events recorded afterwards.
+
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        self.recent_buffer_events.clear()
+
+    def add_buffer_resize(self, buffer_size: int) -> float:
+        """
+        Records that the buffer was resized to the given size.
+
+        :param buffer_size: The new capacity of the buffer.
+        :type buffer_size: int
+        :return: The seconds since tracking started when the resize happened.
+        :rtype: float
+        """
+        elapsed_time: float = time.time() - self.start_time if self.start_time else 0.0
+        self.buffer_resizes.append((elapsed_time, buffer_size))
+        return elapsed_time
 
     def start_tracking(self) -> None:
         """
@@ -159,29 +297,143 @@ class StatisticTracker:
         """
         return self.end_time - self.start_time
 
-    def add_producer_throughput(self, throughput: float) -> None:
+    def should_sample_producer(self) -> bool:
+        """
+        Decides whether the timing of the next producer operation is
+        recorded. Operations are always timed until a producer throughput is
+        recorded.
+
+        :return: True if the operation should be timed, False otherwise.
+        :rtype: bool
         """
-        Adds the throughput value for a producer to the throughput list.
+        return (self.should_sample(self.producer_operation_counter) or
+                not self.producer_throughput_list)
+
+    def should_sample_consumer(self) -> bool:
+        """
+        Decides whether the timing of the next consumer operation is
+        recorded. Operations are always timed until a consumer throughput is
+        recorded.
+
+        :return: True if the operation should be timed, False otherwise.
+        :rtype: bool
+        """
+        return (self.should_sample(self.consumer_operation_counter) or
+                not self.consumer_throughput_list)
+
+    def should_sample(self, operation_counter: Iterator[int]) -> bool:
+        """
+        Decides whether the timing of the next operation of the producers or
+        of the consumers is recorded. Each side counts its own operations,
+        so the throughput of both is sampled whatever the sample rate and
+        the order of their operations. Deterministic sampling records every
+        N-th operation, starting with the first one, and random sampling
+        records each operation with a probability of 1 / N.
+
+        :param operation_counter: The counter of the operations of the side.
+        :type operation_counter: Iterator[int]
+        :return: True if the operation should be timed, False otherwise.
+        :rtype: bool
+        """
+        if self.sample_rate == 1:
+            return True
+        if self.sample_mode == SampleMode.RANDOM:
+            return random.random() * self.sample_rate < 1
+        return next(operation_counter) % self.sample_rate == 0
+
+    def add_producer_throughput(self,
+                                throughput: float,
+                                num_items: int = 1) -> None:
+        """
+        Adds the throughput value for a producer to the throughput list,
+        once for every item it was measured over. If overhead correction is
+        enabled, the share of the timing overhead of each item is
+        subtracted first.
 
         :param throughput: The throughput value to be added, representing the
             production rate of a producer as a float.
+        :param num_items: The number of items produced at this throughput.
+        :type num_items: int
         :return: This method does not return any value.
         :rtype: None
         """
-        self.increment_produced_items()
-        self.producer_throughput_list.append(throughput)
+        self.increment_produced_items(num_items)
+        if self.is_overhead_corrected:
+            throughput = max(throughput - self.timing_overhead // num_items, 0)
+        self.producer_throughput_list.extend([throughput] * num_items)
 
-    def add_consumer_throughput(self, throughput: float) -> None:
+    def add_consumer_throughput(self,
+                                throughput: float,
+                                num_items: int = 1) -> None:
         """
-        Adds the throughput value for a producer to the throughput list.
+        Adds the throughput value for a consumer to the throughput list,
+        once for every item it was measured over. If overhead correction is
+        enabled, the share of the timing overhead of each item is
+        subtracted first.
 
         :param throughput: Throughput of the consumer to be added.
         :type throughput: float
+        :param num_items: The number of items consumed at this throughput.
+        :type num_items: int
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        self.increment_consumed_items(num_items)
+        if self.is_overhead_corrected:
+            throughput = max(throughput - self.timing_overhead // num_items, 0)
+        self.consumer_throughput_list.extend([throughput] * num_items)
+
+    def add_priority_wait_time(self,
+                               priority_class: PriorityClass,
+                               wait_time: int) -> None:
+        """
+        Records how long an item of the given priority class waited in the
+        buffer before it was dequeued.
+
+        :param priority_class: The priority class of the dequeued item.
+        :type priority_class: PriorityClass
+        :param wait_time: The time the item spent in the buffer in
+            nanoseconds.
+        :type wait_time: int
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        self.priority_wait_times.setdefault(priority_class, []).append(wait_time)
+
+    def get_process_statistics(self) -> Dict[str, Any]:
+        """
+        Collects the statistics a producer or consumer running in a separate
+        process reports back to the tracker of the parent process.
+
+        :return: The throughput lists and the item and buffer counters.
+        :rtype: Dict[str, Any]
+        """
+        return {
+            'producer_throughput_list': self.producer_throughput_list,
+            'consumer_throughput_list': self.consumer_throughput_list,
+            'items_produced': self.items_produced,
+            'items_consumed': self.items_consumed,
+            'num_empty_buffer': self.num_empty_buffer,
+            'num_full_buffer': self.num_full_buffer
+        }
+
+    def merge_process_statistics(self, process_statistics: Dict[str, Any]) -> None:
+        """
+        Adds the statistics reported by a producer or consumer process to
+        this tracker.
+
+        :param process_statistics: The statistics returned by
+            `get_process_statistics` in the child process.
+        :type process_statistics: Dict[str, Any]
         :return: This method does not return any value.
         :rtype: None
         """
-        self.increment_consumed_items()
-        self.consumer_throughput_list.append(throughput)
+        self.producer_throughput_list.extend(process_statistics['producer_throughput_list'])
+        self.consumer_throughput_list.extend(process_statistics['consumer_throughput_list'])
+        self.items_produced += process_statistics['items_produced']
+        self.items_consumed += process_statistics['items_consumed']
+        self.num_empty_buffer += process_statistics['num_empty_buffer']
+        self.num_full_buffer += process_statistics['num_full_buffer']
 
     def show_statistics(self) -> None:
         """
@@ -198,6 +450,18 @@ class StatisticTracker:
         print_logging_seperator()
         log_in_bold(self.get_performance_info())
         print_logging_seperator()
+        if self.sample_rate > 1:
+            log_in_bold(self.get_sampling_statistics())
+            print_logging_seperator()
+        if self.lock_profiler is not None:
+            log_in_bold(self.lock_profiler.get_lock_statistics())
+            print_logging_seperator()
+        if self.priority_wait_times:
+            log_in_bold(self.get_priority_statistics())
+            print_logging_seperator()
+        if self.buffer_resizes:
+            log_in_bold(self.get_resize_statistics())
+            print_logging_seperator()
 
     def get_buffer_statistics(self) -> str:
         """
@@ -241,8 +505,125 @@ class StatisticTracker:
         performance_string: str = f"""
         Producer throughput: {producer_throughput_str} {time_interval} per item
         Consumer throughput: {consumer_throughput_str} {time_interval} per item"""
+        if self.timing_overhead > 0:
+            performance_string += self.get_overhead_info()
         return performance_string
 
+    def get_overhead_info(self) -> str:
+        """
+        Describes the calibrated cost of the timing decorators, and whether
+        the timing overhead was subtracted from the throughput figures.
+
+        :return: A formatted string with the timing and decorator overhead.
+        :rtype: str
+        """
+        correction: str = ("subtracted from the throughput above"
+                           if self.is_overhead_corrected
+                           else "included in the throughput above")
+        overhead_info: str = f"""
+        Timing overhead: {format_execution_time_number(self.timing_overhead)} nanoseconds per timed operation, {correction}
+        Decorator overhead: {format_execution_time_number(self.decorator_overhead)} nanoseconds per operation, not included in the throughput"""
+        return overhead_info
+
+    def get_sampling_statistics(self) -> str:
+        """
+        Summarizes how the throughput was sampled and the sampling error of
+        the reported averages: the 95% confidence margin of each average,
+        with the finite population correction for the exact number of items,
+        and the 95th percentile of the sample.
+
+        :return: A formatted string with the sample sizes and the margins of
+            error of the producer and consumer throughput.
+        :rtype: str
+        """
+        sampling_statistics: str = f"""
+        Sampled 1 in {self.sample_rate} operations ({self.sample_mode.value})"""
+        for name, throughput_list, num_items in (
+                ('Producer', self.producer_throughput_list, self.items_produced),
+                ('Consumer', self.consumer_throughput_list, self.items_consumed)):
+            if len(throughput_list) < 2:
+                sampling_statistics += f"""
+        {name} throughput: {len(throughput_list)} of {num_items} items sampled, too few to estimate the sampling error"""
+                continue
+            margin: float = self.get_margin_of_error(throughput_list, num_items)
+            percentile: float = self.get_percentile(throughput_list, 0.95)
+            sampling_statistics += f"""
+        {name} throughput: {len(throughput_list)} of {num_items} items sampled, average within ±{format_execution_time_number(margin)} nanoseconds per item (95% confidence), 95th percentile {format_execution_time_number(percentile)} nanoseconds per item"""
+        return sampling_statistics
+
+    @staticmethod
+    def get_margin_of_error(sample: List[float], population_size: int) -> float:
+        """
+        Calculates the 95% confidence margin of error of the mean of a simple
+        sample of at least two values drawn from a finite population.
+
+        :param sample: The sampled values.
+        :type sample: List[float]
+        :param population_size: The number of values the sample was drawn
+            from.
+        :type population_size: int
+        :return: The margin of error of the sample mean.
+        :rtype: float
+        """
+        standard_error: float = statistics.stdev(sample) / math.sqrt(len(sample))
+        if population_size > len(sample):
+            standard_error *= math.sqrt(1 - len(sample) / population_size)
+        else:
+            standard_error = 0.0
+        return StatisticTracker.CONFIDENCE_Z_SCORE * standard_error
+
+    @staticmethod
+    def get_percentile(values: List[float], percentile: float) -> float:
+        """
+        Finds the value below which the given fraction of the values fall.
+
+        :param values: A non-empty list of values.
+        :type values: List[float]
+        :param percentile: The percentile as a fraction between zero and one.
+        :type percentile: float
+        :return: The value at the given percentile.
+        :rtype: float
+        """
+        sorted_values: List[float] = sorted(values)
+        return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * percentile))]
+
+    def get_priority_statistics(self) -> str:
+        """
+        Summarizes, per priority class, how many items were dequeued, the
+        class throughput over the tracked time, and the average and 95th
+        percentile time the items waited in the buffer.
+
+        :return: A formatted string with one line per priority class.
+        :rtype: str
+        """
+        total_time: float = self.get_total_time()
+        priority_statistics: str = ""
+        for priority_class in sorted(self.priority_wait_times,
+                                     key=lambda priority: priority.value):
+            wait_times: List[int] = sorted(self.priority_wait_times[priority_class])
+            average_wait: float = nanoseconds_to_milliseconds(self.get_average_throughput(wait_times))
+            percentile_index: int = min(len(wait_times) - 1, int(len(wait_times) * 0.95))
+            percentile_wait: float = nanoseconds_to_milliseconds(wait_times[percentile_index])
+            throughput: float = len(wait_times) / total_time if total_time > 0 else 0
+            priority_statistics += f"""
+        {priority_class.name.capitalize()} items: {len(wait_times)} - {format_execution_time_number(throughput)} items per second
+            Average wait: {format_execution_time_number(average_wait)} milliseconds, 95th percentile wait: {format_execution_time_number(percentile_wait)} milliseconds"""
+        return priority_statistics
+
+    def get_resize_statistics(self) -> str:
+        """
+        Summarizes how often the buffer was resized during the run and the
+        capacity it settled on.
+
+        :return: A formatted string with the resize count and final size.
+        :rtype: str
+        """
+        final_buffer_size: int = self.buffer_resizes[-1][1]
+        resize_statistics: str = f"""
+        Number of buffer resizes: {len(self.buffer_resizes)}
+        Final buffer size: {final_buffer_size}"""
+        return resize_statistics
+
     @staticmethod
     def get_average_throughput(throughput_list: List[float]) -> float:
         """
@@ -251,6 +632,9 @@ class StatisticTracker:
 
         :param throughput_list: A list of throughput values as floats.
         :type throughput_list: List[float]
-        :return: The average throughput value as a float.
+        :return: The average throughput value as a float, or zero if no
+            value was recorded.
         """
+        if not throughput_list:
+            return 0.0
         return sum(throughput_list) / len(throughput_list)
\ No newline at end of file
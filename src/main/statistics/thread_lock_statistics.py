@@ -0,0 +1,78 @@
+from typing import List
+
+
+class ThreadLockStatistics:
+    """
+    Lock acquisition statistics of a single thread, with the wait and hold
+    times bucketed into power-of-two nanosecond histograms. Bucket `i` counts
+    durations `d` with `2 ** (i - 1) <= d < 2 ** i` nanoseconds.
+
+    :ivar num_acquisitions: The number of times the thread acquired a lock.
+    :type num_acquisitions: int
+    :ivar total_wait_time: Nanoseconds spent waiting to acquire locks.
+    :type total_wait_time: int
+    :ivar total_hold_time: Nanoseconds spent holding locks.
+    :type total_hold_time: int
+    :ivar wait_histogram: Counts of wait times per power-of-two bucket.
+    :type wait_histogram: List[int]
+    :ivar hold_histogram: Counts of hold times per power-of-two bucket.
+    :type hold_histogram: List[int]
+    """
+    NUM_BUCKETS: int = 64
+    def __init__(self):
+        """
+        Initializes empty statistics.
+        """
+        self.num_acquisitions: int = 0
+        self.total_wait_time: int = 0
+        self.total_hold_time: int = 0
+        self.wait_histogram: List[int] = [0] * ThreadLockStatistics.NUM_BUCKETS
+        self.hold_histogram: List[int] = [0] * ThreadLockStatistics.NUM_BUCKETS
+
+    def add_wait_time(self, wait_time: int) -> None:
+        """
+        Records one acquisition and the time spent waiting for it.
+
+        :param wait_time: The wait time in nanoseconds.
+        :type wait_time: int
+        :return: None
+        """
+        self.num_acquisitions += 1
+        self.total_wait_time += wait_time
+        self.wait_histogram[min(wait_time.bit_length(), ThreadLockStatistics.NUM_BUCKETS - 1)] += 1
+
+    def add_hold_time(self, hold_time: int) -> None:
+        """
+        Records the time a lock was held.
+
+        :param hold_time: The hold time in nanoseconds.
+        :type hold_time: int
+        :return: None
+        """
+        self.total_hold_time += hold_time
+        self.hold_histogram[min(hold_time.bit_length(), ThreadLockStatistics.NUM_BUCKETS - 1)] += 1
+
+    @staticmethod
+    def get_percentile_bound(histogram: List[int], percentile: float) -> int:
+        """
+        Finds the upper bound of the histogram bucket containing the given
+        percentile.
+
+        :param histogram: A power-of-two histogram of durations.
+        :type histogram: List[int]
+        :param percentile: The percentile as a fraction between zero and one.
+        :type percentile: float
+        :return: An upper bound in nanoseconds for the given percentile, or
+            zero if the histogram is empty.
+        :rtype: int
+        """
+        num_samples: int = sum(histogram)
+        if num_samples == 0:
+            return 0
+        threshold: float = num_samples * percentile
+        cumulative_count: int = 0
+        for bucket, count in enumerate(histogram):
+            cumulative_count += count
+            if cumulative_count >= threshold:
+                return 2 ** bucket
+        return 2 ** (len(histogram) - 1)
@@ -0,0 +1,183 @@
+import cProfile
+import io
+import logging
+import pstats
+import sys
+import threading
+from typing import Any, Callable, List
+
+
+class ThreadProfiler:
+    """
+    Deterministic profiler for the worker threads of the simulation.
+
+    Before Python 3.12, `cProfile` only profiles the thread it is enabled on,
+    so profiling the simulator from the outside shows the main thread waiting
+    in `join`. Instead, every producer and consumer thread runs its work under
+    a profile of its own, as does the thread manager on the main thread. Once
+    the threads have exited, the profiles are merged into a single `pstats`
+    file and the hottest functions are reported.
+
+    From Python 3.12, `cProfile` is built on `sys.monitoring`, whose events
+    are process-wide and which allows only one active profiler at a time.
+    There, a single shared profile is enabled while at least one profiled
+    call is running, and it sees every thread. Call counts stay exact, but
+    the threads share one call stack in the profile, so the time a thread
+    spends blocked may be charged to whichever function another thread is
+    running.
+
+    :ivar output_file: The path of the merged `pstats` file.
+    :type output_file: str
+    :ivar profiles: The profile of every profiled call, or every shared
+        profile.
+    :type profiles: List[cProfile.Profile]
+    :ivar profiles_lock: A lock guarding the profiles and the shared profile
+        state.
+    :type profiles_lock: threading.Lock
+    :ivar shared_profile: The shared profile currently enabled, or None.
+    :type shared_profile: cProfile.Profile | None
+    :ivar num_active_calls: The number of profiled calls running under the
+        shared profile.
+    :type num_active_calls: int
+    """
+    OUTPUT_FILE: str = 'pc_simulator.pstats'
+    NUM_HOT_SPOTS: int = 15
+    SORT_KEY: pstats.SortKey = pstats.SortKey.TIME
+    def __init__(self, output_file: str = OUTPUT_FILE):
+        """
+        Initializes a profiler without any profiles.
+
+        :param output_file: The path the merged `pstats` file is written to.
+        :type output_file: str
+        """
+        self.output_file: str = output_file
+        self.profiles: List[cProfile.Profile] = []
+        self.profiles_lock: threading.Lock = threading.Lock()
+        self.shared_profile: cProfile.Profile | None = None
+        self.num_active_calls: int = 0
+
+    @staticmethod
+    def is_per_thread_cprofile_supported() -> bool:
+        """
+        Determines if several `cProfile` profilers can run at the same time
+        on different threads of the running interpreter.
+
+        :return: True before Python 3.12, False otherwise.
+        :rtype: bool
+        """
+        return not hasattr(sys, 'monitoring')
+
+    def run_profiled(self, function: Callable, *args, **kwargs) -> Any:
+        """
+        Calls a function under a profile of the calling thread, or under the
+        shared profile if profilers cannot run on several threads at once.
+
+        :param function: The function to profile.
+        :type function: Callable
+        :param args: The positional arguments of the function.
+        :param kwargs: The keyword arguments of the function.
+        :return: The return value of the function.
+        :rtype: Any
+        """
+        if not ThreadProfiler.is_per_thread_cprofile_supported():
+            self.enable_shared_profile()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.disable_shared_profile()
+        thread_profile: cProfile.Profile = cProfile.Profile()
+        try:
+            return thread_profile.runcall(function, *args, **kwargs)
+        finally:
+            with self.profiles_lock:
+                self.profiles.append(thread_profile)
+
+    def enable_shared_profile(self) -> None:
+        """
+        Registers a profiled call, enabling a new shared profile if no other
+        profiled call is running. If another tool already profiles the
+        interpreter, a warning is logged and the call runs unprofiled.
+
+        :return: None
+        """
+        with self.profiles_lock:
+            self.num_active_calls += 1
+            if self.num_active_calls > 1:
+                return
+            shared_profile: cProfile.Profile = cProfile.Profile()
+            try:
+                shared_profile.enable()
+            except ValueError as exception:
+                logging.warning(f"Thread profiling is unavailable: {exception}")
+                return
+            self.shared_profile = shared_profile
+            self.profiles.append(shared_profile)
+
+    def disable_shared_profile(self) -> None:
+        """
+        Unregisters a profiled call, disabling the shared profile once no
+        profiled call is running anymore.
+
+        :return: None
+        """
+        with self.profiles_lock:
+            self.num_active_calls -= 1
+            if self.num_active_calls > 0 or self.shared_profile is None:
+                return
+            self.shared_profile.disable()
+            self.shared_profile = None
+
+    def get_stats(self) -> pstats.Stats | None:
+        """
+        Merges the finished profiles of all threads.
+
+        :return: The merged statistics, or None if nothing was profiled.
+        :rtype: pstats.Stats | None
+        """
+        with self.profiles_lock:
+            profiles: List[cProfile.Profile] = [profile for profile in self.profiles
+                                                if profile is not self.shared_profile]
+        if not profiles:
+            return None
+        stats: pstats.Stats = pstats.Stats(profiles[0], stream=io.StringIO())
+        for profile in profiles[1:]:
+            stats.add(profile)
+        return stats
+
+    def get_hot_spots(self, stats: pstats.Stats) -> str:
+        """
+        Formats the functions with the highest internal time.
+
+        :param stats: The merged statistics.
+        :type stats: pstats.Stats
+        :return: The `pstats` listing of the hottest functions.
+        :rtype: str
+        """
+        stream: io.StringIO = io.StringIO()
+        stats.stream = stream
+        stats.sort_stats(ThreadProfiler.SORT_KEY).print_stats(ThreadProfiler.NUM_HOT_SPOTS)
+        return stream.getvalue()
+
+    def save_profile(self) -> str:
+        """
+        Writes the merged statistics to the output file and summarizes the
+        hottest functions. Nothing is written if nothing was profiled. The
+        summary counts the thread profiles merged only where every thread
+        has its own profile; on Python 3.12 or newer, the profiles are the
+        profiling sessions of a single profile shared by all threads.
+
+        :return: A formatted string with the output file and the hot spots,
+            or an empty string if nothing was profiled.
+        :rtype: str
+        """
+        stats: pstats.Stats | None = self.get_stats()
+        if stats is None:
+            return ""
+        stats.dump_stats(self.output_file)
+        logging.debug(f"Profile written to {self.output_file}")
+        source: str = "Profiled all threads with a single shared profile, written to"
+        if ThreadProfiler.is_per_thread_cprofile_supported():
+            source = f"Merged {len(self.profiles)} thread profiles into"
+        return f"""
+        {source} {self.output_file}
+        {self.get_hot_spots(stats)}"""
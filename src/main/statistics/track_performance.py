@@ -3,8 +3,10 @@ import logging
 import threading
 import time
 
+from src.main.buffer.buffer_status import BufferStatus
 from src.main.buffer.empty_buffer_exception import EmptyBufferException
 from src.main.buffer.full_buffer_exception import FullBufferException
+from src.main.statistics.tracking_mode import TrackingMode
 
 
 def track_performance(function):
@@ -12,7 +14,8 @@ def track_performance(function):
     Tracks the execution time of the given function and logs it with
     additional information, such as the thread name and formatted time
     string. If execution time is less than 1 millisecond, it converts
-    the duration to nanoseconds and logs it accordingly.
+    the duration to nanoseconds and logs it accordingly. Outside verbose
+    tracking mode the function is called directly.
 
     :param function: The function whose execution time is to be tracked.
     :type function: Callable
@@ -21,6 +24,8 @@ def track_performance(function):
     """
     @functools.wraps(function)
     def wrapper(*args, **kwargs):
+        if not TrackingMode.is_verbose:
+            return function(*args, **kwargs)
         thread_name: str = threading.current_thread().name
         start_time: float = time.perf_counter()  * 1000
         result = function(*args, **kwargs)
@@ -60,6 +65,13 @@ def track_producer_performance(function):
     A decorator that measures the execution time of a function called within
     a producer thread, logs its details, and tracks performance metrics.
 
+    If the wrapped function returns an integer, it is taken as the number of
+    items handled by the call: the execution time is spread evenly across
+    those items, and calls that handled no items are not recorded. Any other
+    return value counts as a single item. The execution time is only logged
+    in verbose tracking mode. Calls the statistic tracker does not sample
+    are not timed; only their items are counted.
+
     :param function: Function to be wrapped and monitored by the
         decorator.
     :type function: Callable
@@ -69,20 +81,29 @@ def track_producer_performance(function):
     """
     @functools.wraps(function)
     def wrapper(self, *args, **kwargs):
-        thread_name: str = threading.current_thread().name
+        if not self.statistic_tracker.should_sample_producer():
+            result = function(self, *args, **kwargs)
+            self.statistic_tracker.increment_produced_items(
+                result if isinstance(result, int) else 1)
+            return result
         start_time: float = time.perf_counter() * 1000
         result = function(self, *args, **kwargs)
         end_time: float = time.perf_counter() * 1000
         execution_time: float | int = end_time - start_time
         nano_execution_time: int = milliseconds_to_nanoseconds(execution_time)
-        time_interval: str = 'milliseconds'
-        if execution_time < 1:
-            execution_time = nano_execution_time
-            time_interval = 'nanoseconds'
-        self.statistic_tracker.add_producer_throughput(nano_execution_time)
-        execution_time_str: str = format_execution_time_number(execution_time)
-        logging.debug(f"Execution time for {function.__name__} on thread "
-                      f"{thread_name}: {execution_time_str} {time_interval}.")
+        num_items: int = result if isinstance(result, int) else 1
+        if num_items > 0:
+            self.statistic_tracker.add_producer_throughput(
+                nano_execution_time // num_items, num_items)
+        if TrackingMode.is_verbose:
+            time_interval: str = 'milliseconds'
+            if execution_time < 1:
+                execution_time = nano_execution_time
+                time_interval = 'nanoseconds'
+            execution_time_str: str = format_execution_time_number(execution_time)
+            logging.debug(f"Execution time for {function.__name__} on thread "
+                          f"{threading.current_thread().name}: "
+                          f"{execution_time_str} {time_interval}.")
         return result
     return wrapper
 
@@ -91,6 +112,13 @@ def track_consumer_performance(function):
     A decorator that measures the execution time of a function called within
     a consumer thread, logs its details, and tracks performance metrics.
 
+    If the wrapped function returns an integer, it is taken as the number of
+    items handled by the call: the execution time is spread evenly across
+    those items, and calls that handled no items are not recorded. Any other
+    return value counts as a single item. The execution time is only logged
+    in verbose tracking mode. Calls the statistic tracker does not sample
+    are not timed; only their items are counted.
+
     :param function: Function to be wrapped and monitored by the
         decorator.
     :type function: Callable
@@ -100,20 +128,99 @@ def track_consumer_performance(function):
     """
     @functools.wraps(function)
     def wrapper(self, *args, **kwargs):
-        thread_name: str = threading.current_thread().name
+        if not self.statistic_tracker.should_sample_consumer():
+            result = function(self, *args, **kwargs)
+            self.statistic_tracker.increment_consumed_items(
+                result if isinstance(result, int) else 1)
+            return result
         start_time: float = time.perf_counter() * 1000
         result = function(self, *args, **kwargs)
         end_time: float = time.perf_counter() * 1000
         execution_time: float | int = end_time - start_time
         nano_execution_time: int = milliseconds_to_nanoseconds(execution_time)
-        time_interval: str = 'milliseconds'
-        if execution_time < 1:
-            execution_time = nano_execution_time
-            time_interval = 'nanoseconds'
-        self.statistic_tracker.add_consumer_throughput(nano_execution_time)
-        execution_time_str: str = format_execution_time_number(execution_time)
-        logging.debug(f"Execution time for {function.__name__} on thread "
-                      f"{thread_name}: {execution_time_str} {time_interval}.")
+        num_items: int = result if isinstance(result, int) else 1
+        if num_items > 0:
+            self.statistic_tracker.add_consumer_throughput(
+                nano_execution_time // num_items, num_items)
+        if TrackingMode.is_verbose:
+            time_interval: str = 'milliseconds'
+            if execution_time < 1:
+                execution_time = nano_execution_time
+                time_interval = 'nanoseconds'
+            execution_time_str: str = format_execution_time_number(execution_time)
+            logging.debug(f"Execution time for {function.__name__} on thread "
+                          f"{threading.current_thread().name}: "
+                          f"{execution_time_str} {time_interval}.")
+        return result
+    return wrapper
+
+def track_async_producer_performance(function):
+    """
+    The coroutine counterpart of `track_producer_performance`, for the
+    `process_item` coroutine of an asynchronous producer. The measured time
+    includes the time the producer was suspended, waiting for space in the
+    buffer or simulating work.
+
+    :param function: Coroutine function to be wrapped and monitored by the
+        decorator.
+    :type function: Callable
+    :return: The decorated coroutine function with added performance
+        tracking.
+    :rtype: Callable
+    """
+    @functools.wraps(function)
+    async def wrapper(self, *args, **kwargs):
+        if not self.statistic_tracker.should_sample_producer():
+            result = await function(self, *args, **kwargs)
+            self.statistic_tracker.increment_produced_items(
+                result if isinstance(result, int) else 1)
+            return result
+        start_time: int = time.perf_counter_ns()
+        result = await function(self, *args, **kwargs)
+        nano_execution_time: int = time.perf_counter_ns() - start_time
+        num_items: int = result if isinstance(result, int) else 1
+        if num_items > 0:
+            self.statistic_tracker.add_producer_throughput(
+                nano_execution_time // num_items, num_items)
+        if TrackingMode.is_verbose:
+            logging.debug(f"Execution time for {function.__name__} on "
+                          f"{self.name}: "
+                          f"{format_execution_time_number(nano_execution_time)} nanoseconds.")
+        return result
+    return wrapper
+
+def track_async_consumer_performance(function):
+    """
+    The coroutine counterpart of `track_consumer_performance`, for the
+    `process_item` coroutine of an asynchronous consumer. The measured time
+    includes the time the consumer was suspended, waiting for an item or
+    simulating work.
+
+    :param function: Coroutine function to be wrapped and monitored by the
+        decorator.
+    :type function: Callable
+    :return: The decorated coroutine function with added performance
+        tracking.
+    :rtype: Callable
+    """
+    @functools.wraps(function)
+    async def wrapper(self, *args, **kwargs):
+        if not self.statistic_tracker.should_sample_consumer():
+            result = await function(self, *args, **kwargs)
+            self.statistic_tracker.increment_consumed_items(
+                result if isinstance(result, int) else 1)
+            return result
+        start_time: int = time.perf_counter_ns()
+        result = await function(self, *args, **kwargs)
+        nano_execution_time: int = time.perf_counter_ns() - start_time
+        num_items: int = result if isinstance(result, int) else 1
+        if num_items > 0:
+            self.statistic_tracker.add_consumer_throughput(
+                nano_execution_time // num_items, num_items)
+        if TrackingMode.is_verbose:
+            logging.debug(f"Execution time for {function.__name__} on "
+                          f"{self.name}: "
+                          f"{format_execution_time_number(nano_execution_time)} nanoseconds.")
         return result
     return wrapper
 
@@ -141,6 +248,28 @@ def track_exceptions(function):
             raise
     return wrapper
 
+def track_buffer_status(function):
+    """
+    A decorator function used to wrap a non-raising buffer operation and
+    count its outcome. The decorator increments the full or empty buffer
+    counter in the statistic tracker when the wrapped function returns
+    `BufferStatus.FULL` or `BufferStatus.EMPTY`.
+
+    :param function: The function to be wrapped by the decorator.
+    :type function: Callable
+    :return: The wrapped function with outcome tracking logic.
+    :rtype: Callable
+    """
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        result = function(self, *args, **kwargs)
+        if result is BufferStatus.FULL:
+            self.statistic_tracker.increment_full_buffer()
+        elif result is BufferStatus.EMPTY:
+            self.statistic_tracker.increment_empty_buffer()
+        return result
+    return wrapper
+
 def milliseconds_to_nanoseconds(milliseconds: float | int) -> int:
     """
     Converts the given time in milliseconds to nanoseconds.
@@ -0,0 +1,26 @@
+class TrackingMode:
+    """
+    Process-wide switch for the per-call instrumentation of the tracking
+    decorators and locks, chosen once at startup from the verbose flag of the
+    configuration.
+
+    Outside verbose mode the debug messages would be discarded by the
+    logger anyway, so the decorators skip timing, thread name lookups, string
+    formatting and logging calls altogether and only keep the bookkeeping the
+    statistics rely on.
+
+    :ivar is_verbose: Whether every tracked call is timed and logged.
+    :type is_verbose: bool
+    """
+    is_verbose: bool = False
+
+    @staticmethod
+    def set_verbose(use_verbose: bool) -> None:
+        """
+        Enables or disables the per-call instrumentation.
+
+        :param use_verbose: True to time and log every tracked call.
+        :type use_verbose: bool
+        :return: None
+        """
+        TrackingMode.is_verbose = bool(use_verbose)
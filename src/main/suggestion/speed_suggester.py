@@ -1,4 +1,3 @@
-import statistics
 from enum import Enum
 from typing import List
 
@@ -207,23 +206,28 @@ class SpeedSuggester:
 
         This method computes the mean value of the producer throughput
         in nanoseconds stored in `self.statistic_tracker.producer_throughput_list`
-        and converts the result into milliseconds before returning.
+        and converts the result into milliseconds before returning. Without
+        any sampled producer throughput, the average speed is zero and no
+        producer speed suggestion is made.
 
         :returns: The average producer speed in milliseconds.
         :rtype: float
         """
-        mean_in_nanoseconds = statistics.mean(self.statistic_tracker.producer_throughput_list)
+        mean_in_nanoseconds = StatisticTracker.get_average_throughput(
+            self.statistic_tracker.producer_throughput_list)
         return nanoseconds_to_milliseconds(mean_in_nanoseconds)
 
     def get_average_consumer_speed(self) -> float:
         """
         Calculates the average consumer speed in milliseconds based on
-        recorded throughput data.
+        recorded throughput data, or zero without any sampled consumer
+        throughput.
 
         :return: The average consumer speed in milliseconds.
         :rtype: float
         """
-        mean_in_nanoseconds = statistics.mean(self.statistic_tracker.consumer_throughput_list)
+        mean_in_nanoseconds = StatisticTracker.get_average_throughput(
+            self.statistic_tracker.consumer_throughput_list)
         return nanoseconds_to_milliseconds(mean_in_nanoseconds)
 
     def get_intended_producer_speed(self) -> float:
@@ -2,14 +2,21 @@ import functools
 import logging
 import threading
 
-from src.main.thread.processor.lock.mutex_lock import MutexLock
+from src.main.buffer.buffer_status import BufferStatus
+from src.main.buffer.empty_buffer_exception import EmptyBufferException
+from src.main.buffer.full_buffer_exception import FullBufferException
+from src.main.statistics.track_performance import track_performance, \
+    track_exceptions, track_buffer_status
+from src.main.statistics.tracking_mode import TrackingMode
+from src.main.thread.processor.lock.lock import Lock
 
 
 def critical_section(function):
     """
     Decorator to apply a mutex lock for critical sections of code. This
     ensures that only one thread at a time can execute the decorated function,
-     providing thread-safety.
+     providing thread-safety. Entering and exiting the critical section is
+    only logged in verbose tracking mode.
 
     :param function: The function being wrapped by the decorator.
     :type function: Callable
@@ -19,11 +26,55 @@ def critical_section(function):
     """
     @functools.wraps(function)
     def wrapper(self, *args, **kwargs):
-        lock: MutexLock = self.mutex_lock
+        lock: Lock = self.mutex_lock
+        if not TrackingMode.is_verbose:
+            with lock:
+                return function(self, *args, **kwargs)
         thread_name: str = threading.current_thread().name
         logging.debug(f"Thread {thread_name} entering critical section in {function.__name__}.")
         with lock:
             result = function(self, *args, **kwargs)
         logging.debug(f"Thread {thread_name} exiting critical section in {function.__name__}.")
         return result
-    return wrapper
\ No newline at end of file
+    return wrapper
+
+def tracked_critical_section(function):
+    """
+    Decorator fusing `track_performance`, `critical_section` and the outcome
+    tracking of `track_exceptions` and `track_buffer_status` into a single
+    wrapper for buffer operations.
+
+    In verbose tracking mode the call goes through the stacked decorators, so
+    it is timed and logged as before. Otherwise the wrapper only holds the
+    mutex lock and counts full and empty buffers, whether they are raised as
+    exceptions or returned as a `BufferStatus`, without any thread name
+    lookups, string formatting or logging calls.
+
+    :param function: The buffer operation being wrapped by the decorator.
+    :type function: Callable
+    :return: A wrapper function that runs the operation under the mutex lock
+        and counts full and empty buffers.
+    :rtype: Callable
+    """
+    verbose_function = track_performance(critical_section(
+        track_exceptions(track_buffer_status(function))))
+
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        if TrackingMode.is_verbose:
+            return verbose_function(self, *args, **kwargs)
+        with self.mutex_lock:
+            try:
+                result = function(self, *args, **kwargs)
+            except FullBufferException:
+                self.statistic_tracker.increment_full_buffer()
+                raise
+            except EmptyBufferException:
+                self.statistic_tracker.increment_empty_buffer()
+                raise
+            if result is BufferStatus.FULL:
+                self.statistic_tracker.increment_full_buffer()
+            elif result is BufferStatus.EMPTY:
+                self.statistic_tracker.increment_empty_buffer()
+            return result
+    return wrapper
@@ -0,0 +1,18 @@
+from enum import Enum
+
+
+class ExecutorType(Enum):
+    """
+    This Enum class defines how the producers and consumers are executed,
+    keyed by the name accepted on the command line.
+
+    :ivar THREAD: Every producer and consumer runs as a thread of the
+        simulator process.
+    :type THREAD: str
+    :ivar PROCESS: Every producer and consumer runs in an operating system
+        process of its own, sharing a shared memory buffer, so CPU-bound work
+        is not serialized by the global interpreter lock.
+    :type PROCESS: str
+    """
+    THREAD: str = 'thread'
+    PROCESS: str = 'process'
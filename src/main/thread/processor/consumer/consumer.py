@@ -1,8 +1,10 @@
 import logging
 import time
 from abc import ABC
+from typing import List
 
 from src.main.buffer.buffer import Buffer
+from src.main.buffer.buffer_status import BufferStatus
 from src.main.buffer.empty_buffer_exception import EmptyBufferException
 from src.main.statistics.statistic_tracker import StatisticTracker
 from src.main.statistics.track_performance import track_consumer_performance
@@ -17,6 +19,8 @@ class Consumer(Processor, ABC):
     :type name: str
     :ivar running: A flag indicating whether the consumer is actively running.
     :type running: bool
+    :ivar batch_size: The maximum number of items dequeued together.
+    :type batch_size: int
     """
     def __init__(self,
                  id: int,
@@ -24,7 +28,8 @@ class Consumer(Processor, ABC):
                  speed_ceiling: int,
                  buffer: Buffer,
                  num_items_to_process: int,
-                 statistic_tracker: StatisticTracker):
+                 statistic_tracker: StatisticTracker,
+                 batch_size: int = 1):
         """
         Initializes a Consumer instance with specific attributes including
         identifiers, speed constraints, a shared buffer, processing
@@ -45,6 +50,9 @@ class Consumer(Processor, ABC):
         :param statistic_tracker: Tracker for collecting processing
         statistics.
         :type statistic_tracker: StatisticTracker
+        :param batch_size: The maximum number of items to dequeue under a
+            single buffer operation.
+        :type batch_size: int
         """
         super().__init__(id,
                          speed_floor,
@@ -53,48 +61,103 @@ class Consumer(Processor, ABC):
                          num_items_to_process,
                          statistic_tracker)
         self.name = f"Consumer-{id}"
+        self.batch_size: int = batch_size
 
     def run(self) -> None:
         """
-        Controls the execution of a running process.
+        Controls the execution of a running process, processing items under
+        the thread profiler if one is set.
 
         :return: This method does not return any value.
         :rtype: None
         """
         self.running = True
-        while self.should_run():
-            self.process_item()
+        self.process_items()
         self.stop()
 
     @track_consumer_performance
-    def process_item(self) -> None:
+    def process_item(self) -> int:
         """
         Processes an item from the buffer by dequeuing it and updating the
         number of items to process. If the buffer is empty, logs relevant
         details about remaining items, checks if the processing is completed,
-        and stops if required.
+        and stops if required. Blocking buffers park the consumer until an
+        item is available instead, so no extra sleep is needed. Consumers
+        with a batch size above one process a batch instead.
 
-        :return: This method does not return any value.
-        :rtype: None
+        :return: The number of items dequeued.
+        :rtype: int
+        """
+        if self.batch_size > 1:
+            return self.process_batch()
+        dequeued_number: int | BufferStatus = self.dequeue_number()
+        if dequeued_number is BufferStatus.EMPTY:
+            self.handle_empty_buffer(self.is_blocking_buffer)
+            return 0
+        logging.debug(f"Dequeued number: {dequeued_number}")
+        self.num_items_to_process -= 1
+        logging.debug(f"Items remaining: {self.num_items_to_process}")
+        self.simulate_processing()
+        return 1
+
+    def process_batch(self) -> int:
+        """
+        Dequeues up to a batch of items from the buffer under a single buffer
+        operation and updates the number of items to process. If the buffer
+        is empty, handles it the same way as a single item.
+
+        :return: The number of items dequeued.
+        :rtype: int
         """
         try:
-            dequeued_number: int = self.buffer.dequeue()
-            logging.debug(f"Dequeued number: {dequeued_number}")
-            self.num_items_to_process -= 1
-            logging.debug(f"Items remaining: {self.num_items_to_process}")
-            self.simulate_processing()
+            batch_size: int = min(self.batch_size, self.num_items_to_process)
+            dequeued_numbers: List[int] = self.buffer.dequeue_many(batch_size)
         except EmptyBufferException:
-            num_remaining_items: int = (self.statistic_tracker.num_items_to_process
-                                        - self.statistic_tracker.items_produced)
-            num_remaining_string: str = f"{num_remaining_items}"
-            logging.debug(f"Buffer is empty. {num_remaining_string} items remaining.")
-            has_completed_processing: bool = (self.statistic_tracker.items_produced ==
-                                              self.statistic_tracker.num_items_to_process)
-            if has_completed_processing:
-                self.stop()
-            else:
-                time.sleep(0.01)
-            return
+            self.handle_empty_buffer(False)
+            return 0
+        num_dequeued: int = len(dequeued_numbers)
+        self.num_items_to_process -= num_dequeued
+        logging.debug(f"Dequeued {num_dequeued} numbers. Items remaining: "
+                      f"{self.num_items_to_process}")
+        self.simulate_batch_processing(num_dequeued)
+        return num_dequeued
+
+    def handle_empty_buffer(self, has_waited: bool) -> None:
+        """
+        Logs the remaining items when the buffer was found empty and stops
+        the consumer if every item has already been produced. Otherwise, it
+        sleeps for a short duration before the next attempt unless the
+        consumer has already waited on a blocking buffer.
+
+        :param has_waited: Whether the consumer already waited for an item.
+        :type has_waited: bool
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        num_remaining_items: int = (self.statistic_tracker.num_items_to_process
+                                    - self.statistic_tracker.items_produced)
+        num_remaining_string: str = f"{num_remaining_items}"
+        logging.debug(f"Buffer is empty. {num_remaining_string} items remaining.")
+        has_completed_processing: bool = (self.statistic_tracker.items_produced ==
+                                          self.statistic_tracker.num_items_to_process)
+        if has_completed_processing:
+            self.stop()
+        elif not has_waited:
+            time.sleep(Processor.POLLING_INTERVAL)
+
+    def dequeue_number(self) -> int | BufferStatus:
+        """
+        Dequeues a number from the buffer through its non-raising API,
+        waiting for an item for up to the blocking timeout if the buffer
+        supports blocking.
+
+        :return: The number removed from the buffer, or `BufferStatus.EMPTY`
+            if the buffer was empty.
+        :rtype: int | BufferStatus
+        """
+        if self.is_blocking_buffer:
+            return self.buffer.try_get(Processor.BLOCKING_TIMEOUT)
+        return self.buffer.try_dequeue()
 
     def stop(self):
         """
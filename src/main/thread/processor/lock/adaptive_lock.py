@@ -0,0 +1,123 @@
+import threading
+import time
+
+from src.main.thread.processor.lock.lock import Lock
+
+
+class AdaptiveLock(Lock):
+    """
+    Mutex lock which spins briefly before parking a contended thread.
+
+    A contended `acquire` first yields the processor and retries for a spin
+    budget, and only parks on a condition variable once the budget is used
+    up. A release wakes a single parked thread, which then retries; it may
+    lose the race to a spinning thread and park again.
+    The budget is twice the recent average hold time, tracked as an
+    exponentially weighted moving average over releases, and capped at the
+    estimated cost of parking. Locks held for a few microseconds are
+    therefore mostly acquired without sleeping, while long holds park almost
+    immediately.
+
+    The counters are updated while the lock or the condition is held, so they
+    are exact.
+
+    :ivar lock: The underlying lock.
+    :type lock: threading.Lock
+    :ivar condition: The condition variable parked threads wait on.
+    :type condition: threading.Condition
+    :ivar num_parked_threads: The number of threads currently parked or
+        about to park.
+    :type num_parked_threads: int
+    :ivar average_hold_time: The moving average hold time in nanoseconds.
+    :type average_hold_time: float
+    :ivar acquire_time: The time the current holder acquired the lock, in
+        nanoseconds.
+    :type acquire_time: int
+    :ivar num_spins: The number of retries made while spinning.
+    :type num_spins: int
+    :ivar num_parks: The number of times a thread parked.
+    :type num_parks: int
+    :ivar num_wakeups: The number of times a parked thread was woken.
+    :type num_wakeups: int
+    """
+    MAX_SPIN_TIME: int = 50_000
+    MAX_SPINS: int = 100
+    HOLD_TIME_WEIGHT: float = 0.125
+    def __init__(self):
+        """
+        Initializes an available lock with an empty hold time history and
+        zeroed counters.
+        """
+        self.lock: threading.Lock = threading.Lock()
+        self.condition: threading.Condition = threading.Condition(threading.Lock())
+        self.num_parked_threads: int = 0
+        self.average_hold_time: float = 0.0
+        self.acquire_time: int = 0
+        self.num_spins: int = 0
+        self.num_parks: int = 0
+        self.num_wakeups: int = 0
+
+    def acquire(self) -> None:
+        """
+        Acquires the lock, spinning for the current spin budget before
+        parking the thread if the lock is contended.
+
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        if self.lock.acquire(blocking=False):
+            self.acquire_time = time.perf_counter_ns()
+            return
+        spin_deadline: int = time.perf_counter_ns() + self.get_spin_budget()
+        num_spins: int = 0
+        while num_spins < AdaptiveLock.MAX_SPINS and time.perf_counter_ns() < spin_deadline:
+            num_spins += 1
+            time.sleep(0)
+            if self.lock.acquire(blocking=False):
+                self.num_spins += num_spins
+                self.acquire_time = time.perf_counter_ns()
+                return
+        with self.condition:
+            self.num_parked_threads += 1
+            while not self.lock.acquire(blocking=False):
+                self.num_parks += 1
+                self.condition.wait()
+                self.num_wakeups += 1
+            self.num_parked_threads -= 1
+        self.num_spins += num_spins
+        self.acquire_time = time.perf_counter_ns()
+
+    def release(self) -> None:
+        """
+        Records how long the lock was held, releases it and wakes one parked
+        thread if there is any.
+
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        hold_time: int = time.perf_counter_ns() - self.acquire_time
+        self.average_hold_time += (AdaptiveLock.HOLD_TIME_WEIGHT *
+                                   (hold_time - self.average_hold_time))
+        self.lock.release()
+        if self.num_parked_threads:
+            with self.condition:
+                self.condition.notify()
+
+    def get_spin_budget(self) -> int:
+        """
+        Calculates how long a contended thread spins before parking: twice
+        the average hold time, capped at the estimated cost of parking.
+
+        :return: The spin budget in nanoseconds.
+        :rtype: int
+        """
+        return int(min(2 * self.average_hold_time, AdaptiveLock.MAX_SPIN_TIME))
+
+    def is_locked(self) -> bool:
+        """
+        Determines if the lock is currently held by a thread.
+
+        :return: True if a thread holds the lock, False otherwise.
+        :rtype: bool
+        """
+        return self.lock.locked()
@@ -0,0 +1,95 @@
+import logging
+import threading
+from collections import deque
+from typing import Deque
+
+from src.main.statistics.tracking_mode import TrackingMode
+from src.main.thread.processor.lock.lock import Lock
+from src.main.thread.processor.lock.lock_state import LockState
+
+
+class FairMutexLock(Lock):
+    """
+    Mutex lock which grants ownership to waiting threads in arrival order.
+
+    Each waiting thread parks on its own private lock, queued in FIFO order.
+    On release, ownership is handed directly to the thread at the head of the
+    queue and only that thread is woken, so every release causes at most one
+    wakeup and no thread can be overtaken by threads arriving after it.
+
+    :ivar lock_state: The current state of the lock, which stays UNAVAILABLE
+        while ownership is handed from one thread to the next.
+    :type lock_state: LockState
+    :ivar state_lock: A short-lived lock guarding the lock state and queue.
+    :type state_lock: threading.Lock
+    :ivar waiters: The private locks of the parked threads, oldest first.
+    :type waiters: Deque[threading.Lock]
+    """
+    def __init__(self):
+        """
+        Initializes an available lock with no waiting threads.
+        """
+        self.lock_state: LockState = LockState.AVAILABLE
+        self.state_lock: threading.Lock = threading.Lock()
+        self.waiters: Deque[threading.Lock] = deque()
+
+    def acquire(self) -> None:
+        """
+        Acquires the lock if it is available and no other thread is waiting
+        for it. Otherwise, the current thread joins the end of the queue and
+        parks until ownership is handed to it.
+
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        with self.state_lock:
+            if self.is_available():
+                self.lock_state = LockState.UNAVAILABLE
+                return
+            waiter: threading.Lock = threading.Lock()
+            waiter.acquire()
+            self.waiters.append(waiter)
+        waiter.acquire()
+        if TrackingMode.is_verbose:
+            logging.debug(f"Thread {threading.current_thread().name} was handed the lock.")
+
+    def release(self) -> None:
+        """
+        Hands ownership to the longest waiting thread and wakes it, or makes
+        the lock available if no thread is waiting.
+
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        with self.state_lock:
+            if self.waiters:
+                self.waiters.popleft().release()
+            else:
+                self.lock_state = LockState.AVAILABLE
+
+    def is_available(self) -> bool:
+        """
+        Checks if the lock is currently available.
+
+        :return: True if no thread holds the lock, False otherwise.
+        :rtype: bool
+        """
+        return self.lock_state == LockState.AVAILABLE
+
+    def is_locked(self) -> bool:
+        """
+        Determines if the lock is currently held by a thread.
+
+        :return: True if a thread holds the lock, False otherwise.
+        :rtype: bool
+        """
+        return self.lock_state == LockState.UNAVAILABLE
+
+    def get_num_waiters(self) -> int:
+        """
+        Returns the number of threads parked waiting for the lock.
+
+        :return: The length of the waiting queue.
+        :rtype: int
+        """
+        return len(self.waiters)
@@ -0,0 +1,56 @@
+from abc import ABC, abstractmethod
+
+
+class Lock(ABC):
+    """
+    Abstract base class for the mutual exclusion locks guarding the buffers.
+
+    Implementations provide `acquire` and `release`; the lock can then be
+    used as a context manager, which is how `critical_section` holds it.
+    """
+    @abstractmethod
+    def acquire(self) -> None:
+        """
+        Acquires the lock, blocking the current thread until it is available.
+
+        :raises NotImplementedError: If the method is not overridden in a
+        subclass.
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        pass
+
+    @abstractmethod
+    def release(self) -> None:
+        """
+        Releases the lock held by the current thread.
+
+        :raises NotImplementedError: If the method is not overridden in a
+        subclass.
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        pass
+
+    def __enter__(self):
+        """
+        Acquires the lock when entering a context.
+
+        :return: None
+        """
+        self.acquire()
+
+    def __exit__(self, exception_type, exception_value, exception_traceback):
+        """
+        Releases the lock when exiting a context.
+
+        :param exception_type: The type of exception raised in the context.
+        :type exception_type: type
+        :param exception_value: The exception object raised in the context.
+        :type exception_value: Exception
+        :param exception_traceback: The traceback for the exception.
+        :type exception_traceback: Traceback
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        self.release()
@@ -0,0 +1,24 @@
+from enum import Enum
+
+
+class LockType(Enum):
+    """
+    This Enum class defines the lock implementations the buffers can be
+    guarded with, keyed by the name accepted on the command line.
+
+    :ivar MUTEX: A condition-based mutex which wakes every waiting thread on
+        release.
+    :type MUTEX: str
+    :ivar FAIR: A mutex which hands ownership to the longest waiting thread,
+        waking only that thread on release.
+    :type FAIR: str
+    :ivar ADAPTIVE: A mutex which spins for a budget derived from recent
+        hold times before parking.
+    :type ADAPTIVE: str
+    :ivar NATIVE: A plain `threading.Lock`, used as a baseline.
+    :type NATIVE: str
+    """
+    MUTEX: str = 'mutex'
+    FAIR: str = 'fair'
+    ADAPTIVE: str = 'adaptive'
+    NATIVE: str = 'native'
@@ -3,10 +3,12 @@ import threading
 from threading import Condition
 
 
+from src.main.statistics.tracking_mode import TrackingMode
+from src.main.thread.processor.lock.lock import Lock
 from src.main.thread.processor.lock.lock_state import LockState
 
 
-class MutexLock:
+class MutexLock(Lock):
     """
     Thread-safe mutex lock implementation for synchronizing access to a shared
     resource across multiple threads.
@@ -46,11 +48,11 @@ class MutexLock:
         :rtype: None
         """
         with self.condition:
-            thread_name: str = threading.current_thread().name
             while self.is_locked():
                 self.condition.wait()
             self.lock()
-            logging.debug(f"Thread {thread_name} acquired the lock.")
+            if TrackingMode.is_verbose:
+                logging.debug(f"Thread {threading.current_thread().name} acquired the lock.")
 
     def release(self) -> None:
         """
@@ -62,7 +64,8 @@ class MutexLock:
         """
         with self.condition:
             self.unlock()
-            logging.debug(f"Thread {threading.current_thread().name} released the lock.")
+            if TrackingMode.is_verbose:
+                logging.debug(f"Thread {threading.current_thread().name} released the lock.")
             self.condition.notify_all()
 
     def __enter__(self):
@@ -0,0 +1,45 @@
+import threading
+
+from src.main.thread.processor.lock.lock import Lock
+
+
+class NativeLock(Lock):
+    """
+    Adapter exposing a plain `threading.Lock` through the `Lock` interface,
+    used as a baseline when comparing lock implementations.
+
+    :ivar lock: The wrapped lock.
+    :type lock: threading.Lock
+    """
+    def __init__(self):
+        """
+        Initializes the adapter around a new, available `threading.Lock`.
+        """
+        self.lock: threading.Lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Acquires the wrapped lock, blocking until it is available.
+
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        self.lock.acquire()
+
+    def release(self) -> None:
+        """
+        Releases the wrapped lock.
+
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        self.lock.release()
+
+    def is_locked(self) -> bool:
+        """
+        Determines if the wrapped lock is currently held by a thread.
+
+        :return: True if a thread holds the lock, False otherwise.
+        :rtype: bool
+        """
+        return self.lock.locked()
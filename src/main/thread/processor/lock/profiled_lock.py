@@ -0,0 +1,61 @@
+import time
+
+from src.main.statistics.lock_profiler import LockProfiler
+from src.main.thread.processor.lock.lock import Lock
+
+
+class ProfiledLock(Lock):
+    """
+    Wrapper around any lock which reports wait and hold times of every
+    acquisition to a lock profiler, using the monotonic nanosecond clock.
+
+    Only the simulator wraps its locks when lock profiling is enabled, so
+    unprofiled runs use the bare locks and pay nothing.
+
+    :ivar lock: The wrapped lock.
+    :type lock: Lock
+    :ivar lock_profiler: The profiler the timings are reported to.
+    :type lock_profiler: LockProfiler
+    :ivar acquire_time: The time the current holder acquired the lock, in
+        nanoseconds.
+    :type acquire_time: int
+    """
+    def __init__(self,
+                 lock: Lock,
+                 lock_profiler: LockProfiler):
+        """
+        Initializes the wrapper around the given lock.
+
+        :param lock: The lock to profile.
+        :type lock: Lock
+        :param lock_profiler: The profiler the timings are reported to.
+        :type lock_profiler: LockProfiler
+        """
+        self.lock: Lock = lock
+        self.lock_profiler: LockProfiler = lock_profiler
+        self.acquire_time: int = 0
+
+    def acquire(self) -> None:
+        """
+        Acquires the wrapped lock and records how long the current thread
+        waited for it.
+
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        start_time: int = time.perf_counter_ns()
+        self.lock.acquire()
+        self.acquire_time = time.perf_counter_ns()
+        self.lock_profiler.record_wait_time(self.acquire_time - start_time)
+
+    def release(self) -> None:
+        """
+        Records how long the current thread held the wrapped lock and
+        releases it.
+
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        hold_time: int = time.perf_counter_ns() - self.acquire_time
+        self.lock.release()
+        self.lock_profiler.record_hold_time(hold_time)
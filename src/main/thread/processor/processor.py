@@ -3,8 +3,10 @@ import threading
 import time
 from abc import ABC, abstractmethod
 
+from src.main.buffer.blocking_buffer import BlockingBuffer
 from src.main.buffer.buffer import Buffer
 from src.main.statistics.statistic_tracker import StatisticTracker
+from src.main.statistics.thread_profiler import ThreadProfiler
 
 
 class Processor(ABC, threading.Thread):
@@ -25,7 +27,15 @@ class Processor(ABC, threading.Thread):
     :type num_items_to_process: int
     :ivar statistic_tracker: Object for tracking processing statistics.
     :type statistic_tracker: StatisticTracker
+    :ivar is_blocking_buffer: Indicates if the buffer can park the processor
+        until an operation can make progress instead of raising.
+    :type is_blocking_buffer: bool
+    :ivar thread_profiler: Profiler the processing loop runs under, or None
+        if the thread is not profiled.
+    :type thread_profiler: ThreadProfiler | None
     """
+    POLLING_INTERVAL: float = 0.01
+    BLOCKING_TIMEOUT: float = 0.1
     def __init__(self,
                  id: int,
                  speed_floor: int,
@@ -61,6 +71,8 @@ class Processor(ABC, threading.Thread):
         self.running: bool = False
         self.num_items_to_process: int = num_items_to_process
         self.statistic_tracker: StatisticTracker = statistic_tracker
+        self.is_blocking_buffer: bool = isinstance(buffer, BlockingBuffer)
+        self.thread_profiler: ThreadProfiler | None = None
 
     @abstractmethod
     def run(self):
@@ -112,6 +124,29 @@ class Processor(ABC, threading.Thread):
         """
         return self.running and self.num_items_to_process > 0
 
+    def process_items(self) -> None:
+        """
+        Processes items for as long as the processor should run, under the
+        thread profiler if one is set.
+
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        if self.thread_profiler is not None:
+            self.thread_profiler.run_profiled(self.process_all_items)
+        else:
+            self.process_all_items()
+
+    def process_all_items(self) -> None:
+        """
+        Repeatedly processes an item while `should_run` evaluates to True.
+
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        while self.should_run():
+            self.process_item()
+
     def get_random_speed(self):
         """
         Returns a random speed within the defined floor and ceiling values.
@@ -132,3 +167,16 @@ class Processor(ABC, threading.Thread):
         """
         processing_time = self.get_random_speed()
         time.sleep(processing_time / 1000)
+
+    def simulate_batch_processing(self, num_items: int):
+        """
+        Simulates processing a batch of items by sleeping once for the sum of
+        a random duration per item within the defined speed range.
+
+        :param num_items: The number of items in the batch.
+        :type num_items: int
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        processing_time = sum(self.get_random_speed() for _ in range(num_items))
+        time.sleep(processing_time / 1000)
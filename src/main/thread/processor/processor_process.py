@@ -0,0 +1,151 @@
+import logging
+import multiprocessing
+import threading
+from multiprocessing.connection import Connection
+from typing import Any, Dict, Type
+
+from src.main.buffer.buffer import Buffer
+from src.main.logging.setup_logging import setup_logging
+from src.main.statistics.sample_mode import SampleMode
+from src.main.statistics.statistic_tracker import StatisticTracker
+from src.main.statistics.tracking_mode import TrackingMode
+from src.main.thread.processor.processor import Processor
+
+
+class ProcessorProcess(multiprocessing.Process):
+    """
+    Runs a producer or consumer in an operating system process of its own.
+
+    The processor is created in the child process with a statistic tracker
+    of its own, configured like the tracker of the parent, and runs on the
+    main thread of the child. The buffer must be shareable between
+    processes. Once the processor has stopped, the child sends the
+    statistics it gathered back through a pipe, to be merged into the
+    tracker of the parent.
+
+    :ivar processor_class: The class of the processor to run.
+    :type processor_class: Type[Processor]
+    :ivar processor_arguments: The keyword arguments of the processor, other
+        than the buffer and the statistic tracker.
+    :type processor_arguments: Dict[str, Any]
+    :ivar buffer: The buffer shared with the other processes.
+    :type buffer: Buffer
+    :ivar num_items_to_process: The total number of items of the simulation.
+    :type num_items_to_process: int
+    :ivar sample_rate: The sample rate of the parent tracker.
+    :type sample_rate: int
+    :ivar sample_mode: The sample mode of the parent tracker.
+    :type sample_mode: SampleMode
+    :ivar timing_overhead: The timing overhead measured by the parent.
+    :type timing_overhead: int
+    :ivar is_overhead_corrected: Whether the timing overhead is subtracted
+        from the throughput.
+    :type is_overhead_corrected: bool
+    :ivar is_verbose: Whether every tracked call is timed and logged.
+    :type is_verbose: bool
+    :ivar statistics_receiver: The end of the pipe the parent receives the
+        statistics from.
+    :type statistics_receiver: Connection
+    :ivar statistics_sender: The end of the pipe the child sends the
+        statistics through.
+    :type statistics_sender: Connection
+    """
+    POLLING_INTERVAL: float = 0.1
+    def __init__(self,
+                 processor_class: Type[Processor],
+                 processor_arguments: Dict[str, Any],
+                 buffer: Buffer,
+                 statistic_tracker: StatisticTracker):
+        """
+        Initializes a process for a processor, named like the processor.
+
+        :param processor_class: The class of the processor to run.
+        :type processor_class: Type[Processor]
+        :param processor_arguments: The keyword arguments of the processor,
+            other than the buffer and the statistic tracker. They must
+            include its `id`.
+        :type processor_arguments: Dict[str, Any]
+        :param buffer: The buffer shared with the other processes.
+        :type buffer: Buffer
+        :param statistic_tracker: The tracker of the parent, which the
+            tracker of the child is configured like.
+        :type statistic_tracker: StatisticTracker
+        """
+        super().__init__(name=f"{processor_class.__name__}-{processor_arguments['id']}")
+        self.processor_class: Type[Processor] = processor_class
+        self.processor_arguments: Dict[str, Any] = processor_arguments
+        self.buffer: Buffer = buffer
+        self.num_items_to_process: int = statistic_tracker.num_items_to_process
+        self.sample_rate: int = statistic_tracker.sample_rate
+        self.sample_mode: SampleMode = statistic_tracker.sample_mode
+        self.timing_overhead: int = statistic_tracker.timing_overhead
+        self.is_overhead_corrected: bool = statistic_tracker.is_overhead_corrected
+        self.is_verbose: bool = TrackingMode.is_verbose
+        self.statistics_receiver: Connection
+        self.statistics_sender: Connection
+        self.statistics_receiver, self.statistics_sender = multiprocessing.Pipe(duplex=False)
+
+    def start(self) -> None:
+        """
+        Starts the child process, then closes the sending end of the pipe in
+        the parent, so the pipe reports the end of the stream once the child
+        has exited.
+
+        :return: None
+        """
+        super().start()
+        self.statistics_sender.close()
+
+    def run(self) -> None:
+        """
+        Runs the processor in the child process and sends its statistics to
+        the parent, even if the run was interrupted.
+
+        :return: None
+        """
+        threading.current_thread().name = self.name
+        setup_logging(self.is_verbose)
+        statistic_tracker: StatisticTracker = self.create_statistic_tracker()
+        self.buffer.statistic_tracker = statistic_tracker
+        processor: Processor = self.processor_class(buffer=self.buffer,
+                                                    statistic_tracker=statistic_tracker,
+                                                    **self.processor_arguments)
+        try:
+            processor.run()
+        except KeyboardInterrupt:
+            logging.debug(f"{self.name} interrupted.")
+        finally:
+            self.statistics_sender.send(statistic_tracker.get_process_statistics())
+            self.statistics_sender.close()
+            self.buffer.close()
+
+    def create_statistic_tracker(self) -> StatisticTracker:
+        """
+        Creates the tracker of the child, configured like the parent tracker.
+
+        :return: A new statistic tracker.
+        :rtype: StatisticTracker
+        """
+        statistic_tracker: StatisticTracker = StatisticTracker(self.num_items_to_process,
+                                                               self.sample_rate,
+                                                               self.sample_mode)
+        statistic_tracker.timing_overhead = self.timing_overhead
+        statistic_tracker.is_overhead_corrected = self.is_overhead_corrected
+        return statistic_tracker
+
+    def receive_statistics(self) -> Dict[str, Any] | None:
+        """
+        Waits for the statistics of the child process.
+
+        :return: The statistics gathered by the child, or None if it exited
+            without sending them or they were already received.
+        :rtype: Dict[str, Any] | None
+        """
+        while self.is_alive() and not self.statistics_receiver.poll(ProcessorProcess.POLLING_INTERVAL):
+            pass
+        try:
+            if self.statistics_receiver.poll():
+                return self.statistics_receiver.recv()
+        except (EOFError, OSError):
+            pass
+        return None
@@ -1,9 +1,13 @@
 import logging
 import random
 import time
+from typing import List
 
 from src.main.buffer.buffer import Buffer
+from src.main.buffer.buffer_status import BufferStatus
 from src.main.buffer.full_buffer_exception import FullBufferException
+from src.main.buffer.priority_buffer import PriorityBuffer
+from src.main.buffer.priority_class import PriorityClass
 from src.main.statistics.statistic_tracker import StatisticTracker
 from src.main.statistics.track_performance import track_producer_performance
 from src.main.thread.processor.processor import Processor
@@ -16,6 +20,20 @@ class Producer(Processor):
 
     :ivar name: Name of the producer instance. Initialized with a unique id.
     :type name: str
+    :ivar batch_size: The number of items produced and enqueued together.
+    :type batch_size: int
+    :ivar pending_numbers: Produced numbers of the current batch which have
+        not been accepted by the buffer yet.
+    :type pending_numbers: List[int]
+    :ivar pending_priority_classes: The priority classes of the pending
+        numbers when the buffer is a priority buffer.
+    :type pending_priority_classes: List[PriorityClass]
+    :ivar urgent_ratio: The fraction of items tagged as urgent when the
+        buffer is a priority buffer.
+    :type urgent_ratio: float
+    :ivar is_priority_buffer: Indicates if items are tagged with a priority
+        class when they are enqueued.
+    :type is_priority_buffer: bool
     """
     def __init__(self,
                  id: int,
@@ -23,7 +41,9 @@ class Producer(Processor):
                  speed_ceiling: int,
                  buffer: Buffer,
                  num_items_to_process: int,
-                 statistic_tracker: StatisticTracker):
+                 statistic_tracker: StatisticTracker,
+                 batch_size: int = 1,
+                 urgent_ratio: float = 0.0):
         """
         Initialize a Producer instance with specific attributes including
         identifiers, speed constraints, a shared buffer, and a tracker for
@@ -43,6 +63,12 @@ class Producer(Processor):
         :param statistic_tracker: Tracks and records production-related
         statistics.
         :type statistic_tracker: StatisticTracker
+        :param batch_size: The number of items to produce and enqueue under a
+            single buffer operation.
+        :type batch_size: int
+        :param urgent_ratio: The fraction of items to tag as urgent when the
+            buffer is a priority buffer.
+        :type urgent_ratio: float
         """
         super().__init__(id,
                          speed_floor,
@@ -51,6 +77,11 @@ class Producer(Processor):
                          num_items_to_process,
                          statistic_tracker)
         self.name = f"Producer-{id}"
+        self.batch_size: int = batch_size
+        self.pending_numbers: List[int] = []
+        self.pending_priority_classes: List[PriorityClass] = []
+        self.urgent_ratio: float = urgent_ratio
+        self.is_priority_buffer: bool = isinstance(buffer, PriorityBuffer)
 
     @staticmethod
     def get_random_number() -> int:
@@ -62,45 +93,116 @@ class Producer(Processor):
         """
         return random.randint(1, 100)
 
+    def get_random_priority_class(self) -> PriorityClass:
+        """
+        Chooses the priority class of the next item, tagging it as urgent
+        with a probability of the urgent ratio.
+
+        :return: The priority class of the next item.
+        :rtype: PriorityClass
+        """
+        if random.random() < self.urgent_ratio:
+            return PriorityClass.URGENT
+        return PriorityClass.BULK
+
     def run(self) -> None:
         """
         This method initiates and runs a continuous execution loop that keeps
         processing items until the stopping condition is met. The loop starts
         by setting the `running` attribute to True, continues execution by
         calling the `process_item` repeatedly while `should_run` evaluates
-        to True, and stops by invoking the `stop` method.
+        to True, under the thread profiler if one is set, and stops by
+        invoking the `stop` method.
 
         :return: This method does not return any value.
         :rtype: None
         """
         self.running = True
-        while self.should_run():
-            self.process_item()
+        self.process_items()
         self.stop()
 
     @track_producer_performance
-    def process_item(self) -> None:
+    def process_item(self) -> int:
         """
         Processes an item by generating a random number, enqueuing it into
         the buffer, and reducing the counter for remaining items to process.
-        Handles `FullBufferException` by sleeping for a short duration and
-        then attempting to reprocess.
+        Handles a full buffer by sleeping for a short duration and then
+        attempting to reprocess. Blocking buffers park the producer until
+        space is available instead, so no extra sleep is needed.
+        Producers with a batch size above one process a batch instead.
 
-        :raises FullBufferException: If the buffer is full and unable to
-            enqueue the generated random number.
-        :return: This method does not return any value.
-        :rtype: None
+        :return: The number of items enqueued.
+        :rtype: int
+        """
+        if self.batch_size > 1:
+            return self.process_batch()
+        random_number: int = self.get_random_number()
+        if self.enqueue_number(random_number) is BufferStatus.FULL:
+            if not self.is_blocking_buffer:
+                time.sleep(Processor.POLLING_INTERVAL)
+            return 0
+        logging.debug(f"Enqueued number: {random_number}")
+        self.num_items_to_process -= 1
+        logging.debug(f"Items remaining: {self.num_items_to_process}")
+        self.simulate_processing()
+        return 1
+
+    def process_batch(self) -> int:
         """
+        Produces a batch of random numbers and enqueues as many of them as
+        the buffer accepts under a single buffer operation. Numbers that do
+        not fit are kept and offered again on the next call. Numbers put into
+        a priority buffer are each tagged with a random priority class. Handles
+        `FullBufferException` by sleeping for a short duration.
+
+        :return: The number of items enqueued.
+        :rtype: int
+        """
+        if not self.pending_numbers:
+            batch_size: int = min(self.batch_size, self.num_items_to_process)
+            self.pending_numbers = [self.get_random_number()
+                                    for _ in range(batch_size)]
+            if self.is_priority_buffer:
+                self.pending_priority_classes = [self.get_random_priority_class()
+                                                 for _ in range(batch_size)]
         try:
-            random_number: int = self.get_random_number()
-            logging.debug(f"Enqueued number: {random_number}")
-            self.buffer.enqueue(random_number)
-            self.num_items_to_process -= 1
-            logging.debug(f"Items remaining: {self.num_items_to_process}")
+            num_enqueued: int
+            if self.is_priority_buffer:
+                num_enqueued = self.buffer.enqueue_many_with_priority(
+                    self.pending_numbers, self.pending_priority_classes)
+            else:
+                num_enqueued = self.buffer.enqueue_many(self.pending_numbers)
         except FullBufferException:
-            time.sleep(0.01)
-            return
-        self.simulate_processing()
+            time.sleep(Processor.POLLING_INTERVAL)
+            return 0
+        del self.pending_numbers[:num_enqueued]
+        del self.pending_priority_classes[:num_enqueued]
+        self.num_items_to_process -= num_enqueued
+        logging.debug(f"Enqueued {num_enqueued} numbers. Items remaining: "
+                      f"{self.num_items_to_process}")
+        self.simulate_batch_processing(num_enqueued)
+        return num_enqueued
+
+    def enqueue_number(self, number_to_enqueue: int) -> BufferStatus:
+        """
+        Enqueues a number into the buffer through its non-raising API,
+        waiting for free space for up to the blocking timeout if the buffer
+        supports blocking. Numbers put into a priority buffer are tagged with
+        a random priority class.
+
+        :param number_to_enqueue: The number to add to the buffer.
+        :type number_to_enqueue: int
+        :return: `BufferStatus.OK` if the number was enqueued, or
+            `BufferStatus.FULL` if the buffer was full.
+        :rtype: BufferStatus
+        """
+        if self.is_priority_buffer:
+            return self.buffer.try_enqueue_with_priority(
+                number_to_enqueue, self.get_random_priority_class())
+        if self.is_blocking_buffer:
+            return self.buffer.try_put(number_to_enqueue,
+                                       Processor.BLOCKING_TIMEOUT)
+        return self.buffer.try_enqueue(number_to_enqueue)
 
     def stop(self):
         """
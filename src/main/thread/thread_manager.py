@@ -1,11 +1,15 @@
 import logging
 import random
 import threading
-from typing import List, Tuple
+from typing import Any, Dict, List, Tuple
 
 from src.main.buffer.buffer import Buffer
 from src.main.statistics.statistic_tracker import StatisticTracker
+from src.main.statistics.thread_profiler import ThreadProfiler
+from src.main.thread.executor_type import ExecutorType
 from src.main.thread.processor.consumer.consumer import Consumer
+from src.main.thread.processor.processor import Processor
+from src.main.thread.processor.processor_process import ProcessorProcess
 from src.main.thread.processor.producer.producer import Producer
 
 
@@ -35,6 +39,24 @@ class ThreadManager:
     :type producers: List[Producer]
     :ivar consumers: List of initialized consumer threads.
     :type consumers: List[Consumer]
+    :ivar producer_batch_size: Number of items each producer enqueues per
+        buffer operation.
+    :type producer_batch_size: int
+    :ivar consumer_batch_size: Number of items each consumer dequeues per
+        buffer operation.
+    :type consumer_batch_size: int
+    :ivar urgent_ratio: Fraction of items producers tag as urgent for a
+        priority buffer.
+    :type urgent_ratio: float
+    :ivar thread_profiler: Profiler installed in every producer and consumer
+        thread and around the thread management, or None.
+    :type thread_profiler: ThreadProfiler | None
+    :ivar executor: Whether producers and consumers run as threads or as
+        processes.
+    :type executor: ExecutorType
+    :ivar processes: The processes running the producers and consumers, or
+        an empty list if they run as threads.
+    :type processes: List[ProcessorProcess]
     """
     def __init__(self, num_producers: int,
                  num_consumers: int,
@@ -42,7 +64,12 @@ class ThreadManager:
                  producer_speed_range: Tuple[int, int],
                  buffer: Buffer,
                  num_items_to_process: int,
-                 statistic_tracker: StatisticTracker):
+                 statistic_tracker: StatisticTracker,
+                 producer_batch_size: int = 1,
+                 consumer_batch_size: int = 1,
+                 urgent_ratio: float = 0.0,
+                 thread_profiler: ThreadProfiler | None = None,
+                 executor: ExecutorType = ExecutorType.THREAD):
         """
         This class initializes the producers and consumers based on the
         provided configuration and handles their interactions with the buffer
@@ -62,6 +89,23 @@ class ThreadManager:
         :type num_items_to_process: int
         :param statistic_tracker: Tracker for collecting processing statistics.
         :type statistic_tracker: StatisticTracker
+        :param producer_batch_size: Number of items each producer enqueues
+            per buffer operation.
+        :type producer_batch_size: int
+        :param consumer_batch_size: Number of items each consumer dequeues
+            per buffer operation.
+        :type consumer_batch_size: int
+        :param urgent_ratio: Fraction of items producers tag as urgent for a
+            priority buffer.
+        :type urgent_ratio: float
+        :param thread_profiler: Profiler to install in every producer and
+            consumer thread and around the thread management, or None to run
+            without profiling.
+        :type thread_profiler: ThreadProfiler | None
+        :param executor: Whether producers and consumers run as threads or
+            as processes. Processes require a buffer shared between
+            processes.
+        :type executor: ExecutorType
 
         :ivar buffer: A shared buffer for producers and consumers to exchange
         data.
@@ -93,9 +137,19 @@ class ThreadManager:
         self.producer_speed_range: tuple[int, int] = producer_speed_range
         self.consumer_speed_range: tuple[int, int] = consumer_speed_range
         self.statistic_tracker: StatisticTracker = statistic_tracker
+        self.producer_batch_size: int = producer_batch_size
+        self.consumer_batch_size: int = consumer_batch_size
+        self.urgent_ratio: float = urgent_ratio
+        self.thread_profiler: ThreadProfiler | None = thread_profiler
+        self.executor: ExecutorType = executor
         self.threads_started: bool = False
         self.producers: List[Producer] = self.initialize_producers()
         self.consumers: List[Consumer] = self.initialize_consumers()
+        for processor in self.producers + self.consumers:
+            processor.thread_profiler = thread_profiler
+        self.processes: List[ProcessorProcess] = []
+        if executor == ExecutorType.PROCESS:
+            self.processes = self.initialize_processes()
 
     def initialize_producers(self) -> List[Producer]:
         """
@@ -113,7 +167,9 @@ class ThreadManager:
                                       self.producer_speed_range[1],
                                       self.buffer,
                                       items_to_produce,
-                                      self.statistic_tracker))
+                                      self.statistic_tracker,
+                                      self.producer_batch_size,
+                                      self.urgent_ratio))
             logging.debug(f"Producer {i + 1} will produce {items_to_produce} items.")
         return producers
 
@@ -133,10 +189,50 @@ class ThreadManager:
                                       self.consumer_speed_range[1],
                                       self.buffer,
                                       items_to_consume,
-                                      self.statistic_tracker))
+                                      self.statistic_tracker,
+                                      self.consumer_batch_size))
             logging.debug(f"Consumer {i + 1} will consume {items_to_consume} items.")
         return consumers
 
+    def initialize_processes(self) -> List[ProcessorProcess]:
+        """
+        Initializes a process for every producer and consumer, which runs a
+        processor configured like it.
+
+        :return: A list of initialized processes, producers first.
+        :rtype: List[ProcessorProcess]
+        """
+        processes: List[ProcessorProcess] = []
+        for producer in self.producers:
+            producer_arguments: Dict[str, Any] = self.get_processor_arguments(producer)
+            producer_arguments['urgent_ratio'] = producer.urgent_ratio
+            processes.append(ProcessorProcess(Producer, producer_arguments,
+                                              self.buffer, self.statistic_tracker))
+        for consumer in self.consumers:
+            processes.append(ProcessorProcess(Consumer, self.get_processor_arguments(consumer),
+                                              self.buffer, self.statistic_tracker))
+        logging.debug(f"Number of processes: {len(processes)}.")
+        return processes
+
+    @staticmethod
+    def get_processor_arguments(processor: Processor) -> Dict[str, Any]:
+        """
+        Collects the keyword arguments shared by producers and consumers,
+        other than the buffer and the statistic tracker.
+
+        :param processor: The producer or consumer to copy.
+        :type processor: Processor
+        :return: The keyword arguments to create a processor like it.
+        :rtype: Dict[str, Any]
+        """
+        return {
+            'id': processor.id,
+            'speed_floor': processor.speed_floor,
+            'speed_ceiling': processor.speed_ceiling,
+            'num_items_to_process': processor.num_items_to_process,
+            'batch_size': processor.batch_size
+        }
+
     def get_num_items_to_produce(self) -> Tuple[int, int]:
         """
         Calculates the number of items each producer will handle and the
@@ -167,11 +263,28 @@ class ThreadManager:
 
     def join_all(self) -> None:
         """
-        Join all running threads for producers and consumers.
+        Join all running threads for producers and consumers, under the
+        thread profiler if one is set.
+
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        if self.thread_profiler is not None:
+            self.thread_profiler.run_profiled(self.join_threads)
+        else:
+            self.join_threads()
+
+    def join_threads(self) -> None:
+        """
+        Join the producer threads, then the consumer threads, or all
+        processes if they run as processes.
 
         :return: This method does not return any value.
         :rtype: None
         """
+        if self.processes:
+            self.join_processes()
+            return
         self.join_producers()
         self.join_consumers()
 
@@ -195,16 +308,60 @@ class ThreadManager:
         for consumer in self.consumers:
             consumer.join()
 
+    def join_processes(self) -> None:
+        """
+        Join all producer and consumer processes, merging the statistics each
+        of them reports into the statistic tracker.
+
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        for process in self.processes:
+            process_statistics: Dict[str, Any] | None = process.receive_statistics()
+            if process_statistics is not None:
+                self.statistic_tracker.merge_process_statistics(process_statistics)
+            process.join()
+
     def start_all(self) -> None:
         """
-        Starts all producer and consumer threads.
+        Starts all producer and consumer threads, under the thread profiler
+        if one is set.
 
         :return: This method does not return any value.
         :rtype: None
         """
+        if self.thread_profiler is not None:
+            self.thread_profiler.run_profiled(self.start_threads)
+        else:
+            self.start_threads()
+
+    def start_threads(self) -> None:
+        """
+        Starts all producer and consumer threads in a random order, or their
+        processes if they run as processes.
+
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        if self.processes:
+            self.start_processes()
+            return
         threads: List[threading.Thread] = self.producers + self.consumers
         random.shuffle(threads)
         logging.debug(f"Number of threads: {len(threads)}.")
         for thread in threads:
             thread.start()
+        self.threads_started = True
+
+    def start_processes(self) -> None:
+        """
+        Starts all producer and consumer processes in a random order.
+
+        :return: This method does not return any value.
+        :rtype: None
+        """
+        processes: List[ProcessorProcess] = list(self.processes)
+        random.shuffle(processes)
+        for process in processes:
+            process.start()
         self.threads_started = True
\ No newline at end of file
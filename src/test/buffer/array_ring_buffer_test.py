@@ -0,0 +1,65 @@
+import unittest
+
+from src.main.buffer.array_ring_buffer import ArrayRingBuffer
+from src.main.buffer.empty_buffer_exception import EmptyBufferException
+from src.main.buffer.full_buffer_exception import FullBufferException
+from src.main.statistics.statistic_tracker import StatisticTracker
+from src.main.thread.processor.lock.mutex_lock import MutexLock
+
+
+class ArrayRingBufferTest(unittest.TestCase):
+    def test_instantiation(self):
+        ring_buffer = ArrayRingBuffer(16, MutexLock(), StatisticTracker(100))
+
+        self.assertEqual(ring_buffer.buffer_size, 16)
+        self.assertEqual(len(ring_buffer.ring), 16)
+        self.assertEqual(ring_buffer.ring.itemsize, 8)
+        self.assertFalse(hasattr(ring_buffer, '__dict__'))
+
+    def test_value_change(self):
+        ring_buffer = ArrayRingBuffer(2, MutexLock(), StatisticTracker(100))
+
+        ring_buffer.enqueue(7)
+        self.assertEqual(ring_buffer.count, 1)
+        ring_buffer.enqueue(8)
+        self.assertTrue(ring_buffer.is_full())
+
+        self.assertEqual(ring_buffer.dequeue(), 7)
+        self.assertEqual(ring_buffer.head, 1)
+        self.assertEqual(ring_buffer.count, 1)
+
+    def test_function_io(self):
+        ring_buffer = ArrayRingBuffer(3, MutexLock(), StatisticTracker(100))
+
+        for number in range(10):
+            ring_buffer.enqueue(number)
+            ring_buffer.enqueue(number + 100)
+            self.assertEqual(ring_buffer.dequeue(), number)
+            self.assertEqual(ring_buffer.dequeue(), number + 100)
+        self.assertTrue(ring_buffer.is_empty())
+
+    def test_execution(self):
+        ring_buffer = ArrayRingBuffer(4, MutexLock(), StatisticTracker(100))
+
+        for number in [1, 2, 3, 4]:
+            ring_buffer.enqueue(number)
+        self.assertEqual([ring_buffer.dequeue() for _ in range(4)], [1, 2, 3, 4])
+
+    def test_error_handling(self):
+        statistic_tracker = StatisticTracker(100)
+        ring_buffer = ArrayRingBuffer(0, MutexLock(), statistic_tracker)
+
+        with self.assertRaises(FullBufferException):
+            ring_buffer.enqueue(1)
+        with self.assertRaises(EmptyBufferException):
+            ring_buffer.dequeue()
+        self.assertEqual(statistic_tracker.num_full_buffer, 1)
+        self.assertEqual(statistic_tracker.num_empty_buffer, 1)
+
+        ring_buffer = ArrayRingBuffer(1, MutexLock(), statistic_tracker)
+        with self.assertRaises(OverflowError):
+            ring_buffer.enqueue(2 ** 64)
+
+
+if __name__ == '__main__':
+    unittest.main()
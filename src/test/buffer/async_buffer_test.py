@@ -0,0 +1,79 @@
+import asyncio
+import unittest
+
+from src.main.buffer.async_buffer import AsyncBuffer
+from src.main.buffer.empty_buffer_exception import EmptyBufferException
+from src.main.buffer.full_buffer_exception import FullBufferException
+from src.main.statistics.statistic_tracker import StatisticTracker
+
+
+async def put_range(async_buffer: AsyncBuffer, num_items: int) -> None:
+    for number in range(num_items):
+        await async_buffer.put(number)
+
+
+async def get_all(async_buffer: AsyncBuffer, num_items: int) -> list:
+    return [await async_buffer.get() for _ in range(num_items)]
+
+
+class AsyncBufferTest(unittest.TestCase):
+    def test_instantiation(self):
+        async_buffer = AsyncBuffer(16, StatisticTracker(100))
+
+        self.assertEqual(async_buffer.buffer_size, 16)
+        self.assertEqual(async_buffer.queue.maxsize, 16)
+        self.assertTrue(async_buffer.is_empty())
+        self.assertFalse(async_buffer.is_full())
+
+    def test_value_change(self):
+        async_buffer = AsyncBuffer(2, StatisticTracker(100))
+
+        async_buffer.enqueue(7)
+        async_buffer.enqueue(8)
+        self.assertTrue(async_buffer.is_full())
+
+        self.assertEqual(async_buffer.dequeue(), 7)
+        self.assertFalse(async_buffer.is_full())
+        self.assertEqual(async_buffer.dequeue(), 8)
+        self.assertTrue(async_buffer.is_empty())
+
+    def test_function_io(self):
+        async_buffer = AsyncBuffer(3, StatisticTracker(100))
+
+        async def put_and_get() -> list:
+            dequeued_numbers = []
+            for number in range(10):
+                await async_buffer.put(number)
+                dequeued_numbers.append(await async_buffer.get())
+            return dequeued_numbers
+
+        self.assertEqual(asyncio.run(put_and_get()), list(range(10)))
+        self.assertTrue(async_buffer.is_empty())
+
+    def test_execution(self):
+        statistic_tracker = StatisticTracker(100)
+        async_buffer = AsyncBuffer(4, statistic_tracker)
+
+        async def run_pair() -> list:
+            consumer = asyncio.ensure_future(get_all(async_buffer, 100))
+            await put_range(async_buffer, 100)
+            return await consumer
+
+        self.assertEqual(asyncio.run(run_pair()), list(range(100)))
+        self.assertGreater(statistic_tracker.num_full_buffer, 0)
+
+    def test_error_handling(self):
+        statistic_tracker = StatisticTracker(100)
+        async_buffer = AsyncBuffer(1, statistic_tracker)
+
+        with self.assertRaises(EmptyBufferException):
+            async_buffer.dequeue()
+        async_buffer.enqueue(1)
+        with self.assertRaises(FullBufferException):
+            async_buffer.enqueue(2)
+        self.assertEqual(statistic_tracker.num_empty_buffer, 1)
+        self.assertEqual(statistic_tracker.num_full_buffer, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import threading
+import time
+import unittest
+
+from src.main.buffer.blocking_buffer import BlockingBuffer
+from src.main.buffer.blocking_buffer_queue import BlockingBufferQueue
+from src.main.buffer.buffer_status import BufferStatus
+from src.main.buffer.empty_buffer_exception import EmptyBufferException
+from src.main.buffer.full_buffer_exception import FullBufferException
+from src.main.statistics.statistic_tracker import StatisticTracker
+
+
+class BlockingBufferQueueTest(unittest.TestCase):
+    def test_instantiation(self):
+        statistic_tracker = StatisticTracker(100)
+        buffer_queue = BlockingBufferQueue(5, statistic_tracker)
+
+        self.assertIsInstance(buffer_queue, BlockingBuffer)
+        self.assertEqual(buffer_queue.buffer_size, 5)
+        self.assertTrue(buffer_queue.is_empty())
+        self.assertFalse(buffer_queue.is_full())
+
+    def test_value_change(self):
+        buffer_queue = BlockingBufferQueue(2, StatisticTracker(100))
+
+        buffer_queue.put(1)
+        self.assertEqual(len(buffer_queue.buffer), 1)
+        buffer_queue.put(2)
+        self.assertTrue(buffer_queue.is_full())
+
+        buffer_queue.get()
+        self.assertEqual(len(buffer_queue.buffer), 1)
+
+    def test_function_io(self):
+        buffer_queue = BlockingBufferQueue(10, StatisticTracker(100))
+
+        buffer_queue.enqueue(1)
+        buffer_queue.put(2)
+        self.assertEqual(buffer_queue.dequeue(), 1)
+        self.assertEqual(buffer_queue.get(), 2)
+
+    def test_execution(self):
+        buffer_queue = BlockingBufferQueue(1, StatisticTracker(100))
+        received = []
+
+        consumer = threading.Thread(target=lambda: received.append(buffer_queue.get(timeout=5)))
+        consumer.start()
+        time.sleep(0.05)
+        buffer_queue.put(42)
+        consumer.join(timeout=5)
+
+        self.assertEqual(received, [42])
+        self.assertEqual(buffer_queue.statistic_tracker.num_empty_buffer, 1)
+
+        buffer_queue.put(1)
+        producer = threading.Thread(target=lambda: buffer_queue.put(2, timeout=5))
+        producer.start()
+        time.sleep(0.05)
+        self.assertEqual(buffer_queue.get(), 1)
+        producer.join(timeout=5)
+
+        self.assertEqual(buffer_queue.get(), 2)
+        self.assertEqual(buffer_queue.statistic_tracker.num_full_buffer, 1)
+
+    def test_error_handling(self):
+        statistic_tracker = StatisticTracker(100)
+        buffer_queue = BlockingBufferQueue(0, statistic_tracker)
+
+        with self.assertRaises(FullBufferException):
+            buffer_queue.enqueue(1)
+        with self.assertRaises(FullBufferException):
+            buffer_queue.put(1, timeout=0.01)
+        with self.assertRaises(EmptyBufferException):
+            buffer_queue.dequeue()
+        with self.assertRaises(EmptyBufferException):
+            buffer_queue.get(timeout=0.01)
+
+        self.assertEqual(statistic_tracker.num_full_buffer, 2)
+        self.assertEqual(statistic_tracker.num_empty_buffer, 2)
+        self.assertIs(buffer_queue.try_put(1, timeout=0.01), BufferStatus.FULL)
+        self.assertIs(buffer_queue.try_get(timeout=0.01), BufferStatus.EMPTY)
+
+
+if __name__ == '__main__':
+    unittest.main()
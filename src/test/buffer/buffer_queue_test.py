@@ -1,6 +1,7 @@
 import unittest
 
 from src.main.buffer.buffer_queue import BufferQueue
+from src.main.buffer.buffer_status import BufferStatus
 from src.main.buffer.empty_buffer_exception import EmptyBufferException
 from src.main.buffer.full_buffer_exception import FullBufferException
 from src.main.statistics.statistic_tracker import StatisticTracker
@@ -74,10 +75,37 @@ class BufferQueueTest(unittest.TestCase):
         with self.assertRaises(EmptyBufferException):
             buffer_queue.dequeue()
 
+    def test_batch_operations(self):
+        statistic_tracker = StatisticTracker(1000)
+        buffer_queue = BufferQueue(3, MutexLock(), statistic_tracker)
+
+        self.assertEqual(buffer_queue.enqueue_many([1, 2]), 2)
+        self.assertEqual(buffer_queue.enqueue_many([3, 4, 5]), 1)
+        with self.assertRaises(FullBufferException):
+            buffer_queue.enqueue_many([6])
+
+        self.assertEqual(buffer_queue.dequeue_many(2), [1, 2])
+        self.assertEqual(buffer_queue.dequeue_many(5), [3])
+        with self.assertRaises(EmptyBufferException):
+            buffer_queue.dequeue_many(5)
+
+        self.assertEqual(statistic_tracker.num_full_buffer, 1)
+        self.assertEqual(statistic_tracker.num_empty_buffer, 1)
+
+
+    def test_try_operations(self):
+        statistic_tracker: StatisticTracker = StatisticTracker(100)
+        buffer_queue: BufferQueue = BufferQueue(1, MutexLock(), statistic_tracker)
+
+        self.assertIs(buffer_queue.try_enqueue(5), BufferStatus.OK)
+        self.assertIs(buffer_queue.try_enqueue(6), BufferStatus.FULL)
+        self.assertEqual(buffer_queue.try_dequeue(), 5)
+        self.assertIs(buffer_queue.try_dequeue(), BufferStatus.EMPTY)
+        self.assertEqual(statistic_tracker.num_full_buffer, 1)
+        self.assertEqual(statistic_tracker.num_empty_buffer, 1)
+
 
 if __name__ == '__main__':
     unittest.main()
 
    
-
-
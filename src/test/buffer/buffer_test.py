@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import MagicMock, Mock, create_autospec
 
 from src.main.buffer.buffer import Buffer
+from src.main.buffer.buffer_status import BufferStatus
 from src.main.buffer.empty_buffer_exception import EmptyBufferException
 from src.main.buffer.full_buffer_exception import FullBufferException
 from src.main.statistics.statistic_tracker import StatisticTracker
@@ -90,6 +91,38 @@ class BufferTest(unittest.TestCase):
         with self.assertRaises(EmptyBufferException):
             buffer.dequeue()
 
+    def test_default_batch_operations(self):
+        class ListBuffer(Buffer):
+            def __init__(self, buffer_size, statistic_tracker):
+                super().__init__(buffer_size, statistic_tracker)
+                self.items = []
+            def enqueue(self, number_to_enqueue: int):
+                if self.is_full():
+                    raise FullBufferException()
+                self.items.append(number_to_enqueue)
+            def dequeue(self) -> int:
+                if self.is_empty():
+                    raise EmptyBufferException()
+                return self.items.pop(0)
+            def is_empty(self) -> bool: return not self.items
+            def is_full(self) -> bool: return len(self.items) >= self.buffer_size
+
+        buffer = ListBuffer(2, MagicMock(spec=StatisticTracker))
+
+        self.assertEqual(buffer.enqueue_many([1, 2, 3]), 2)
+        with self.assertRaises(FullBufferException):
+            buffer.enqueue_many([4])
+        self.assertEqual(buffer.dequeue_many(5), [1, 2])
+        with self.assertRaises(EmptyBufferException):
+            buffer.dequeue_many(1)
+
+        self.assertIs(buffer.try_enqueue(4), BufferStatus.OK)
+        self.assertIs(buffer.try_enqueue(5), BufferStatus.OK)
+        self.assertIs(buffer.try_enqueue(6), BufferStatus.FULL)
+        self.assertEqual(buffer.try_dequeue(), 4)
+        self.assertEqual(buffer.try_dequeue(), 5)
+        self.assertIs(buffer.try_dequeue(), BufferStatus.EMPTY)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+
+from src.main.buffer.elastic_buffer_queue import ElasticBufferQueue
+from src.main.buffer.empty_buffer_exception import EmptyBufferException
+from src.main.buffer.full_buffer_exception import FullBufferException
+from src.main.statistics.statistic_tracker import StatisticTracker
+from src.main.thread.processor.lock.mutex_lock import MutexLock
+
+
+class ElasticBufferQueueTest(unittest.TestCase):
+    def test_instantiation(self):
+        elastic_buffer = ElasticBufferQueue(4, MutexLock(), StatisticTracker(100), 2, 8)
+
+        self.assertEqual(elastic_buffer.buffer_size, 4)
+        self.assertEqual(elastic_buffer.buffer.maxlen, 4)
+        self.assertEqual(elastic_buffer.min_buffer_size, 2)
+        self.assertEqual(elastic_buffer.max_buffer_size, 8)
+        self.assertEqual(ElasticBufferQueue(100, MutexLock(), StatisticTracker(100), 2, 8).buffer_size, 8)
+        self.assertEqual(ElasticBufferQueue(1, MutexLock(), StatisticTracker(100), 2, 8).buffer_size, 2)
+
+    def test_value_change(self):
+        statistic_tracker = StatisticTracker(100)
+        elastic_buffer = ElasticBufferQueue(1, MutexLock(), statistic_tracker, 1, 100)
+
+        elastic_buffer.enqueue(1)
+        for _ in range(StatisticTracker.BUFFER_EVENT_WINDOW):
+            with self.assertRaises(FullBufferException):
+                elastic_buffer.enqueue(2)
+
+        self.assertEqual(elastic_buffer.buffer_size, 3)
+        self.assertEqual(elastic_buffer.buffer.maxlen, 3)
+        self.assertEqual(len(statistic_tracker.recent_buffer_events), 0)
+        self.assertEqual(statistic_tracker.buffer_resizes[-1][1], 3)
+
+    def test_function_io(self):
+        statistic_tracker = StatisticTracker(100)
+        elastic_buffer = ElasticBufferQueue(40, MutexLock(), statistic_tracker, 10, 100)
+
+        elastic_buffer.enqueue(1)
+        elastic_buffer.enqueue(2)
+        self.assertEqual(elastic_buffer.dequeue(), 1)
+        self.assertEqual(elastic_buffer.dequeue(), 2)
+        for _ in range(StatisticTracker.BUFFER_EVENT_WINDOW):
+            with self.assertRaises(EmptyBufferException):
+                elastic_buffer.dequeue()
+
+        self.assertEqual(elastic_buffer.buffer_size, 30)
+        self.assertEqual(statistic_tracker.get_resize_statistics().split()[-1], "30")
+
+    def test_execution(self):
+        statistic_tracker = StatisticTracker(100)
+        elastic_buffer = ElasticBufferQueue(2, MutexLock(), statistic_tracker, 2, 4)
+
+        self.assertEqual(elastic_buffer.enqueue_many([1, 2, 3]), 2)
+        for _ in range(StatisticTracker.BUFFER_EVENT_WINDOW):
+            with self.assertRaises(FullBufferException):
+                elastic_buffer.enqueue_many([3])
+        self.assertEqual(elastic_buffer.enqueue_many([3, 4, 5]), 2)
+
+        self.assertEqual(elastic_buffer.buffer_size, 4)
+        self.assertEqual(len(statistic_tracker.buffer_resizes), 1)
+        self.assertEqual(elastic_buffer.dequeue_many(10), [1, 2, 3, 4])
+
+    def test_error_handling(self):
+        statistic_tracker = StatisticTracker(100)
+        elastic_buffer = ElasticBufferQueue(3, MutexLock(), statistic_tracker, 1, 3)
+
+        for number in range(3):
+            elastic_buffer.enqueue(number)
+        for _ in range(StatisticTracker.BUFFER_EVENT_WINDOW):
+            statistic_tracker.increment_empty_buffer()
+        with self.assertRaises(FullBufferException):
+            elastic_buffer.enqueue(3)
+
+        self.assertEqual(elastic_buffer.buffer_size, 3)
+        self.assertEqual([elastic_buffer.dequeue() for _ in range(3)], [0, 1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
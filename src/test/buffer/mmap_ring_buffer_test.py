@@ -0,0 +1,72 @@
+import struct
+import unittest
+
+from src.main.buffer.empty_buffer_exception import EmptyBufferException
+from src.main.buffer.full_buffer_exception import FullBufferException
+from src.main.buffer.mmap_ring_buffer import MmapRingBuffer
+from src.main.statistics.statistic_tracker import StatisticTracker
+from src.main.thread.processor.lock.mutex_lock import MutexLock
+
+
+class MmapRingBufferTest(unittest.TestCase):
+    def test_instantiation(self):
+        ring_buffer = MmapRingBuffer(16, MutexLock(), StatisticTracker(100))
+
+        self.assertEqual(ring_buffer.buffer_size, 16)
+        self.assertEqual(len(ring_buffer.log), 16 * MmapRingBuffer.RECORD_FORMAT.size)
+        self.assertTrue(ring_buffer.is_empty())
+        ring_buffer.close()
+
+    def test_value_change(self):
+        ring_buffer = MmapRingBuffer(2, MutexLock(), StatisticTracker(100))
+
+        ring_buffer.enqueue(7)
+        ring_buffer.enqueue(8)
+        self.assertTrue(ring_buffer.is_full())
+        self.assertEqual(ring_buffer.log[8:16], struct.pack('<q', 8))
+
+        self.assertEqual(ring_buffer.dequeue(), 7)
+        self.assertEqual(ring_buffer.head, 1)
+        self.assertEqual(ring_buffer.count, 1)
+        ring_buffer.close()
+        self.assertTrue(ring_buffer.log.closed)
+
+    def test_function_io(self):
+        ring_buffer = MmapRingBuffer(3, MutexLock(), StatisticTracker(100))
+
+        for number in range(10):
+            ring_buffer.enqueue(number)
+            ring_buffer.enqueue(-number)
+            self.assertEqual(ring_buffer.dequeue(), number)
+            self.assertEqual(ring_buffer.dequeue(), -number)
+        self.assertTrue(ring_buffer.is_empty())
+        ring_buffer.close()
+
+    def test_execution(self):
+        ring_buffer = MmapRingBuffer(10 ** 8, MutexLock(), StatisticTracker(100))
+
+        for number in range(1000):
+            ring_buffer.enqueue(number)
+        self.assertEqual([ring_buffer.dequeue() for _ in range(1000)], list(range(1000)))
+        ring_buffer.close()
+
+    def test_error_handling(self):
+        statistic_tracker = StatisticTracker(100)
+        ring_buffer = MmapRingBuffer(0, MutexLock(), statistic_tracker)
+
+        with self.assertRaises(FullBufferException):
+            ring_buffer.enqueue(1)
+        with self.assertRaises(EmptyBufferException):
+            ring_buffer.dequeue()
+        self.assertEqual(statistic_tracker.num_full_buffer, 1)
+        self.assertEqual(statistic_tracker.num_empty_buffer, 1)
+        ring_buffer.close()
+
+        ring_buffer = MmapRingBuffer(1, MutexLock(), statistic_tracker)
+        with self.assertRaises(struct.error):
+            ring_buffer.enqueue(2 ** 64)
+        ring_buffer.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+
+from src.main.buffer.empty_buffer_exception import EmptyBufferException
+from src.main.buffer.full_buffer_exception import FullBufferException
+from src.main.buffer.priority_buffer import PriorityBuffer
+from src.main.buffer.priority_class import PriorityClass
+from src.main.statistics.statistic_tracker import StatisticTracker
+from src.main.thread.processor.lock.mutex_lock import MutexLock
+
+
+class PriorityBufferTest(unittest.TestCase):
+    def test_instantiation(self):
+        priority_buffer = PriorityBuffer(5, MutexLock(), StatisticTracker(100))
+
+        self.assertEqual(priority_buffer.buffer_size, 5)
+        self.assertEqual(priority_buffer.heap, [])
+        self.assertTrue(priority_buffer.is_empty())
+
+    def test_value_change(self):
+        statistic_tracker = StatisticTracker(100)
+        priority_buffer = PriorityBuffer(2, MutexLock(), statistic_tracker)
+
+        priority_buffer.enqueue(1)
+        priority_buffer.enqueue_with_priority(2, PriorityClass.URGENT)
+        self.assertTrue(priority_buffer.is_full())
+
+        priority_buffer.dequeue()
+        priority_buffer.dequeue()
+        self.assertEqual(len(statistic_tracker.priority_wait_times[PriorityClass.URGENT]), 1)
+        self.assertEqual(len(statistic_tracker.priority_wait_times[PriorityClass.BULK]), 1)
+
+    def test_function_io(self):
+        priority_buffer = PriorityBuffer(10, MutexLock(), StatisticTracker(100))
+
+        priority_buffer.enqueue(1)
+        priority_buffer.enqueue(2)
+        priority_buffer.enqueue_with_priority(3, PriorityClass.URGENT)
+        priority_buffer.enqueue(4)
+        priority_buffer.enqueue_with_priority(5, PriorityClass.URGENT)
+
+        self.assertEqual([priority_buffer.dequeue() for _ in range(5)], [3, 5, 1, 2, 4])
+
+    def test_enqueue_many_with_priority(self):
+        statistic_tracker = StatisticTracker(100)
+        priority_buffer = PriorityBuffer(3, MutexLock(), statistic_tracker)
+
+        self.assertEqual(priority_buffer.enqueue_many_with_priority(
+            [1, 2, 3, 4], [PriorityClass.BULK, PriorityClass.URGENT,
+                           PriorityClass.BULK, PriorityClass.URGENT]), 3)
+        with self.assertRaises(FullBufferException):
+            priority_buffer.enqueue_many([5])
+        self.assertEqual(statistic_tracker.num_full_buffer, 1)
+
+        self.assertEqual(priority_buffer.dequeue_many(3), [2, 1, 3])
+        self.assertEqual(priority_buffer.enqueue_many([6, 7]), 2)
+        self.assertTrue(all(entry[3] is PriorityClass.BULK for entry in priority_buffer.heap))
+
+    def test_execution(self):
+        statistic_tracker = StatisticTracker(100)
+        priority_buffer = PriorityBuffer(10, MutexLock(), statistic_tracker)
+
+        statistic_tracker.start_tracking()
+        priority_buffer.enqueue_with_priority(1, PriorityClass.URGENT)
+        priority_buffer.enqueue(2)
+        priority_buffer.dequeue()
+        priority_buffer.dequeue()
+        statistic_tracker.stop_tracking()
+
+        priority_statistics = statistic_tracker.get_priority_statistics()
+        self.assertIn("Urgent items: 1", priority_statistics)
+        self.assertIn("Bulk items: 1", priority_statistics)
+        self.assertLess(priority_statistics.index("Urgent"), priority_statistics.index("Bulk"))
+
+    def test_error_handling(self):
+        statistic_tracker = StatisticTracker(100)
+        priority_buffer = PriorityBuffer(0, MutexLock(), statistic_tracker)
+
+        with self.assertRaises(FullBufferException):
+            priority_buffer.enqueue_with_priority(1, PriorityClass.URGENT)
+        with self.assertRaises(EmptyBufferException):
+            priority_buffer.dequeue()
+
+        self.assertEqual(statistic_tracker.num_full_buffer, 1)
+        self.assertEqual(statistic_tracker.num_empty_buffer, 1)
+        self.assertEqual(statistic_tracker.priority_wait_times, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import threading
+import time
+import unittest
+
+from src.main.buffer.blocking_buffer import BlockingBuffer
+from src.main.buffer.buffer_status import BufferStatus
+from src.main.buffer.empty_buffer_exception import EmptyBufferException
+from src.main.buffer.full_buffer_exception import FullBufferException
+from src.main.buffer.semaphore_buffer import SemaphoreBuffer
+from src.main.statistics.statistic_tracker import StatisticTracker
+from src.main.thread.processor.lock.mutex_lock import MutexLock
+
+
+class SemaphoreBufferTest(unittest.TestCase):
+    def test_instantiation(self):
+        mutex_lock = MutexLock()
+        semaphore_buffer = SemaphoreBuffer(5, mutex_lock, StatisticTracker(100))
+
+        self.assertIsInstance(semaphore_buffer, BlockingBuffer)
+        self.assertEqual(semaphore_buffer.buffer_size, 5)
+        self.assertEqual(len(semaphore_buffer.slots), 5)
+        self.assertIs(semaphore_buffer.mutex_lock, mutex_lock)
+        self.assertTrue(semaphore_buffer.is_empty())
+        self.assertFalse(semaphore_buffer.is_full())
+
+    def test_value_change(self):
+        semaphore_buffer = SemaphoreBuffer(2, MutexLock(), StatisticTracker(100))
+
+        semaphore_buffer.put(1)
+        self.assertEqual(semaphore_buffer.count, 1)
+        semaphore_buffer.put(2)
+        self.assertTrue(semaphore_buffer.is_full())
+        self.assertEqual(semaphore_buffer.tail, 0)
+
+        semaphore_buffer.get()
+        self.assertEqual(semaphore_buffer.count, 1)
+        self.assertEqual(semaphore_buffer.head, 1)
+
+    def test_function_io(self):
+        semaphore_buffer = SemaphoreBuffer(2, MutexLock(), StatisticTracker(100))
+
+        for number in range(5):
+            semaphore_buffer.enqueue(number)
+            self.assertEqual(semaphore_buffer.dequeue(), number)
+        semaphore_buffer.put(7)
+        self.assertIs(semaphore_buffer.try_put(8), BufferStatus.OK)
+        self.assertEqual(semaphore_buffer.get(), 7)
+        self.assertEqual(semaphore_buffer.try_get(), 8)
+
+    def test_execution(self):
+        semaphore_buffer = SemaphoreBuffer(1, MutexLock(), StatisticTracker(100))
+        received = []
+
+        consumer = threading.Thread(target=lambda: received.append(semaphore_buffer.get(timeout=5)))
+        consumer.start()
+        time.sleep(0.05)
+        semaphore_buffer.put(42)
+        consumer.join(timeout=5)
+
+        self.assertEqual(received, [42])
+        self.assertEqual(semaphore_buffer.statistic_tracker.num_empty_buffer, 1)
+
+        semaphore_buffer.put(1)
+        producer = threading.Thread(target=lambda: semaphore_buffer.put(2, timeout=5))
+        producer.start()
+        time.sleep(0.05)
+        self.assertEqual(semaphore_buffer.get(), 1)
+        producer.join(timeout=5)
+
+        self.assertEqual(semaphore_buffer.get(), 2)
+        self.assertEqual(semaphore_buffer.statistic_tracker.num_full_buffer, 1)
+
+    def test_error_handling(self):
+        statistic_tracker = StatisticTracker(100)
+        semaphore_buffer = SemaphoreBuffer(0, MutexLock(), statistic_tracker)
+
+        with self.assertRaises(FullBufferException):
+            semaphore_buffer.enqueue(1)
+        with self.assertRaises(FullBufferException):
+            semaphore_buffer.put(1, timeout=0.01)
+        with self.assertRaises(EmptyBufferException):
+            semaphore_buffer.dequeue()
+        with self.assertRaises(EmptyBufferException):
+            semaphore_buffer.get(timeout=0.01)
+
+        self.assertEqual(statistic_tracker.num_full_buffer, 2)
+        self.assertEqual(statistic_tracker.num_empty_buffer, 2)
+        self.assertIs(semaphore_buffer.try_put(1, timeout=0.01), BufferStatus.FULL)
+        self.assertIs(semaphore_buffer.try_get(timeout=0.01), BufferStatus.EMPTY)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import threading
+import unittest
+from unittest.mock import patch
+
+from src.main.buffer.empty_buffer_exception import EmptyBufferException
+from src.main.buffer.full_buffer_exception import FullBufferException
+from src.main.buffer.shard_policy import ShardPolicy
+from src.main.buffer.sharded_buffer import ShardedBuffer
+from src.main.statistics.statistic_tracker import StatisticTracker
+from src.main.statistics.tracking_mode import TrackingMode
+
+
+class ShardedBufferTest(unittest.TestCase):
+    def test_instantiation(self):
+        sharded_buffer = ShardedBuffer(10, 3, StatisticTracker(100))
+
+        self.assertEqual(sharded_buffer.num_shards, 3)
+        self.assertEqual(sharded_buffer.shard_capacities, [4, 3, 3])
+        self.assertEqual(sharded_buffer.shard_policy, ShardPolicy.ROUND_ROBIN)
+        self.assertTrue(sharded_buffer.is_empty())
+
+    def test_value_change(self):
+        sharded_buffer = ShardedBuffer(4, 2, StatisticTracker(100))
+
+        for number in range(4):
+            sharded_buffer.enqueue(number)
+        self.assertEqual([len(shard) for shard in sharded_buffer.shards], [2, 2])
+        self.assertTrue(sharded_buffer.is_full())
+
+    def test_function_io(self):
+        sharded_buffer = ShardedBuffer(6, 2, StatisticTracker(100),
+                                       ShardPolicy.LEAST_LOADED)
+
+        sharded_buffer.enqueue(1)
+        sharded_buffer.enqueue(2)
+        sharded_buffer.enqueue(3)
+        self.assertEqual([len(shard) for shard in sharded_buffer.shards], [2, 1])
+
+        home_shard = sharded_buffer.get_home_shard()
+        self.assertEqual(home_shard, 0)
+        self.assertEqual(sharded_buffer.dequeue(), 1)
+        self.assertEqual(sharded_buffer.dequeue(), 3)
+        self.assertEqual(sharded_buffer.dequeue(), 2)
+
+    def test_execution(self):
+        sharded_buffer = ShardedBuffer(4, 2, StatisticTracker(100))
+        for number in range(4):
+            sharded_buffer.enqueue(number)
+
+        received = []
+        thread = threading.Thread(target=lambda: received.extend(
+            sharded_buffer.dequeue() for _ in range(4)))
+        thread.start()
+        thread.join(timeout=5)
+
+        self.assertEqual(sorted(received), [0, 1, 2, 3])
+        self.assertEqual(sharded_buffer.get_home_shard(), 1)
+
+    def test_error_handling(self):
+        statistic_tracker = StatisticTracker(100)
+        sharded_buffer = ShardedBuffer(1, 2, statistic_tracker)
+
+        sharded_buffer.enqueue(1)
+        with self.assertRaises(FullBufferException):
+            sharded_buffer.enqueue(2)
+        sharded_buffer.dequeue()
+        with self.assertRaises(EmptyBufferException):
+            sharded_buffer.dequeue()
+
+        self.assertEqual(statistic_tracker.num_full_buffer, 1)
+        self.assertEqual(statistic_tracker.num_empty_buffer, 1)
+
+    def test_quiet_mode(self):
+        sharded_buffer = ShardedBuffer(2, 2, StatisticTracker(100))
+        sharded_buffer.get_home_shard()
+        TrackingMode.set_verbose(False)
+
+        with patch("logging.debug") as mock_logging_debug:
+            sharded_buffer.enqueue(1)
+            sharded_buffer.enqueue(2)
+            with self.assertRaises(FullBufferException):
+                sharded_buffer.enqueue(3)
+            sharded_buffer.dequeue()
+            sharded_buffer.dequeue()
+            with self.assertRaises(EmptyBufferException):
+                sharded_buffer.dequeue()
+
+        mock_logging_debug.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
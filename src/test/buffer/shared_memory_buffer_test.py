@@ -0,0 +1,133 @@
+import multiprocessing
+import os
+import subprocess
+import sys
+import unittest
+
+from src.main.buffer.empty_buffer_exception import EmptyBufferException
+from src.main.buffer.full_buffer_exception import FullBufferException
+from src.main.buffer.shared_memory_buffer import SharedMemoryBuffer
+from src.main.statistics.statistic_tracker import StatisticTracker
+
+
+def enqueue_range(shared_memory_buffer: SharedMemoryBuffer, num_items: int) -> None:
+    for number in range(num_items):
+        while True:
+            try:
+                shared_memory_buffer.enqueue(number)
+                break
+            except FullBufferException:
+                pass
+    shared_memory_buffer.close()
+
+
+SPAWN_SCRIPT: str = """
+import multiprocessing
+from src.main.buffer.shared_memory_buffer import SharedMemoryBuffer
+from src.main.statistics.statistic_tracker import StatisticTracker
+from src.test.buffer.shared_memory_buffer_test import enqueue_range
+
+if __name__ == "__main__":
+    multiprocessing.set_start_method("spawn")
+    shared_memory_buffer = SharedMemoryBuffer(16, StatisticTracker(10))
+    producer_process = multiprocessing.Process(target=enqueue_range,
+                                               args=(shared_memory_buffer, 10))
+    producer_process.start()
+    producer_process.join()
+    print([shared_memory_buffer.dequeue() for _ in range(10)])
+    shared_memory_buffer.close()
+"""
+
+
+class SharedMemoryBufferTest(unittest.TestCase):
+    def test_instantiation(self):
+        shared_memory_buffer = SharedMemoryBuffer(16, StatisticTracker(100))
+
+        self.assertEqual(shared_memory_buffer.buffer_size, 16)
+        self.assertEqual(len(shared_memory_buffer.slots), 18)
+        self.assertTrue(shared_memory_buffer.is_owner())
+        self.assertTrue(shared_memory_buffer.is_empty())
+        shared_memory_buffer.close()
+
+    def test_value_change(self):
+        shared_memory_buffer = SharedMemoryBuffer(2, StatisticTracker(100))
+
+        shared_memory_buffer.enqueue(7)
+        shared_memory_buffer.enqueue(8)
+        self.assertTrue(shared_memory_buffer.is_full())
+
+        self.assertEqual(shared_memory_buffer.dequeue(), 7)
+        self.assertEqual(shared_memory_buffer.slots[SharedMemoryBuffer.HEAD_INDEX], 1)
+        self.assertEqual(shared_memory_buffer.slots[SharedMemoryBuffer.COUNT_INDEX], 1)
+
+        attached_buffer = SharedMemoryBuffer.__new__(SharedMemoryBuffer)
+        attached_buffer.__setstate__(shared_memory_buffer.__getstate__())
+        attached_buffer.enqueue(9)
+        attached_buffer.slots.release()
+        attached_buffer.shared_memory.close()
+        self.assertEqual(shared_memory_buffer.dequeue(), 8)
+        self.assertEqual(shared_memory_buffer.dequeue(), 9)
+        shared_memory_buffer.close()
+
+    def test_function_io(self):
+        shared_memory_buffer = SharedMemoryBuffer(3, StatisticTracker(100))
+
+        for number in range(10):
+            shared_memory_buffer.enqueue(number)
+            shared_memory_buffer.enqueue(-number)
+            self.assertEqual(shared_memory_buffer.dequeue(), number)
+            self.assertEqual(shared_memory_buffer.dequeue(), -number)
+        self.assertTrue(shared_memory_buffer.is_empty())
+        shared_memory_buffer.close()
+
+    def test_execution(self):
+        shared_memory_buffer = SharedMemoryBuffer(8, StatisticTracker(100))
+        producer_process = multiprocessing.Process(
+            target=enqueue_range, args=(shared_memory_buffer, 100))
+
+        producer_process.start()
+        dequeued_numbers = []
+        while len(dequeued_numbers) < 100:
+            try:
+                dequeued_numbers.append(shared_memory_buffer.dequeue())
+            except EmptyBufferException:
+                pass
+        producer_process.join()
+
+        self.assertEqual(producer_process.exitcode, 0)
+        self.assertEqual(dequeued_numbers, list(range(100)))
+        shared_memory_buffer.close()
+
+    def test_spawn_start_method(self):
+        root_directory = os.path.dirname(os.path.dirname(os.path.dirname(
+            os.path.dirname(os.path.abspath(__file__)))))
+
+        result = subprocess.run([sys.executable, "-c", SPAWN_SCRIPT],
+                                cwd=root_directory, capture_output=True,
+                                text=True, timeout=60)
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), str(list(range(10))))
+        self.assertNotIn("KeyError", result.stderr)
+        self.assertNotIn("leaked", result.stderr)
+
+    def test_error_handling(self):
+        statistic_tracker = StatisticTracker(100)
+        shared_memory_buffer = SharedMemoryBuffer(0, statistic_tracker)
+
+        with self.assertRaises(FullBufferException):
+            shared_memory_buffer.enqueue(1)
+        with self.assertRaises(EmptyBufferException):
+            shared_memory_buffer.dequeue()
+        self.assertEqual(statistic_tracker.num_full_buffer, 1)
+        self.assertEqual(statistic_tracker.num_empty_buffer, 1)
+        shared_memory_buffer.close()
+
+        shared_memory_buffer = SharedMemoryBuffer(1, statistic_tracker)
+        with self.assertRaises(ValueError):
+            shared_memory_buffer.enqueue(2 ** 64)
+        shared_memory_buffer.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import threading
+import time
+import unittest
+
+from src.main.buffer.empty_buffer_exception import EmptyBufferException
+from src.main.buffer.full_buffer_exception import FullBufferException
+from src.main.buffer.spsc_ring_buffer import SpscRingBuffer
+from src.main.statistics.statistic_tracker import StatisticTracker
+
+
+class SpscRingBufferTest(unittest.TestCase):
+    def test_instantiation(self):
+        ring_buffer = SpscRingBuffer(4, StatisticTracker(100))
+
+        self.assertEqual(ring_buffer.buffer_size, 4)
+        self.assertEqual(len(ring_buffer.ring), 4)
+        self.assertEqual((ring_buffer.head, ring_buffer.tail), (0, 0))
+        self.assertTrue(ring_buffer.is_empty())
+
+    def test_value_change(self):
+        ring_buffer = SpscRingBuffer(2, StatisticTracker(100))
+
+        ring_buffer.enqueue(1)
+        ring_buffer.enqueue(2)
+        self.assertTrue(ring_buffer.is_full())
+        self.assertEqual(ring_buffer.tail, 2)
+
+        ring_buffer.dequeue()
+        self.assertEqual(ring_buffer.head, 1)
+        self.assertFalse(ring_buffer.is_full())
+
+    def test_function_io(self):
+        ring_buffer = SpscRingBuffer(3, StatisticTracker(100))
+
+        for number in range(10):
+            ring_buffer.enqueue(number)
+            self.assertEqual(ring_buffer.dequeue(), number)
+        self.assertTrue(ring_buffer.is_empty())
+
+    def test_execution(self):
+        ring_buffer = SpscRingBuffer(8, StatisticTracker(100))
+        num_items = 5000
+        received = []
+
+        def produce():
+            number = 0
+            while number < num_items:
+                try:
+                    ring_buffer.enqueue(number)
+                    number += 1
+                except FullBufferException:
+                    time.sleep(0)
+
+        def consume():
+            while len(received) < num_items:
+                try:
+                    received.append(ring_buffer.dequeue())
+                except EmptyBufferException:
+                    time.sleep(0)
+
+        threads = [threading.Thread(target=produce), threading.Thread(target=consume)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        self.assertEqual(received, list(range(num_items)))
+
+    def test_error_handling(self):
+        statistic_tracker = StatisticTracker(100)
+        ring_buffer = SpscRingBuffer(0, statistic_tracker)
+
+        with self.assertRaises(FullBufferException):
+            ring_buffer.enqueue(1)
+        with self.assertRaises(EmptyBufferException):
+            ring_buffer.dequeue()
+
+        self.assertEqual(statistic_tracker.num_full_buffer, 1)
+        self.assertEqual(statistic_tracker.num_empty_buffer, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
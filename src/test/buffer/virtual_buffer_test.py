@@ -0,0 +1,75 @@
+import unittest
+from unittest.mock import Mock
+
+from src.main.buffer.empty_buffer_exception import EmptyBufferException
+from src.main.buffer.full_buffer_exception import FullBufferException
+from src.main.buffer.virtual_buffer import VirtualBuffer
+from src.main.event.event_queue import EventQueue
+from src.main.event.timing_wheel import TimingWheel
+from src.main.statistics.statistic_tracker import StatisticTracker
+
+
+class VirtualBufferTest(unittest.TestCase):
+    def test_instantiation(self):
+        virtual_buffer = VirtualBuffer(16, StatisticTracker(100))
+
+        self.assertEqual(virtual_buffer.buffer_size, 16)
+        self.assertFalse(virtual_buffer.is_blocking)
+        self.assertTrue(virtual_buffer.is_empty())
+        self.assertFalse(virtual_buffer.is_full())
+        self.assertTrue(virtual_buffer.event_queue.is_empty())
+        self.assertIs(type(virtual_buffer.event_queue), EventQueue)
+
+        timing_wheel = TimingWheel()
+        self.assertIs(VirtualBuffer(16, StatisticTracker(100), True, timing_wheel).event_queue,
+                      timing_wheel)
+
+    def test_value_change(self):
+        virtual_buffer = VirtualBuffer(2, StatisticTracker(100))
+
+        virtual_buffer.enqueue(7)
+        virtual_buffer.enqueue(8)
+        self.assertTrue(virtual_buffer.is_full())
+
+        self.assertEqual(virtual_buffer.dequeue(), 7)
+        self.assertEqual(virtual_buffer.dequeue(), 8)
+        self.assertTrue(virtual_buffer.is_empty())
+
+    def test_function_io(self):
+        virtual_buffer = VirtualBuffer(3, StatisticTracker(100))
+
+        self.assertEqual(virtual_buffer.enqueue_many([1, 2, 3, 4]), 3)
+        self.assertEqual(virtual_buffer.dequeue_many(2), [1, 2])
+        self.assertEqual(virtual_buffer.enqueue_many([5]), 1)
+        self.assertEqual(virtual_buffer.dequeue_many(5), [3, 5])
+
+    def test_execution(self):
+        virtual_buffer = VirtualBuffer(1, StatisticTracker(100), True)
+        producer, consumers = Mock(), [Mock(), Mock()]
+        for consumer in consumers:
+            virtual_buffer.wait_for_item(consumer)
+
+        virtual_buffer.enqueue(1)
+        self.assertIs(virtual_buffer.event_queue.pop(), consumers[0])
+        self.assertTrue(virtual_buffer.event_queue.is_empty())
+
+        virtual_buffer.wait_for_space(producer)
+        virtual_buffer.dequeue()
+        self.assertIs(virtual_buffer.event_queue.pop(), producer)
+        self.assertEqual(list(virtual_buffer.waiting_consumers), [consumers[1]])
+
+    def test_error_handling(self):
+        statistic_tracker = StatisticTracker(100)
+        virtual_buffer = VirtualBuffer(1, statistic_tracker)
+
+        with self.assertRaises(EmptyBufferException):
+            virtual_buffer.dequeue_many(3)
+        virtual_buffer.enqueue(1)
+        with self.assertRaises(FullBufferException):
+            virtual_buffer.enqueue_many([2, 3])
+        self.assertEqual(statistic_tracker.num_empty_buffer, 1)
+        self.assertEqual(statistic_tracker.num_full_buffer, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,10 +2,18 @@ import argparse
 import unittest
 from unittest.mock import Mock, patch
 
+from src.main.buffer.buffer_type import BufferType
+from src.main.buffer.shard_policy import ShardPolicy
+from src.main.statistics.sample_mode import SampleMode
 from src.main.config import command_parser
 from src.main.config.command_flag import CommandFlag
-from src.main.config.command_parser import set_parser_args, get_config_from_arguments, parse_speed_range
+from src.main.config.command_parser import set_parser_args, get_config_from_arguments, parse_speed_range, \
+    parse_batch_size, parse_ratio, parse_buffer_size_bounds, parse_sample_rate, parse_grid
 from src.main.config.config import Config
+from src.main.event.event_queue_type import EventQueueType
+from src.main.simulator.engine_type import EngineType
+from src.main.thread.executor_type import ExecutorType
+from src.main.thread.processor.lock.lock_type import LockType
 
 
 class CommandParserTest(unittest.TestCase):
@@ -96,7 +104,27 @@ class CommandParserTest(unittest.TestCase):
                 producer_speed_range="3:5",
                 consumer_speed_range="3:5",
                 verbose=True,
-                suggestions=True
+                suggestions=True,
+                buffer_type="blocking",
+                producer_batch=4,
+                consumer_batch=2,
+                shard_policy="least-loaded",
+                urgent_ratio=0.25,
+                min_buffer_size=16,
+                max_buffer_size=512,
+                lock="fair",
+                lock_profile=True,
+                monitor=True,
+                sample_rate=10,
+                sample_mode="random",
+                calibrate=True,
+                correct_overhead=False,
+                profile=True,
+                memory_profile=True,
+                executor="process",
+                engine="asyncio",
+                grid="10,100:1:2,4",
+                event_queue="wheel"
             )
             config = get_config_from_arguments(args)
 
@@ -109,6 +137,42 @@ class CommandParserTest(unittest.TestCase):
         self.assertEqual(config.consumer_speed_range, (3, 5))
         self.assertTrue(config.verbose)
         self.assertTrue(config.suggestions)
+        self.assertEqual(config.buffer_type, BufferType.BLOCKING)
+        self.assertEqual(config.producer_batch_size, 4)
+        self.assertEqual(config.consumer_batch_size, 2)
+        self.assertEqual(config.shard_policy, ShardPolicy.LEAST_LOADED)
+        self.assertEqual(config.urgent_ratio, 0.25)
+        self.assertEqual(config.min_buffer_size, 16)
+        self.assertEqual(config.max_buffer_size, 512)
+        self.assertEqual(config.lock_type, LockType.FAIR)
+        self.assertTrue(config.lock_profile)
+        self.assertTrue(config.monitor)
+        self.assertEqual(config.sample_rate, 10)
+        self.assertEqual(config.sample_mode, SampleMode.RANDOM)
+        self.assertTrue(config.calibrate)
+        self.assertFalse(config.correct_overhead)
+        self.assertTrue(config.profile)
+        self.assertTrue(config.memory_profile)
+        self.assertEqual(config.executor, ExecutorType.PROCESS)
+        self.assertEqual(config.engine, EngineType.ASYNCIO)
+        self.assertEqual(config.grid, ((10, 1, 2), (10, 1, 4), (100, 1, 2), (100, 1, 4)))
+        self.assertEqual(config.event_queue, EventQueueType.WHEEL)
+        with self.assertRaises(ValueError):
+            parse_buffer_size_bounds(64, 32)
+        with self.assertRaises(ValueError):
+            parse_ratio(1.5)
+        with self.assertRaises(ValueError):
+            parse_batch_size(0)
+        with self.assertRaises(ValueError):
+            parse_sample_rate(0)
+        with self.assertRaises(ValueError):
+            parse_grid("10:1")
+        with self.assertRaises(ValueError):
+            parse_grid("10:0:1")
+
+    def test_parse_grid(self):
+        self.assertEqual(parse_grid(""), ())
+        self.assertEqual(parse_grid("5:1,2:3"), ((5, 1, 3), (5, 2, 3)))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,77 @@
+import asyncio
+import unittest
+
+from src.main.buffer.async_buffer import AsyncBuffer
+from src.main.coroutine.async_consumer import AsyncConsumer
+from src.main.statistics.statistic_tracker import StatisticTracker
+
+
+class AsyncConsumerTest(unittest.TestCase):
+    def test_instantiation(self):
+        statistic_tracker = StatisticTracker(100)
+        consumer = AsyncConsumer(2, 5, 10, AsyncBuffer(10, statistic_tracker), 100,
+                                 statistic_tracker, 8)
+
+        self.assertEqual(consumer.id, 2)
+        self.assertEqual(consumer.speed_floor, 5)
+        self.assertEqual(consumer.speed_ceiling, 10)
+        self.assertEqual(consumer.num_items_to_process, 100)
+        self.assertEqual(consumer.batch_size, 8)
+        self.assertEqual(consumer.name, "Consumer-2")
+        self.assertFalse(consumer.running)
+
+    def test_value_change(self):
+        statistic_tracker = StatisticTracker(10)
+        async_buffer = AsyncBuffer(10, statistic_tracker)
+        for number in range(10):
+            async_buffer.enqueue(number)
+        consumer = AsyncConsumer(1, 0, 0, async_buffer, 10, statistic_tracker, 4)
+
+        self.assertEqual(asyncio.run(consumer.process_item()), 4)
+        self.assertEqual(consumer.num_items_to_process, 6)
+        self.assertEqual(async_buffer.queue.qsize(), 6)
+        self.assertEqual(statistic_tracker.items_consumed, 4)
+
+    def test_function_io(self):
+        statistic_tracker = StatisticTracker(5)
+        async_buffer = AsyncBuffer(10, statistic_tracker)
+        async_buffer.enqueue(42)
+        consumer = AsyncConsumer(1, 0, 0, async_buffer, 5, statistic_tracker)
+
+        self.assertEqual(asyncio.run(consumer.process_item()), 1)
+        self.assertTrue(async_buffer.is_empty())
+        self.assertEqual(consumer.num_items_to_process, 4)
+
+    def test_execution(self):
+        statistic_tracker = StatisticTracker(20)
+        async_buffer = AsyncBuffer(20, statistic_tracker)
+        for number in range(20):
+            async_buffer.enqueue(number)
+        consumer = AsyncConsumer(1, 0, 1, async_buffer, 20, statistic_tracker, 3)
+
+        asyncio.run(consumer.run())
+
+        self.assertFalse(consumer.running)
+        self.assertEqual(consumer.num_items_to_process, 0)
+        self.assertTrue(async_buffer.is_empty())
+        self.assertEqual(statistic_tracker.items_consumed, 20)
+
+    def test_error_handling(self):
+        statistic_tracker = StatisticTracker(1)
+        async_buffer = AsyncBuffer(1, statistic_tracker)
+        consumer = AsyncConsumer(1, 0, 0, async_buffer, 1, statistic_tracker)
+
+        async def run_with_empty_buffer() -> None:
+            consumer_task = asyncio.ensure_future(consumer.run())
+            await asyncio.sleep(0.01)
+            self.assertFalse(consumer_task.done())
+            self.assertEqual(statistic_tracker.num_empty_buffer, 1)
+            await async_buffer.put(7)
+            await consumer_task
+
+        asyncio.run(run_with_empty_buffer())
+        self.assertEqual(statistic_tracker.items_consumed, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import asyncio
+import unittest
+
+from src.main.buffer.async_buffer import AsyncBuffer
+from src.main.coroutine.async_producer import AsyncProducer
+from src.main.statistics.statistic_tracker import StatisticTracker
+
+
+class AsyncProducerTest(unittest.TestCase):
+    def test_instantiation(self):
+        statistic_tracker = StatisticTracker(100)
+        producer = AsyncProducer(1, 5, 10, AsyncBuffer(10, statistic_tracker), 100,
+                                 statistic_tracker)
+
+        self.assertEqual(producer.id, 1)
+        self.assertEqual(producer.speed_floor, 5)
+        self.assertEqual(producer.speed_ceiling, 10)
+        self.assertEqual(producer.num_items_to_process, 100)
+        self.assertEqual(producer.batch_size, 1)
+        self.assertEqual(producer.name, "Producer-1")
+        self.assertFalse(producer.running)
+
+    def test_value_change(self):
+        statistic_tracker = StatisticTracker(10)
+        async_buffer = AsyncBuffer(10, statistic_tracker)
+        producer = AsyncProducer(1, 0, 0, async_buffer, 10, statistic_tracker, 4)
+
+        self.assertEqual(asyncio.run(producer.process_item()), 4)
+        self.assertEqual(producer.num_items_to_process, 6)
+        self.assertEqual(async_buffer.queue.qsize(), 4)
+        self.assertEqual(statistic_tracker.items_produced, 4)
+
+        producer.num_items_to_process = 2
+        self.assertEqual(asyncio.run(producer.process_item()), 2)
+        self.assertEqual(producer.num_items_to_process, 0)
+
+    def test_function_io(self):
+        statistic_tracker = StatisticTracker(5)
+        async_buffer = AsyncBuffer(10, statistic_tracker)
+        producer = AsyncProducer(1, 0, 0, async_buffer, 5, statistic_tracker)
+
+        self.assertEqual(asyncio.run(producer.process_item()), 1)
+        number = async_buffer.dequeue()
+        self.assertGreaterEqual(number, 1)
+        self.assertLessEqual(number, 100)
+        self.assertEqual(producer.num_items_to_process, 4)
+
+    def test_execution(self):
+        statistic_tracker = StatisticTracker(20)
+        async_buffer = AsyncBuffer(20, statistic_tracker)
+        producer = AsyncProducer(1, 0, 1, async_buffer, 20, statistic_tracker, 3)
+
+        asyncio.run(producer.run())
+
+        self.assertFalse(producer.running)
+        self.assertEqual(producer.num_items_to_process, 0)
+        self.assertEqual(async_buffer.queue.qsize(), 20)
+        self.assertEqual(statistic_tracker.items_produced, 20)
+
+    def test_error_handling(self):
+        statistic_tracker = StatisticTracker(2)
+        async_buffer = AsyncBuffer(1, statistic_tracker)
+        producer = AsyncProducer(1, 0, 0, async_buffer, 2, statistic_tracker)
+
+        async def run_with_full_buffer() -> None:
+            producer_task = asyncio.ensure_future(producer.run())
+            await asyncio.sleep(0.01)
+            self.assertFalse(producer_task.done())
+            self.assertEqual(statistic_tracker.num_full_buffer, 1)
+            await async_buffer.get()
+            await producer_task
+
+        asyncio.run(run_with_full_buffer())
+        self.assertEqual(statistic_tracker.items_produced, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import threading
+import unittest
+
+from src.main.buffer.async_buffer import AsyncBuffer
+from src.main.coroutine.async_consumer import AsyncConsumer
+from src.main.coroutine.async_producer import AsyncProducer
+from src.main.coroutine.coroutine_manager import CoroutineManager
+from src.main.statistics.statistic_tracker import StatisticTracker
+from src.main.statistics.thread_profiler import ThreadProfiler
+
+
+class CoroutineManagerTest(unittest.TestCase):
+    def test_instantiation(self):
+        statistic_tracker = StatisticTracker(100)
+        coroutine_manager = CoroutineManager(
+            2, 3, (1, 3), (2, 4), AsyncBuffer(10, statistic_tracker), 100, statistic_tracker
+        )
+
+        self.assertEqual(coroutine_manager.num_producers, 2)
+        self.assertEqual(coroutine_manager.num_consumers, 3)
+        self.assertEqual(len(coroutine_manager.producers), 2)
+        self.assertEqual(len(coroutine_manager.consumers), 3)
+        self.assertIsNone(coroutine_manager.event_loop_thread)
+        self.assertEqual(coroutine_manager.processes, [])
+        self.assertFalse(coroutine_manager.threads_started)
+
+    def test_value_change(self):
+        statistic_tracker = StatisticTracker(10)
+        coroutine_manager = CoroutineManager(
+            num_producers=3,
+            num_consumers=4,
+            consumer_speed_range=(1, 2),
+            producer_speed_range=(2, 4),
+            buffer=AsyncBuffer(10, statistic_tracker),
+            num_items_to_process=10,
+            statistic_tracker=statistic_tracker,
+            producer_batch_size=2,
+            consumer_batch_size=3
+        )
+
+        self.assertEqual([producer.num_items_to_process for producer in coroutine_manager.producers],
+                         [4, 3, 3])
+        self.assertEqual([consumer.num_items_to_process for consumer in coroutine_manager.consumers],
+                         [3, 3, 2, 2])
+        self.assertTrue(all(producer.batch_size == 2 for producer in coroutine_manager.producers))
+        self.assertTrue(all(consumer.batch_size == 3 for consumer in coroutine_manager.consumers))
+
+    def test_function_io(self):
+        statistic_tracker = StatisticTracker(10)
+        coroutine_manager = CoroutineManager(
+            2, 2, (2, 3), (1, 2), AsyncBuffer(10, statistic_tracker), 10, statistic_tracker
+        )
+
+        for producer in coroutine_manager.producers:
+            self.assertIsInstance(producer, AsyncProducer)
+            self.assertEqual(producer.speed_floor, 1)
+            self.assertEqual(producer.speed_ceiling, 2)
+        for consumer in coroutine_manager.consumers:
+            self.assertIsInstance(consumer, AsyncConsumer)
+            self.assertEqual(consumer.speed_floor, 2)
+            self.assertEqual(consumer.speed_ceiling, 3)
+
+    def test_execution(self):
+        statistic_tracker = StatisticTracker(20_000)
+        coroutine_manager = CoroutineManager(
+            5_000, 5_000, (0, 0), (0, 0), AsyncBuffer(100, statistic_tracker), 20_000,
+            statistic_tracker
+        )
+        num_threads = threading.active_count()
+
+        coroutine_manager.start_all()
+        self.assertTrue(coroutine_manager.threads_started)
+        self.assertLessEqual(threading.active_count(), num_threads + 1)
+        coroutine_manager.join_all()
+
+        self.assertFalse(coroutine_manager.event_loop_thread.is_alive())
+        self.assertEqual(statistic_tracker.items_produced, 20_000)
+        self.assertEqual(statistic_tracker.items_consumed, 20_000)
+        self.assertTrue(coroutine_manager.buffer.is_empty())
+        self.assertFalse(any(processor.running for processor in
+                             coroutine_manager.producers + coroutine_manager.consumers))
+
+    def test_error_handling(self):
+        statistic_tracker = StatisticTracker(10)
+        coroutine_manager = CoroutineManager(
+            1, 1, (0, 0), (0, 0), AsyncBuffer(10, statistic_tracker), 10, statistic_tracker
+        )
+
+        coroutine_manager.join_all()
+        self.assertFalse(coroutine_manager.threads_started)
+
+        with self.assertRaises(ZeroDivisionError):
+            CoroutineManager(0, 1, (0, 0), (0, 0), AsyncBuffer(10, statistic_tracker), 10,
+                             statistic_tracker)
+
+    def test_profiling(self):
+        statistic_tracker = StatisticTracker(10)
+        thread_profiler = ThreadProfiler()
+        coroutine_manager = CoroutineManager(
+            2, 2, (0, 0), (0, 0), AsyncBuffer(10, statistic_tracker), 10, statistic_tracker,
+            thread_profiler=thread_profiler
+        )
+
+        coroutine_manager.start_all()
+        coroutine_manager.join_all()
+
+        stats = thread_profiler.get_stats()
+        self.assertIsNotNone(stats)
+        function_names = {function[2] for function in stats.stats}
+        self.assertIn('run_all', function_names)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import unittest
+
+from src.main.buffer.virtual_buffer import VirtualBuffer
+from src.main.event.event_manager import EventManager
+from src.main.event.virtual_consumer import VirtualConsumer
+from src.main.event.virtual_producer import VirtualProducer
+from src.main.statistics.statistic_tracker import StatisticTracker
+from src.main.statistics.thread_profiler import ThreadProfiler
+
+
+class EventManagerTest(unittest.TestCase):
+    def test_instantiation(self):
+        statistic_tracker = StatisticTracker(100)
+        virtual_buffer = VirtualBuffer(10, statistic_tracker)
+        event_manager = EventManager(
+            2, 3, (1, 3), (2, 4), virtual_buffer, 100, statistic_tracker
+        )
+
+        self.assertEqual(len(event_manager.producers), 2)
+        self.assertEqual(len(event_manager.consumers), 3)
+        self.assertIs(event_manager.event_queue, virtual_buffer.event_queue)
+        self.assertIsNone(event_manager.event_loop_thread)
+        self.assertEqual(event_manager.num_events, 0)
+        self.assertFalse(event_manager.threads_started)
+
+    def test_value_change(self):
+        statistic_tracker = StatisticTracker(10)
+        event_manager = EventManager(
+            num_producers=3,
+            num_consumers=4,
+            consumer_speed_range=(1, 2),
+            producer_speed_range=(2, 4),
+            buffer=VirtualBuffer(10, statistic_tracker),
+            num_items_to_process=10,
+            statistic_tracker=statistic_tracker,
+            producer_batch_size=2,
+            consumer_batch_size=3
+        )
+
+        self.assertEqual([producer.num_items_to_process for producer in event_manager.producers],
+                         [4, 3, 3])
+        self.assertEqual([consumer.num_items_to_process for consumer in event_manager.consumers],
+                         [3, 3, 2, 2])
+        self.assertTrue(all(isinstance(producer, VirtualProducer) and producer.batch_size == 2
+                            for producer in event_manager.producers))
+        self.assertTrue(all(isinstance(consumer, VirtualConsumer) and consumer.batch_size == 3
+                            for consumer in event_manager.consumers))
+
+    def test_function_io(self):
+        statistic_tracker = StatisticTracker(100)
+        event_manager = EventManager(
+            1, 1, (2, 2), (2, 2), VirtualBuffer(10, statistic_tracker), 100, statistic_tracker
+        )
+
+        event_manager.run_events()
+
+        self.assertIn(event_manager.event_queue.current_time, (200_000_000, 210_000_000))
+        self.assertEqual(statistic_tracker.items_produced, 100)
+        self.assertEqual(statistic_tracker.items_consumed, 100)
+        self.assertEqual(statistic_tracker.producer_throughput_list, [2_000_000] * 100)
+        self.assertEqual(statistic_tracker.consumer_throughput_list, [2_000_000] * 100)
+
+    def test_execution(self):
+        for is_blocking in (False, True):
+            statistic_tracker = StatisticTracker(20_000)
+            virtual_buffer = VirtualBuffer(50, statistic_tracker, is_blocking)
+            event_manager = EventManager(
+                4, 6, (1, 5), (1, 5), virtual_buffer, 20_000, statistic_tracker
+            )
+
+            event_manager.start_all()
+            self.assertTrue(event_manager.threads_started)
+            event_manager.join_all()
+
+            self.assertFalse(event_manager.event_loop_thread.is_alive())
+            self.assertEqual(statistic_tracker.items_produced, 20_000)
+            self.assertEqual(statistic_tracker.items_consumed, 20_000)
+            self.assertTrue(virtual_buffer.is_empty())
+            self.assertTrue(event_manager.event_queue.is_empty())
+            self.assertGreater(event_manager.event_queue.current_time, 10 * 10 ** 9)
+            self.assertFalse(any(processor.running for processor in
+                                 event_manager.producers + event_manager.consumers))
+
+    def test_error_handling(self):
+        statistic_tracker = StatisticTracker(10)
+        event_manager = EventManager(
+            1, 1, (0, 0), (0, 0), VirtualBuffer(10, statistic_tracker), 10, statistic_tracker
+        )
+
+        event_manager.join_all()
+        self.assertFalse(event_manager.threads_started)
+
+        with self.assertRaises(ZeroDivisionError):
+            EventManager(1, 0, (0, 0), (0, 0), VirtualBuffer(10, statistic_tracker), 10,
+                         statistic_tracker)
+
+    def test_profiling(self):
+        statistic_tracker = StatisticTracker(10)
+        thread_profiler = ThreadProfiler()
+        event_manager = EventManager(
+            2, 2, (1, 1), (1, 1), VirtualBuffer(10, statistic_tracker), 10, statistic_tracker,
+            thread_profiler=thread_profiler
+        )
+
+        event_manager.start_all()
+        event_manager.join_all()
+
+        function_names = {function[2] for function in thread_profiler.get_stats().stats}
+        self.assertIn('handle_event', function_names)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+
+from src.main.event.event_queue import EventQueue
+
+
+class EventQueueTest(unittest.TestCase):
+    def test_instantiation(self):
+        event_queue = EventQueue()
+
+        self.assertEqual(event_queue.heap, [])
+        self.assertEqual(event_queue.current_time, 0)
+        self.assertTrue(event_queue.is_empty())
+        self.assertEqual(len(event_queue), 0)
+
+    def test_value_change(self):
+        event_queue = EventQueue()
+
+        event_queue.push(30, 'c')
+        event_queue.push(10, 'a')
+        self.assertEqual(len(event_queue), 2)
+
+        self.assertEqual(event_queue.pop(), 'a')
+        self.assertEqual(event_queue.current_time, 10)
+        self.assertEqual(event_queue.pop(), 'c')
+        self.assertEqual(event_queue.current_time, 30)
+        self.assertTrue(event_queue.is_empty())
+
+    def test_function_io(self):
+        event_queue = EventQueue()
+
+        for name in ('first', 'second', 'third'):
+            event_queue.push(5, name)
+
+        self.assertEqual([event_queue.pop() for _ in range(3)], ['first', 'second', 'third'])
+
+    def test_execution(self):
+        event_queue = EventQueue()
+        event_times = [7, 3, 9, 1, 3, 8, 2]
+        for index, event_time in enumerate(event_times):
+            event_queue.push(event_time, index)
+
+        popped_times = []
+        while not event_queue.is_empty():
+            event_queue.pop()
+            popped_times.append(event_queue.current_time)
+
+        self.assertEqual(popped_times, sorted(event_times))
+
+    def test_error_handling(self):
+        event_queue = EventQueue()
+
+        with self.assertRaises(IndexError):
+            event_queue.pop()
+
+        event_queue.push(10, 'a')
+        event_queue.pop()
+        with self.assertRaises(ValueError):
+            event_queue.push(9, 'b')
+
+
+if __name__ == '__main__':
+    unittest.main()
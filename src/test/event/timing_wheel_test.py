@@ -0,0 +1,98 @@
+import random
+import unittest
+
+from src.main.event.event_queue import EventQueue
+from src.main.event.timing_wheel import TimingWheel
+
+MILLISECOND = TimingWheel.TICK_DURATION
+
+
+class TimingWheelTest(unittest.TestCase):
+    def test_instantiation(self):
+        timing_wheel = TimingWheel()
+
+        self.assertIsInstance(timing_wheel, EventQueue)
+        self.assertEqual(timing_wheel.heap, [])
+        self.assertEqual([len(level_slots) for level_slots in timing_wheel.slots],
+                         [256, 64, 64, 64])
+        self.assertEqual(timing_wheel.bitmaps, [0, 0, 0, 0])
+        self.assertEqual(timing_wheel.current_time, 0)
+        self.assertEqual(timing_wheel.current_tick, 0)
+        self.assertTrue(timing_wheel.is_empty())
+        self.assertEqual(len(timing_wheel), 0)
+
+    def test_value_change(self):
+        timing_wheel = TimingWheel()
+
+        timing_wheel.push(0, 'now')
+        timing_wheel.push(3 * MILLISECOND, 'level 0')
+        timing_wheel.push(300 * MILLISECOND, 'level 1')
+        timing_wheel.push(20_000 * MILLISECOND, 'level 2')
+        timing_wheel.push(2_000_000 * MILLISECOND, 'level 3')
+        timing_wheel.push(100_000_000 * MILLISECOND, 'heap')
+
+        self.assertEqual(len(timing_wheel), 6)
+        self.assertEqual(len(timing_wheel.ready), 1)
+        self.assertEqual(timing_wheel.bitmaps, [1 << 3, 1 << 1, 1 << 1, 1 << 1])
+        self.assertEqual(len(timing_wheel.heap), 1)
+
+        popped = [timing_wheel.pop() for _ in range(6)]
+        self.assertEqual(popped, ['now', 'level 0', 'level 1', 'level 2', 'level 3', 'heap'])
+        self.assertEqual(timing_wheel.current_time, 100_000_000 * MILLISECOND)
+        self.assertEqual(timing_wheel.current_tick, 100_000_000)
+        self.assertTrue(timing_wheel.is_empty())
+
+    def test_function_io(self):
+        timing_wheel = TimingWheel()
+
+        for name in ('first', 'second', 'third'):
+            timing_wheel.push(5 * MILLISECOND, name)
+        timing_wheel.push(5 * MILLISECOND + 2, 'later')
+        timing_wheel.push(5 * MILLISECOND + 1, 'earlier')
+
+        self.assertEqual(timing_wheel.pop(), 'first')
+        timing_wheel.push(5 * MILLISECOND, 'fourth')
+        timing_wheel.push(5 * MILLISECOND + 1, 'between')
+        self.assertEqual([timing_wheel.pop() for _ in range(6)],
+                         ['second', 'third', 'fourth', 'earlier', 'between', 'later'])
+
+    def test_execution(self):
+        random_generator = random.Random(1)
+        timing_wheel = TimingWheel()
+        event_queue = EventQueue()
+        for name in range(1_000):
+            event_time = random_generator.randint(0, 10 ** 14)
+            timing_wheel.push(event_time, name)
+            event_queue.push(event_time, name)
+
+        for name in range(20_000):
+            if event_queue.is_empty() or random_generator.random() < 0.5:
+                event_time = event_queue.current_time + random_generator.choice(
+                    (0, random_generator.randint(0, 10 ** 7), random_generator.randint(0, 10 ** 14)))
+                timing_wheel.push(event_time, name)
+                event_queue.push(event_time, name)
+            else:
+                self.assertEqual(timing_wheel.pop(), event_queue.pop())
+                self.assertEqual(timing_wheel.current_time, event_queue.current_time)
+        while not event_queue.is_empty():
+            self.assertEqual(timing_wheel.pop(), event_queue.pop())
+
+        self.assertTrue(timing_wheel.is_empty())
+        self.assertEqual(timing_wheel.bitmaps, [0, 0, 0, 0])
+
+    def test_error_handling(self):
+        timing_wheel = TimingWheel()
+
+        with self.assertRaises(IndexError):
+            timing_wheel.pop()
+
+        timing_wheel.push(10 * MILLISECOND, 'a')
+        timing_wheel.pop()
+        with self.assertRaises(ValueError):
+            timing_wheel.push(10 * MILLISECOND - 1, 'b')
+        with self.assertRaises(IndexError):
+            timing_wheel.pop()
+
+
+if __name__ == '__main__':
+    unittest.main()
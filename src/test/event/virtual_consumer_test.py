@@ -0,0 +1,81 @@
+import unittest
+
+from src.main.buffer.virtual_buffer import VirtualBuffer
+from src.main.event.virtual_consumer import VirtualConsumer
+from src.main.event.virtual_processor import VirtualProcessor
+from src.main.statistics.sample_mode import SampleMode
+from src.main.statistics.statistic_tracker import StatisticTracker
+
+
+class VirtualConsumerTest(unittest.TestCase):
+    def test_instantiation(self):
+        statistic_tracker = StatisticTracker(100)
+        consumer = VirtualConsumer(2, 5, 10, VirtualBuffer(10, statistic_tracker), 100,
+                                   statistic_tracker, 8)
+
+        self.assertEqual(consumer.id, 2)
+        self.assertEqual(consumer.num_items_to_process, 100)
+        self.assertEqual(consumer.batch_size, 8)
+        self.assertEqual(consumer.name, "Consumer-2")
+        self.assertFalse(consumer.running)
+        self.assertFalse(consumer.is_waiting)
+
+    def test_value_change(self):
+        statistic_tracker = StatisticTracker(10)
+        virtual_buffer = VirtualBuffer(10, statistic_tracker)
+        virtual_buffer.enqueue_many([1, 2, 3])
+        consumer = VirtualConsumer(1, 1, 1, virtual_buffer, 10, statistic_tracker, 4)
+        consumer.start()
+
+        self.assertEqual(consumer.handle_event(0), 3_000_000)
+        self.assertEqual(consumer.num_items_to_process, 7)
+        self.assertTrue(virtual_buffer.is_empty())
+        self.assertEqual(consumer.num_processing_items, 3)
+
+    def test_function_io(self):
+        statistic_tracker = StatisticTracker(4, 2)
+        virtual_buffer = VirtualBuffer(10, statistic_tracker)
+        virtual_buffer.enqueue_many([1, 2, 3, 4])
+        consumer = VirtualConsumer(1, 1, 1, virtual_buffer, 4, statistic_tracker)
+        consumer.start()
+
+        event_time = 0
+        while event_time is not None:
+            event_time = consumer.handle_event(event_time)
+
+        self.assertEqual(statistic_tracker.items_consumed, 4)
+        self.assertEqual(statistic_tracker.consumer_throughput_list, [1_000_000] * 2)
+        self.assertEqual(statistic_tracker.sample_mode, SampleMode.DETERMINISTIC)
+
+    def test_execution(self):
+        statistic_tracker = StatisticTracker(2)
+        virtual_buffer = VirtualBuffer(10, statistic_tracker)
+        consumer = VirtualConsumer(1, 1, 1, virtual_buffer, 2, statistic_tracker)
+        consumer.start()
+
+        self.assertEqual(consumer.handle_event(0), VirtualProcessor.POLLING_INTERVAL)
+        self.assertEqual(statistic_tracker.num_empty_buffer, 1)
+
+        statistic_tracker.items_produced = 2
+        self.assertIsNone(consumer.handle_event(VirtualProcessor.POLLING_INTERVAL))
+        self.assertFalse(consumer.running)
+        self.assertEqual(consumer.num_items_to_process, 2)
+
+    def test_error_handling(self):
+        statistic_tracker = StatisticTracker(1)
+        virtual_buffer = VirtualBuffer(1, statistic_tracker, True)
+        consumer = VirtualConsumer(1, 1, 1, virtual_buffer, 1, statistic_tracker)
+        consumer.start()
+
+        self.assertIsNone(consumer.handle_event(0))
+        self.assertEqual(list(virtual_buffer.waiting_consumers), [consumer])
+
+        virtual_buffer.enqueue(9)
+        self.assertIs(virtual_buffer.event_queue.pop(), consumer)
+        self.assertEqual(consumer.handle_event(0), 1_000_000)
+        self.assertIsNone(consumer.handle_event(1_000_000))
+        self.assertEqual(statistic_tracker.items_consumed, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
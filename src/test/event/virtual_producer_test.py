@@ -0,0 +1,91 @@
+import unittest
+
+from src.main.buffer.virtual_buffer import VirtualBuffer
+from src.main.event.virtual_processor import VirtualProcessor
+from src.main.event.virtual_producer import VirtualProducer
+from src.main.statistics.statistic_tracker import StatisticTracker
+
+
+class VirtualProducerTest(unittest.TestCase):
+    def test_instantiation(self):
+        statistic_tracker = StatisticTracker(100)
+        producer = VirtualProducer(1, 5, 10, VirtualBuffer(10, statistic_tracker), 100,
+                                   statistic_tracker)
+
+        self.assertEqual(producer.id, 1)
+        self.assertEqual(producer.speed_floor, 5)
+        self.assertEqual(producer.speed_ceiling, 10)
+        self.assertEqual(producer.num_items_to_process, 100)
+        self.assertEqual(producer.batch_size, 1)
+        self.assertEqual(producer.name, "Producer-1")
+        self.assertEqual(producer.pending_numbers, [])
+        self.assertFalse(producer.running)
+
+    def test_value_change(self):
+        statistic_tracker = StatisticTracker(10)
+        virtual_buffer = VirtualBuffer(3, statistic_tracker)
+        producer = VirtualProducer(1, 2, 2, virtual_buffer, 10, statistic_tracker, 4)
+        producer.start()
+
+        self.assertEqual(producer.handle_event(0), 6_000_000)
+        self.assertEqual(producer.num_items_to_process, 7)
+        self.assertEqual(len(producer.pending_numbers), 1)
+        self.assertEqual(statistic_tracker.items_produced, 0)
+
+        self.assertEqual(producer.handle_event(6_000_000),
+                         6_000_000 + VirtualProcessor.POLLING_INTERVAL)
+        self.assertEqual(statistic_tracker.items_produced, 3)
+        self.assertEqual(statistic_tracker.producer_throughput_list, [2_000_000] * 3)
+        self.assertEqual(statistic_tracker.num_full_buffer, 1)
+
+    def test_function_io(self):
+        statistic_tracker = StatisticTracker(5)
+        virtual_buffer = VirtualBuffer(10, statistic_tracker)
+        producer = VirtualProducer(1, 1, 3, virtual_buffer, 5, statistic_tracker)
+        producer.start()
+
+        next_event_time = producer.handle_event(0)
+        self.assertIn(next_event_time, (1_000_000, 2_000_000, 3_000_000))
+        number = virtual_buffer.dequeue()
+        self.assertGreaterEqual(number, 1)
+        self.assertLessEqual(number, 100)
+        self.assertEqual(producer.num_items_to_process, 4)
+
+    def test_execution(self):
+        statistic_tracker = StatisticTracker(3)
+        virtual_buffer = VirtualBuffer(10, statistic_tracker)
+        producer = VirtualProducer(1, 1, 1, virtual_buffer, 3, statistic_tracker)
+        producer.start()
+
+        event_times = [0]
+        while event_times[-1] is not None:
+            event_times.append(producer.handle_event(event_times[-1]))
+
+        self.assertEqual(event_times, [0, 1_000_000, 2_000_000, 3_000_000, None])
+        self.assertFalse(producer.running)
+        self.assertEqual(statistic_tracker.items_produced, 3)
+        self.assertEqual(len(virtual_buffer.items), 3)
+
+    def test_error_handling(self):
+        statistic_tracker = StatisticTracker(2)
+        virtual_buffer = VirtualBuffer(1, statistic_tracker, True)
+        virtual_buffer.enqueue(1)
+        producer = VirtualProducer(1, 1, 1, virtual_buffer, 2, statistic_tracker)
+        producer.start()
+
+        self.assertIsNone(producer.handle_event(0))
+        self.assertTrue(producer.is_waiting)
+        self.assertEqual(list(virtual_buffer.waiting_producers), [producer])
+
+        virtual_buffer.event_queue.push(5_000_000, None)
+        virtual_buffer.event_queue.pop()
+        virtual_buffer.dequeue()
+        self.assertIs(virtual_buffer.event_queue.pop(), producer)
+        self.assertEqual(producer.handle_event(5_000_000), 6_000_000)
+        self.assertIsNone(producer.handle_event(6_000_000))
+        self.assertEqual(statistic_tracker.producer_throughput_list, [6_000_000])
+        self.assertEqual(statistic_tracker.num_full_buffer, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
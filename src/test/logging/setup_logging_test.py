@@ -5,6 +5,7 @@ from src.main.logging.setup_logging import (setup_logging,
                                             setup_default_logging,
                                             setup_verbose_logging,
                                             execution_trace)
+from src.main.statistics.tracking_mode import TrackingMode
 
 
 class SetupLoggingTest(unittest.TestCase):
@@ -22,12 +23,15 @@ class SetupLoggingTest(unittest.TestCase):
         result = test_function()
         self.assertEqual(result, "Test")
 
+    @patch.object(TrackingMode, "is_verbose", False)
     @patch("logging.basicConfig")
     def test_value_change(self, mock_basic_config):
         setup_logging(False)
         mock_basic_config.assert_called_once()
+        self.assertFalse(TrackingMode.is_verbose)
 
         setup_logging(True)
+        self.assertTrue(TrackingMode.is_verbose)
         mock_basic_config.assert_called_with(
             level=10,
             format="%(asctime)s - %(threadName)s - %(levelname)s - %(message)s",
@@ -0,0 +1,112 @@
+import importlib
+import sys
+import unittest
+from unittest.mock import patch
+
+from src.main.buffer.virtual_buffer import VirtualBuffer
+from src.main.config.config import Config
+from src.main.event.event_manager import EventManager
+from src.main.simulator import grid_simulator
+from src.main.simulator.grid_simulator import GridSimulator
+from src.main.statistics.statistic_tracker import StatisticTracker
+
+
+def get_config(grid, num_items=100, speed_range=(2, 2)):
+    return Config(10, num_items, 1, 1, speed_range, speed_range, False, False, grid=grid)
+
+
+@unittest.skipUnless(GridSimulator.is_supported(), "requires NumPy")
+class GridSimulatorTest(unittest.TestCase):
+    def test_instantiation(self):
+        config = get_config(((10, 1, 2), (100, 3, 4)))
+        simulator = GridSimulator(config)
+
+        self.assertIs(simulator.config, config)
+        self.assertEqual(simulator.buffer_sizes.tolist(), [10, 100])
+        self.assertEqual(simulator.num_producers.tolist(), [1, 3])
+        self.assertEqual(simulator.num_consumers.tolist(), [2, 4])
+        self.assertEqual(simulator.current_time, 0)
+        self.assertEqual(simulator.num_steps, 0)
+        self.assertEqual(simulator.results, {})
+
+    def test_value_change(self):
+        simulator = GridSimulator(get_config(((10, 1, 1),)))
+
+        results = simulator.run()
+
+        self.assertIs(simulator.results, results)
+        self.assertEqual(simulator.current_time, 200)
+        self.assertEqual(simulator.num_steps, 101)
+        self.assertEqual(set(results), {key for key, _, _ in GridSimulator.COLUMNS})
+
+    def test_function_io(self):
+        simulator = GridSimulator(get_config(((10, 1, 1), (1, 2, 1), (100, 3, 2))))
+
+        results = simulator.run()
+
+        self.assertEqual(results['duration'].tolist(), [0.2, 0.2, 0.1])
+        self.assertEqual(results['producer_throughput'].tolist(), [2.0, 2.0, 2.0])
+        self.assertEqual(results['consumer_throughput'].tolist(), [2.0, 2.0, 2.0])
+        self.assertEqual(results['num_full_buffer'].tolist(), [0, 10, 0])
+        self.assertEqual(results['num_empty_buffer'].tolist(), [0, 0, 0])
+        self.assertEqual(results['latency'][:2].tolist(), [0.0, 0.0])
+        self.assertGreater(results['latency'][2], 0.0)
+
+        single_results = GridSimulator(get_config(((1, 2, 1),))).run()
+        self.assertEqual(single_results['num_full_buffer'].tolist(), [10])
+
+    def test_execution(self):
+        num_items = 5_000
+        simulator = GridSimulator(get_config(((20, 2, 3), (20, 3, 2)), num_items, (1, 5)), seed=1)
+
+        results = simulator.run()
+
+        for row, (num_producers, num_consumers) in enumerate(((2, 3), (3, 2))):
+            statistic_tracker = StatisticTracker(num_items)
+            virtual_buffer = VirtualBuffer(20, statistic_tracker)
+            event_manager = EventManager(num_producers, num_consumers, (1, 5), (1, 5),
+                                         virtual_buffer, num_items, statistic_tracker)
+            event_manager.run_events()
+            virtual_duration = event_manager.event_queue.current_time / 10 ** 9
+            self.assertAlmostEqual(results['duration'][row], virtual_duration,
+                                   delta=virtual_duration / 10)
+            self.assertAlmostEqual(results['producer_throughput'][row], 3.0, delta=0.2)
+            self.assertAlmostEqual(results['consumer_throughput'][row], 3.0, delta=0.2)
+
+    def test_error_handling(self):
+        config = get_config(((10, 1, 1),))
+        simulator = GridSimulator(config)
+        self.assertEqual(simulator.get_results_table(), "")
+
+        with patch.object(grid_simulator, 'np', None):
+            self.assertFalse(GridSimulator.is_supported())
+            with self.assertRaises(RuntimeError):
+                GridSimulator(config)
+
+    def test_simulate(self):
+        simulator = GridSimulator(get_config(((10, 1, 1), (1, 2, 1))))
+
+        with self.assertLogs(level='INFO') as logs:
+            simulator.simulate()
+
+        output = "\n".join(logs.output)
+        self.assertIn("Simulating 2 configurations at once", output)
+        self.assertIn("Latency (ms)", output)
+        self.assertEqual(len(simulator.get_results_table().splitlines()), 4)
+
+
+class GridSimulatorWithoutNumPyTest(unittest.TestCase):
+    def test_import(self):
+        grid_modules = ('src.main.simulator.grid_workers', 'src.main.simulator.grid_simulator')
+        with patch.dict(sys.modules, {'numpy': None}):
+            for module_name in grid_modules:
+                sys.modules.pop(module_name, None)
+            unsupported_module = importlib.import_module('src.main.simulator.grid_simulator')
+
+            self.assertFalse(unsupported_module.GridSimulator.is_supported())
+            with self.assertRaises(RuntimeError):
+                unsupported_module.GridSimulator(get_config(((10, 1, 1),)))
+
+
+if __name__ == '__main__':
+    unittest.main()
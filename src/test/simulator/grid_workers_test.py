@@ -0,0 +1,80 @@
+import unittest
+
+from src.main.simulator.grid_workers import GridWorkers
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def get_workers(num_workers, num_items=10, speed_range=(2, 2), batch_size=1):
+    return GridWorkers(np.array(num_workers), num_items, speed_range, batch_size,
+                       np.random.default_rng(0))
+
+
+@unittest.skipIf(np is None, "requires NumPy")
+class GridWorkersTest(unittest.TestCase):
+    def test_instantiation(self):
+        workers = get_workers([3, 1])
+
+        self.assertEqual(workers.num_configurations, 2)
+        self.assertEqual(workers.width, 3)
+        self.assertEqual(workers.quotas.tolist(), [4, 3, 3, 10, 0, 0])
+        self.assertEqual(workers.times.tolist(), [0, 0, 0, 0, GridWorkers.NEVER, GridWorkers.NEVER])
+        self.assertEqual(workers.processing_items.tolist(), [0] * 6)
+        self.assertEqual(workers.time_sums.tolist(), [0, 0])
+
+    def test_value_change(self):
+        workers = get_workers([2, 2], batch_size=3)
+        indices = workers.get_due(0)
+
+        served = workers.serve(indices, np.array([4, 10]))
+        failed = workers.start_work(indices, served, 5)
+
+        self.assertEqual(served.tolist(), [3, 1, 3, 3])
+        self.assertEqual(failed.tolist(), [])
+        self.assertEqual(workers.quotas.tolist(), [2, 4, 2, 2])
+        self.assertEqual(workers.processing_items.tolist(), [3, 1, 3, 3])
+        self.assertEqual(workers.times.tolist(), [11, 7, 11, 11])
+        self.assertEqual(workers.time_sums.tolist(), [8, 12])
+        self.assertEqual(workers.get_next_time(), 7)
+
+    def test_function_io(self):
+        workers = get_workers([3, 1])
+
+        self.assertEqual(workers.get_due(0).tolist(), [0, 1, 2, 3])
+        self.assertEqual(workers.get_configurations(np.array([0, 2, 3, 5])).tolist(), [0, 0, 1, 1])
+        self.assertEqual(workers.count(np.array([0, 2, 3])).tolist(), [2, 1])
+        self.assertEqual(workers.count(np.array([0, 2, 3]), np.array([1, 2, 4])).tolist(), [3, 4])
+        self.assertEqual(workers.draw_processing_times(np.array([1, 3, 0])).tolist(), [2, 6, 0])
+
+    def test_execution(self):
+        workers = get_workers([2], num_items=2)
+        indices = workers.get_due(0)
+        workers.start_work(indices, workers.serve(indices, np.array([1])), 0)
+
+        indices = workers.get_due(2)
+        self.assertEqual(workers.complete_work(indices).tolist(), [1])
+        indices = workers.stop_finished(indices)
+        self.assertEqual(indices.tolist(), [])
+        self.assertEqual(workers.times.tolist(), [GridWorkers.NEVER, 0])
+        self.assertEqual(workers.processing_items.tolist(), [0, 0])
+
+    def test_error_handling(self):
+        workers = get_workers([2, 1])
+        indices = workers.get_due(0)
+
+        served = workers.serve(indices, np.array([0, 0]))
+        failed = workers.start_work(indices, served, 0)
+
+        self.assertEqual(served.tolist(), [0, 0, 0])
+        self.assertEqual(failed.tolist(), indices.tolist())
+        self.assertEqual(workers.times.tolist(), [0, 0, 0, GridWorkers.NEVER])
+        empty_indices = np.array([], dtype=np.int64)
+        self.assertEqual(workers.serve(empty_indices, np.array([1, 1])).tolist(), [])
+        self.assertEqual(workers.complete_work(empty_indices).tolist(), [0, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()
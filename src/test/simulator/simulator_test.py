@@ -1,8 +1,34 @@
+import signal
+import tracemalloc
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 
+from src.main.buffer.async_buffer import AsyncBuffer
+from src.main.buffer.blocking_buffer_queue import BlockingBufferQueue
+from src.main.buffer.buffer_queue import BufferQueue
+from src.main.buffer.buffer_type import BufferType
+from src.main.buffer.semaphore_buffer import SemaphoreBuffer
+from src.main.buffer.shared_memory_buffer import SharedMemoryBuffer
+from src.main.buffer.spsc_ring_buffer import SpscRingBuffer
+from src.main.buffer.virtual_buffer import VirtualBuffer
 from src.main.config.config import Config
+from src.main.coroutine.coroutine_manager import CoroutineManager
+from src.main.event.event_manager import EventManager
+from src.main.event.event_queue import EventQueue
+from src.main.event.event_queue_type import EventQueueType
+from src.main.event.timing_wheel import TimingWheel
+from src.main.simulator.engine_type import EngineType
 from src.main.simulator.simulator import Simulator
+from src.main.statistics.monitoring_profiler import MonitoringProfiler
+from src.main.statistics.memory_profiler import MemoryProfiler
+from src.main.statistics.sample_mode import SampleMode
+from src.main.statistics.thread_profiler import ThreadProfiler
+from src.main.suggestion.suggester import Suggester
+from src.main.thread.executor_type import ExecutorType
+from src.main.thread.processor.lock.fair_mutex_lock import FairMutexLock
+from src.main.thread.processor.lock.lock_type import LockType
+from src.main.thread.processor.lock.native_lock import NativeLock
+from src.main.thread.processor.lock.profiled_lock import ProfiledLock
 
 
 class SimulatorTest(unittest.TestCase):
@@ -15,6 +41,216 @@ class SimulatorTest(unittest.TestCase):
         self.assertIsNotNone(simulator.buffer)
         self.assertIsNotNone(simulator.thread_manager)
 
+    def test_buffer_selection(self):
+        config = Config(10, 100, 2, 2, (1, 3), (2, 4), False, False,
+                        BufferType.BLOCKING)
+        simulator = Simulator(config)
+
+        self.assertIsInstance(simulator.buffer, BlockingBufferQueue)
+
+        single_config = Config(10, 100, 1, 1, (1, 3), (2, 4), False, False)
+        self.assertIsInstance(Simulator(single_config).buffer, SpscRingBuffer)
+
+        spsc_config = Config(10, 100, 2, 1, (1, 3), (2, 4), False, False,
+                             BufferType.SPSC)
+        self.assertIsInstance(Simulator(spsc_config).buffer, BufferQueue)
+
+        semaphore_config = Config(10, 100, 2, 2, (1, 3), (2, 4), False, False,
+                                  BufferType.SEMAPHORE)
+        self.assertIsInstance(Simulator(semaphore_config).buffer, SemaphoreBuffer)
+
+    def test_process_executor(self):
+        for buffer_type in (BufferType.QUEUE, BufferType.BLOCKING):
+            config = Config(10, 100, 1, 1, (1, 3), (2, 4), False, False,
+                            buffer_type, executor=ExecutorType.PROCESS)
+            simulator = Simulator(config)
+
+            self.assertIsInstance(simulator.buffer, SharedMemoryBuffer)
+            self.assertEqual(len(simulator.thread_manager.processes), 2)
+            simulator.buffer.close()
+
+        self.assertEqual(Simulator(Config(10, 100, 2, 2, (1, 3), (2, 4), False, False))
+                         .thread_manager.processes, [])
+
+    def test_asyncio_engine(self):
+        config = Config(10, 100, 3, 2, (0, 0), (0, 0), False, False,
+                        BufferType.BLOCKING, engine=EngineType.ASYNCIO)
+        simulator = Simulator(config)
+
+        self.assertIsInstance(simulator.buffer, AsyncBuffer)
+        self.assertIsInstance(simulator.thread_manager, CoroutineManager)
+        self.assertEqual(len(simulator.thread_manager.producers), 3)
+        self.assertEqual(len(simulator.thread_manager.consumers), 2)
+
+        simulator.start()
+        simulator.thread_manager.join_all()
+        self.assertEqual(simulator.statistic_tracker.items_produced, 100)
+        self.assertEqual(simulator.statistic_tracker.items_consumed, 100)
+
+        self.assertNotIsInstance(Simulator(Config(10, 100, 2, 2, (1, 3), (2, 4), False, False))
+                                 .thread_manager, CoroutineManager)
+
+    def test_des_engine(self):
+        config = Config(10, 1000, 2, 3, (1, 5), (1, 5), False, False,
+                        BufferType.BLOCKING, engine=EngineType.DES)
+        simulator = Simulator(config)
+
+        self.assertIsInstance(simulator.buffer, VirtualBuffer)
+        self.assertTrue(simulator.buffer.is_blocking)
+        self.assertIs(type(simulator.buffer.event_queue), EventQueue)
+        self.assertIsInstance(simulator.thread_manager, EventManager)
+
+        simulator.start()
+        simulator.thread_manager.join_all()
+        self.assertEqual(simulator.statistic_tracker.items_produced, 1000)
+        self.assertEqual(simulator.statistic_tracker.items_consumed, 1000)
+        self.assertGreater(simulator.thread_manager.event_queue.current_time, 10 ** 9)
+
+        polling_config = Config(10, 100, 2, 2, (1, 3), (2, 4), False, False,
+                                BufferType.SHARDED, engine=EngineType.DES,
+                                correct_overhead=True)
+        polling_simulator = Simulator(polling_config)
+        self.assertFalse(polling_simulator.buffer.is_blocking)
+        self.assertFalse(polling_simulator.statistic_tracker.is_overhead_corrected)
+
+    def test_sampling(self):
+        config = Config(10, 50, 2, 2, (1, 1), (1, 1), False, False, sample_rate=1000)
+        simulator = Simulator(config)
+        simulator.start()
+        simulator.thread_manager.join_all()
+        self.assertTrue(simulator.statistic_tracker.producer_throughput_list)
+        self.assertTrue(simulator.statistic_tracker.consumer_throughput_list)
+        Suggester(config, simulator.statistic_tracker).show_suggestions()
+
+        alternating_config = Config(10, 100, 1, 1, (3, 3), (3, 3), False, False,
+                                    engine=EngineType.DES, sample_rate=2)
+        alternating_simulator = Simulator(alternating_config)
+        alternating_simulator.start()
+        alternating_simulator.thread_manager.join_all()
+        tracker = alternating_simulator.statistic_tracker
+        self.assertEqual(len(tracker.producer_throughput_list), 50)
+        self.assertEqual(len(tracker.consumer_throughput_list), 50)
+        Suggester(alternating_config, tracker).show_suggestions()
+
+    def test_timing_wheel(self):
+        config = Config(10, 1000, 2, 3, (1, 5), (1, 5), False, False,
+                        engine=EngineType.DES, event_queue=EventQueueType.WHEEL)
+        simulator = Simulator(config)
+
+        self.assertIsInstance(simulator.buffer.event_queue, TimingWheel)
+        self.assertIs(simulator.thread_manager.event_queue, simulator.buffer.event_queue)
+
+        simulator.start()
+        simulator.thread_manager.join_all()
+        self.assertEqual(simulator.statistic_tracker.items_produced, 1000)
+        self.assertEqual(simulator.statistic_tracker.items_consumed, 1000)
+        self.assertTrue(simulator.thread_manager.event_queue.is_empty())
+
+    def test_lock_selection(self):
+        config = Config(10, 100, 2, 2, (1, 3), (2, 4), False, False,
+                        lock_type=LockType.FAIR)
+        simulator = Simulator(config)
+
+        self.assertIsInstance(simulator.buffer.mutex_lock, FairMutexLock)
+
+        sharded_config = Config(10, 100, 2, 2, (1, 3), (2, 4), False, False,
+                                BufferType.SHARDED, lock_type=LockType.FAIR)
+        for shard_lock in Simulator(sharded_config).buffer.shard_locks:
+            self.assertIsInstance(shard_lock, FairMutexLock)
+
+        profiled_config = Config(10, 100, 2, 2, (1, 3), (2, 4), False, False,
+                                 lock_type=LockType.FAIR, lock_profile=True)
+        profiled_simulator = Simulator(profiled_config)
+        self.assertIsInstance(profiled_simulator.buffer.mutex_lock, ProfiledLock)
+        self.assertIsInstance(profiled_simulator.buffer.mutex_lock.lock, FairMutexLock)
+        self.assertIsNotNone(profiled_simulator.statistic_tracker.lock_profiler)
+
+        single_profiled_config = Config(10, 100, 1, 1, (1, 3), (2, 4), False, False,
+                                        lock_profile=True)
+        single_profiled_simulator = Simulator(single_profiled_config)
+        self.assertIsInstance(single_profiled_simulator.buffer, BufferQueue)
+        self.assertIsInstance(single_profiled_simulator.buffer.mutex_lock, ProfiledLock)
+
+        spsc_profiled_config = Config(10, 100, 1, 1, (1, 3), (2, 4), False, False,
+                                      BufferType.SPSC, lock_profile=True)
+        with self.assertLogs(level='WARNING') as logs:
+            self.assertIsInstance(Simulator(spsc_profiled_config).buffer, SpscRingBuffer)
+        self.assertIn("lock profiling is unavailable", "\n".join(logs.output))
+
+        for lock_type in (LockType.FAIR, LockType.ADAPTIVE, LockType.NATIVE):
+            single_config = Config(10, 100, 1, 1, (1, 3), (2, 4), False, False,
+                                   lock_type=lock_type)
+            self.assertIsInstance(Simulator(single_config).buffer, BufferQueue)
+        self.assertIsInstance(Simulator(single_config).buffer.mutex_lock, NativeLock)
+        spsc_fair_config = Config(10, 100, 1, 1, (1, 3), (2, 4), False, False,
+                                  BufferType.SPSC, lock_type=LockType.FAIR)
+        with self.assertLogs(level='WARNING') as logs:
+            self.assertIsInstance(Simulator(spsc_fair_config).buffer, SpscRingBuffer)
+        self.assertIn("the fair lock has no effect", "\n".join(logs.output))
+
+    def test_monitoring(self):
+        config = Config(10, 100, 2, 2, (1, 3), (2, 4), False, False,
+                        monitor=True)
+        simulator = Simulator(config)
+
+        self.assertFalse(simulator.monitoring_profiler.is_attached)
+        if MonitoringProfiler.is_supported():
+            simulator.start_monitoring()
+            self.assertTrue(simulator.monitoring_profiler.is_attached)
+            simulator.handle_monitoring_signal(signal.SIGUSR1, None)
+            self.assertFalse(simulator.monitoring_profiler.is_attached)
+        else:
+            with self.assertLogs(level='WARNING'):
+                simulator.start_monitoring()
+            self.assertIsNone(simulator.previous_signal_handler)
+        simulator.stop_monitoring()
+        self.assertFalse(simulator.monitoring_profiler.is_attached)
+        self.assertIsNone(simulator.previous_signal_handler)
+
+    def test_calibration(self):
+        config = Config(10, 100, 2, 2, (1, 3), (2, 4), False, False,
+                        correct_overhead=True)
+        simulator = Simulator(config)
+
+        self.assertGreater(simulator.statistic_tracker.timing_overhead, 0)
+        self.assertTrue(simulator.statistic_tracker.is_overhead_corrected)
+        self.assertFalse(Simulator(Config(10, 100, 2, 2, (1, 3), (2, 4), False, False))
+                         .statistic_tracker.timing_overhead)
+
+    def test_thread_profiling(self):
+        self.assertIsNone(Simulator(Config(10, 100, 2, 2, (1, 3), (2, 4), False, False))
+                          .thread_profiler)
+
+        simulator = Simulator(Config(10, 100, 2, 2, (1, 3), (2, 4), False, False,
+                                     profile=True))
+
+        self.assertIsInstance(simulator.thread_profiler, ThreadProfiler)
+        self.assertIs(simulator.thread_manager.thread_profiler, simulator.thread_profiler)
+        for processor in simulator.thread_manager.producers + simulator.thread_manager.consumers:
+            self.assertIs(processor.thread_profiler, simulator.thread_profiler)
+
+        simulator.thread_profiler.save_profile = Mock(return_value="")
+        simulator.show_thread_profile()
+        simulator.thread_profiler.save_profile.assert_called_once()
+
+    def test_memory_profiling(self):
+        self.assertIsNone(Simulator(Config(10, 100, 2, 2, (1, 3), (2, 4), False, False))
+                          .memory_profiler)
+
+        simulator = Simulator(Config(10, 100, 2, 2, (1, 3), (2, 4), False, False,
+                                     memory_profile=True))
+        try:
+            self.assertIsInstance(simulator.memory_profiler, MemoryProfiler)
+            self.assertTrue(tracemalloc.is_tracing())
+            self.assertIn(MemoryProfiler.START_SNAPSHOT, simulator.memory_profiler.snapshot_sizes)
+        finally:
+            simulator.memory_profiler.stop()
+
+        self.assertFalse(tracemalloc.is_tracing())
+        with patch('src.main.simulator.simulator.log_in_bold') as log_in_bold_mock:
+            simulator.show_memory_profile()
+        self.assertIn("Peak traced memory", log_in_bold_mock.call_args[0][0])
+
     def test_value_change(self):
         config_mock = Mock()
         config_mock.buffer_size = 10
@@ -24,6 +260,7 @@ class SimulatorTest(unittest.TestCase):
         config_mock.consumer_speed_range = (1, 3)
         config_mock.producer_speed_range = (2, 4)
         config_mock.suggestions = False
+        config_mock.memory_profile = False
 
         statistic_tracker_mock = Mock()
 
@@ -47,7 +284,8 @@ class SimulatorTest(unittest.TestCase):
             consumer_speed_range=(1, 3),
             producer_speed_range=(2, 4),
             verbose=True,
-            suggestions=False
+            suggestions=False,
+            memory_profile=False
         )
 
         with patch('src.main.simulator.simulator.ThreadManager') as self.MockThreadManager:
@@ -70,6 +308,7 @@ class SimulatorTest(unittest.TestCase):
         mock_config.consumer_speed_range = (1, 2)
         mock_config.producer_speed_range = (1, 2)
         mock_config.suggestions = False
+        mock_config.memory_profile = False
 
         simulator = Simulator(config=mock_config)
         simulator.simulate()
@@ -85,6 +324,22 @@ class SimulatorTest(unittest.TestCase):
             config_mock.consumer_speed_range = (1, 5)
             config_mock.producer_speed_range = (1, 5)
             config_mock.suggestions = False
+            config_mock.buffer_type = BufferType.QUEUE
+            config_mock.producer_batch_size = 1
+            config_mock.consumer_batch_size = 1
+            config_mock.urgent_ratio = 0.0
+            config_mock.lock_type = LockType.MUTEX
+            config_mock.lock_profile = False
+            config_mock.monitor = False
+            config_mock.sample_rate = 1
+            config_mock.sample_mode = SampleMode.DETERMINISTIC
+            config_mock.calibrate = False
+            config_mock.correct_overhead = False
+            config_mock.profile = False
+            config_mock.memory_profile = False
+            config_mock.executor = ExecutorType.THREAD
+            config_mock.engine = EngineType.THREADED
+            config_mock.event_queue = EventQueueType.HEAP
 
             simulator = Simulator(config=config_mock)
             simulator.simulate()
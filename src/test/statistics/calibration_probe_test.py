@@ -0,0 +1,67 @@
+import unittest
+from unittest.mock import patch
+
+from src.main.statistics.calibration_probe import CalibrationProbe
+from src.main.statistics.statistic_tracker import StatisticTracker
+from src.main.statistics.tracking_mode import TrackingMode
+
+
+class CalibrationProbeTest(unittest.TestCase):
+    def test_instantiation(self):
+        calibration_probe = CalibrationProbe()
+
+        self.assertIsInstance(calibration_probe.statistic_tracker, StatisticTracker)
+        self.assertEqual(calibration_probe.statistic_tracker.producer_throughput_list, [])
+
+    def test_value_change(self):
+        calibration_probe = CalibrationProbe()
+
+        self.assertEqual(calibration_probe.timed_operation(), 1)
+        self.assertEqual(calibration_probe.plain_operation(), 1)
+        self.assertEqual(calibration_probe.statistic_tracker.items_produced, 1)
+        self.assertEqual(len(calibration_probe.statistic_tracker.producer_throughput_list), 1)
+
+    @patch.object(CalibrationProbe, "NUM_CALLS", 100)
+    def test_function_io(self):
+        calibration_probe = CalibrationProbe()
+
+        timing_overhead = calibration_probe.measure_timing_overhead()
+
+        self.assertIsInstance(timing_overhead, int)
+        self.assertGreater(timing_overhead, 0)
+        self.assertEqual(len(calibration_probe.statistic_tracker.producer_throughput_list), 100)
+
+    @patch.object(CalibrationProbe, "NUM_CALLS", 1000)
+    def test_execution(self):
+        calibration_probe = CalibrationProbe()
+
+        decorator_overhead = calibration_probe.measure_decorator_overhead()
+
+        self.assertIsInstance(decorator_overhead, int)
+        self.assertGreaterEqual(decorator_overhead, 0)
+
+    @patch("logging.debug")
+    @patch.object(CalibrationProbe, "NUM_CALLS", 100)
+    def test_calibrate(self, mock_logging_debug):
+        calibration_probe = CalibrationProbe()
+        TrackingMode.set_verbose(True)
+        try:
+            timing_overhead, decorator_overhead = calibration_probe.calibrate()
+            self.assertTrue(TrackingMode.is_verbose)
+        finally:
+            TrackingMode.set_verbose(False)
+
+        self.assertGreater(timing_overhead, 0)
+        self.assertGreaterEqual(decorator_overhead, 0)
+        mock_logging_debug.assert_not_called()
+
+    @patch("time.perf_counter_ns", side_effect=[0, 2000, 2000, 1000])
+    @patch.object(CalibrationProbe, "NUM_CALLS", 10)
+    def test_error_handling(self, mock_perf_counter_ns):
+        calibration_probe = CalibrationProbe()
+
+        self.assertEqual(calibration_probe.measure_decorator_overhead(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import threading
+import unittest
+
+from src.main.statistics.lock_profiler import LockProfiler
+from src.main.statistics.thread_lock_statistics import ThreadLockStatistics
+
+
+class LockProfilerTest(unittest.TestCase):
+    def test_instantiation(self):
+        lock_profiler = LockProfiler()
+
+        self.assertEqual(lock_profiler.thread_statistics, {})
+        self.assertEqual(lock_profiler.get_lock_statistics(), "")
+
+    def test_value_change(self):
+        lock_profiler = LockProfiler()
+
+        lock_profiler.record_wait_time(100)
+        lock_profiler.record_hold_time(300)
+
+        statistics = lock_profiler.thread_statistics[threading.current_thread().name]
+        self.assertEqual(statistics.num_acquisitions, 1)
+        self.assertEqual(statistics.total_wait_time, 100)
+        self.assertEqual(statistics.total_hold_time, 300)
+        self.assertEqual(statistics.wait_histogram[(100).bit_length()], 1)
+        self.assertEqual(statistics.hold_histogram[(300).bit_length()], 1)
+
+    def test_function_io(self):
+        self.assertEqual(ThreadLockStatistics.get_percentile_bound([0] * 4, 0.99), 0)
+        self.assertEqual(ThreadLockStatistics.get_percentile_bound([0, 99, 0, 1], 0.99), 2)
+        self.assertEqual(ThreadLockStatistics.get_percentile_bound([0, 98, 0, 2], 0.99), 8)
+
+        lock_profiler = LockProfiler()
+        lock_profiler.record_wait_time(1000)
+        lock_profiler.record_hold_time(2000)
+        lock_statistics = lock_profiler.get_lock_statistics()
+
+        self.assertIn(f"{threading.current_thread().name}: 1 lock acquisitions", lock_statistics)
+        self.assertIn("1,000 nanoseconds average", lock_statistics)
+        self.assertIn("2,000 nanoseconds average", lock_statistics)
+
+    def test_execution(self):
+        lock_profiler = LockProfiler()
+
+        def record():
+            for _ in range(100):
+                lock_profiler.record_wait_time(10)
+                lock_profiler.record_hold_time(20)
+
+        threads = [threading.Thread(target=record, name=f"Worker {i}") for i in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sorted(lock_profiler.thread_statistics), ["Worker 0", "Worker 1", "Worker 2"])
+        for statistics in lock_profiler.thread_statistics.values():
+            self.assertEqual(statistics.num_acquisitions, 100)
+            self.assertEqual(statistics.total_hold_time, 2000)
+
+    def test_error_handling(self):
+        lock_profiler = LockProfiler()
+
+        lock_profiler.record_wait_time(2 ** 80)
+
+        statistics = lock_profiler.thread_statistics[threading.current_thread().name]
+        self.assertEqual(statistics.wait_histogram[ThreadLockStatistics.NUM_BUCKETS - 1], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import logging
+import os
+import tracemalloc
+import unittest
+
+from src.main.statistics.memory_profiler import MemoryProfiler
+from src.main.statistics.statistic_tracker import StatisticTracker
+
+
+class MemoryProfilerTest(unittest.TestCase):
+    def tearDown(self):
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def test_instantiation(self):
+        memory_profiler = MemoryProfiler()
+
+        self.assertEqual(memory_profiler.snapshot_sizes, {})
+        self.assertEqual(memory_profiler.peak_memory, 0)
+        self.assertFalse(memory_profiler.is_tracing_started)
+        self.assertEqual(memory_profiler.get_memory_statistics(), "")
+
+    def test_value_change(self):
+        memory_profiler = MemoryProfiler()
+
+        memory_profiler.start()
+
+        self.assertTrue(tracemalloc.is_tracing())
+        self.assertTrue(memory_profiler.is_tracing_started)
+        self.assertEqual(list(memory_profiler.snapshot_sizes), [MemoryProfiler.START_SNAPSHOT])
+
+        memory_profiler.stop()
+
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertFalse(memory_profiler.is_tracing_started)
+        self.assertEqual(list(memory_profiler.snapshot_sizes),
+                         [MemoryProfiler.START_SNAPSHOT, MemoryProfiler.END_SNAPSHOT])
+        self.assertGreater(memory_profiler.peak_memory, 0)
+
+    def test_function_io(self):
+        memory_profiler = MemoryProfiler()
+        main_directory = MemoryProfiler.MAIN_DIRECTORY
+
+        self.assertEqual(memory_profiler.get_file_subsystem(
+            os.path.join(main_directory, 'buffer', 'buffer_queue.py')), 'buffer')
+        self.assertEqual(memory_profiler.get_file_subsystem(
+            os.path.join(main_directory, 'thread', 'processor', 'producer', 'producer.py')), 'thread')
+        self.assertEqual(memory_profiler.get_file_subsystem(
+            os.path.join(main_directory, 'logging', 'logging_utilities.py')), 'logging')
+        self.assertEqual(memory_profiler.get_file_subsystem(logging.__file__), 'logging')
+        self.assertIsNone(memory_profiler.get_file_subsystem(
+            os.path.join(main_directory, 'simulator', 'simulator.py')))
+        self.assertIsNone(memory_profiler.get_file_subsystem(os.__file__))
+
+        self.assertEqual(MemoryProfiler.format_memory_size(1536), "1.5 KiB")
+        self.assertEqual(MemoryProfiler.format_memory_size(2 * 1024 * 1024), "2,048.0 KiB")
+
+        memory_profiler.snapshot_sizes = {
+            MemoryProfiler.START_SNAPSHOT: dict.fromkeys(MemoryProfiler.SUBSYSTEMS + ('other',), 0),
+            MemoryProfiler.END_SNAPSHOT: dict.fromkeys(MemoryProfiler.SUBSYSTEMS + ('other',), 2048),
+        }
+        memory_profiler.peak_memory = 4096
+        memory_statistics = memory_profiler.get_memory_statistics()
+
+        self.assertIn("statistics: 0.0 KiB at start, 2.0 KiB at end", memory_statistics)
+        self.assertIn("Peak: 2.0 KiB, retained: 2.0 KiB", memory_statistics)
+        self.assertIn("Peak traced memory: 4.0 KiB", memory_statistics)
+
+    def test_execution(self):
+        memory_profiler = MemoryProfiler()
+        statistic_tracker = StatisticTracker(10_000)
+
+        memory_profiler.start()
+        for _ in range(10_000):
+            statistic_tracker.add_producer_throughput(1_000_000)
+        memory_profiler.take_snapshot(MemoryProfiler.STEADY_STATE_SNAPSHOT)
+        memory_profiler.stop()
+
+        start_sizes = memory_profiler.snapshot_sizes[MemoryProfiler.START_SNAPSHOT]
+        end_sizes = memory_profiler.snapshot_sizes[MemoryProfiler.END_SNAPSHOT]
+        self.assertGreater(end_sizes['statistics'] - start_sizes['statistics'], 10_000)
+        self.assertGreaterEqual(memory_profiler.peak_memory, end_sizes['statistics'])
+
+    def test_error_handling(self):
+        memory_profiler = MemoryProfiler()
+
+        memory_profiler.stop()
+        self.assertEqual(memory_profiler.snapshot_sizes, {})
+
+        tracemalloc.start()
+        memory_profiler.start()
+        memory_profiler.stop()
+
+        self.assertFalse(memory_profiler.is_tracing_started)
+        self.assertTrue(tracemalloc.is_tracing())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import threading
+import unittest
+
+from src.main.statistics.monitoring_profiler import MonitoringProfiler
+
+
+class Worker:
+    def work(self, number):
+        return number * 2
+
+    def fail(self):
+        raise ValueError("An intentional error occurred.")
+
+
+class MonitoringProfilerTest(unittest.TestCase):
+    def test_instantiation(self):
+        monitoring_profiler = MonitoringProfiler([Worker.work, Worker.fail])
+
+        self.assertFalse(monitoring_profiler.is_attached)
+        self.assertEqual(sorted(monitoring_profiler.function_names.values()),
+                         ["Worker.fail", "Worker.work"])
+        self.assertEqual(monitoring_profiler.get_timings(), {})
+        self.assertEqual(monitoring_profiler.get_monitoring_statistics(), "")
+
+    def test_value_change(self):
+        monitoring_profiler = MonitoringProfiler([Worker.work])
+        code = Worker.work.__code__
+
+        monitoring_profiler.handle_start(code, 0)
+        monitoring_profiler.handle_return(code, 0, None)
+        monitoring_profiler.handle_return(code, 0, None)
+
+        self.assertEqual(monitoring_profiler.get_timings()["Worker.work"][0], 1)
+
+    def test_function_io(self):
+        monitoring_profiler = MonitoringProfiler([Worker.work])
+        code = Worker.work.__code__
+
+        def record():
+            for _ in range(10):
+                monitoring_profiler.handle_start(code, 0)
+                monitoring_profiler.handle_return(code, 0, None)
+
+        threads = [threading.Thread(target=record) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(monitoring_profiler.thread_timings), 3)
+        self.assertEqual(monitoring_profiler.get_timings()["Worker.work"][0], 30)
+        self.assertIn("Worker.work: 30 calls", monitoring_profiler.get_monitoring_statistics())
+
+    @unittest.skipUnless(MonitoringProfiler.is_supported(), "requires sys.monitoring")
+    def test_execution(self):
+        monitoring_profiler = MonitoringProfiler([Worker.work, Worker.fail])
+        worker = Worker()
+
+        worker.work(1)
+        monitoring_profiler.attach()
+        try:
+            for number in range(5):
+                worker.work(number)
+            with self.assertRaises(ValueError):
+                worker.fail()
+        finally:
+            monitoring_profiler.detach()
+        worker.work(1)
+
+        timings = monitoring_profiler.get_timings()
+        self.assertEqual(timings["Worker.work"][0], 5)
+        self.assertEqual(timings["Worker.fail"][0], 1)
+        self.assertTrue(monitoring_profiler.toggle())
+        self.assertFalse(monitoring_profiler.toggle())
+
+    def test_error_handling(self):
+        monitoring_profiler = MonitoringProfiler([Worker.work])
+
+        monitoring_profiler.detach()
+        self.assertFalse(monitoring_profiler.is_attached)
+        if not MonitoringProfiler.is_supported():
+            with self.assertRaises(RuntimeError):
+                monitoring_profiler.attach()
+            self.assertFalse(monitoring_profiler.is_attached)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,7 @@
 import unittest
 
+from src.main.statistics.buffer_event import BufferEvent
+from src.main.statistics.sample_mode import SampleMode
 from src.main.statistics.statistic_tracker import StatisticTracker
 
 
@@ -81,6 +83,96 @@ class StatisticTrackerTest(unittest.TestCase):
         except Exception as e:
             self.fail(f"StatisticTracker raised an unexpected exception: {e}")
 
+    def test_buffer_event_window(self):
+        tracker = StatisticTracker(num_items_to_process=100)
+
+        for _ in range(StatisticTracker.BUFFER_EVENT_WINDOW):
+            tracker.increment_empty_buffer()
+        tracker.increment_full_buffer()
+
+        self.assertEqual(len(tracker.recent_buffer_events), StatisticTracker.BUFFER_EVENT_WINDOW)
+        self.assertEqual(tracker.count_recent_buffer_events(BufferEvent.FULL), 1)
+        self.assertEqual(tracker.count_recent_buffer_events(BufferEvent.EMPTY),
+                         StatisticTracker.BUFFER_EVENT_WINDOW - 1)
+        tracker.clear_recent_buffer_events()
+        self.assertEqual(tracker.count_recent_buffer_events(BufferEvent.EMPTY), 0)
+        self.assertEqual(tracker.num_empty_buffer, StatisticTracker.BUFFER_EVENT_WINDOW)
+
+    def test_sampling(self):
+        tracker = StatisticTracker(100, sample_rate=4)
+
+        self.assertEqual([tracker.should_sample_producer() for _ in range(8)],
+                         [True, True, True, True, True, True, True, True])
+        self.assertTrue(tracker.should_sample_consumer())
+        self.assertTrue(all(StatisticTracker(100).should_sample_consumer() for _ in range(8)))
+        random_tracker = StatisticTracker(100, 1000, SampleMode.RANDOM)
+        self.assertTrue(all(random_tracker.should_sample_producer() for _ in range(8)))
+        random_tracker.add_producer_throughput(100)
+        self.assertLess(sum(random_tracker.should_sample_producer() for _ in range(1000)), 50)
+
+        alternating_tracker = StatisticTracker(100, sample_rate=2)
+        alternating_tracker.add_producer_throughput(100)
+        alternating_tracker.add_consumer_throughput(100)
+        sampled = [(alternating_tracker.should_sample_producer(),
+                    alternating_tracker.should_sample_consumer()) for _ in range(4)]
+        self.assertEqual(sampled, [(True, True), (False, False), (True, True), (False, False)])
+
+        for throughput in (100, 200, 300):
+            tracker.add_producer_throughput(throughput)
+        self.assertEqual([tracker.should_sample_producer() for _ in range(8)],
+                         [True, False, False, False, True, False, False, False])
+        tracker.increment_produced_items(9)
+        sampling_statistics = tracker.get_sampling_statistics()
+
+        self.assertEqual(tracker.get_average_throughput(tracker.producer_throughput_list), 200)
+        self.assertIn("Sampled 1 in 4 operations (deterministic)", sampling_statistics)
+        self.assertIn("Producer throughput: 3 of 12 items sampled", sampling_statistics)
+        self.assertIn("Consumer throughput: 0 of 0 items sampled, too few", sampling_statistics)
+        self.assertAlmostEqual(StatisticTracker.get_margin_of_error([100, 200, 300], 12),
+                               1.96 * 100 / 3 ** 0.5 * 0.75 ** 0.5)
+        self.assertEqual(StatisticTracker.get_margin_of_error([100, 200], 2), 0)
+        self.assertEqual(StatisticTracker.get_percentile([3, 1, 2, 4], 0.5), 3)
+        self.assertEqual(StatisticTracker.get_average_throughput([]), 0)
+
+    def test_overhead_correction(self):
+        tracker = StatisticTracker(100)
+        tracker.timing_overhead = 400
+        tracker.decorator_overhead = 900
+
+        tracker.add_producer_throughput(1000)
+        self.assertIn("Timing overhead: 400 nanoseconds per timed operation, included",
+                      tracker.get_performance_info())
+
+        tracker.is_overhead_corrected = True
+        tracker.add_producer_throughput(1000)
+        tracker.add_producer_throughput(1000, 4)
+        tracker.add_consumer_throughput(300)
+
+        self.assertEqual(tracker.producer_throughput_list, [1000, 600, 900, 900, 900, 900])
+        self.assertEqual(tracker.consumer_throughput_list, [0])
+        self.assertIn("subtracted from the throughput above", tracker.get_performance_info())
+        self.assertIn("Decorator overhead: 900 nanoseconds per operation", tracker.get_performance_info())
+
+    def test_process_statistics(self):
+        process_tracker = StatisticTracker(10)
+        process_tracker.add_producer_throughput(500, 2)
+        process_tracker.add_consumer_throughput(700)
+        process_tracker.increment_empty_buffer()
+        process_tracker.increment_full_buffer()
+        process_statistics = process_tracker.get_process_statistics()
+
+        tracker = StatisticTracker(10)
+        tracker.add_consumer_throughput(100)
+        tracker.merge_process_statistics(process_statistics)
+        tracker.merge_process_statistics(process_statistics)
+
+        self.assertEqual(tracker.items_produced, 4)
+        self.assertEqual(tracker.items_consumed, 3)
+        self.assertEqual(tracker.num_empty_buffer, 2)
+        self.assertEqual(tracker.num_full_buffer, 2)
+        self.assertEqual(tracker.producer_throughput_list, [500] * 4)
+        self.assertEqual(tracker.consumer_throughput_list, [100, 700, 700])
+        self.assertEqual(process_tracker.items_produced, 2)
 
 
 if __name__ == '__main__':
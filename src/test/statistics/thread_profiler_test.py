@@ -0,0 +1,113 @@
+import cProfile
+import os
+import pstats
+import sys
+import tempfile
+import threading
+import unittest
+
+from src.main.statistics.thread_profiler import ThreadProfiler
+
+
+def busy_function(num_iterations: int) -> int:
+    total = 0
+    for i in range(num_iterations):
+        total += i
+    return total
+
+
+class ThreadProfilerTest(unittest.TestCase):
+    def test_instantiation(self):
+        thread_profiler = ThreadProfiler()
+
+        self.assertEqual(thread_profiler.output_file, ThreadProfiler.OUTPUT_FILE)
+        self.assertEqual(thread_profiler.profiles, [])
+        self.assertIsNone(thread_profiler.get_stats())
+        self.assertEqual(thread_profiler.save_profile(), "")
+
+    def test_value_change(self):
+        thread_profiler = ThreadProfiler("custom.pstats")
+
+        self.assertEqual(thread_profiler.run_profiled(busy_function, 10), 45)
+        self.assertEqual(thread_profiler.output_file, "custom.pstats")
+        self.assertEqual(len(thread_profiler.profiles), 1)
+
+    def test_function_io(self):
+        self.assertEqual(ThreadProfiler.is_per_thread_cprofile_supported(),
+                         sys.version_info < (3, 12))
+
+        thread_profiler = ThreadProfiler()
+        thread_profiler.run_profiled(busy_function, 1000)
+        stats = thread_profiler.get_stats()
+
+        self.assertIsInstance(stats, pstats.Stats)
+        self.assertIn("busy_function", thread_profiler.get_hot_spots(stats))
+
+    def test_execution(self):
+        thread_profiler = ThreadProfiler()
+        threads = [threading.Thread(target=thread_profiler.run_profiled,
+                                    args=(busy_function, 1000))
+                   for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertGreaterEqual(len(thread_profiler.profiles), 1)
+        self.assertLessEqual(len(thread_profiler.profiles), 3)
+        with tempfile.TemporaryDirectory() as directory:
+            thread_profiler.output_file = os.path.join(directory, "threads.pstats")
+            profile_statistics = thread_profiler.save_profile()
+
+            if ThreadProfiler.is_per_thread_cprofile_supported():
+                self.assertIn(f"Merged {len(thread_profiler.profiles)} thread profiles",
+                              profile_statistics)
+            else:
+                self.assertIn("Profiled all threads with a single shared profile",
+                              profile_statistics)
+                self.assertNotIn("Merged", profile_statistics)
+            stats = pstats.Stats(thread_profiler.output_file)
+        calls = [stat[1] for function, stat in stats.stats.items()
+                 if function[2] == "busy_function"]
+        self.assertEqual(calls, [3])
+
+    def test_error_handling(self):
+        thread_profiler = ThreadProfiler()
+
+        with self.assertRaises(ZeroDivisionError):
+            thread_profiler.run_profiled(lambda: 1 / 0)
+        self.assertEqual(len(thread_profiler.profiles), 1)
+
+    @unittest.skipIf(ThreadProfiler.is_per_thread_cprofile_supported(),
+                     "profiles are only shared on Python 3.12 or newer")
+    def test_shared_profile(self):
+        thread_profiler = ThreadProfiler()
+
+        thread_profiler.enable_shared_profile()
+        thread_profiler.enable_shared_profile()
+        shared_profile = thread_profiler.shared_profile
+        busy_function(10)
+        thread_profiler.disable_shared_profile()
+
+        self.assertIs(thread_profiler.shared_profile, shared_profile)
+        self.assertIsNone(thread_profiler.get_stats())
+
+        thread_profiler.disable_shared_profile()
+
+        self.assertIsNone(thread_profiler.shared_profile)
+        self.assertEqual(thread_profiler.profiles, [shared_profile])
+        self.assertIsNotNone(thread_profiler.get_stats())
+
+        other_profile = cProfile.Profile()
+        other_profile.enable()
+        try:
+            with self.assertLogs(level='WARNING'):
+                self.assertEqual(thread_profiler.run_profiled(busy_function, 10), 45)
+        finally:
+            other_profile.disable()
+        self.assertEqual(thread_profiler.num_active_calls, 0)
+        self.assertEqual(len(thread_profiler.profiles), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,12 @@
+import asyncio
 import unittest
 import time
 from unittest.mock import Mock, patch
+from src.main.buffer.buffer_status import BufferStatus
+from src.main.statistics.tracking_mode import TrackingMode
 from src.main.statistics.track_performance import track_performance, track_producer_performance, \
-    track_consumer_performance, track_exceptions, milliseconds_to_nanoseconds, nanoseconds_to_milliseconds
+    track_consumer_performance, track_exceptions, milliseconds_to_nanoseconds, nanoseconds_to_milliseconds, \
+    track_buffer_status, track_async_producer_performance, track_async_consumer_performance
 
 
 class TrackPerformanceTest(unittest.TestCase):
@@ -24,6 +28,7 @@ class TrackPerformanceTest(unittest.TestCase):
         self.assertEqual(sample_function(), "Test")
         self.assertEqual(producer_function(Mock(statistic_tracker=Mock())), "Producer")
 
+    @patch.object(TrackingMode, "is_verbose", True)
     @patch("time.perf_counter", side_effect=[1.0, 1.5])
     @patch("logging.debug")
     def test_value_change(self, mock_logging_debug, mock_perf_counter):
@@ -48,12 +53,69 @@ class TrackPerformanceTest(unittest.TestCase):
 
         wrapped_function = track_performance(mock_function)
 
-        result = wrapped_function()
+        with patch.object(TrackingMode, "is_verbose", True):
+            result = wrapped_function()
 
         self.assertEqual(result, "Result")
 
         mock_logging_debug.assert_called_once()
 
+    @patch('src.main.statistics.track_performance.logging.debug')
+    def test_non_verbose_tracking(self, mock_logging_debug):
+        @track_performance
+        def sample_function():
+            return "Test"
+
+        @track_consumer_performance
+        def consumer_function(self):
+            return 3
+
+        owner = Mock(statistic_tracker=Mock())
+
+        self.assertEqual(sample_function(), "Test")
+        self.assertEqual(consumer_function(owner), 3)
+        owner.statistic_tracker.add_consumer_throughput.assert_called_once()
+        mock_logging_debug.assert_not_called()
+
+    def test_sampling(self):
+        @track_producer_performance
+        def producer_function(self):
+            return 2
+
+        owner = Mock(statistic_tracker=Mock())
+        owner.statistic_tracker.should_sample_producer.return_value = False
+
+        with patch("time.perf_counter") as mock_perf_counter:
+            self.assertEqual(producer_function(owner), 2)
+        mock_perf_counter.assert_not_called()
+        owner.statistic_tracker.increment_produced_items.assert_called_once_with(2)
+        owner.statistic_tracker.add_producer_throughput.assert_not_called()
+
+
+    def test_async_tracking(self):
+        @track_async_producer_performance
+        async def producer_coroutine(self):
+            await asyncio.sleep(0)
+            return 3
+
+        @track_async_consumer_performance
+        async def consumer_coroutine(self):
+            return 0
+
+        owner = Mock(statistic_tracker=Mock())
+        owner.statistic_tracker.should_sample_producer.return_value = True
+        owner.statistic_tracker.should_sample_consumer.return_value = True
+
+        with patch("time.perf_counter_ns", side_effect=[0, 600]):
+            self.assertEqual(asyncio.run(producer_coroutine(owner)), 3)
+        owner.statistic_tracker.add_producer_throughput.assert_called_once_with(200, 3)
+
+        self.assertEqual(asyncio.run(consumer_coroutine(owner)), 0)
+        owner.statistic_tracker.add_consumer_throughput.assert_not_called()
+
+        owner.statistic_tracker.should_sample_consumer.return_value = False
+        self.assertEqual(asyncio.run(consumer_coroutine(owner)), 0)
+        owner.statistic_tracker.increment_consumed_items.assert_called_once_with(0)
 
     def test_execution(self):
         @track_performance
@@ -65,6 +127,19 @@ class TrackPerformanceTest(unittest.TestCase):
 
         self.assertEqual(result, "Executed")
 
+    def test_track_buffer_status(self):
+        @track_buffer_status
+        def buffer_function(self, result):
+            return result
+
+        owner = Mock(statistic_tracker=Mock())
+
+        self.assertIs(buffer_function(owner, BufferStatus.FULL), BufferStatus.FULL)
+        self.assertIs(buffer_function(owner, BufferStatus.EMPTY), BufferStatus.EMPTY)
+        self.assertEqual(buffer_function(owner, 7), 7)
+        owner.statistic_tracker.increment_full_buffer.assert_called_once()
+        owner.statistic_tracker.increment_empty_buffer.assert_called_once()
+
     def test_conversion_methods(self):
         self.assertEqual(milliseconds_to_nanoseconds(1), 1000000)
         self.assertAlmostEqual(nanoseconds_to_milliseconds(1000000), 1.0)
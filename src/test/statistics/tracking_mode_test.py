@@ -0,0 +1,35 @@
+import unittest
+from unittest.mock import patch
+
+from src.main.statistics.tracking_mode import TrackingMode
+
+
+class TrackingModeTest(unittest.TestCase):
+    def test_instantiation(self):
+        self.assertFalse(TrackingMode.is_verbose)
+
+    @patch.object(TrackingMode, "is_verbose", False)
+    def test_value_change(self):
+        TrackingMode.set_verbose(True)
+        self.assertTrue(TrackingMode.is_verbose)
+
+        TrackingMode.set_verbose(False)
+        self.assertFalse(TrackingMode.is_verbose)
+
+    @patch.object(TrackingMode, "is_verbose", False)
+    def test_function_io(self):
+        self.assertIsNone(TrackingMode.set_verbose(True))
+
+    @patch.object(TrackingMode, "is_verbose", True)
+    def test_execution(self):
+        TrackingMode.set_verbose(False)
+        self.assertIs(TrackingMode.is_verbose, False)
+
+    @patch.object(TrackingMode, "is_verbose", False)
+    def test_error_handling(self):
+        TrackingMode.set_verbose(None)
+        self.assertIs(TrackingMode.is_verbose, False)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -83,6 +83,17 @@ class SpeedSuggesterTest(unittest.TestCase):
         self.assertIn(SpeedSuggestions.INCREASE_PRODUCER_SPEED, suggester.suggestions)
         self.assertIn(SpeedSuggestions.INCREASE_CONSUMER_SPEED, suggester.suggestions)
 
+    def test_empty_throughput(self):
+        config = Mock(producer_speed_range=(1, 3), consumer_speed_range=(1, 3),
+                      num_producers=1, num_consumers=2)
+        tracker = Mock(producer_throughput_list=[], consumer_throughput_list=[9_000_000])
+
+        suggester = SpeedSuggester(config, tracker, Mock())
+        suggester.calculate()
+
+        self.assertEqual(suggester.average_producer_speed, 0)
+        self.assertEqual(suggester.suggestions, [SpeedSuggestions.INCREASE_CONSUMER_SPEED])
+
     def test_error_handling(self):
         with self.assertRaises(AttributeError):
             SpeedSuggester(None, None, None)
@@ -1,7 +1,11 @@
 import unittest
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock, Mock, patch
 
-from src.main.thread.critical_section import critical_section
+from src.main.buffer.buffer_status import BufferStatus
+from src.main.buffer.full_buffer_exception import FullBufferException
+from src.main.statistics.tracking_mode import TrackingMode
+from src.main.thread.critical_section import critical_section, \
+    tracked_critical_section
 
 
 class CriticalSectionTest(unittest.TestCase):
@@ -70,6 +74,41 @@ class CriticalSectionTest(unittest.TestCase):
         mock_instance.mutex_lock.__enter__.assert_called_once()
         mock_instance.mutex_lock.__exit__.assert_called_once()
 
+    @patch('src.main.thread.critical_section.logging.debug')
+    def test_tracked_critical_section(self, mock_logging_debug):
+        class MockBuffer:
+            def __init__(self):
+                self.mutex_lock = MagicMock()
+                self.mutex_lock.__exit__.return_value = False
+                self.statistic_tracker = Mock()
+
+            @tracked_critical_section
+            def try_enqueue(self, result):
+                return result
+
+            @tracked_critical_section
+            def enqueue(self):
+                raise FullBufferException()
+
+        mock_buffer = MockBuffer()
+
+        self.assertEqual(mock_buffer.try_enqueue(7), 7)
+        self.assertIs(mock_buffer.try_enqueue(BufferStatus.FULL), BufferStatus.FULL)
+        self.assertIs(mock_buffer.try_enqueue(BufferStatus.EMPTY), BufferStatus.EMPTY)
+        with self.assertRaises(FullBufferException):
+            mock_buffer.enqueue()
+
+        self.assertEqual(mock_buffer.mutex_lock.__enter__.call_count, 4)
+        self.assertEqual(mock_buffer.mutex_lock.__exit__.call_count, 4)
+        self.assertEqual(mock_buffer.statistic_tracker.increment_full_buffer.call_count, 2)
+        mock_buffer.statistic_tracker.increment_empty_buffer.assert_called_once()
+        mock_logging_debug.assert_not_called()
+
+        with patch.object(TrackingMode, "is_verbose", True):
+            self.assertIs(mock_buffer.try_enqueue(BufferStatus.FULL), BufferStatus.FULL)
+        self.assertEqual(mock_buffer.statistic_tracker.increment_full_buffer.call_count, 3)
+        self.assertEqual(mock_logging_debug.call_count, 3)
+
 
 if __name__ == '__main__':
     unittest.main()
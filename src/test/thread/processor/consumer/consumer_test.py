@@ -1,7 +1,7 @@
 import unittest
 from unittest.mock import Mock, MagicMock
 
-from src.main.buffer.empty_buffer_exception import EmptyBufferException
+from src.main.buffer.buffer_status import BufferStatus
 from src.main.thread.processor.consumer.consumer import Consumer
 
 
@@ -21,13 +21,13 @@ class ConsumerTest(unittest.TestCase):
         tracker = Mock(num_items_to_process=10, items_produced=5)
         consumer = Consumer(1, 1, 3, buffer, 10, tracker)
 
-        buffer.dequeue.return_value = 42
+        buffer.try_dequeue.return_value = 42
         consumer.process_item()
         self.assertEqual(consumer.num_items_to_process, 9)
 
-        buffer.dequeue.side_effect = EmptyBufferException
+        buffer.try_dequeue.return_value = BufferStatus.EMPTY
         tracker.items_produced = 10
-        consumer.process_item()
+        self.assertEqual(consumer.process_item(), 0)
         self.assertEqual(consumer.num_items_to_process, 9)  # No change
 
         consumer.stop()
@@ -39,14 +39,14 @@ class ConsumerTest(unittest.TestCase):
         consumer = Consumer(1, 1, 3, buffer, 5, tracker)
 
         consumer.process_item()
-        buffer.dequeue.assert_called_once()
+        buffer.try_dequeue.assert_called_once()
 
         consumer.stop()
         self.assertFalse(consumer.running)
 
     def test_execution(self):
         mock_buffer = MagicMock()
-        mock_buffer.dequeue.return_value = 42
+        mock_buffer.try_dequeue.return_value = 42
 
         mock_stat_tracker = MagicMock()
         mock_stat_tracker.num_items_to_process = 10
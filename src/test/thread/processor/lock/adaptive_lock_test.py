@@ -0,0 +1,79 @@
+import threading
+import unittest
+
+from src.main.thread.processor.lock.adaptive_lock import AdaptiveLock
+from src.main.thread.processor.lock.lock import Lock
+
+
+class AdaptiveLockTest(unittest.TestCase):
+    def test_instantiation(self):
+        adaptive_lock = AdaptiveLock()
+
+        self.assertIsInstance(adaptive_lock, Lock)
+        self.assertFalse(adaptive_lock.is_locked())
+        self.assertEqual(adaptive_lock.average_hold_time, 0.0)
+        self.assertEqual(adaptive_lock.num_spins, 0)
+        self.assertEqual(adaptive_lock.num_parks, 0)
+        self.assertEqual(adaptive_lock.num_wakeups, 0)
+
+    def test_value_change(self):
+        adaptive_lock = AdaptiveLock()
+
+        adaptive_lock.acquire()
+        self.assertTrue(adaptive_lock.is_locked())
+        adaptive_lock.release()
+        self.assertFalse(adaptive_lock.is_locked())
+        self.assertGreater(adaptive_lock.average_hold_time, 0)
+
+    def test_function_io(self):
+        adaptive_lock = AdaptiveLock()
+
+        self.assertEqual(adaptive_lock.get_spin_budget(), 0)
+        adaptive_lock.average_hold_time = 1_000
+        self.assertEqual(adaptive_lock.get_spin_budget(), 2_000)
+        adaptive_lock.average_hold_time = 10 ** 9
+        self.assertEqual(adaptive_lock.get_spin_budget(), AdaptiveLock.MAX_SPIN_TIME)
+
+    def test_execution(self):
+        adaptive_lock = AdaptiveLock()
+        adaptive_lock.average_hold_time = 10 ** 9
+        acquired = threading.Event()
+
+        def acquire_and_release():
+            with adaptive_lock:
+                acquired.set()
+
+        adaptive_lock.acquire()
+        waiting_thread = threading.Thread(target=acquire_and_release)
+        waiting_thread.start()
+        while not adaptive_lock.num_parks:
+            acquired.wait(0.001)
+        adaptive_lock.release()
+        waiting_thread.join()
+
+        self.assertTrue(acquired.is_set())
+        self.assertGreaterEqual(adaptive_lock.num_wakeups, 1)
+        self.assertEqual(adaptive_lock.num_parked_threads, 0)
+
+    def test_error_handling(self):
+        adaptive_lock = AdaptiveLock()
+        counter = [0]
+
+        def increment():
+            for _ in range(1000):
+                with adaptive_lock:
+                    counter[0] += 1
+
+        threads = [threading.Thread(target=increment) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(counter[0], 4000)
+        self.assertFalse(adaptive_lock.is_locked())
+        self.assertEqual(adaptive_lock.num_parked_threads, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
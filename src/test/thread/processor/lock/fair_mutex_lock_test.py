@@ -0,0 +1,107 @@
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from src.main.statistics.tracking_mode import TrackingMode
+from src.main.thread.processor.lock.fair_mutex_lock import FairMutexLock
+from src.main.thread.processor.lock.lock import Lock
+from src.main.thread.processor.lock.lock_state import LockState
+
+
+class FairMutexLockTest(unittest.TestCase):
+    def test_instantiation(self):
+        fair_lock = FairMutexLock()
+
+        self.assertIsInstance(fair_lock, Lock)
+        self.assertEqual(fair_lock.lock_state, LockState.AVAILABLE)
+        self.assertEqual(fair_lock.get_num_waiters(), 0)
+
+    def test_value_change(self):
+        fair_lock = FairMutexLock()
+
+        fair_lock.acquire()
+        self.assertTrue(fair_lock.is_locked())
+        fair_lock.release()
+        self.assertTrue(fair_lock.is_available())
+
+    def test_function_io(self):
+        fair_lock = FairMutexLock()
+        acquired = threading.Event()
+
+        def acquire_and_release():
+            with fair_lock:
+                acquired.set()
+
+        fair_lock.acquire()
+        waiting_thread = threading.Thread(target=acquire_and_release)
+        waiting_thread.start()
+        while fair_lock.get_num_waiters() == 0:
+            time.sleep(0.001)
+        self.assertFalse(acquired.is_set())
+
+        fair_lock.release()
+        waiting_thread.join()
+        self.assertTrue(acquired.is_set())
+        self.assertTrue(fair_lock.is_available())
+
+    @patch("logging.debug")
+    def test_quiet_hand_off(self, mock_logging_debug):
+        fair_lock = FairMutexLock()
+        TrackingMode.set_verbose(False)
+
+        fair_lock.acquire()
+        waiting_thread = threading.Thread(target=fair_lock.acquire)
+        waiting_thread.start()
+        while fair_lock.get_num_waiters() == 0:
+            time.sleep(0.001)
+        fair_lock.release()
+        waiting_thread.join()
+        fair_lock.release()
+
+        mock_logging_debug.assert_not_called()
+
+    def test_execution(self):
+        fair_lock = FairMutexLock()
+        acquisition_order = []
+
+        def record_acquisition(thread_id):
+            with fair_lock:
+                acquisition_order.append(thread_id)
+
+        fair_lock.acquire()
+        threads = []
+        for thread_id in range(5):
+            thread = threading.Thread(target=record_acquisition, args=(thread_id,))
+            thread.start()
+            threads.append(thread)
+            while fair_lock.get_num_waiters() <= thread_id:
+                time.sleep(0.001)
+        fair_lock.release()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(acquisition_order, [0, 1, 2, 3, 4])
+
+    def test_error_handling(self):
+        fair_lock = FairMutexLock()
+        counter = [0]
+
+        def increment():
+            for _ in range(1000):
+                with fair_lock:
+                    counter[0] += 1
+
+        threads = [threading.Thread(target=increment) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(counter[0], 4000)
+        self.assertTrue(fair_lock.is_available())
+        self.assertEqual(fair_lock.get_num_waiters(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import threading
+import unittest
+
+from src.main.thread.processor.lock.lock import Lock
+from src.main.thread.processor.lock.native_lock import NativeLock
+
+
+class NativeLockTest(unittest.TestCase):
+    def test_instantiation(self):
+        native_lock = NativeLock()
+
+        self.assertIsInstance(native_lock, Lock)
+        self.assertFalse(native_lock.is_locked())
+
+    def test_value_change(self):
+        native_lock = NativeLock()
+
+        native_lock.acquire()
+        self.assertTrue(native_lock.is_locked())
+        native_lock.release()
+        self.assertFalse(native_lock.is_locked())
+
+    def test_function_io(self):
+        native_lock = NativeLock()
+
+        with native_lock:
+            self.assertTrue(native_lock.is_locked())
+        self.assertFalse(native_lock.is_locked())
+
+    def test_execution(self):
+        native_lock = NativeLock()
+        counter = [0]
+
+        def increment():
+            for _ in range(1000):
+                with native_lock:
+                    counter[0] += 1
+
+        threads = [threading.Thread(target=increment) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(counter[0], 4000)
+
+    def test_error_handling(self):
+        native_lock = NativeLock()
+
+        with self.assertRaises(RuntimeError):
+            native_lock.release()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import threading
+import unittest
+
+from src.main.statistics.lock_profiler import LockProfiler
+from src.main.thread.processor.lock.lock import Lock
+from src.main.thread.processor.lock.mutex_lock import MutexLock
+from src.main.thread.processor.lock.native_lock import NativeLock
+from src.main.thread.processor.lock.profiled_lock import ProfiledLock
+
+
+class ProfiledLockTest(unittest.TestCase):
+    def test_instantiation(self):
+        mutex_lock = MutexLock()
+        lock_profiler = LockProfiler()
+        profiled_lock = ProfiledLock(mutex_lock, lock_profiler)
+
+        self.assertIsInstance(profiled_lock, Lock)
+        self.assertIs(profiled_lock.lock, mutex_lock)
+        self.assertIs(profiled_lock.lock_profiler, lock_profiler)
+        self.assertEqual(profiled_lock.acquire_time, 0)
+
+    def test_value_change(self):
+        mutex_lock = MutexLock()
+        profiled_lock = ProfiledLock(mutex_lock, LockProfiler())
+
+        profiled_lock.acquire()
+        self.assertTrue(mutex_lock.is_locked())
+        self.assertGreater(profiled_lock.acquire_time, 0)
+        profiled_lock.release()
+        self.assertFalse(mutex_lock.is_locked())
+
+    def test_function_io(self):
+        lock_profiler = LockProfiler()
+        profiled_lock = ProfiledLock(MutexLock(), lock_profiler)
+
+        with profiled_lock:
+            pass
+        with profiled_lock:
+            pass
+
+        statistics = lock_profiler.thread_statistics[threading.current_thread().name]
+        self.assertEqual(statistics.num_acquisitions, 2)
+        self.assertEqual(sum(statistics.wait_histogram), 2)
+        self.assertEqual(sum(statistics.hold_histogram), 2)
+
+    def test_execution(self):
+        lock_profiler = LockProfiler()
+        profiled_lock = ProfiledLock(MutexLock(), lock_profiler)
+        counter = [0]
+
+        def increment():
+            for _ in range(500):
+                with profiled_lock:
+                    counter[0] += 1
+
+        threads = [threading.Thread(target=increment, name=f"Worker {i}") for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(counter[0], 2000)
+        self.assertEqual(len(lock_profiler.thread_statistics), 4)
+        for statistics in lock_profiler.thread_statistics.values():
+            self.assertEqual(statistics.num_acquisitions, 500)
+
+    def test_error_handling(self):
+        lock_profiler = LockProfiler()
+        profiled_lock = ProfiledLock(NativeLock(), lock_profiler)
+
+        with self.assertRaises(RuntimeError):
+            profiled_lock.release()
+        self.assertEqual(lock_profiler.thread_statistics, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
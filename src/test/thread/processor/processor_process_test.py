@@ -0,0 +1,98 @@
+import unittest
+
+from src.main.buffer.shared_memory_buffer import SharedMemoryBuffer
+from src.main.statistics.sample_mode import SampleMode
+from src.main.statistics.statistic_tracker import StatisticTracker
+from src.main.thread.processor.consumer.consumer import Consumer
+from src.main.thread.processor.processor_process import ProcessorProcess
+from src.main.thread.processor.producer.producer import Producer
+
+
+def get_arguments(num_items_to_process: int) -> dict:
+    return {
+        'id': 1,
+        'speed_floor': 0,
+        'speed_ceiling': 0,
+        'num_items_to_process': num_items_to_process,
+        'batch_size': 1
+    }
+
+
+class ProcessorProcessTest(unittest.TestCase):
+    def setUp(self):
+        self.statistic_tracker = StatisticTracker(20, 2, SampleMode.RANDOM)
+        self.statistic_tracker.timing_overhead = 100
+        self.statistic_tracker.is_overhead_corrected = True
+        self.buffer = SharedMemoryBuffer(4, self.statistic_tracker)
+
+    def tearDown(self):
+        self.buffer.close()
+
+    def test_instantiation(self):
+        process = ProcessorProcess(Producer, get_arguments(20), self.buffer,
+                                   self.statistic_tracker)
+
+        self.assertEqual(process.name, "Producer-1")
+        self.assertIs(process.processor_class, Producer)
+        self.assertIs(process.buffer, self.buffer)
+        self.assertEqual(process.num_items_to_process, 20)
+        self.assertEqual(process.sample_rate, 2)
+        self.assertEqual(process.sample_mode, SampleMode.RANDOM)
+
+    def test_value_change(self):
+        process = ProcessorProcess(Consumer, get_arguments(20), self.buffer,
+                                   self.statistic_tracker)
+
+        process.timing_overhead = 500
+        process.sample_rate = 1
+        statistic_tracker = process.create_statistic_tracker()
+
+        self.assertEqual(statistic_tracker.timing_overhead, 500)
+        self.assertEqual(statistic_tracker.sample_rate, 1)
+
+    def test_function_io(self):
+        process = ProcessorProcess(Consumer, get_arguments(20), self.buffer,
+                                   self.statistic_tracker)
+
+        statistic_tracker = process.create_statistic_tracker()
+
+        self.assertIsNot(statistic_tracker, self.statistic_tracker)
+        self.assertEqual(statistic_tracker.num_items_to_process, 20)
+        self.assertEqual(statistic_tracker.sample_mode, SampleMode.RANDOM)
+        self.assertEqual(statistic_tracker.timing_overhead, 100)
+        self.assertTrue(statistic_tracker.is_overhead_corrected)
+        self.assertEqual(statistic_tracker.items_produced, 0)
+
+    def test_execution(self):
+        producer_process = ProcessorProcess(Producer, get_arguments(20), self.buffer,
+                                            self.statistic_tracker)
+        consumer_process = ProcessorProcess(Consumer, get_arguments(20), self.buffer,
+                                            self.statistic_tracker)
+
+        producer_process.start()
+        consumer_process.start()
+        producer_statistics = producer_process.receive_statistics()
+        consumer_statistics = consumer_process.receive_statistics()
+        producer_process.join()
+        consumer_process.join()
+
+        self.assertEqual(producer_process.exitcode, 0)
+        self.assertEqual(consumer_process.exitcode, 0)
+        self.assertEqual(producer_statistics['items_produced'], 20)
+        self.assertEqual(consumer_statistics['items_consumed'], 20)
+        self.assertEqual(self.statistic_tracker.items_produced, 0)
+        self.assertTrue(self.buffer.is_empty())
+
+    def test_error_handling(self):
+        process = ProcessorProcess(Producer, get_arguments(0), self.buffer,
+                                   self.statistic_tracker)
+
+        process.start()
+        self.assertIsNotNone(process.receive_statistics())
+        process.join()
+
+        self.assertIsNone(process.receive_statistics())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,11 @@
 import unittest
 from unittest.mock import Mock, MagicMock
 
-from src.main.buffer.full_buffer_exception import FullBufferException
+from src.main.buffer.buffer_status import BufferStatus
+from src.main.buffer.priority_buffer import PriorityBuffer
+from src.main.buffer.priority_class import PriorityClass
+from src.main.statistics.statistic_tracker import StatisticTracker
+from src.main.thread.processor.lock.mutex_lock import MutexLock
 from src.main.thread.processor.producer.producer import Producer
 
 
@@ -21,12 +25,12 @@ class ProducerTest(unittest.TestCase):
         tracker = Mock(num_items_to_process=10, items_produced=5)  # Set valid integers
         producer = Producer(1, 1, 3, buffer, 10, tracker)
 
-        buffer.enqueue.return_value = None
+        buffer.try_enqueue.return_value = BufferStatus.OK
         producer.process_item()
         self.assertEqual(producer.num_items_to_process, 9)
 
-        buffer.enqueue.side_effect = FullBufferException
-        producer.process_item()
+        buffer.try_enqueue.return_value = BufferStatus.FULL
+        self.assertEqual(producer.process_item(), 0)
         self.assertEqual(producer.num_items_to_process, 9)
 
         tracker.num_items_to_process = 10
@@ -42,9 +46,9 @@ class ProducerTest(unittest.TestCase):
 
         producer = Producer(1, 1, 3, buffer, 5, tracker)
 
-        buffer.enqueue.return_value = None
-        producer.process_item()
-        buffer.enqueue.assert_called_once()
+        buffer.try_enqueue.return_value = BufferStatus.OK
+        self.assertEqual(producer.process_item(), 1)
+        buffer.try_enqueue.assert_called_once()
         self.assertEqual(producer.num_items_to_process, 4)
 
         producer.stop()
@@ -67,7 +71,23 @@ class ProducerTest(unittest.TestCase):
 
         producer.process_item()
         self.assertEqual(producer.num_items_to_process, 4)
-        mock_buffer.enqueue.assert_called_once()
+        mock_buffer.try_enqueue.assert_called_once()
+        mock_buffer.enqueue.assert_not_called()
+
+    def test_batch_priority_classes(self):
+        statistic_tracker = StatisticTracker(400)
+        priority_buffer = PriorityBuffer(400, MutexLock(), statistic_tracker)
+        producer = Producer(1, 0, 0, priority_buffer, 400, statistic_tracker,
+                            batch_size=4, urgent_ratio=0.5)
+
+        while producer.num_items_to_process > 0:
+            producer.process_batch()
+
+        priority_classes = [entry[3] for entry in priority_buffer.heap]
+        self.assertEqual(len(priority_classes), 400)
+        self.assertGreater(priority_classes.count(PriorityClass.URGENT), 100)
+        self.assertGreater(priority_classes.count(PriorityClass.BULK), 100)
+        self.assertEqual(producer.pending_priority_classes, [])
 
 
 if __name__ == '__main__':
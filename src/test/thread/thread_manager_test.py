@@ -1,6 +1,14 @@
 import unittest
 from unittest.mock import Mock, MagicMock
 
+from src.main.buffer.buffer_queue import BufferQueue
+from src.main.statistics.statistic_tracker import StatisticTracker
+from src.main.buffer.shared_memory_buffer import SharedMemoryBuffer
+from src.main.statistics.thread_profiler import ThreadProfiler
+from src.main.thread.executor_type import ExecutorType
+from src.main.thread.processor.consumer.consumer import Consumer
+from src.main.thread.processor.producer.producer import Producer
+from src.main.thread.processor.lock.native_lock import NativeLock
 from src.main.thread.thread_manager import ThreadManager
 
 
@@ -83,6 +91,50 @@ class ThreadManagerTest(unittest.TestCase):
         manager.start_all()
         self.assertTrue(manager.threads_started)
 
+    def test_processes(self):
+        tracker = StatisticTracker(30)
+        buffer = SharedMemoryBuffer(5, tracker)
+        manager = ThreadManager(2, 3, (0, 0), (0, 0), buffer, 30, tracker,
+                                producer_batch_size=2, urgent_ratio=0.5,
+                                executor=ExecutorType.PROCESS)
+
+        self.assertEqual([process.processor_class for process in manager.processes],
+                         [Producer, Producer, Consumer, Consumer, Consumer])
+        self.assertEqual(manager.processes[0].processor_arguments,
+                         {'id': 1, 'speed_floor': 0, 'speed_ceiling': 0,
+                          'num_items_to_process': 15, 'batch_size': 2, 'urgent_ratio': 0.5})
+        self.assertEqual(manager.processes[2].processor_arguments['num_items_to_process'], 10)
+
+        manager.start_all()
+        manager.join_all()
+        manager.join_all()
+        buffer.close()
+
+        self.assertTrue(manager.threads_started)
+        self.assertEqual(tracker.items_produced, 30)
+        self.assertEqual(tracker.items_consumed, 30)
+        self.assertEqual(len(tracker.consumer_throughput_list), 30)
+        for process in manager.processes:
+            self.assertEqual(process.exitcode, 0)
+
+    def test_profiling(self):
+        tracker = StatisticTracker(10)
+        thread_profiler = ThreadProfiler()
+        manager = ThreadManager(2, 2, (0, 0), (0, 0),
+                                BufferQueue(5, NativeLock(), tracker), 10,
+                                tracker, thread_profiler=thread_profiler)
+
+        for processor in manager.producers + manager.consumers:
+            self.assertIs(processor.thread_profiler, thread_profiler)
+
+        manager.start_all()
+        manager.join_all()
+
+        if ThreadProfiler.is_per_thread_cprofile_supported():
+            self.assertEqual(len(thread_profiler.profiles), 6)
+        profiled_functions = [function[2] for function in thread_profiler.get_stats().stats]
+        self.assertIn("process_item", profiled_functions)
+
 
 if __name__ == '__main__':
     unittest.main()